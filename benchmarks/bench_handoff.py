@@ -0,0 +1,96 @@
+"""
+Compares handing messages from a receiver to a processing thread via
+queue.Queue, as BitfinexWSS does by default, against the lock-free RingBuffer
+drained in batches (BitfinexWSS(transport='ring')).
+
+Reports throughput and the p50/p99 latency between put() and the consumer
+picking the message up.
+
+Usage:
+    python -m benchmarks.bench_handoff [n_messages] [batch_size]
+"""
+# Import Built-Ins
+import sys
+import time
+import queue
+import threading
+
+# Import Homebrew
+from bitex.api.WSS.ringbuffer import RingBuffer
+
+
+CAPACITY = 1024
+PAYLOAD = [17, [2500.1, 3, 1.25]]
+
+
+def produce_queue(q, n):
+    for _ in range(n):
+        q.put((time.perf_counter(), PAYLOAD))
+
+
+def consume_queue(q, n, lock):
+    # Mirrors BitfinexWSS.process(): one lock and one get() per message
+    latencies = []
+    while len(latencies) < n:
+        if lock.acquire(blocking=False):
+            try:
+                ts, _ = q.get(timeout=0.1)
+            except queue.Empty:
+                pass
+            else:
+                latencies.append(time.perf_counter() - ts)
+            lock.release()
+    return latencies
+
+
+def produce_ring(ring, n):
+    for _ in range(n):
+        msg = time.perf_counter(), PAYLOAD
+        while not ring.put(msg):
+            time.sleep(0)
+
+
+def consume_ring(ring, n, lock, batch_size):
+    latencies = []
+    while len(latencies) < n:
+        if lock.acquire(blocking=False):
+            for ts, _ in ring.drain(batch_size, timeout=0.1):
+                latencies.append(time.perf_counter() - ts)
+            lock.release()
+    return latencies
+
+
+def run(producer, consumer, n):
+    start = time.perf_counter()
+    t = threading.Thread(target=producer, args=(n,))
+    t.start()
+    latencies = consumer(n)
+    elapsed = time.perf_counter() - start
+    t.join()
+    latencies.sort()
+    return {'msgs_per_sec': n / elapsed,
+            'p50_us': latencies[len(latencies) // 2] * 1e6,
+            'p99_us': latencies[int(len(latencies) * 0.99)] * 1e6}
+
+
+def main(n=200000, batch_size=100):
+    lock = threading.Lock()
+    q = queue.Queue(CAPACITY)
+    ring = RingBuffer(CAPACITY)
+    results = {
+        'queue.Queue': run(lambda n: produce_queue(q, n),
+                           lambda n: consume_queue(q, n, lock), n),
+        'RingBuffer': run(lambda n: produce_ring(ring, n),
+                          lambda n: consume_ring(ring, n, lock, batch_size),
+                          n),
+    }
+    for label, r in results.items():
+        print("%-12s %10.0f msg/s  p50 %8.1fus  p99 %8.1fus" %
+              (label, r['msgs_per_sec'], r['p50_us'], r['p99_us']))
+    print("speed-up: %.2fx" % (results['RingBuffer']['msgs_per_sec'] /
+                               results['queue.Queue']['msgs_per_sec']))
+    return results
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:3]])
@@ -0,0 +1,46 @@
+"""
+Measures the time a fresh interpreter takes to import bitex and resolve a
+REST-only interface, and fails if the median exceeds the budget.
+
+Usage:
+    python benchmarks/bench_import.py [budget_in_seconds] [runs]
+"""
+# Import Built-Ins
+import sys
+import statistics
+import subprocess
+
+# Modules which must not be loaded by the REST-only import path
+HEAVY_MODULES = ('autobahn', 'pusherclient', 'websocket', 'multiprocessing',
+                 'aiohttp')
+
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import bitex
+bitex.Kraken
+elapsed = time.perf_counter() - start
+print(elapsed, ','.join(m for m in %r if m in sys.modules))
+""" % (HEAVY_MODULES,)
+
+
+def measure():
+    out = subprocess.check_output([sys.executable, '-c', SCRIPT],
+                                  stderr=subprocess.DEVNULL)
+    elapsed, _, loaded = out.decode().strip().partition(' ')
+    return float(elapsed), [m for m in loaded.split(',') if m]
+
+
+def main(budget=0.5, runs=7):
+    results = [measure() for _ in range(runs)]
+    median = statistics.median(elapsed for elapsed, _ in results)
+    loaded = sorted({m for _, modules in results for m in modules})
+    print("import bitex; bitex.Kraken: median %.3fs over %d runs "
+          "(budget %.3fs)" % (median, runs, budget))
+    assert not loaded, "REST-only import loaded %s" % ', '.join(loaded)
+    assert median <= budget, "Import time exceeds budget!"
+    return median
+
+
+if __name__ == '__main__':
+    main(*[t(a) for t, a in zip((float, int), sys.argv[1:])])
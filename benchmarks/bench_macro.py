@@ -0,0 +1,49 @@
+"""
+Macro-benchmarks against the local stand-ins of bitex.simulator: sequential
+ticker polls through the Kraken interface, and a websocket book feed decoded
+and dispatched by BitfinexWSS.
+
+The simulators run in this process, so their share of the interpreter is
+measured as well; compare results of the same machine only.
+
+Usage:
+    python -m benchmarks.run --only macro
+"""
+# Import Built-Ins
+import time
+import json
+
+# Import Third-Party
+from websocket import create_connection
+
+# Import Homebrew
+from bitex.interfaces import Kraken
+from bitex.api.WSS.bitfinex import BitfinexWSS
+from bitex.simulator import Market, RESTSimulator, WSSSimulator
+from benchmarks.harness import benchmark, timed
+
+
+@benchmark('macro', n=10000, repeat=3)
+def kraken_ticker_polls(n):
+    with RESTSimulator(market=Market(seed=1)) as sim:
+        kraken = Kraken(url=sim.url('Kraken'), rate_limit=False,
+                        timings=False)
+        kraken.ticker('XBTUSD')  # warm up the connection pool
+        return timed(lambda: kraken.ticker('XBTUSD'), n)
+
+
+@benchmark('macro', n=1000000, repeat=3)
+def bitfinex_wss_frames(n):
+    wss = BitfinexWSS(pairs=['BTCUSD'])
+    wss.data_q.put = lambda item, **kwargs: None  # Only measure the handlers
+    with WSSSimulator(market=Market(seed=1), rate=None, limit=n) as sim:
+        conn = create_connection(sim.url('Bitfinex'), timeout=10)
+        try:
+            wss.handle_frame(conn.recv(), time.time())  # info
+            conn.send(json.dumps({'event': 'subscribe', 'channel': 'book',
+                                  'pair': 'BTCUSD', 'prec': 'P0'}))
+            # The subscription reply and book snapshot precede the n updates
+            recv, handle_frame = conn.recv, wss.handle_frame
+            return timed(lambda: handle_frame(recv(), time.time()), n + 2)
+        finally:
+            conn.close()
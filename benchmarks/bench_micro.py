@@ -0,0 +1,100 @@
+"""
+Micro-benchmarks of the hot paths of a REST query and of a websocket feed:
+signing, pair formatting, response processing and channel dispatch.
+
+Usage:
+    python -m benchmarks.run --only micro
+"""
+# Import Built-Ins
+import time
+import json
+import base64
+from itertools import cycle
+
+# Import Third-Party
+import requests
+
+# Import Homebrew
+from bitex.api.REST import KrakenREST
+from bitex.api.REST.response import APIResponse
+from bitex.api.WSS.bitfinex import BitfinexWSS
+from bitex.formatters.kraken import KrknFormatter
+from bitex.utils import return_api_response
+from benchmarks.harness import benchmark, timed
+
+TICKER = json.dumps({'error': [], 'result': {'XXBTZUSD': {
+    'a': ['2500.10000', '1', '1.000'], 'b': ['2499.90000', '2', '2.000'],
+    'c': ['2500.00000', '0.01000000'], 'v': ['120.5', '1300.25'],
+    'p': ['2495.1', '2490.3'], 't': [1200, 13000], 'l': ['2450.0', '2440.0'],
+    'h': ['2550.0', '2560.0'], 'o': '2480.00000'}}}).encode('utf-8')
+
+
+@benchmark('micro', n=20000)
+def kraken_sign(n):
+    client = KrakenREST(key='key', secret=base64.b64encode(b'secret' * 8),
+                        rate_limit=False, timings=False)
+    url = client.uri + '/0/private/AddOrder'
+
+    def op():
+        client.sign(url, 'AddOrder', '/0/private/AddOrder', 'POST',
+                    params={'pair': 'XXBTZUSD', 'type': 'buy',
+                            'ordertype': 'limit', 'price': '2500.1',
+                            'volume': '0.5'})
+    return timed(op, n)
+
+
+@benchmark('micro', n=100000)
+def kraken_format_pair(n):
+    pairs = cycle(('BTCUSD', 'ETHBTC', 'XXBTZEUR', 'LTCEUR', 'XETHZUSD'))
+    format_pair = KrknFormatter.format_pair
+    return timed(lambda: format_pair(next(pairs)), n)
+
+
+class _Client:
+    """
+    Returns canned ticker responses, as if queried from Kraken.
+    """
+    timings = None
+
+    def __init__(self):
+        self.raw = requests.Response()
+        self.raw.status_code = 200
+        self.raw._content = TICKER
+
+    @return_api_response(KrknFormatter.ticker)
+    def ticker(self, pair):
+        # A fresh response each time, so its json is decoded on every call
+        return APIResponse(self.raw)
+
+
+@benchmark('micro', n=20000)
+def return_api_response_ticker(n):
+    client = _Client()
+    return timed(lambda: client.ticker('XXBTZUSD'), n)
+
+
+def _bitfinex_book(n):
+    wss = BitfinexWSS(pairs=['BTCUSD'])
+    wss.data_q.put = lambda item, **kwargs: None  # Only measure the handlers
+    wss.handle_frame(json.dumps({'event': 'subscribed', 'channel': 'book',
+                                 'chanId': 7, 'pair': 'BTCUSD',
+                                 'prec': 'P0'}), time.time())
+    levels = [(2500 + i % 50, i % 3, 1.5 if i % 50 < 25 else -1.5)
+              for i in range(n)]
+    return wss, levels
+
+
+@benchmark('micro', n=100000)
+def bitfinex_handle_data(n):
+    wss, levels = _bitfinex_book(min(n, 1000))
+    messages = cycle([[7, list(level)] for level in levels])
+    ts = time.time()
+    return timed(lambda: wss.handle_data(ts, next(messages)), n)
+
+
+@benchmark('micro', n=100000)
+def bitfinex_handle_frame(n):
+    wss, levels = _bitfinex_book(min(n, 1000))
+    frames = cycle(['[7,[%d,%d,%s]]' % level for level in levels])
+    ts = time.time()
+    return timed(lambda: wss.handle_frame(next(frames), ts), n)
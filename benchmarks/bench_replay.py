@@ -0,0 +1,48 @@
+"""
+Measures how fast a capture can be read back with read_capture(), and
+replayed through BitfinexWSS.handle_frame() into its local order book.
+
+Usage:
+    python -m benchmarks.bench_replay [n_messages]
+"""
+# Import Built-Ins
+import sys
+import time
+import json
+import tempfile
+
+# Import Homebrew
+from bitex.api.WSS.capture import CaptureWriter, Replayer, read_capture
+from bitex.api.WSS.bitfinex import BitfinexWSS
+
+
+def write_capture(path, n):
+    with CaptureWriter(path) as writer:
+        writer.write(0.0, json.dumps({'event': 'subscribed', 'channel': 'book',
+                                      'chanId': 7, 'pair': 'BTCUSD',
+                                      'prec': 'P0'}))
+        for i in range(n):
+            price = 2500 + i % 50
+            amount = 1.5 if price < 2525 else -1.5
+            writer.write(i / 1000, '[7,[%d,%d,%s]]' % (price, i % 3, amount))
+
+
+def main(n=1000000):
+    with tempfile.TemporaryDirectory() as path:
+        write_capture(path, n)
+
+        start = time.perf_counter()
+        count = sum(1 for _ in read_capture(path))
+        elapsed = time.perf_counter() - start
+        print("read_capture  %10.0f msg/s" % (count / elapsed))
+
+        wss = BitfinexWSS(pairs=['BTCUSD'])
+        wss.data_q.put = lambda item: None  # Only measure the handlers
+        start = time.perf_counter()
+        count = Replayer(path, wss).run()
+        elapsed = time.perf_counter() - start
+        print("replay book   %10.0f msg/s" % (count / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:2]])
@@ -0,0 +1,43 @@
+"""
+Compares sequential REST queries with and without the pooled, keep-alive
+session of APIClient against a local stand-in server.
+
+Usage:
+    python -m benchmarks.bench_rest_pool [n_requests]
+"""
+# Import Built-Ins
+import sys
+import time
+
+# Import Homebrew
+from bitex.api.REST import KrakenREST
+from benchmarks.stub_server import StubServer
+
+
+def run(client, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        client.query('GET', 'public/Ticker', params={'pair': 'XXBTZEUR'})
+    return time.perf_counter() - start
+
+
+def main(n=1000):
+    server = StubServer().start()
+    results = {}
+    try:
+        for label, keep_alive in (('no pool', False), ('pooled', True)):
+            with KrakenREST(url=server.uri, keep_alive=keep_alive) as client:
+                run(client, 10)  # warm up
+                results[label] = run(client, n)
+    finally:
+        server.stop()
+
+    for label, elapsed in results.items():
+        print("%-8s %6d requests in %.3fs - %8.1f req/s, %.3f ms/req" %
+              (label, n, elapsed, n / elapsed, elapsed / n * 1000))
+    print("speed-up: %.2fx" % (results['no pool'] / results['pooled']))
+    return results
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,137 @@
+"""
+Registers, runs and compares the benchmarks of bench_micro and bench_macro.
+
+A benchmark is a function taking the number of operations to run, which
+returns the seconds those took - so that setup, such as starting a
+simulator, isn't measured. Each is run `repeat` times; the fastest run
+counts, as it's the one least disturbed by the rest of the system.
+
+Results are saved as json, and compared to a stored baseline: a benchmark
+regressed if its time per operation exceeds the baseline's by more than the
+threshold.
+"""
+# Import Built-Ins
+import sys
+import json
+import time
+import platform
+import statistics
+from collections import namedtuple, OrderedDict
+
+Benchmark = namedtuple('Benchmark', ('name', 'group', 'func', 'n', 'repeat'))
+
+BENCHMARKS = OrderedDict()
+
+
+def benchmark(group, n, repeat=5):
+    """
+    Decorator, registering a benchmark under the function's name.
+    :param group: str, 'micro' or 'macro'
+    :param n: int, default number of operations per run
+    :param repeat: int, number of runs
+    """
+    def register(func):
+        BENCHMARKS[func.__name__] = Benchmark(func.__name__, group, func, n,
+                                              repeat)
+        return func
+    return register
+
+
+def timed(op, n):
+    """
+    Calls op n times.
+    :return: float, seconds elapsed
+    """
+    start = time.perf_counter()
+    for _ in range(n):
+        op()
+    return time.perf_counter() - start
+
+
+def run(bench, scale=1.0):
+    """
+    :param bench: Benchmark
+    :param scale: factor applied to bench.n
+    :return: dict of n, repeat, best and median seconds per op and ops per
+             second of the best run
+    """
+    n = max(1, int(bench.n * scale))
+    times = [bench.func(n) / n for _ in range(bench.repeat)]
+    best = min(times)
+    return {'group': bench.group, 'n': n, 'repeat': bench.repeat,
+            'best': best, 'median': statistics.median(times),
+            'ops_per_sec': 1 / best if best else float('inf')}
+
+
+def run_all(names=None, scale=1.0, out=sys.stdout):
+    """
+    Runs the registered benchmarks, printing one line per benchmark.
+    :param names: iterable of str; substrings of the names to run, or None
+                  to run all
+    :param scale: factor applied to each benchmark's number of operations
+    :return: dict, as expected by save()
+    """
+    results = OrderedDict()
+    for bench in BENCHMARKS.values():
+        if names and not any(name in bench.name for name in names):
+            continue
+        results[bench.name] = result = run(bench, scale)
+        print("%-28s %12.3f us/op %14.0f op/s  (n=%d)" %
+              (bench.name, result['best'] * 1e6, result['ops_per_sec'],
+               result['n']), file=out, flush=True)
+    return {'meta': {'python': platform.python_version(),
+                     'implementation': platform.python_implementation(),
+                     'machine': platform.machine(),
+                     'time': time.strftime('%Y-%m-%dT%H:%M:%SZ',
+                                           time.gmtime())},
+            'results': results}
+
+
+def save(results, path):
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(results, baseline, threshold=0.25):
+    """
+    :param results: dict, as returned by run_all()
+    :param baseline: dict, as returned by run_all()
+    :param threshold: float, tolerated slow-down; 0.25 fails benchmarks
+                      taking more than 1.25 times the baseline's time per op
+    :return: list of (name, baseline seconds, seconds, ratio) of regressed
+             benchmarks
+    """
+    regressions = []
+    for name, result in results['results'].items():
+        try:
+            before = baseline['results'][name]['best']
+        except KeyError:
+            continue
+        ratio = result['best'] / before
+        if ratio > 1 + threshold:
+            regressions.append((name, before, result['best'], ratio))
+    return regressions
+
+
+def report(results, baseline, threshold=0.25, out=sys.stdout):
+    """
+    Prints the change of each benchmark relative to the baseline.
+    :return: list of regressions, see compare()
+    """
+    for name, result in results['results'].items():
+        try:
+            before = baseline['results'][name]['best']
+        except KeyError:
+            print("%-28s %12s" % (name, 'new'), file=out)
+            continue
+        ratio = result['best'] / before
+        print("%-28s %+11.1f%%%s" % (name, (ratio - 1) * 100,
+                                     '  REGRESSED' if ratio > 1 + threshold
+                                     else ''), file=out)
+    return compare(results, baseline, threshold)
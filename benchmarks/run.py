@@ -0,0 +1,73 @@
+"""
+Runs the micro- and macro-benchmarks, saves their results as json and
+compares them to a stored baseline; exits with status 1 if any benchmark
+regressed by more than the threshold.
+
+Usage:
+    python -m benchmarks.run [--only NAME ...] [--scale FACTOR]
+                             [--save PATH] [--baseline PATH]
+                             [--threshold FRACTION] [--update-baseline]
+"""
+# Import Built-Ins
+import os
+import sys
+import argparse
+
+# Import Homebrew
+from benchmarks import bench_micro, bench_macro  # Register the benchmarks
+from benchmarks.harness import BENCHMARKS, run_all, save, load, report
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'baseline.json')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--only', nargs='+', metavar='NAME',
+                        help="run benchmarks whose name contains NAME, or "
+                             "whose group ('micro', 'macro') is NAME")
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help="factor applied to each benchmark's number of "
+                             "operations, i.e. 0.1 for a quick run")
+    parser.add_argument('--save', metavar='PATH',
+                        help="write the results as json to PATH")
+    parser.add_argument('--baseline', metavar='PATH', default=BASELINE,
+                        help="results to compare to (default: %(default)s)")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="tolerated slow-down per op (default: "
+                             "%(default)s)")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="store the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    groups = [name for name in args.only or () if name in ('micro', 'macro')]
+    names = [name for name in args.only or () if name not in groups]
+    if groups:
+        names += [name for name, bench in BENCHMARKS.items()
+                  if bench.group in groups]
+    results = run_all(names, args.scale)
+
+    if args.save:
+        save(results, args.save)
+    if args.update_baseline:
+        if os.path.exists(args.baseline):
+            # Keep the baseline of benchmarks which weren't run
+            baseline = load(args.baseline)
+            baseline['results'].update(results['results'])
+            baseline['meta'] = results['meta']
+            results = baseline
+        save(results, args.baseline)
+        return 0
+    if not os.path.exists(args.baseline):
+        print("No baseline at %s; run with --update-baseline to store one."
+              % args.baseline)
+        return 0
+
+    print("\nCompared to %s (threshold %+.0f%%):" % (args.baseline,
+                                                    args.threshold * 100))
+    regressions = report(results, load(args.baseline), args.threshold)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Local stand-in HTTP server for benchmarks. Answers every GET and POST request
+with a small, static JSON payload and supports HTTP/1.1 keep-alive, so it can
+be used to measure client-side overhead without touching a real exchange.
+"""
+# Import Built-Ins
+import logging
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+# Import Third-Party
+
+# Import Homebrew
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+TICKER = json.dumps({'error': [], 'result': {'XXBTZEUR': {
+    'a': ['2500.00000', '1', '1.000'], 'b': ['2499.90000', '2', '2.000'],
+    'c': ['2500.00000', '0.01000000'], 'v': ['100.0', '1500.0'],
+    'p': ['2490.0', '2480.0'], 't': [100, 1500], 'l': ['2400.0', '2390.0'],
+    'h': ['2600.0', '2610.0'], 'o': '2450.00000'}}}).encode('utf-8')
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    payload = TICKER
+
+    def _respond(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(self.payload)))
+        self.end_headers()
+        self.wfile.write(self.payload)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host='127.0.0.1', port=0, handler=StubRequestHandler):
+        super(StubServer, self).__init__((host, port), handler)
+        self._thread = None
+
+    @property
+    def uri(self):
+        host, port = self.server_address[:2]
+        return 'http://%s:%s' % (host, port)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever,
+                                        daemon=True, name='Stub Server')
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
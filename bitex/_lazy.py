@@ -0,0 +1,58 @@
+"""
+Lazy module attributes, so importing a package does not import all of its
+submodules - and their dependencies - up front.
+
+Usage, at the end of a package's __init__.py:
+
+    from bitex._lazy import lazy_attributes
+    lazy_attributes(__name__, {'Kraken': 'bitex.interfaces.kraken'})
+
+Accessing bitex.Kraken then imports bitex.interfaces.kraken and caches its
+Kraken attribute on the package. Module level __getattr__ (PEP 562) needs
+Python 3.7, so instead the module's class is swapped for a ModuleType subclass
+implementing __getattr__, which works from Python 3.5 on.
+"""
+# Import Built-Ins
+import sys
+import types
+import importlib
+
+# Import Third-Party
+
+# Import Homebrew
+
+
+class LazyModule(types.ModuleType):
+    """
+    Module resolving the attributes listed in its _lazy_attributes dict on
+    first access.
+    """
+    def __getattr__(self, name):
+        try:
+            module_name = self.__dict__['_lazy_attributes'][name]
+        except KeyError:
+            raise AttributeError("module %r has no attribute %r" %
+                                 (self.__name__, name))
+        module = importlib.import_module(module_name)
+        # Submodules are resolved to themselves
+        value = (module if module_name == self.__name__ + '.' + name
+                 else getattr(module, name))
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(super(LazyModule, self).__dir__()) |
+                      set(self.__dict__['_lazy_attributes']))
+
+
+def lazy_attributes(module_name, attributes):
+    """
+    Makes the given module resolve the given attributes lazily.
+    :param module_name: str, name of the module, i.e. __name__
+    :param attributes: dict of attribute name: name of the module defining it;
+                       for submodules, the submodule's full name
+    """
+    module = sys.modules[module_name]
+    module._lazy_attributes = dict(attributes)
+    module.__all__ = sorted(attributes)
+    module.__class__ = LazyModule
@@ -0,0 +1,356 @@
+"""
+Order book analytics - cumulative depth, VWAP, slippage, price impact and
+imbalance.
+
+BookAnalytics works on order books as returned by the interfaces'
+order_book() methods, i.e. the formatted lists of [ts, price, size] quotes,
+or the arrays returned with arrays=True. The cumulative sizes and notionals of
+each side are computed in a single pass, after which each query is a binary
+search:
+
+    >>> book = BookAnalytics(Kraken().order_book('XXBTZEUR').formatted)
+    >>> book.vwap(5, 'buy')       # average price paid to buy 5 BTC
+    >>> book.slippage(5, 'buy')   # relative to the best ask
+    >>> book.imbalance(levels=10)
+
+IncrementalAnalytics is a PriceLevelBook which maintains the total size and
+notional of each side as updates are applied, so imbalance and totals need no
+rescan, and fill queries only walk the levels they consume.
+
+Sides are given as 'buy' or 'asks' (buying consumes the asks), and 'sell' or
+'bids'.
+"""
+# Import Built-Ins
+import logging
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+# Import Third-Party
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
+# Import Homebrew
+from bitex.api.WSS.orderbook import PriceLevelBook
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+SIDES = {'buy': 'asks', 'asks': 'asks', 'sell': 'bids', 'bids': 'bids'}
+
+
+def _book_side(side):
+    try:
+        return SIDES[side]
+    except KeyError:
+        raise ValueError("side must be one of %s!" % sorted(SIDES))
+
+
+def _imbalance(bid_size, ask_size):
+    total = bid_size + ask_size
+    return (bid_size - ask_size) / total if total else 0.0
+
+
+def _microprice(bid, ask):
+    """
+    Size-weighted mid price of the best bid and ask, each (price, size).
+    """
+    (bid_price, bid_size), (ask_price, ask_size) = bid, ask
+    total = bid_size + ask_size
+    if not total:
+        return (bid_price + ask_price) / 2
+    return (bid_price * ask_size + ask_price * bid_size) / total
+
+
+class _Side:
+    """
+    Prices of one side of a book, best first, with cumulative sizes and
+    notionals.
+    """
+    __slots__ = ('prices', 'cum_size', 'cum_notional', 'keys')
+
+    def __init__(self, quotes, bids):
+        if isinstance(quotes, dict):
+            # Arrays, as returned by order_book(..., arrays=True)
+            prices, sizes = quotes['price'], quotes['size']
+            self.cum_size = numpy.cumsum(sizes)
+            self.cum_notional = numpy.cumsum(prices * sizes)
+            self.keys = -prices if bids else prices
+        else:
+            prices = [float(q[1]) for q in quotes]
+            sizes = [float(q[2]) for q in quotes]
+            self.cum_size = list(accumulate(sizes))
+            self.cum_notional = list(accumulate(
+                p * s for p, s in zip(prices, sizes)))
+            self.keys = [-p for p in prices] if bids else prices
+        self.prices = prices
+
+    def __len__(self):
+        return len(self.prices)
+
+    def best(self):
+        if not len(self.prices):
+            return None
+        return float(self.prices[0]), float(self.cum_size[0])
+
+    def fill(self, size):
+        if not len(self.prices) or size <= 0:
+            return 0.0, 0.0, None
+        i = bisect_left(self.cum_size, size)
+        if i >= len(self.prices):
+            # Not enough depth to fill size
+            return (float(self.cum_size[-1]), float(self.cum_notional[-1]),
+                    float(self.prices[-1]))
+        filled, notional = ((self.cum_size[i - 1], self.cum_notional[i - 1])
+                            if i else (0.0, 0.0))
+        price = float(self.prices[i])
+        return size, float(notional + (size - filled) * price), price
+
+    def size_within(self, price, bids):
+        n = bisect_right(self.keys, -price if bids else price)
+        return float(self.cum_size[n - 1]) if n else 0.0
+
+    def size_of(self, levels):
+        n = len(self.prices) if levels is None else min(levels,
+                                                        len(self.prices))
+        return float(self.cum_size[n - 1]) if n else 0.0
+
+
+class _Analytics:
+    """
+    Queries shared by BookAnalytics and IncrementalAnalytics, based on
+    fill(), best() and size_of().
+    """
+    def mid(self):
+        """
+        :return: float, or None if a side is empty
+        """
+        bid, ask = self.best('bids'), self.best('asks')
+        if bid is None or ask is None:
+            return None
+        return (bid[0] + ask[0]) / 2
+
+    def spread(self):
+        bid, ask = self.best('bids'), self.best('asks')
+        if bid is None or ask is None:
+            return None
+        return ask[0] - bid[0]
+
+    def microprice(self):
+        """
+        Mid price weighted by the sizes at the best bid and ask; closer to
+        the ask if there is more size bid, and vice versa.
+        :return: float, or None if a side is empty
+        """
+        bid, ask = self.best('bids'), self.best('asks')
+        if bid is None or ask is None:
+            return None
+        return _microprice(bid, ask)
+
+    def cost(self, size, side='buy'):
+        """
+        Returns the notional of filling size against the book.
+        :param size: float, in base currency
+        :param side: 'buy' or 'sell'
+        :return: float; if the book lacks depth, the cost of what is available
+        """
+        return self.fill(size, side)[1]
+
+    def vwap(self, size, side='buy'):
+        """
+        Returns the average price of filling size against the book; if it
+        lacks the depth, the average price of all available size.
+        :param size: float, in base currency
+        :param side: 'buy' or 'sell'
+        :return: float, or None if the side is empty
+        """
+        filled, notional, _ = self.fill(size, side)
+        return notional / filled if filled else None
+
+    def slippage(self, size, side='buy'):
+        """
+        Returns how much worse the average price of filling size is than the
+        best price, as a fraction of the best price.
+        :param size: float, in base currency
+        :param side: 'buy' or 'sell'
+        :return: float, or None if the side is empty
+        """
+        vwap = self.vwap(size, side)
+        if vwap is None:
+            return None
+        best = self.best(side)[0]
+        return ((vwap - best) if _book_side(side) == 'asks'
+                else (best - vwap)) / best
+
+    def impact(self, size, side='buy'):
+        """
+        Returns how far filling size moves the price, i.e. the distance of
+        the last price level it reaches from the mid price, as a fraction of
+        the mid price.
+        :param size: float, in base currency
+        :param side: 'buy' or 'sell'
+        :return: float, or None if a side is empty
+        """
+        mid = self.mid()
+        last = self.fill(size, side)[2]
+        if mid is None or last is None:
+            return None
+        return abs(last - mid) / mid
+
+    def impact_curve(self, sizes, side='buy'):
+        """
+        :param sizes: iterable of floats
+        :return: list of (size, vwap, impact)
+        """
+        return [(size, self.vwap(size, side), self.impact(size, side))
+                for size in sizes]
+
+    def imbalance(self, levels=None):
+        """
+        Returns (bid size - ask size) / (bid size + ask size), over the given
+        number of best levels per side.
+        :param levels: int, or None for all levels
+        :return: float between -1 and 1
+        """
+        return _imbalance(self.size_of('bids', levels),
+                          self.size_of('asks', levels))
+
+
+class BookAnalytics(_Analytics):
+    """
+    Analytics of an order book as returned by an interface's order_book().
+    """
+    def __init__(self, book):
+        """
+        :param book: dict of 'bids' and 'asks', each a list of
+                     [ts, price, size] quotes best first, or a dict of arrays
+                     as returned by order_book(..., arrays=True)
+        """
+        if any(isinstance(book.get(s), dict) for s in ('bids', 'asks')):
+            if not numpy_available:
+                raise SystemError("No numpy installed! Cannot analyze "
+                                  "arrays!")
+        self._sides = {s: _Side(book.get(s) or [], s == 'bids')
+                       for s in ('bids', 'asks')}
+
+    def best(self, side):
+        """
+        :return: best (price, size) of the side, or None if it's empty
+        """
+        return self._sides[_book_side(side)].best()
+
+    def fill(self, size, side='buy'):
+        """
+        Fills size against the book.
+        :param size: float, in base currency
+        :param side: 'buy' or 'sell'
+        :return: tuple of filled size, notional, and the last price level
+                 reached (None if the side is empty)
+        """
+        return self._sides[_book_side(side)].fill(size)
+
+    def size_of(self, side, levels=None):
+        """
+        :return: total size of the given number of best levels
+        """
+        return self._sides[_book_side(side)].size_of(levels)
+
+    def depth(self, side):
+        """
+        Returns the cumulative depth curve of a side.
+        :return: tuple of prices and cumulative sizes, best first
+        """
+        s = self._sides[_book_side(side)]
+        return s.prices, s.cum_size
+
+    def size_within(self, price, side):
+        """
+        Returns the size offered at prices up to (asks) or down to (bids)
+        the given price.
+        :param price: float
+        :param side: 'buy' or 'sell'
+        :return: float
+        """
+        side = _book_side(side)
+        return self._sides[side].size_within(price, side == 'bids')
+
+
+class IncrementalAnalytics(PriceLevelBook, _Analytics):
+    """
+    PriceLevelBook which keeps each side's total size and notional up to
+    date as updates are applied.
+    """
+    def __init__(self):
+        super(IncrementalAnalytics, self).__init__()
+        self._totals = {'bids': [0.0, 0.0], 'asks': [0.0, 0.0]}
+
+    def _set(self, side, price, size):
+        totals = self._totals[side]
+        old = self._sizes[side].get(price, 0)
+        super(IncrementalAnalytics, self)._set(side, price, size)
+        totals[0] += size - old
+        totals[1] += (size - old) * price
+
+    def reset(self, bids=(), asks=(), ts=None):
+        super(IncrementalAnalytics, self).reset(bids, asks, ts)
+        with self._lock:
+            self._totals = {
+                side: [sum(sizes.values()),
+                       sum(p * s for p, s in sizes.items())]
+                for side, sizes in self._sizes.items()}
+
+    def _levels(self, side):
+        """
+        Iterates over a side's price levels, best first. Must be called while
+        holding self._lock.
+        """
+        prices, sizes = self._prices[side], self._sizes[side]
+        for price in (reversed(prices) if side == 'bids' else prices):
+            yield price, sizes[price]
+
+    def best(self, side):
+        side = _book_side(side)
+        return self.best_bid() if side == 'bids' else self.best_ask()
+
+    def total(self, side):
+        """
+        Returns a side's total size and notional.
+        :return: tuple of floats
+        """
+        with self._lock:
+            return tuple(self._totals[_book_side(side)])
+
+    def fill(self, size, side='buy'):
+        """
+        Fills size against the book, walking only the levels needed.
+        :return: see BookAnalytics.fill()
+        """
+        side = _book_side(side)
+        filled = notional = 0.0
+        last = None
+        if size <= 0:
+            return filled, notional, last
+        with self._lock:
+            for price, level in self._levels(side):
+                take = min(level, size - filled)
+                filled += take
+                notional += take * price
+                last = price
+                if filled >= size:
+                    break
+        return filled, notional, last
+
+    def size_of(self, side, levels=None):
+        side = _book_side(side)
+        with self._lock:
+            if levels is None:
+                return self._totals[side][0]
+            total = 0.0
+            for i, (_, size) in enumerate(self._levels(side)):
+                if i >= levels:
+                    break
+                total += size
+            return total
@@ -0,0 +1,191 @@
+"""
+asyncio based counterpart to APIClient. Requests are signed by the exchange's
+regular sign() method, and sent via aiohttp, allowing many concurrent queries
+on a single event loop.
+"""
+# Import Built-ins
+import logging
+import time
+import asyncio
+from datetime import timedelta
+
+# Import Third-Party
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import aiohttp
+    import yarl
+    aiohttp_available = True
+except ImportError:
+    aiohttp_available = False
+
+# Import Homebrew
+from bitex.api.REST.api import APIClient
+from bitex.api.REST.response import APIResponse
+from bitex.api.REST.ratelimit import RateLimitExceeded
+
+
+log = logging.getLogger(__name__)
+
+
+# Keyword arguments sign() may return, which are understood by requests.Request
+REQUEST_KWARGS = ('headers', 'files', 'data', 'params', 'auth', 'cookies',
+                  'hooks', 'json')
+
+
+class AsyncAPIClient(APIClient):
+    """
+    Mixin turning an exchange's API Client into an asynchronous one. It must
+    precede the exchange class in the list of bases:
+
+        class AsyncKraken(AsyncAPIClient, Kraken):
+            pass
+
+    query() becomes a coroutine, and so do all methods decorated with
+    bitex.utils.return_api_response(), which still return APIResponse objects.
+
+    Requests are built and signed exactly as in the synchronous client, then
+    prepared by requests (which also applies AuthBase objects, as used by GDAX)
+    and sent through a pooled aiohttp.ClientSession.
+    """
+
+    def __init__(self, *args, **kwargs):
+        if not aiohttp_available:
+            raise SystemError("No aiohttp installed! "
+                              "Async API Clients unavailable!")
+        super(AsyncAPIClient, self).__init__(*args, **kwargs)
+        self._async_session = None
+        if self.cache is not None:
+            log.warning("AsyncAPIClient: Response caching is not supported "
+                        "by async clients - disabling it.")
+            self.cache = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    @property
+    def async_session(self):
+        """
+        Pooled aiohttp.ClientSession, created on first access; this must happen
+        from within a running event loop.
+        :return: aiohttp.ClientSession() obj
+        """
+        if self._async_session is None or self._async_session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size,
+                                             force_close=not self.keep_alive)
+            self._async_session = aiohttp.ClientSession(connector=connector)
+        return self._async_session
+
+    async def close(self):
+        """
+        Closes the aiohttp session and all its pooled connections.
+        """
+        super(AsyncAPIClient, self).close()
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+
+    async def api_request(self, method_verb, url, timeout=None, **kwargs):
+        """
+        Sends the request via aiohttp and converts the result into our custom
+        APIResponse object.
+        :param method_verb: valid request type (PUT, GET, POST etc)
+        :param url: str
+        :param timeout: total timeout for the request in seconds
+        :param kwargs: kwargs as accepted by requests.Request
+        :return: APIResponse
+        """
+        unsupported = [k for k in kwargs if k not in REQUEST_KWARGS]
+        for k in unsupported:
+            log.warning("AsyncAPIClient.api_request(): Ignoring unsupported "
+                        "request parameter %s", k)
+            kwargs.pop(k)
+
+        prepared = requests.Request(method_verb, url, **kwargs).prepare()
+        headers = {k: v.decode('utf-8') if isinstance(v, bytes) else v
+                   for k, v in prepared.headers.items()}
+
+        start = time.time()
+        async with self.async_session.request(
+                prepared.method, yarl.URL(prepared.url, encoded=True),
+                headers=headers, data=prepared.body,
+                timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+            headers_received = time.time()
+            content = await resp.read()
+
+        r = requests.Response()
+        r.status_code = resp.status
+        r.reason = resp.reason
+        r.headers = CaseInsensitiveDict(resp.headers)
+        r.encoding = get_encoding_from_headers(r.headers)
+        r.url = str(resp.url)
+        r.request = prepared
+        r.elapsed = timedelta(seconds=headers_received - start)
+        r._content = content
+        return APIResponse(r)
+
+    async def throttle(self, authenticate=False):
+        """
+        Coroutine version of APIClient.throttle(), which waits for the rate
+        limiter without blocking the event loop.
+        :param authenticate: Bool, whether the query is private
+        """
+        if self.rate_limiter is None:
+            return
+        endpoint_class = 'private' if authenticate else 'public'
+        host = self.rate_limiter.host(self.uri)
+        bucket = self.rate_limiter.bucket(host, endpoint_class)
+        if bucket is None:
+            return
+        wait = bucket.reserve(max_wait=None if self.rate_limit_blocking else 0)
+        if wait is None:
+            raise RateLimitExceeded("Rate limit for %s queries to %s "
+                                    "exceeded!" % (endpoint_class, host))
+        if wait:
+            await asyncio.sleep(wait)
+
+    async def query(self, method_verb, endpoint, authenticate=False,
+                    *args, **kwargs):
+        """
+        Queries exchange using given data. Defaults to unauthenticated query.
+        See APIClient.query().
+        :return: APIResponse
+        """
+        attempts = self._attempts(method_verb, authenticate, kwargs)
+        while True:
+            await self.throttle(authenticate)
+            start = time.perf_counter()
+            url, request_kwargs = self.prepare_request(
+                method_verb, endpoint, authenticate, *args,
+                **self._attempt_kwargs(attempts, kwargs))
+            signed = time.perf_counter()
+            log.debug("Making request to: %s, kwargs: %s", url, request_kwargs)
+            timeout = (attempts.timeout(self.timeout) if attempts
+                       else self.timeout)
+            try:
+                r = await self.api_request(method_verb, url, timeout=timeout,
+                                           **request_kwargs)
+                self.record_timings(endpoint, signed - start, r,
+                                    time.perf_counter() - signed)
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as e:
+                delay = attempts.next_delay() if attempts else None
+                if delay is None:
+                    raise
+                log.warning("%s request to %s failed (%r) - retrying in "
+                            "%.2fs", method_verb, url, e, delay)
+            else:
+                log.debug("Made %s request made to %s, with headers %s and "
+                          "body %s. Status code %s", r.request.method,
+                          r.request.url, r.request.headers,
+                          r.request.body, r.status_code)
+                delay = attempts.next_delay(r) if attempts else None
+                if delay is None:
+                    return r
+                log.warning("%s request to %s returned status %s - retrying "
+                            "in %.2fs", method_verb, url, r.status_code, delay)
+            await asyncio.sleep(delay)
@@ -8,9 +8,15 @@ from abc import ABCMeta, abstractmethod
 
 # Import Third-Party
 import requests
+from requests.adapters import HTTPAdapter
 
 # Import Homebrew
 from bitex.api.REST.response import APIResponse
+from bitex.api.REST import ratelimit
+from bitex.api.REST import retry as retries
+from bitex.api.REST.ratelimit import RateLimitExceeded
+from bitex.cache import default_cache
+from bitex import timing
 
 log = logging.getLogger(__name__)
 
@@ -22,19 +28,52 @@ class APIClient(metaclass=ABCMeta):
     authentication.
     """
 
-    def __init__(self, uri, api_version=None, key=None, secret=None, timeout=5):
+    def __init__(self, uri, api_version=None, key=None, secret=None, timeout=5,
+                 pool_size=10, keep_alive=True, rate_limit=False,
+                 rate_limit_blocking=True, cache=None, retry=True,
+                 timings=True):
         """
         Create API Client object.
         :param uri: string address for api (i.e. https://api.kraken.com/
         :param api_version: version, as required to query an endpoint
         :param key: API access key
         :param secret: API secret
+        :param pool_size: max number of connections kept open to the exchange
+        :param keep_alive: if False, every request opens a new connection
+        :param rate_limit: True to use the shared, default rate limiter, or a
+                           RateLimiter instance; False (default) disables
+                           rate limiting
+        :param rate_limit_blocking: if False, queries raise RateLimitExceeded
+                                    instead of waiting for the rate limiter
+        :param cache: True to cache the responses of public market data
+                      methods in the shared, default cache, or a
+                      bitex.cache.ResponseCache instance; None disables caching
+        :param retry: True to retry failed queries with the default policy,
+                      False to disable retries, or a
+                      bitex.api.REST.retry.RetryPolicy instance
+        :param timings: True to record the duration of each query's phases
+                        in the shared bitex.timing.timings registry, False to
+                        disable it, or a bitex.timing.Timings instance
         """
         self.key = key
         self.secret = secret
         self.uri = uri
         self.version = api_version if api_version else ''
         self.timeout = timeout
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        self._session = None
+        if rate_limit is True:
+            self.rate_limiter = ratelimit.limiter
+        else:
+            self.rate_limiter = rate_limit or None
+        self.rate_limit_blocking = rate_limit_blocking
+        self.cache = default_cache if cache is True else cache
+        if retry is True:
+            self.retry = retries.default_policy
+        else:
+            self.retry = retry or None
+        self.timings = timing.timings if timings is True else timings or None
         log.debug("Initialized API Client for URI: %s; "
                   "Will request on API version: %s" %
                   (self.uri, self.version))
@@ -55,8 +94,39 @@ class APIClient(metaclass=ABCMeta):
         """
         return str(round(100000 * time.time()) * 2) 
 
-    @staticmethod
-    def api_request(*args, **kwargs):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def session(self):
+        """
+        Pooled requests.Session, created on first access. Connections are kept
+        alive and reused across queries, saving a TCP and TLS handshake per
+        request.
+        :return: requests.Session() obj
+        """
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1,
+                                  pool_maxsize=self.pool_size)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._session = session
+        return self._session
+
+    def close(self):
+        """
+        Closes all pooled connections. The client remains usable; a new pool
+        is created on the next query.
+        """
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def api_request(self, *args, **kwargs):
         """
         Wrapper which converts a requests.Response into our custom APIResponse
         object
@@ -64,7 +134,10 @@ class APIClient(metaclass=ABCMeta):
         :param kwargs:
         :return:
         """
-        r = requests.request(*args, **kwargs)
+        if self.keep_alive:
+            r = self.session.request(*args, **kwargs)
+        else:
+            r = requests.request(*args, **kwargs)
         return APIResponse(r)
 
     @abstractmethod
@@ -83,18 +156,35 @@ class APIClient(metaclass=ABCMeta):
 
         return url, {'params': {'test_param': "authenticated_chimichanga"}}
 
-    def query(self, method_verb, endpoint, authenticate=False,
-              *args, **kwargs):
+    def throttle(self, authenticate=False):
         """
-        Queries exchange using given data. Defaults to unauthenticated query.
+        Takes a token from the rate limiter's bucket for this exchange's
+        public or private queries, waiting for one to become available if
+        self.rate_limit_blocking is True.
+        :param authenticate: Bool, whether the query is private
+        """
+        if self.rate_limiter is None:
+            return
+        endpoint_class = 'private' if authenticate else 'public'
+        host = self.rate_limiter.host(self.uri)
+        if not self.rate_limiter.acquire(host, endpoint_class,
+                                         blocking=self.rate_limit_blocking):
+            raise RateLimitExceeded("Rate limit for %s queries to %s "
+                                    "exceeded!" % (endpoint_class, host))
+
+    def prepare_request(self, method_verb, endpoint, authenticate=False,
+                        *args, **kwargs):
+        """
+        Builds the url and the keyword arguments for the request, signing them
+        if authentication is required.
         :param method_verb: valid request type (PUT, GET, POST etc)
         :param endpoint: endpoint path for the resource to query, sans the url &
                          API version (i.e. '/btcusd/ticker/').
         :param authenticate: Bool to determine whether or not a signature is
                              required.
-        :param args: Optional args for requests.request()
+        :param args: Optional args for self.sign()
         :param kwargs: Optional Kwargs for self.sign() and requests.request()
-        :return: request.response() obj
+        :return: tuple of url (str) and request kwargs (dict)
         """
         if self.version:
             endpoint_path = '/' + self.version + '/' + endpoint
@@ -107,11 +197,93 @@ class APIClient(metaclass=ABCMeta):
                                             method_verb, *args, **kwargs)
         else:
             request_kwargs = kwargs
-        log.debug("Making request to: %s, kwargs: %s", url, request_kwargs)
-        r = self.api_request(method_verb, url, timeout=self.timeout,
-                             **request_kwargs)
-        log.debug("Made %s request made to %s, with headers %s and body %s. "
-                  "Status code %s", r.request.method,
-                  r.request.url, r.request.headers,
-                  r.request.body, r.status_code)
-        return r
+        return url, request_kwargs
+
+    def query(self, method_verb, endpoint, authenticate=False,
+              *args, **kwargs):
+        """
+        Queries exchange using given data. Defaults to unauthenticated query.
+        :param method_verb: valid request type (PUT, GET, POST etc)
+        :param endpoint: endpoint path for the resource to query, sans the url &
+                         API version (i.e. '/btcusd/ticker/').
+        :param authenticate: Bool to determine whether or not a signature is
+                             required.
+        :param args: Optional args for requests.request()
+        :param kwargs: Optional Kwargs for self.sign() and requests.request()
+        :return: request.response() obj
+        """
+        attempts = self._attempts(method_verb, authenticate, kwargs)
+        while True:
+            self.throttle(authenticate)
+            start = time.perf_counter()
+            # Signed anew for every attempt, as nonces mustn't be reused
+            url, request_kwargs = self.prepare_request(
+                method_verb, endpoint, authenticate, *args,
+                **self._attempt_kwargs(attempts, kwargs))
+            signed = time.perf_counter()
+            log.debug("Making request to: %s, kwargs: %s", url, request_kwargs)
+            timeout = (attempts.timeout(self.timeout) if attempts
+                       else self.timeout)
+            try:
+                r = self.api_request(method_verb, url, timeout=timeout,
+                                     **request_kwargs)
+                self.record_timings(endpoint, signed - start, r,
+                                    time.perf_counter() - signed)
+            except (requests.Timeout, requests.ConnectionError) as e:
+                delay = attempts.next_delay() if attempts else None
+                if delay is None:
+                    raise
+                log.warning("%s request to %s failed (%s) - retrying in "
+                            "%.2fs", method_verb, url, e, delay)
+            else:
+                log.debug("Made %s request made to %s, with headers %s and "
+                          "body %s. Status code %s", r.request.method,
+                          r.request.url, r.request.headers,
+                          r.request.body, r.status_code)
+                delay = attempts.next_delay(r) if attempts else None
+                if delay is None:
+                    return r
+                log.warning("%s request to %s returned status %s - retrying "
+                            "in %.2fs", method_verb, url, r.status_code, delay)
+            time.sleep(delay)
+
+    def record_timings(self, endpoint, sign, r, request):
+        """
+        Records the durations of a query's phases up to the download of the
+        response, if timings are enabled.
+        :param endpoint: str, used if not queried by an interface method
+        :param sign: float, seconds spent building and signing the request
+        :param r: APIResponse, whose elapsed attribute holds the time to the
+                  response headers
+        :param request: float, seconds spent sending the request and reading
+                        the response
+        """
+        if self.timings is None:
+            return
+        exchange = self.__class__.__name__
+        endpoint = timing.method.get() or endpoint
+        ttfb = min(r.elapsed.total_seconds(), request)
+        self.timings.record(exchange, endpoint, 'sign', sign)
+        self.timings.record(exchange, endpoint, 'ttfb', ttfb)
+        self.timings.record(exchange, endpoint, 'download', request - ttfb)
+
+    def _attempts(self, method_verb, authenticate, kwargs):
+        """
+        Returns a retry.Attempts object tracking the attempts of a query, or
+        None if it must not be retried.
+        """
+        if (self.retry is None or
+                not self.retry.retryable(method_verb, kwargs, authenticate)):
+            return None
+        return self.retry.start()
+
+    @staticmethod
+    def _attempt_kwargs(attempts, kwargs):
+        """
+        Copies the request parameters for an attempt, as sign() may modify
+        them.
+        """
+        if attempts is None:
+            return kwargs
+        return {k: dict(v) if isinstance(v, dict) else v
+                for k, v in kwargs.items()}
@@ -18,10 +18,10 @@ log = logging.getLogger(__name__)
 
 class BitfinexREST(APIClient):
     def __init__(self, key=None, secret=None, api_version='v1',
-                 url='https://api.bitfinex.com', timeout=5):
+                 url='https://api.bitfinex.com', timeout=5, **kwargs):
         super(BitfinexREST, self).__init__(url, api_version=api_version,
                                            key=key, secret=secret,
-                                           timeout=timeout)
+                                           timeout=timeout, **kwargs)
 
     def sign(self, url, endpoint, endpoint_path, method_verb, *args, **kwargs):
         try:
@@ -16,11 +16,11 @@ log = logging.getLogger(__name__)
 
 class BitstampREST(APIClient):
     def __init__(self, user_id='', key=None, secret=None, api_version=None,
-                 url='https://www.bitstamp.net/api', timeout=5):
+                 url='https://www.bitstamp.net/api', timeout=5, **kwargs):
         self.id = user_id
         super(BitstampREST, self).__init__(url, api_version=api_version,
                                            key=key, secret=secret,
-                                           timeout=timeout)
+                                           timeout=timeout, **kwargs)
 
     def load_key(self, path):
         """Load key and secret from file."""
@@ -19,9 +19,10 @@ log = logging.getLogger(__name__)
 
 class BittrexREST(APIClient):
     def __init__(self, key=None, secret=None, api_version='v1.1',
-                 url='https://bittrex.com/api', timeout=5):
+                 url='https://bittrex.com/api', timeout=5, **kwargs):
         super(BittrexREST, self).__init__(url, api_version=api_version, key=key,
-                                          secret=secret, timeout=timeout)
+                                          secret=secret,
+                                          timeout=timeout, **kwargs)
 
     def sign(self, url, endpoint, endpoint_path, method_verb, *args, **kwargs):
 
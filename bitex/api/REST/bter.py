@@ -18,11 +18,11 @@ log = logging.getLogger(__name__)
 
 class BterREST(APIClient):
     def __init__(self, key=None, secret=None, api_version=None,
-                 url='http://data.bter.com/api', timeout=5):
+                 url='http://data.bter.com/api', timeout=5, **kwargs):
         api_version = '1' if not api_version else api_version
         super(BterREST, self).__init__(url, api_version=api_version,
                                            key=key, secret=secret,
-                                           timeout=timeout)
+                                           timeout=timeout, **kwargs)
 
     def sign(self, uri, endpoint, endpoint_path, method_verb, *args, **kwargs):
         try:
@@ -18,9 +18,10 @@ log = logging.getLogger(__name__)
 
 class CCEXRest(APIClient):
     def __init__(self, key=None, secret=None, api_version=None,
-                 url='https://c-cex.com/t', timeout=5):
+                 url='https://c-cex.com/t', timeout=5, **kwargs):
         super(CCEXRest, self).__init__(url, api_version=api_version, key=key,
-                                         secret=secret, timeout=timeout)
+                                         secret=secret,
+                                         timeout=timeout, **kwargs)
 
     def sign(self, uri, endpoint, endpoint_path, method_verb, *args, **kwargs):
         nonce = self.nonce()
@@ -17,10 +17,10 @@ log = logging.getLogger(__name__)
 
 class CoincheckREST(APIClient):
     def __init__(self, key=None, secret=None, api_version='api',
-                 url='https://coincheck.com', timeout=5):
+                 url='https://coincheck.com', timeout=5, **kwargs):
         super(CoincheckREST, self).__init__(url, api_version=api_version,
                                             key=key, secret=secret,
-                                            timeout=timeout)
+                                            timeout=timeout, **kwargs)
 
     def sign(self, url, endpoint, endpoint_path, method_verb, *args, **kwargs):
 
@@ -20,9 +20,10 @@ log = logging.getLogger(__name__)
 
 class CryptopiaREST(APIClient):
     def __init__(self, key=None, secret=None, api_version=None,
-                 url='https://www.cryptopia.co.nz/api', timeout=5):
+                 url='https://www.cryptopia.co.nz/api', timeout=5, **kwargs):
         super(CryptopiaREST, self).__init__(url, api_version=api_version, key=key,
-                                         secret=secret, timeout=timeout)
+                                         secret=secret,
+                                         timeout=timeout, **kwargs)
 
     def sign(self, uri, endpoint, endpoint_path, method_verb, *args, **kwargs):
         nonce = self.nonce()
@@ -45,10 +45,10 @@ class GdaxAuth(AuthBase):
 
 class GDAXRest(APIClient):
     def __init__(self, passphrase='', key=None, secret=None, api_version=None,
-                 url='https://api.gdax.com', timeout=5):
+                 url='https://api.gdax.com', timeout=5, **kwargs):
         self.passphrase = passphrase
         super(GDAXRest, self).__init__(url, api_version=api_version, key=key,
-                                       secret=secret, timeout=timeout)
+                                       secret=secret, timeout=timeout, **kwargs)
 
     def load_key(self, path):
         """
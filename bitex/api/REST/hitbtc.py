@@ -18,11 +18,11 @@ log = logging.getLogger(__name__)
 
 class HitBTCREST(APIClient):
     def __init__(self, key=None, secret=None, api_version='1',
-                 url='http://api.hitbtc.com/', timeout=5):
+                 url='http://api.hitbtc.com/', timeout=5, **kwargs):
         api_version = '' if not api_version else api_version
         super(HitBTCREST, self).__init__(url, api_version=api_version,
                                          key=key, secret=secret,
-                                         timeout=timeout)
+                                         timeout=timeout, **kwargs)
 
     def sign(self, uri, endpoint, endpoint_path, method_verb, *args, **kwargs):
         try:
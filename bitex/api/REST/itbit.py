@@ -18,10 +18,11 @@ log = logging.getLogger(__name__)
 
 class ItbitREST(APIClient):
     def __init__(self, user_id = '', key=None, secret=None, api_version='v1',
-                 url='https://api.itbit.com', timeout=5):
+                 url='https://api.itbit.com', timeout=5, **kwargs):
         self.userId = user_id
         super(ItbitREST, self).__init__(url, api_version=api_version,
-                                 key=key, secret=secret, timeout=timeout)
+                                 key=key, secret=secret,
+                                 timeout=timeout, **kwargs)
 
     def load_key(self, path):
         """
@@ -19,9 +19,10 @@ log = logging.getLogger(__name__)
 
 class KrakenREST(APIClient):
     def __init__(self, key=None, secret=None, api_version='0',
-                 url='https://api.kraken.com', timeout=5):
+                 url='https://api.kraken.com', timeout=5, **kwargs):
         super(KrakenREST, self).__init__(url, api_version=api_version,
-                                         key=key, secret=secret, timeout=timeout)
+                                         key=key, secret=secret,
+                                         timeout=timeout, **kwargs)
 
     def sign(self, url, endpoint, endpoint_path, method_verb, *args, **kwargs):
         try:
@@ -18,10 +18,10 @@ log = logging.getLogger(__name__)
 
 class PoloniexREST(APIClient):
     def __init__(self, key=None, secret=None, api_version=None,
-                 url='https://poloniex.com', timeout=5):
+                 url='https://poloniex.com', timeout=5, **kwargs):
         super(PoloniexREST, self).__init__(url, api_version=api_version,
                                            key=key, secret=secret,
-                                           timeout=timeout)
+                                           timeout=timeout, **kwargs)
 
     def sign(self, uri, endpoint, endpoint_path, method_verb, *args, **kwargs):
         try:
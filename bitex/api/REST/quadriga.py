@@ -16,11 +16,11 @@ log = logging.getLogger(__name__)
 
 class QuadrigaCXREST(APIClient):
     def __init__(self, key=None, secret=None, client_id='', api_version='v2',
-                 url='https://api.quoine.com/', timeout=5):
+                 url='https://api.quoine.com/', timeout=5, **kwargs):
         self.client_id = client_id
         super(QuadrigaCXREST, self).__init__(url, api_version=api_version,
                                              key=key, secret=secret,
-                                             timeout=timeout)
+                                             timeout=timeout, **kwargs)
 
     def load_key(self, path):
         """
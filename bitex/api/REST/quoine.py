@@ -26,11 +26,12 @@ class QuoineREST(APIClient):
     header as {'X-Quoine-API-Version': 2}
     """
     def __init__(self, key=None, secret=None, api_version=None,
-                 url='https://api.quoine.com', timeout=5):
+                 url='https://api.quoine.com', timeout=5, **kwargs):
         if not jwt_available:
             raise SystemError("No JWT Installed! Quoine API Unavailable!")
         super(QuoineREST, self).__init__(url, api_version=api_version,
-                                         key=key, secret=secret, timeout=timeout)
+                                         key=key, secret=secret,
+                                         timeout=timeout, **kwargs)
 
     def sign(self, uri, endpoint, endpoint_path, method_verb, *args, **kwargs):
         try:
@@ -0,0 +1,192 @@
+"""
+Client-side rate limiting for API Clients. Each exchange is assigned one
+token bucket for public and one for private (authenticated) queries; queries
+take a token before being sent and wait (or fail) while the bucket is empty.
+
+Buckets are shared by all clients querying the same host, as exchanges
+enforce their limits per IP or API key, not per client object.
+"""
+# Import Built-ins
+import logging
+import time
+import threading
+from urllib.parse import urlsplit
+
+
+log = logging.getLogger(__name__)
+
+
+# Default limits per host, as (rate in tokens per second, capacity). Hosts not
+# listed here are not limited.
+DEFAULT_LIMITS = {
+    # Public: ~1 call/s; Private: counter of 15, decreasing by 1 every 3s
+    'api.kraken.com': {'public': (1, 1), 'private': (1 / 3, 15)},
+    # 60 calls per minute
+    'bittrex.com': {'public': (1, 1), 'private': (1, 1)},
+    # 6 calls per second
+    'poloniex.com': {'public': (6, 6), 'private': (6, 6)},
+    # 90 calls per minute
+    'api.bitfinex.com': {'public': (1.5, 10), 'private': (1.5, 10)},
+    # 600 calls per 10 minutes
+    'www.bitstamp.net': {'public': (1, 10), 'private': (1, 10)},
+    # Public: 3 calls/s, bursts of 6; Private: 5 calls/s, bursts of 10
+    'api.gdax.com': {'public': (3, 6), 'private': (5, 10)},
+    # Public: 120 calls per minute; Private: 600 calls per minute
+    'api.gemini.com': {'public': (2, 2), 'private': (10, 10)},
+}
+
+
+class RateLimitExceeded(Exception):
+    """
+    Raised when a non-blocking query finds its token bucket empty.
+    """
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket, refilling at `rate` tokens per second, up to
+    `capacity` tokens.
+    """
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.acquired = 0
+        self.rejected = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def reserve(self, tokens=1, max_wait=None):
+        """
+        Takes the given number of tokens, which may leave the bucket in debt,
+        and returns the time in seconds the caller must wait before using
+        them. If that time would exceed max_wait, no tokens are taken and
+        None is returned.
+        :param tokens: int
+        :param max_wait: float or None for no limit
+        :return: float or None
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity,
+                               self._tokens + (now - self._last) * self.rate)
+            self._last = now
+
+            wait = max(0.0, (tokens - self._tokens) / self.rate)
+            if max_wait is not None and wait > max_wait:
+                self.rejected += 1
+                return None
+
+            self._tokens -= tokens
+            self.acquired += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+            return wait
+
+    def acquire(self, tokens=1, blocking=True, timeout=None):
+        """
+        Takes the given number of tokens from the bucket.
+        :param tokens: int
+        :param blocking: if False, returns False immediately if the tokens are
+                         not available
+        :param timeout: max seconds to wait, if blocking
+        :return: bool
+        """
+        wait = self.reserve(tokens, max_wait=timeout if blocking else 0)
+        if wait is None:
+            return False
+        if wait:
+            time.sleep(wait)
+        return True
+
+    def stats(self):
+        """
+        Returns the bucket's metrics as dict.
+        :return: dict
+        """
+        return {'acquired': self.acquired, 'rejected': self.rejected,
+                'wait_total': self.wait_total, 'wait_max': self.wait_max,
+                'wait_avg': (self.wait_total / self.acquired
+                             if self.acquired else 0.0)}
+
+
+class RateLimiter:
+    """
+    Registry of TokenBuckets, keyed by exchange host and endpoint class
+    ('public' or 'private').
+    """
+    def __init__(self, limits=None):
+        """
+        :param limits: dict of host: {endpoint class: (rate, capacity)};
+                       defaults to DEFAULT_LIMITS
+        """
+        self.limits = dict(DEFAULT_LIMITS if limits is None else limits)
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host(uri):
+        """
+        Returns the host of the given API uri, which identifies the exchange.
+        :param uri: str
+        :return: str
+        """
+        return urlsplit(uri).netloc
+
+    def set_limit(self, host, endpoint_class, rate, capacity):
+        """
+        Sets or replaces the limit for the given host and endpoint class.
+        """
+        with self._lock:
+            self.limits.setdefault(host, {})[endpoint_class] = (rate, capacity)
+            self._buckets.pop((host, endpoint_class), None)
+
+    def bucket(self, host, endpoint_class):
+        """
+        Returns the TokenBucket for the given host and endpoint class, or None
+        if it isn't limited.
+        :return: TokenBucket or None
+        """
+        key = (host, endpoint_class)
+        try:
+            return self._buckets[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in self._buckets:
+                try:
+                    rate, capacity = self.limits[host][endpoint_class]
+                except KeyError:
+                    self._buckets[key] = None
+                else:
+                    self._buckets[key] = TokenBucket(rate, capacity)
+            return self._buckets[key]
+
+    def acquire(self, host, endpoint_class, blocking=True, timeout=None):
+        """
+        Takes a token for the given host and endpoint class.
+        :return: bool
+        """
+        bucket = self.bucket(host, endpoint_class)
+        if bucket is None:
+            return True
+        return bucket.acquire(blocking=blocking, timeout=timeout)
+
+    def stats(self):
+        """
+        Returns the metrics of all buckets in use, including the time queries
+        spent waiting for a token.
+        :return: dict of (host, endpoint class): dict
+        """
+        with self._lock:
+            buckets = list(self._buckets.items())
+        return {key: bucket.stats() for key, bucket in buckets
+                if bucket is not None}
+
+
+# Shared by all API Clients, unless told otherwise
+limiter = RateLimiter()
@@ -1,6 +1,9 @@
 # Import Third-Party
 from requests import Response
 
+# Import Homebrew
+from bitex import jsonlib
+
 
 class APIResponse(Response):
 
@@ -9,6 +12,27 @@ class APIResponse(Response):
             self.__dict__[k] = v
         self._formatted = formatted_json
 
+    def json(self, **kwargs):
+        """
+        Returns the json-encoded content of the response. The parsed data is
+        kept, so repeated calls (and copies of this response) don't parse it
+        again. Decoded using bitex.jsonlib, unless kwargs are given.
+        :param kwargs: Optional arguments for json.loads(); bypass the stored
+                       data.
+        """
+        if kwargs:
+            return super(APIResponse, self).json(**kwargs)
+        try:
+            return self.__dict__['_json']
+        except KeyError:
+            try:
+                data = jsonlib.loads(self.content)
+            except ValueError:
+                # Let requests guess the encoding (or raise)
+                data = super(APIResponse, self).json()
+            self.__dict__['_json'] = data
+            return data
+
     @property
     def formatted(self):
         return self._formatted
@@ -0,0 +1,209 @@
+"""
+Retries of failed REST queries, with exponential backoff and jitter.
+
+A query is retried if the exchange answers with a transient error status
+(429, 502, 503, 504) or the request fails with a timeout or connection error.
+The delay before each retry is drawn uniformly from zero to an exponentially
+growing backoff ("full jitter"), so that clients which failed together don't
+retry together; a Retry-After header sent by the exchange takes precedence.
+All attempts of a query, including the delays, must finish within its
+deadline.
+
+Only queries which are safe to repeat are retried: public GET requests by
+default, and others - such as placing an order via bid() or ask() - only if
+they carry an idempotency key or client order id, which lets the exchange
+recognize the repetition. Private GET requests are treated alike, as several
+exchanges (i.e. Bittrex, Bter, HitBTC, Vaultoro) place orders and withdrawals
+via GET:
+
+    >>> gdax = GDAX(key, secret, retry=RetryPolicy(attempts=5, deadline=10))
+    >>> gdax.bid('BTC-USD', 2500, 0.1, client_oid=str(uuid.uuid4()))
+"""
+# Import Built-Ins
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# Import Third-Party
+
+# Import Homebrew
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+# Status codes of transient errors
+RETRY_STATUSES = frozenset((429, 502, 503, 504))
+
+# Methods which may be repeated without side effects
+IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS'))
+
+# Parameters and headers carrying an idempotency key or client order id
+IDEMPOTENCY_KEYS = frozenset(('client_oid', 'clientOrderId', 'client_order_id',
+                              'newClientOrderId', 'clOrdID', 'cid',
+                              'idempotency_key'))
+IDEMPOTENCY_HEADERS = frozenset(('idempotency-key', 'x-idempotency-key'))
+
+
+def retry_after(response):
+    """
+    Returns the delay requested by a response's Retry-After header.
+    :param response: requests.Response
+    :return: float, seconds, or None if the header is missing or invalid
+    """
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def has_idempotency_key(request_kwargs):
+    """
+    Checks whether a request carries an idempotency key or client order id.
+    :param request_kwargs: kwargs as passed to APIClient.query()
+    :return: Bool
+    """
+    for name in ('params', 'data', 'json'):
+        values = request_kwargs.get(name)
+        if isinstance(values, dict) and IDEMPOTENCY_KEYS.intersection(
+                k for k, v in values.items() if v is not None):
+            return True
+    headers = request_kwargs.get('headers') or {}
+    return any(h.lower() in IDEMPOTENCY_HEADERS for h in headers)
+
+
+class RetryPolicy:
+    """
+    Decides whether and when failed queries are retried.
+    """
+    def __init__(self, attempts=3, backoff=0.25, max_backoff=10.0,
+                 deadline=20.0, jitter=True, statuses=RETRY_STATUSES,
+                 methods=IDEMPOTENT_METHODS):
+        """
+        :param attempts: max number of attempts per query, including the first
+        :param backoff: base delay in seconds; doubles with every retry
+        :param max_backoff: upper bound of the delay in seconds
+        :param deadline: seconds all attempts of a query must finish within,
+                         or None for no limit
+        :param jitter: if True, delays are drawn uniformly from zero to the
+                       backoff; if False, the backoff itself is used
+        :param statuses: HTTP status codes to retry
+        :param methods: request types of public queries to retry without an
+                        idempotency key
+        """
+        if attempts < 1:
+            raise ValueError("attempts must be at least 1!")
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(m.upper() for m in methods)
+
+    def retryable(self, method_verb, request_kwargs, authenticate=False):
+        """
+        Checks whether a query may be repeated. Private queries need an
+        idempotency key, whatever their request type.
+        :param method_verb: valid request type (PUT, GET, POST etc)
+        :param request_kwargs: kwargs as passed to APIClient.query()
+        :param authenticate: Bool, whether the query is private
+        :return: Bool
+        """
+        if self.attempts < 2:
+            return False
+        if has_idempotency_key(request_kwargs):
+            return True
+        return not authenticate and method_verb.upper() in self.methods
+
+    def delay(self, retry):
+        """
+        Returns the backoff delay before the given retry.
+        :param retry: int, 1 for the first retry
+        :return: float, seconds
+        """
+        cap = min(self.max_backoff, self.backoff * 2 ** (retry - 1))
+        return random.uniform(0, cap) if self.jitter else cap
+
+    def start(self):
+        """
+        Starts tracking the attempts of a query.
+        :return: Attempts
+        """
+        return Attempts(self)
+
+
+class Attempts:
+    """
+    Attempt count and remaining time budget of a single query.
+    """
+    __slots__ = ('policy', 'count', 'expires')
+
+    def __init__(self, policy):
+        self.policy = policy
+        self.count = 1
+        self.expires = (time.monotonic() + policy.deadline
+                        if policy.deadline is not None else None)
+
+    def remaining(self):
+        """
+        :return: float, seconds left until the deadline, or None
+        """
+        if self.expires is None:
+            return None
+        return max(self.expires - time.monotonic(), 0.0)
+
+    def timeout(self, timeout):
+        """
+        Limits a request's timeout to the time left until the deadline.
+        :param timeout: float, tuple of connect and read timeout, or None
+        :return: timeout of the same form
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        remaining = max(remaining, 0.001)
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            return tuple(remaining if t is None else min(t, remaining)
+                         for t in timeout)
+        return min(timeout, remaining)
+
+    def next_delay(self, response=None):
+        """
+        Decides whether to retry after a failed attempt.
+        :param response: the attempt's response, or None if it raised a
+                         timeout or connection error
+        :return: float, seconds to wait before the next attempt, or None if
+                 the query must not be retried
+        """
+        policy = self.policy
+        if (response is not None and
+                response.status_code not in policy.statuses):
+            return None
+        if self.count >= policy.attempts:
+            return None
+        delay = None if response is None else retry_after(response)
+        if delay is None:
+            delay = policy.delay(self.count)
+        remaining = self.remaining()
+        if remaining is not None and delay >= remaining:
+            return None
+        self.count += 1
+        return delay
+
+
+default_policy = RetryPolicy()
@@ -16,10 +16,10 @@ log = logging.getLogger(__name__)
 
 class RockTradingREST(APIClient):
     def __init__(self, key=None, secret=None, api_version='v1',
-                 url='https://api.therocktrading.com', timeout=5):
+                 url='https://api.therocktrading.com', timeout=5, **kwargs):
         super(RockTradingREST, self).__init__(url, api_version=api_version,
                                               key=key, secret=secret,
-                                              timeout=timeout)
+                                              timeout=timeout, **kwargs)
 
     def sign(self, uri, endpoint, endpoint_path, method_verb, *args, **kwargs):
         nonce = self.nonce()
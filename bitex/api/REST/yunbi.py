@@ -18,9 +18,10 @@ log = logging.getLogger(__name__)
 
 class YunbiREST(APIClient):
     def __init__(self, key=None, secret=None, api_version='v2',
-                 url='https://yunbi.com/api', timeout=5):
+                 url='https://yunbi.com/api', timeout=5, **kwargs):
         super(YunbiREST, self).__init__(url, api_version=api_version, key=key,
-                                         secret=secret, timeout=timeout)
+                                         secret=secret,
+                                         timeout=timeout, **kwargs)
 
     def sign(self, uri, endpoint, endpoint_path, method_verb, *args, **kwargs):
         nonce = self.nonce()
@@ -1,11 +1,15 @@
 # Import Built-Ins
 import logging
+import time
 from queue import Queue, Empty
 from threading import Thread
 
 # Import Third-Party
 
 # Import Homebrew
+from bitex.api.WSS.dataqueue import DataQueue
+from bitex.api.WSS.latency import FeedItem
+from bitex.jsonlib import LazyJSON
 
 # Init Logging Facilities
 log = logging.getLogger(__name__)
@@ -17,12 +21,29 @@ class WSSAPI:
     subclass, as the various wss APIs are too diverse in order to distill a
     sensible pool of common attributes.
     """
-    def __init__(self, addr, name):
+    def __init__(self, addr, name, maxsize=0, policy='block',
+                 conflate_channels=None, raw_frames=False, capture=None):
         """
         Initialize Object.
         :param addr:
         :param name:
+        :param maxsize: max number of items in data_q; 0 for no limit
+        :param policy: what to do once data_q is full - 'block',
+                       'drop_oldest', 'drop_newest' or 'conflate'; see
+                       DataQueue
+        :param conflate_channels: channels to conflate, if policy is
+                                  'conflate'; None for snapshot channels
+                                  only, see DataQueue
+        :param raw_frames: if True, clients which support it put received
+                           messages on data_q undecoded, as
+                           ('raw', None, LazyJSON, ts), instead of decoding
+                           them on their receiving thread
+        :param capture: bitex.api.WSS.capture.CaptureWriter, recording all
+                        received messages for replay
         """
+        if raw_frames and policy == 'conflate':
+            raise ValueError("raw_frames cannot be conflated, as their "
+                             "channel and pair are unknown!")
         log.debug("WSSAPI.__init__(): Initializing Websocket API")
         self.addr = addr
         self.name = name
@@ -35,11 +56,57 @@ class WSSAPI:
         self._controller_q = Queue()
 
         # Queue storing all received data
-        self.data_q = Queue()
+        self.data_q = DataQueue(maxsize, policy, conflate_channels)
+        self.raw_frames = raw_frames
+        self.capture = capture
+        self.replaying = False  # True while a Replayer feeds handle_frame()
 
         # Internal Controller thread, responsible for starts / restarts / stops
         self._controller_thread = None
 
+    def put_item(self, item, ts=None, exchange_ts=None, **kwargs):
+        """
+        Puts an item on data_q, as a FeedItem stamped with the time it was
+        received, sent by the exchange and enqueued.
+        :param item: tuple, starting with channel and pair
+        :param ts: timestamp, declares when data was received by the client
+        :param exchange_ts: timestamp, when the exchange sent the data, if
+                            known
+        :param kwargs: kwargs for data_q.put()
+        """
+        item = FeedItem(item, ts, exchange_ts)
+        item.enqueue_ts = time.time()
+        self.data_q.put(item, **kwargs)
+
+    def put_raw(self, raw, ts):
+        """
+        Puts an undecoded message on data_q; consumers decode it via its data
+        attribute.
+        :param raw: str or bytes, as received
+        :param ts: timestamp, declares when data was received by the client
+        """
+        self.put_item(('raw', None, LazyJSON(raw), ts), ts)
+
+    def record(self, raw, ts, tag=''):
+        """
+        Appends a received message to the capture, if any.
+        :param raw: str or bytes, as received
+        :param ts: timestamp, declares when data was received by the client
+        :param tag: str, passed to handle_frame() on replay
+        """
+        if self.capture is not None:
+            self.capture.write(ts, raw, tag)
+
+    def handle_frame(self, raw, ts, tag=''):
+        """
+        Processes a received or replayed message. Implement this in your
+        child class to support bitex.api.WSS.capture.Replayer.
+        :param raw: str or bytes, as received
+        :param ts: timestamp, declares when data was received by the client
+        :param tag: str, as passed to record()
+        """
+        raise NotImplementedError
+
     def start(self):
         """
         Starts threads. Extend this in your child class.
@@ -61,6 +128,8 @@ class WSSAPI:
         """
         log.debug("WSSAPI.stop(): Stopping..")
         self.running = False
+        if self.capture is not None:
+            self.capture.flush()
 
     def restart(self):
         """
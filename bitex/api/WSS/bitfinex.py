@@ -12,6 +12,9 @@ from websocket import WebSocketConnectionClosedException
 
 # Import Homebrew
 from bitex.api.WSS.base import WSSAPI
+from bitex.api.WSS.orderbook import PriceLevelBook, OrderLevelBook
+from bitex.api.WSS.ringbuffer import RingBuffer
+from bitex import jsonlib
 
 # import Server-side Exceptions
 from bitex.api.WSS.exceptions import InvalidBookLengthError, GenericSubscriptionError
@@ -36,14 +39,21 @@ class BitfinexWSS(WSSAPI):
     the Server issues a connection reset.
     """
 
-    def __init__(self, pairs=None):
+    def __init__(self, pairs=None, transport='queue', batch_size=100,
+                 **kwargs):
         """
         Initializes BitfinexWSS Instance.
         :param key: Api Key as string
         :param secret: Api secret as string
         :param addr: Websocket API Address
-        """
-        super(BitfinexWSS, self).__init__('wss://api.bitfinex.com/ws/2', 'Bitfinex')
+        :param transport: 'queue' to pass messages from the receiver to the
+                          processing thread via queue.Queue, or 'ring' to use
+                          a lock-free RingBuffer, drained in batches
+        :param batch_size: max number of messages processed per wakeup, if
+                           transport is 'ring'
+        """
+        super(BitfinexWSS, self).__init__('wss://api.bitfinex.com/ws/2', 'Bitfinex',
+                                          **kwargs)
         self.conn = None
         if pairs:
             self.pairs = pairs
@@ -55,7 +65,14 @@ class BitfinexWSS(WSSAPI):
         # Set up variables for receiver and main loop threads
         self._receiver_lock = threading.Lock()
         self._processor_lock = threading.Lock()
-        self.receiver_q = queue.Queue()
+        if transport == 'ring':
+            self.receiver_q = RingBuffer()
+        elif transport == 'queue':
+            self.receiver_q = queue.Queue()
+        else:
+            raise ValueError("transport must be 'queue' or 'ring'!")
+        self.transport = transport
+        self.batch_size = batch_size
         self.receiver_thread = None
         self.processing_thread = None
 
@@ -72,6 +89,10 @@ class BitfinexWSS(WSSAPI):
         self.channel_configs = {}  # Variables, as set by subscribe command
         self.wss_config = {}  # Config as passed by 'config' command
 
+        # Local order books, maintained from the book and raw_book channels
+        self.books = {}  # Dict of pair: PriceLevelBook
+        self.raw_books = {}  # Dict of pair: OrderLevelBook
+
         self._event_handlers = {'error': self._raise_error,
                                 'unsubscribed': self._handle_unsubscribed,
                                 'subscribed': self._handle_subscribed,
@@ -277,7 +298,8 @@ class BitfinexWSS(WSSAPI):
     def receive(self):
         """
         Receives incoming websocket messages, and puts them on the Client queue
-        for processing.
+        for processing. Messages are decoded by the processing thread, so this
+        thread only reads from the socket.
         :return:
         """
         while self.running:
@@ -292,18 +314,48 @@ class BitfinexWSS(WSSAPI):
                     # of the currently subscribed channels!
                     self.conn = None
                     self._controller_q.put('restart')
+                    self._receiver_lock.release()
+                    continue
                 except AttributeError:
                     # self.conn is None, idle loop until shutdown of thread
                     self._receiver_lock.release()
                     continue
-                msg = time.time(), json.loads(raw)
+                msg = time.time(), raw
                 log.debug("receiver Thread: Data Received: %s", msg)
-                self.receiver_q.put(msg)
+                self.record(raw, msg[0])
+                self._hand_off(msg)
                 self._receiver_lock.release()
             else:
                 # The receiver_lock was locked, idling until available
                 time.sleep(0.5)
 
+    def _hand_off(self, msg):
+        """
+        Passes a received message to the processing thread. If the ring
+        buffer is full, waits for the processing thread to catch up.
+        :param msg: tuple of timestamp and raw message
+        """
+        if self.transport == 'queue':
+            self.receiver_q.put(msg)
+            return
+        while not self.receiver_q.put(msg):
+            if not self.running:
+                return
+            time.sleep(0.001)
+
+    def _next_messages(self):
+        """
+        Returns the next received message(s) to process, waiting up to 0.1s
+        if there are none.
+        :return: list of (timestamp, raw message) tuples
+        """
+        if self.transport == 'ring':
+            return self.receiver_q.drain(self.batch_size, timeout=0.1)
+        try:
+            return [self.receiver_q.get(timeout=0.1)]
+        except queue.Empty:
+            return []
+
     def process(self):
         """
         Processes the Client queue, and passes the data to the respective
@@ -328,41 +380,48 @@ class BitfinexWSS(WSSAPI):
                     # The connection was killed - initiate restart
                     self._controller_q.put('restart')
 
-                skip_processing = False
-
-                try:
-                    ts, data = self.receiver_q.get(timeout=0.1)
-                except queue.Empty:
-                    skip_processing = True
-                    ts = time.time()
-                    data = None
-
-                if not skip_processing:
-                    log.debug("Processing Data: %s", data)
-                    if isinstance(data, list):
-                        self.handle_data(ts, data)
-                    else:  # Not a list, hence it could be a response
-                        try:
-                            self.handle_response(ts, data)
-                        except UnknownEventError:
-
-                            # We don't know what event this is- Raise an
-                            # error & log data!
-                            log.exception("main() - UnknownEventError: %s",
-                                          data)
-                            log.info("main() - Shutting Down due to "
-                                     "Unknown Error!")
-                            self._controller_q.put('stop')
-                        except ConnectionResetError:
-                            log.info("processor Thread: Connection Was reset, "
-                                     "initiating restart")
-                            self._controller_q.put('restart')
+                ts = time.time()
+                for ts, raw in self._next_messages():
+                    try:
+                        self.handle_frame(raw, ts)
+                    except UnknownEventError:
+
+                        # We don't know what event this is- Raise an
+                        # error & log data!
+                        log.exception("main() - UnknownEventError: %s", raw)
+                        log.info("main() - Shutting Down due to "
+                                 "Unknown Error!")
+                        self._controller_q.put('stop')
+                    except ConnectionResetError:
+                        log.info("processor Thread: Connection Was reset, "
+                                 "initiating restart")
+                        self._controller_q.put('restart')
 
                 self._check_heartbeats(ts)
                 self._processor_lock.release()
             else:
                 time.sleep(0.5)
 
+    def handle_frame(self, raw, ts, tag=''):
+        """
+        Decodes a received message and passes it to handle_data() or
+        handle_response().
+        :param raw: str or bytes, as received
+        :param ts: timestamp, declares when data was received by the client
+        :param tag: unused; see WSSAPI.record()
+        :return:
+        """
+        try:
+            data = jsonlib.loads(raw)
+        except ValueError:
+            log.error("processor Thread: Discarding invalid message: %r", raw)
+            return
+        log.debug("Processing Data: %s", data)
+        if isinstance(data, list):
+            self.handle_data(ts, data)
+        else:  # Not a list, hence it could be a response
+            self.handle_response(ts, data)
+
     ##
     # Response Message Handlers
     ##
@@ -568,31 +627,75 @@ class BitfinexWSS(WSSAPI):
         """
         pair = self.channel_labels[chan_id][1]['pair']
         entry = (*data, ts)
-        self.data_q.put(('ticker', pair, entry))
+        self.put_item(('ticker', pair, entry), ts)
 
     def _handle_book(self, ts, chan_id, data):
         """
-        Updates the order book stored in self.books[chan_id]
+        Updates the order book stored in self.books[pair]
         :param ts: timestamp, declares when data was received by the client
         :param chan_id: int, channel id
         :param data: dict, tuple or list of data received via wss
         :return:
         """
         pair = self.channel_labels[chan_id][1]['pair']
+        try:
+            book = self.books[pair]
+        except KeyError:
+            book = self.books[pair] = PriceLevelBook()
+
+        entries = data[0]
+        if entries and isinstance(entries[0], list):
+            # Snapshot of [price, count, amount] entries
+            bids, asks = [], []
+            for price, count, amount in entries:
+                amount = float(amount)
+                if amount > 0:
+                    bids.append((float(price), amount))
+                else:
+                    asks.append((float(price), -amount))
+            book.reset(bids, asks, ts=ts)
+        elif entries:
+            # Update of a single price level; a count of 0 removes it, and
+            # the sign of amount denotes the side (1: bids, -1: asks).
+            price, count, amount = entries
+            amount = float(amount)
+            side = 'bids' if amount > 0 else 'asks'
+            book.set(side, float(price), abs(amount) if int(count) else 0,
+                     ts=ts)
+
         entry = data, ts
-        self.data_q.put(('order_book', pair, entry))
+        self.put_item(('order_book', pair, entry), ts)
 
     def _handle_raw_book(self, ts, chan_id, data):
         """
-        Updates the raw order books stored in self.raw_books[chan_id]
+        Updates the raw order books stored in self.raw_books[pair]
         :param ts: timestamp, declares when data was received by the client
         :param chan_id: int, channel id
         :param data: dict, tuple or list of data received via wss
         :return:
         """
         pair = self.channel_labels[chan_id][1]['pair']
+        try:
+            book = self.raw_books[pair]
+        except KeyError:
+            book = self.raw_books[pair] = OrderLevelBook()
+
+        def parse(order_id, price, amount):
+            amount = float(amount)
+            side = 'bids' if amount > 0 else 'asks'
+            # A price of 0 removes the order
+            price = float(price)
+            return order_id, side, price, abs(amount) if price else 0
+
+        entries = data[0]
+        if entries and isinstance(entries[0], list):
+            # Snapshot of [order id, price, amount] entries
+            book.reset_orders((parse(*entry) for entry in entries), ts=ts)
+        elif entries:
+            book.set_order(*parse(*entries), ts=ts)
+
         entry = data, ts
-        self.data_q.put(('raw_order_book', pair, entry))
+        self.put_item(('raw_order_book', pair, entry), ts)
 
     def _handle_trades(self, ts, chan_id, data):
         """
@@ -604,7 +707,22 @@ class BitfinexWSS(WSSAPI):
         """
         pair = self.channel_labels[chan_id][1]['pair']
         entry = data, ts
-        self.data_q.put(('trades', pair, entry))
+        self.put_item(('trades', pair, entry), ts, self._trade_ts(data))
+
+    @staticmethod
+    def _trade_ts(data):
+        """
+        Returns the exchange time of the latest trade in a trades message.
+        :param data: list, a snapshot of [id, mts, amount, price] entries or
+                     an update, i.e. ['te', [id, mts, amount, price]]
+        :return: float timestamp, or None
+        """
+        try:
+            if data[0] in ('te', 'tu'):
+                return data[1][1] / 1000
+            return max(trade[1] for trade in data[0]) / 1000
+        except (IndexError, TypeError, ValueError):
+            return None
 
     def _handle_candles(self, ts, chan_id, data):
         """
@@ -616,7 +734,7 @@ class BitfinexWSS(WSSAPI):
         """
         pair = self.channel_labels[chan_id][1]['key'].split(':')[-1][1:]
         entry = data, ts
-        self.data_q.put(('ohlc', pair, entry))
+        self.put_item(('ohlc', pair, entry), ts)
 
     def _handle_auth(self, ts, chan_id, data):
         keys = {'hts': self._handle_auth_trades,
@@ -663,47 +781,47 @@ class BitfinexWSS(WSSAPI):
 
     def _handle_auth_trades(self, ts, data):
         entry = data, ts
-        self.data_q.put(('account_trades', 'NA', entry))
+        self.put_item(('account_trades', 'NA', entry), ts)
 
     def _handle_auth_positions(self, ts, data):
         entry = data, ts
-        self.data_q.put(('account_positions', 'NA', entry))
+        self.put_item(('account_positions', 'NA', entry), ts)
 
     def _handle_auth_orders(self, ts, data):
         entry = data, ts
-        self.data_q.put(('account_orders', 'NA', entry))
+        self.put_item(('account_orders', 'NA', entry), ts)
 
     def _handle_auth_wallet(self, ts, data):
         entry = data, ts
-        self.data_q.put(('account_wallet', 'NA', entry))
+        self.put_item(('account_wallet', 'NA', entry), ts)
 
     def _handle_auth_balance(self, ts, data):
         entry = data, ts
-        self.data_q.put(('account_balance', 'NA', entry))
+        self.put_item(('account_balance', 'NA', entry), ts)
 
     def _handle_auth_margin_info(self, ts, data):
         entry = data, ts
-        self.data_q.put(('account_margin_info', 'NA', entry))
+        self.put_item(('account_margin_info', 'NA', entry), ts)
 
     def _handle_auth_funding_info(self, ts, data):
         entry = data, ts
-        self.data_q.put(('account_funding_info', 'NA', entry))
+        self.put_item(('account_funding_info', 'NA', entry), ts)
 
     def _handle_auth_offers(self, ts, data):
         entry = data, ts
-        self.data_q.put(('account_offers', 'NA', entry))
+        self.put_item(('account_offers', 'NA', entry), ts)
 
     def _handle_auth_credits(self, ts, data):
         entry = data, ts
-        self.data_q.put(('account_credits', 'NA', entry))
+        self.put_item(('account_credits', 'NA', entry), ts)
 
     def _handle_auth_loans(self, event, data):
         entry = data, time.time()
-        self.data_q.put(('account_loans', 'NA', entry))
+        self.put_item(('account_loans', 'NA', entry), entry[1])
 
     def _handle_auth_funding_trades(self, event, data):
         entry = data, time.time()
-        self.data_q.put(('account_funding_trades', 'NA', entry))
+        self.put_item(('account_funding_trades', 'NA', entry), entry[1])
 
     ##
     # Commands
@@ -1,5 +1,6 @@
 # Import Built-Ins
 import logging
+import time
 
 # Import Third-Party
 import pusherclient
@@ -22,7 +23,9 @@ class BitstampWSS(WSSAPI):
     If you need to have per-channel customization, you will have to overwrite
     the _register_*_channel() methods accordingly.
     """
-    def __init__(self, key=None, exclude=None, include_only=None, **kwargs):
+    def __init__(self, key=None, exclude=None, include_only=None, maxsize=0,
+                 policy='block', conflate_channels=None, capture=None,
+                 **kwargs):
         """
         Initializes Instance.
 
@@ -33,7 +36,8 @@ class BitstampWSS(WSSAPI):
 
         key = key if key else 'de504dc5763aeef9ff52'
 
-        super(BitstampWSS, self).__init__(key, 'Bitstamp')
+        super(BitstampWSS, self).__init__(key, 'Bitstamp', maxsize, policy,
+                                          conflate_channels, capture=capture)
 
         self.pusher = None
         self.__pusher_options = kwargs
@@ -85,129 +89,141 @@ class BitstampWSS(WSSAPI):
     Custom Callbacks
     """
 
-    def live_trades_callback(self, pair, data):
+    def live_trades_callback(self, pair, data, ts=None):
         """
         This callback is called when data from the live_trades channel is
         received. Overwrite this in children, to change the way data is handled.
         if you require per-pair customization, see the pair-specific callbacks.
         :param pair:
         :param data:
+        :param ts: timestamp, declares when data was received; defaults
+                   to now
         :return:
         """
-        self.data_q.put(('live_trades', pair, data))
+        self.put_item(('live_trades', pair, data),
+                      time.time() if ts is None else ts)
 
-    def btcusd_lt_callback(self, data):
-        self.live_trades_callback('BTCUSD', data)
+    def btcusd_lt_callback(self, data, ts=None):
+        self.live_trades_callback('BTCUSD', data, ts)
 
-    def btceur_lt_callback(self, data):
-        self.live_trades_callback('BTCEUR', data)
+    def btceur_lt_callback(self, data, ts=None):
+        self.live_trades_callback('BTCEUR', data, ts)
 
-    def eurusd_lt_callback(self, data):
-        self.live_trades_callback('EURUSD', data)
+    def eurusd_lt_callback(self, data, ts=None):
+        self.live_trades_callback('EURUSD', data, ts)
 
-    def xrpusd_lt_callback(self, data):
-        self.live_trades_callback('XRPUSD', data)
+    def xrpusd_lt_callback(self, data, ts=None):
+        self.live_trades_callback('XRPUSD', data, ts)
 
-    def xrpeur_lt_callback(self, data):
-        self.live_trades_callback('XRPEUR', data)
+    def xrpeur_lt_callback(self, data, ts=None):
+        self.live_trades_callback('XRPEUR', data, ts)
 
-    def xrpbtc_lt_callback(self, data):
-        self.live_trades_callback('XRPBTC', data)
+    def xrpbtc_lt_callback(self, data, ts=None):
+        self.live_trades_callback('XRPBTC', data, ts)
 
     """
     Custom Order Book Callback
     """
 
-    def order_book_callback(self, pair, data):
+    def order_book_callback(self, pair, data, ts=None):
         """
         This callback is called when data from the order_book channel is
         received.
         :param data:
+        :param ts: timestamp, declares when data was received; defaults
+                   to now
         :return:
         """
-        self.data_q.put(('order_book', pair, data))
+        self.put_item(('order_book', pair, data),
+                      time.time() if ts is None else ts)
 
-    def btcusd_ob_callback(self, data):
-        self.order_book_callback('BTCUSD', data)
+    def btcusd_ob_callback(self, data, ts=None):
+        self.order_book_callback('BTCUSD', data, ts)
 
-    def btceur_ob_callback(self, data):
-        self.order_book_callback('BTCEUR', data)
+    def btceur_ob_callback(self, data, ts=None):
+        self.order_book_callback('BTCEUR', data, ts)
 
-    def eurusd_ob_callback(self, data):
-        self.order_book_callback('EURUSD', data)
+    def eurusd_ob_callback(self, data, ts=None):
+        self.order_book_callback('EURUSD', data, ts)
 
-    def xrpusd_ob_callback(self, data):
-        self.order_book_callback('XRPUSD', data)
+    def xrpusd_ob_callback(self, data, ts=None):
+        self.order_book_callback('XRPUSD', data, ts)
 
-    def xrpeur_ob_callback(self, data):
-        self.order_book_callback('XRPEUR', data)
+    def xrpeur_ob_callback(self, data, ts=None):
+        self.order_book_callback('XRPEUR', data, ts)
 
-    def xrpbtc_ob_callback(self, data):
-        self.order_book_callback('XRPBTC', data)
+    def xrpbtc_ob_callback(self, data, ts=None):
+        self.order_book_callback('XRPBTC', data, ts)
 
     """
     Custom Diff Order Book Callback
     """
 
-    def diff_order_book_callback(self, pair, data):
+    def diff_order_book_callback(self, pair, data, ts=None):
         """
         This callback is called when data from the diff_order_book channel is
         received.
         :param pair:
         :param data:
+        :param ts: timestamp, declares when data was received; defaults
+                   to now
         :return:
         """
-        self.data_q.put(('diff_order_book', pair, data))
+        self.put_item(('diff_order_book', pair, data),
+                      time.time() if ts is None else ts)
 
-    def btcusd_dob_callback(self, data):
-        self.diff_order_book_callback('BTCUSD', data)
+    def btcusd_dob_callback(self, data, ts=None):
+        self.diff_order_book_callback('BTCUSD', data, ts)
 
-    def btceur_dob_callback(self, data):
-        self.diff_order_book_callback('BTCEUR', data)
+    def btceur_dob_callback(self, data, ts=None):
+        self.diff_order_book_callback('BTCEUR', data, ts)
 
-    def eurusd_dob_callback(self, data):
-        self.diff_order_book_callback('EURUSD', data)
+    def eurusd_dob_callback(self, data, ts=None):
+        self.diff_order_book_callback('EURUSD', data, ts)
 
-    def xrpusd_dob_callback(self, data):
-        self.diff_order_book_callback('XRPUSD', data)
+    def xrpusd_dob_callback(self, data, ts=None):
+        self.diff_order_book_callback('XRPUSD', data, ts)
 
-    def xrpeur_dob_callback(self, data):
-        self.diff_order_book_callback('XRPEUR', data)
+    def xrpeur_dob_callback(self, data, ts=None):
+        self.diff_order_book_callback('XRPEUR', data, ts)
 
-    def xrpbtc_dob_callback(self, data):
-        self.diff_order_book_callback('XRPBTC', data)
+    def xrpbtc_dob_callback(self, data, ts=None):
+        self.diff_order_book_callback('XRPBTC', data, ts)
 
     """
     Custom Live Orders Callback
     """
 
-    def live_orders_callback(self, pair, data):
+    def live_orders_callback(self, pair, data, ts=None):
         """
         This callback is called when data from the live_orders channel is
         received.
         :param pair:
         :param data:
+        :param ts: timestamp, declares when data was received; defaults
+                   to now
         :return:
         """
-        self.data_q.put(('live_orders', pair, data))
+        self.put_item(('live_orders', pair, data),
+                      time.time() if ts is None else ts)
 
-    def btcusd_lo_callback(self, data):
-        self.live_orders_callback('BTCUSD', data)
+    def btcusd_lo_callback(self, data, ts=None):
+        self.live_orders_callback('BTCUSD', data, ts)
 
-    def btceur_lo_callback(self, data):
-        self.live_orders_callback('BTCEUR', data)
+    def btceur_lo_callback(self, data, ts=None):
+        self.live_orders_callback('BTCEUR', data, ts)
 
-    def eurusd_lo_callback(self, data):
-        self.live_orders_callback('EURUSD', data)
+    def eurusd_lo_callback(self, data, ts=None):
+        self.live_orders_callback('EURUSD', data, ts)
 
-    def xrpusd_lo_callback(self, data):
-        self.live_orders_callback('XRPUSD', data)
+    def xrpusd_lo_callback(self, data, ts=None):
+        self.live_orders_callback('XRPUSD', data, ts)
 
-    def xrpeur_lo_callback(self, data):
-        self.live_orders_callback('XRPEUR', data)
+    def xrpeur_lo_callback(self, data, ts=None):
+        self.live_orders_callback('XRPEUR', data, ts)
 
-    def xrpbtc_lo_callback(self, data):
-        self.live_orders_callback('XRPBTC', data)
+    def xrpbtc_lo_callback(self, data, ts=None):
+        self.live_orders_callback('XRPBTC', data, ts)
 
     """
     Register Methods
@@ -234,11 +250,39 @@ class BitstampWSS(WSSAPI):
         for channel_name in channels:
             if channel_name in self.channels:
                 channel = self.pusher.subscribe(channel_name)
+                callback = channels[channel_name]
+                if self.capture is not None:
+                    callback = self._recording(callback)
                 if isinstance(events, list):
                     for event in events:
-                        channel.bind(event, channels[channel_name])
+                        channel.bind(event, callback)
                 else:
-                    channel.bind(events, channels[channel_name])
+                    channel.bind(events, callback)
+
+    def _recording(self, callback):
+        """
+        Wraps a callback, recording its data before passing it on.
+        :param callback: *_callback() method
+        :return: function
+        """
+        def record(data):
+            ts = time.time()
+            self.record(data, ts, callback.__name__)
+            callback(data, ts)
+        return record
+
+    def handle_frame(self, raw, ts, tag=''):
+        """
+        Passes a recorded message to the callback it was recorded for.
+        :param raw: str or bytes, as received
+        :param ts: timestamp, declares when data was received by the client
+        :param tag: str, name of a *_callback() method
+        """
+        if not tag.endswith('_callback'):
+            raise ValueError("Unknown tag %r!" % tag)
+        if isinstance(raw, bytes):
+            raw = raw.decode('utf-8')
+        getattr(self, tag)(raw, ts)
 
     def _register_live_trades_channels(self):
         """
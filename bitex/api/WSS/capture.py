@@ -0,0 +1,248 @@
+"""
+Capture and replay of the raw messages received by the Websocket clients.
+
+A CaptureWriter appends each message, together with the time it was received
+and a tag naming its handler, to binary segment files of a bounded size:
+
+    <prefix>-000000.cap, <prefix>-000001.cap, ...
+
+Each segment starts with MAGIC, followed by records of a HEADER (receive
+timestamp, tag length, payload length) and the tag and payload bytes. Files
+are only ever appended to, so a capture can be read while it is written; a
+record cut off by a crash is ignored. Writes are flushed to the OS at least
+every flush_interval seconds or flush_size bytes, bounding what a crash of the
+recording process loses.
+
+A Replayer feeds a capture back through a client's handle_frame(), exactly as
+the client processes live messages, either as fast as possible or at the
+recorded speed:
+
+    wss = GDAXWSS(pairs=['BTC-USD'], capture=CaptureWriter('captures/gdax'))
+    ...
+    Replayer('captures/gdax', GDAXWSS(pairs=['BTC-USD'])).run()
+"""
+# Import Built-Ins
+import logging
+import os
+import struct
+import threading
+import time
+
+# Import Third-Party
+
+# Import Homebrew
+from bitex.api.WSS.base import WSSAPI
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+MAGIC = b'BTXCAP1\n'
+HEADER = struct.Struct('<dHI')  # Receive timestamp, tag length, payload length
+SUFFIX = '.cap'
+
+
+def segment_paths(path, prefix=None):
+    """
+    Returns the segment files at path, in the order they were written.
+    :param path: a segment file, or a directory containing segments
+    :param prefix: only return segments with this prefix
+    :return: list of paths
+    """
+    if not os.path.isdir(path):
+        return [path]
+    return [os.path.join(path, f) for f in sorted(os.listdir(path))
+            if f.endswith(SUFFIX) and (prefix is None or
+                                       f.rsplit('-', 1)[0] == prefix)]
+
+
+class CaptureWriter:
+    """
+    Appends messages to segment files in a directory; thread-safe, so
+    several clients may share one writer.
+    """
+    def __init__(self, directory, prefix='capture', segment_size=64 * 2**20,
+                 flush_interval=1.0, flush_size=64 * 2**10):
+        """
+        :param directory: directory to store segments in; created if missing
+        :param prefix: file name prefix of the segments
+        :param segment_size: max size of a segment in bytes, after which a new
+                             one is started
+        :param flush_interval: max seconds between a write and its flush
+                               (checked on the next write); 0 flushes every
+                               write
+        :param flush_size: max number of unflushed bytes
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.prefix = prefix
+        self.segment_size = segment_size
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self.segments = []
+        self._lock = threading.Lock()
+        self._file = None
+        self._size = 0
+        self._unflushed = 0
+        self._flushed_at = time.monotonic()
+        self._tags = {}
+
+        existing = segment_paths(directory, prefix)
+        self._index = (int(existing[-1][:-len(SUFFIX)].rsplit('-', 1)[1]) + 1
+                       if existing else 0)
+
+    def _rotate(self):
+        if self._file is not None:
+            self._file.close()
+        path = os.path.join(self.directory, '%s-%06d%s' %
+                            (self.prefix, self._index, SUFFIX))
+        self._index += 1
+        self._file = open(path, 'xb')
+        self._file.write(MAGIC)
+        self._size = len(MAGIC)
+        self._unflushed = len(MAGIC)
+        self.segments.append(path)
+        log.debug("CaptureWriter: Writing to %s", path)
+
+    def write(self, ts, payload, tag=''):
+        """
+        Appends a message.
+        :param ts: timestamp, declares when the message was received
+        :param payload: str or bytes, the message as received
+        :param tag: str, identifies the message's handler on replay
+        """
+        if isinstance(payload, str):
+            payload = payload.encode('utf-8')
+        try:
+            tag_bytes = self._tags[tag]
+        except KeyError:
+            tag_bytes = self._tags[tag] = tag.encode('utf-8')
+        record = (HEADER.pack(ts, len(tag_bytes), len(payload)) + tag_bytes +
+                  payload)
+
+        with self._lock:
+            if self._file is None or (self._size > len(MAGIC) and
+                                      self._size + len(record) >
+                                      self.segment_size):
+                self._rotate()
+            self._file.write(record)
+            self._size += len(record)
+            self._unflushed += len(record)
+            if (self._unflushed >= self.flush_size or
+                    time.monotonic() - self._flushed_at >=
+                    self.flush_interval):
+                self._flush()
+
+    def _flush(self):
+        self._file.flush()
+        self._unflushed = 0
+        self._flushed_at = time.monotonic()
+
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_capture(path, prefix=None):
+    """
+    Yields the messages stored at path, oldest first.
+    :param path: a segment file, or a directory containing segments
+    :param prefix: only read segments with this prefix
+    :return: generator of (ts, tag, payload) tuples; payload is bytes
+    """
+    unpack, header_size = HEADER.unpack, HEADER.size
+    tags = {b'': ''}
+    for segment in segment_paths(path, prefix):
+        # Segments are streamed record by record, never loaded as a whole
+        with open(segment, 'rb') as f:
+            magic = f.read(len(MAGIC))
+            if magic != MAGIC:
+                if MAGIC.startswith(magic):
+                    continue  # Just created, nothing written yet
+                raise ValueError("%s is not a capture segment!" % segment)
+            read = f.read
+            while True:
+                header = read(header_size)
+                if len(header) < header_size:
+                    truncated = bool(header)
+                    break
+                ts, tag_len, payload_len = unpack(header)
+                body = read(tag_len + payload_len)
+                if len(body) < tag_len + payload_len:
+                    truncated = True
+                    break
+                tag = body[:tag_len]
+                try:
+                    tag = tags[tag]
+                except KeyError:
+                    tag = tags[tag] = tag.decode('utf-8')
+                yield ts, tag, body[tag_len:]
+        if truncated:
+            log.warning("read_capture(): Ignoring truncated record at the end "
+                        "of %s", segment)
+
+
+class Replayer:
+    """
+    Feeds a capture through a handler - usually a Websocket client, whose
+    handle_frame() processes the messages just as if they had been received.
+    """
+    def __init__(self, path, handler, speed=None, prefix=None):
+        """
+        :param path: a segment file, or a directory containing segments
+        :param handler: WSSAPI instance, or a callable taking raw, ts and tag
+        :param speed: None to replay as fast as possible; otherwise a factor
+                      of the recorded speed, i.e. 1.0 for real time
+        :param prefix: only replay segments with this prefix
+        """
+        self.path = path
+        self.handler = handler
+        self.speed = speed
+        self.prefix = prefix
+
+    def run(self, start=None, end=None):
+        """
+        Replays all messages received between start and end.
+        :param start: timestamp; None to start with the first message
+        :param end: timestamp; None to end with the last message
+        :return: int, number of replayed messages
+        """
+        client = self.handler if isinstance(self.handler, WSSAPI) else None
+        handle = client.handle_frame if client else self.handler
+        if client:
+            client.replaying = True
+
+        n = 0
+        first = wall_start = None
+        try:
+            for ts, tag, raw in read_capture(self.path, self.prefix):
+                if start is not None and ts < start:
+                    continue
+                if end is not None and ts > end:
+                    break
+                if self.speed:
+                    if first is None:
+                        first, wall_start = ts, time.monotonic()
+                    delay = (wall_start + (ts - first) / self.speed -
+                             time.monotonic())
+                    if delay > 0:
+                        time.sleep(delay)
+                handle(raw, ts, tag)
+                n += 1
+        finally:
+            if client:
+                client.replaying = False
+        return n
@@ -0,0 +1,156 @@
+"""
+Bounded data queue for the Websocket clients, with selectable policies for
+what happens once it is full.
+
+Items are tuples starting with the channel and pair, i.e.
+('ticker', 'BTCUSD', data); these identify items for conflation and
+statistics.
+"""
+# Import Built-Ins
+import logging
+import time
+from collections import Counter, deque
+from queue import Queue
+
+# Import Third-Party
+
+# Import Homebrew
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+POLICIES = ('block', 'drop_oldest', 'drop_newest', 'conflate')
+
+# Channels conflated by default: each of their items replaces the previous
+# one entirely. Book deltas and trades are never conflated unless explicitly
+# listed, as dropping them corrupts the state consumers build from them.
+SNAPSHOT_CHANNELS = frozenset({'ticker'})
+
+
+def _channel(item):
+    try:
+        return item[0]
+    except (TypeError, IndexError, KeyError):
+        return None
+
+
+def _key(item):
+    try:
+        key = tuple(item[:2])
+        hash(key)
+    except TypeError:
+        return _channel(item)
+    return key
+
+
+class DataQueue(Queue):
+    """
+    Queue with a maximum size and a policy applied to put() calls while it is
+    full:
+
+        - 'block': wait for a free slot, like queue.Queue
+        - 'drop_oldest': discard the oldest item to make room
+        - 'drop_newest': discard the item being put
+        - 'conflate': an item of a conflated channel replaces the queued item
+          of the same channel and pair, if any, keeping its position; only
+          the latest ticker of a pair is kept, for example. Otherwise, the
+          oldest item is discarded if the queue is full.
+
+    Discarded and replaced items are counted per channel.
+    """
+    def __init__(self, maxsize=0, policy='block', conflate_channels=None):
+        """
+        :param maxsize: max number of items; 0 for no limit
+        :param policy: one of POLICIES
+        :param conflate_channels: channels to conflate if policy is
+                                  'conflate'; None for SNAPSHOT_CHANNELS
+        """
+        if policy not in POLICIES:
+            raise ValueError("policy must be one of %s!" % (POLICIES,))
+        self.policy = policy
+        self.conflate_channels = (set(conflate_channels)
+                                  if conflate_channels is not None
+                                  else set(SNAPSHOT_CHANNELS))
+        self.dropped = Counter()
+        self.conflated = Counter()
+        super(DataQueue, self).__init__(maxsize)
+
+    # Internal storage; items are stored in cells of [key, item], so that
+    # conflation can replace an item in place.
+    def _init(self, maxsize):
+        self.queue = deque()
+        self._cells = {}
+
+    def _qsize(self):
+        return len(self.queue)
+
+    def _put(self, item):
+        key = self._conflation_key(item)
+        cell = [key, item]
+        if key is not None:
+            self._cells[key] = cell
+        self.queue.append(cell)
+
+    def _get(self):
+        cell = self.queue.popleft()
+        key, item = cell
+        if key is not None and self._cells.get(key) is cell:
+            del self._cells[key]
+        return item
+
+    def _conflation_key(self, item):
+        if self.policy != 'conflate':
+            return None
+        if _channel(item) not in self.conflate_channels:
+            return None
+        return _key(item)
+
+    def put(self, item, block=True, timeout=None):
+        if self.policy == 'block':
+            return super(DataQueue, self).put(item, block, timeout)
+
+        with self.not_full:
+            key = self._conflation_key(item)
+            if key is not None and key in self._cells:
+                self._cells[key][1] = item
+                self.conflated[_channel(item)] += 1
+                return
+
+            if 0 < self.maxsize <= self._qsize():
+                if self.policy == 'drop_newest':
+                    self.dropped[_channel(item)] += 1
+                    return
+                dropped = self._get()
+                self.dropped[_channel(dropped)] += 1
+                self.unfinished_tasks -= 1
+
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+    def head_age(self, now=None):
+        """
+        Returns how long the oldest queued item has been waiting, if it
+        carries its enqueue time (see bitex.api.WSS.latency.FeedItem). A
+        growing age means the consumer has stalled.
+        :param now: timestamp, defaults to the current time
+        :return: float, seconds, or None if the queue is empty
+        """
+        with self.mutex:
+            if not self.queue:
+                return None
+            enqueued = getattr(self.queue[0][1], 'enqueue_ts', None)
+        if enqueued is None:
+            return None
+        return (time.time() if now is None else now) - enqueued
+
+    def stats(self):
+        """
+        Returns the number of queued items and the number of dropped and
+        conflated items per channel.
+        :return: dict
+        """
+        with self.mutex:
+            return {'size': self._qsize(), 'dropped': dict(self.dropped),
+                    'conflated': dict(self.conflated)}
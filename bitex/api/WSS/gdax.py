@@ -9,19 +9,90 @@ from websocket import create_connection, WebSocketTimeoutException
 import requests
 # Import Homebrew
 from bitex.api.WSS.base import WSSAPI
+from bitex.api.WSS.latency import parse_iso
+from bitex.api.WSS.orderbook import PriceLevelBook
+from bitex.metadata import metadata_cache
+from bitex import jsonlib
 
 # Init Logging Facilities
 log = logging.getLogger(__name__)
 
 
 class GDAXWSS(WSSAPI):
-    def __init__(self):
-        super(GDAXWSS, self).__init__('wss://ws-feed.gdax.com', 'GDAX')
+    """
+    Client for GDAX's Websocket feed. Besides putting all messages on data_q,
+    it maintains a level 2 order book per product from the level2 channel.
+
+    Gaps in the per-product sequence numbers of the full channel indicate
+    lost messages; the affected product's book is then replaced by a snapshot
+    queried via the REST API on a separate thread. Meanwhile, the product's
+    l2updates are buffered; those received before the snapshot's sequence
+    number are dropped, as the snapshot covers them, and the rest applied on
+    top of it.
+
+    With raw_frames=True, messages are put on data_q undecoded instead, and
+    no books are maintained.
+    """
+    def __init__(self, pairs=None, **kwargs):
+        """
+        :param pairs: list of product ids to subscribe to; defaults to all
+                      products, which are looked up when first needed
+        """
+        super(GDAXWSS, self).__init__('wss://ws-feed.gdax.com', 'GDAX',
+                                      **kwargs)
         self.conn = None
-        r = requests.get('https://api.gdax.com/products').json()
-        self.pairs = [x['id'] for x in r]
+        self._pairs = pairs
         self._data_thread = None
 
+        self.books = {}  # Dict of product id: PriceLevelBook
+        self.sequences = {}  # Last sequence number seen per product id
+        # Last sequence number each book reflects, if known
+        self._book_sequences = {}
+        # Incremented on every (re-)connect; snapshots queried before are
+        # discarded
+        self._generation = 0
+        self._rest = None
+        # Product id: list of (last sequence, changes, ts) of l2updates
+        # received while waiting for a snapshot
+        self._pending = {}
+        self._snapshot_threads = {}
+        self._book_lock = threading.Lock()
+
+    @property
+    def pairs(self):
+        """
+        Product ids to subscribe to; all products by default, as cached in
+        bitex.metadata.
+        :return: list
+        """
+        if self._pairs is None:
+            self._pairs = metadata_cache.get('gdax_products',
+                                             self._load_pairs)
+        return self._pairs
+
+    @pairs.setter
+    def pairs(self, value):
+        self._pairs = value
+
+    @staticmethod
+    def _load_pairs():
+        r = requests.get('https://api.gdax.com/products', timeout=10)
+        r.raise_for_status()
+        return [x['id'] for x in r.json()]
+
+    @property
+    def rest(self):
+        """
+        GDAX REST interface, used to query book snapshots. Neither rate
+        limited nor retried, so a snapshot is either received promptly or
+        requested again at the next gap.
+        :return: bitex.interfaces.GDAX
+        """
+        if self._rest is None:
+            from bitex.interfaces.gdax import GDAX
+            self._rest = GDAX(rate_limit=False, retry=False, timeout=5)
+        return self._rest
+
     def start(self):
         super(GDAXWSS, self).start()
 
@@ -36,15 +107,208 @@ class GDAXWSS(WSSAPI):
 
     def _process_data(self):
         self.conn = create_connection(self.addr, timeout=4)
-        payload = json.dumps({'type': 'subscribe', 'product_ids': self.pairs})
+        self._reset_sequences()
+        payload = json.dumps({'type': 'subscribe', 'product_ids': self.pairs,
+                              'channels': ['full', 'level2']})
         self.conn.send(payload)
         while self.running:
             try:
-                data = json.loads(self.conn.recv())
+                raw = self.conn.recv()
             except (WebSocketTimeoutException, ConnectionResetError):
                 self._controller_q.put('restart')
+                continue
+            ts = time.time()
+            self.record(raw, ts)
+            self.handle_frame(raw, ts)
+        self.conn = None
+
+    def _reset_sequences(self):
+        """
+        Forgets all sequence numbers, buffered l2updates and snapshots being
+        queried: the level2 channel sends a new snapshot of each product after
+        (re-)subscribing, so previous state is stale.
+        """
+        with self._book_lock:
+            self.sequences = {}
+            self._book_sequences = {}
+            self._pending = {}
+            self._generation += 1
+
+    def handle_frame(self, raw, ts, tag=''):
+        """
+        Processes a received message, or a book snapshot recorded by
+        resnapshot() if tag is 'snapshot'.
+        :param raw: str or bytes, as received
+        :param ts: timestamp, declares when data was received by the client
+        :param tag: str, see WSSAPI.record()
+        """
+        if self.raw_frames:
+            self.put_raw(raw, ts)
+            return
+
+        data = jsonlib.loads(raw)
+        if tag == 'snapshot':
+            self._apply_snapshot(data.pop('product_id'), data, ts)
+        elif 'product_id' in data:
+            if self.handle_message(data, ts):
+                self.put_item(('order_book', data['product_id'], data, ts),
+                              ts, parse_iso(data.get('time')))
+
+    def handle_message(self, data, ts):
+        """
+        Checks the message's sequence number and applies it to the product's
+        book, if it is a level2 message.
+        :param data: dict, decoded message
+        :param ts: timestamp, declares when data was received by the client
+        :return: False if the message is outdated and should be dropped
+        """
+        pid = data['product_id']
+        msg_type = data.get('type')
+
+        if 'sequence' in data:
+            seq = data['sequence']
+            # Snapshots raise the sequence from another thread
+            with self._book_lock:
+                last = self.sequences.get(pid)
+                if last is not None and seq <= last:
+                    return False
+                self.sequences[pid] = seq
+            if last is not None and seq > last + 1:
+                log.warning("GDAXWSS: Sequence gap for %s (%s -> %s); "
+                            "requesting snapshot..", pid, last, seq)
+                self._request_snapshot(pid)
+
+        if msg_type == 'snapshot':
+            with self._book_lock:
+                # Supersedes a snapshot still being queried
+                self._pending.pop(pid, None)
+                self._book(pid).reset(
+                    [(float(p), float(s)) for p, s in data['bids']],
+                    [(float(p), float(s)) for p, s in data['asks']], ts=ts)
+                self._book_sequences[pid] = self.sequences.get(pid)
+        elif msg_type == 'l2update':
+            changes = [('bids' if side == 'buy' else 'asks', float(p),
+                        float(s)) for side, p, s in data['changes']]
+            with self._book_lock:
+                try:
+                    self._pending[pid].append(
+                        (self.sequences.get(pid), changes, ts))
+                except KeyError:
+                    self._book(pid).update(changes, ts=ts)
+                    self._book_sequences[pid] = self.sequences.get(pid)
+        return True
+
+    def _request_snapshot(self, pid):
+        """
+        Buffers the product's l2updates until a snapshot has been applied,
+        and queries that snapshot on a separate thread, unless one is
+        already pending.
+        """
+        with self._book_lock:
+            if pid in self._pending:
+                return
+            self._pending[pid] = []
+        if self.replaying:
+            # The recorded snapshot follows instead
+            return
+        thread = threading.Thread(target=self.resnapshot, args=(pid,),
+                                  daemon=True, name='GDAXWSS Snapshot')
+        self._snapshot_threads[pid] = thread
+        thread.start()
+
+    def _book(self, pid):
+        try:
+            return self.books[pid]
+        except KeyError:
+            book = self.books[pid] = PriceLevelBook()
+            return book
+
+    def resnapshot(self, pid, ts=None):
+        """
+        Replaces the given product's book with a level 2 snapshot queried via
+        the REST API. If that fails, l2updates buffered meanwhile are applied
+        to the stale book.
+        :param pid: str, product id
+        :param ts: timestamp of the snapshot
+        """
+        generation = self._generation
+        try:
+            r = self.rest.order_book(pid, level=2)
+            snapshot = r.json()
+            r.raise_for_status()
+        except Exception:
+            log.exception("GDAXWSS.resnapshot(): Failed to query order book "
+                          "snapshot for %s!", pid)
+            with self._book_lock:
+                if generation == self._generation:
+                    for _, changes, update_ts in self._pending.pop(pid, ()):
+                        self._book(pid).update(changes, ts=update_ts)
+            return
+        ts = time.time() if ts is None else ts
+        if self.capture is not None:
+            self.record(json.dumps(dict(snapshot, product_id=pid)), ts,
+                        'snapshot')
+        self._apply_snapshot(pid, snapshot, ts, generation)
+
+    def _apply_snapshot(self, pid, snapshot, ts, generation=None):
+        """
+        Resets the product's book to the snapshot, then applies the l2updates
+        buffered since the gap which it doesn't cover. Snapshots which aren't
+        newer than the book, or were queried before a reconnect, are
+        discarded.
+        :param generation: value of self._generation when the snapshot was
+                           queried; None to skip this check
+        :return: Bool, whether the snapshot was applied
+        """
+        seq = snapshot.get('sequence')
+        with self._book_lock:
+            if generation is not None and generation != self._generation:
+                log.debug("GDAXWSS: Discarding snapshot of %s queried before "
+                          "reconnecting", pid)
+                return False
+            book_seq = self._book_sequences.get(pid)
+            if seq is not None and book_seq is not None and seq <= book_seq:
+                log.debug("GDAXWSS: Discarding snapshot of %s at %s, as the "
+                          "book is at %s", pid, seq, book_seq)
+                return False
+            pending = self._pending.pop(pid, ())
+            book = self._book(pid)
+            book.reset(
+                [(float(p), float(s)) for p, s, *_ in snapshot['bids']],
+                [(float(p), float(s)) for p, s, *_ in snapshot['asks']],
+                ts=ts)
+            book_seq = seq
+            for last, changes, update_ts in pending:
+                # Received after message `last` of the full channel; if the
+                # snapshot includes that message, it includes this update
+                if seq is None or last is None or last > seq:
+                    book.update(changes, ts=update_ts)
+                    book_seq = last
+            self._book_sequences[pid] = book_seq
+            if seq is not None:
+                self.sequences[pid] = max(seq, self.sequences.get(pid, seq))
+        return True
+
+    def best_bid_ask(self, pid):
+        """
+        Returns the given product's best bid and ask.
+        :param pid: str, product id
+        :return: tuple of (price, size) or None, for bid and ask
+        """
+        try:
+            book = self.books[pid]
+        except KeyError:
+            return None, None
+        return book.best_bid(), book.best_ask()
 
-            if 'product_id' in data:
-                self.data_q.put(('order_book', data['product_id'],
-                                 data, time.time()))
-        self.conn = None
\ No newline at end of file
+    def top(self, pid, n=10):
+        """
+        Returns the n best price levels of the given product's book.
+        :param pid: str, product id
+        :param n: int
+        :return: dict, see PriceLevelBook.top()
+        """
+        try:
+            return self.books[pid].top(n)
+        except KeyError:
+            return {'bids': [], 'asks': [], 'ts': None}
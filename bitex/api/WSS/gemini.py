@@ -9,6 +9,8 @@ import requests
 
 # Import Homebrew
 from bitex.api.WSS.base import WSSAPI
+from bitex.api.WSS.multiplex import WebsocketMultiplexer
+from bitex.metadata import metadata_cache
 
 # Init Logging Facilities
 log = logging.getLogger(__name__)
@@ -17,15 +19,60 @@ from websocket import create_connection, WebSocketTimeoutException
 
 
 class GeminiWSS(WSSAPI):
-    def __init__(self, endpoints=None):
-        super(GeminiWSS, self).__init__('wss://api.gemini.com/v1/', 'Gemini')
-        self.endpoints = (endpoints if endpoints else
-                          requests.get('https://api.gemini.com/v1/symbols').json())
-        self.endpoints = ['marketdata/' + x.upper() for x in self.endpoints]
+    """
+    Client for Gemini's market data Websocket API, which offers one endpoint
+    per symbol.
+
+    By default, each endpoint is served by a dedicated thread. With
+    multiplex=True, all endpoints are instead driven by a single
+    WebsocketMultiplexer loop, which reconnects each endpoint independently
+    and stops within milliseconds.
+    """
+    def __init__(self, endpoints=None, multiplex=False, **kwargs):
+        super(GeminiWSS, self).__init__('wss://api.gemini.com/v1/', 'Gemini',
+                                        **kwargs)
+        self._endpoints = (['marketdata/' + x.upper() for x in endpoints]
+                           if endpoints else None)
         self.endpoint_threads = {}
         self.threads_running = {}
         self.restarter_thread = None
         self.restart_q = Queue()
+        self.multiplexer = (WebsocketMultiplexer(self._handle_message,
+                                                 name='Gemini')
+                            if multiplex else None)
+
+    @property
+    def endpoints(self):
+        """
+        Endpoints to connect to; those of all symbols by default, as cached in
+        bitex.metadata.
+        :return: list
+        """
+        if self._endpoints is None:
+            symbols = metadata_cache.get('gemini_symbols', self._load_symbols)
+            self._endpoints = ['marketdata/' + x.upper() for x in symbols]
+        return self._endpoints
+
+    @endpoints.setter
+    def endpoints(self, value):
+        self._endpoints = value
+
+    @staticmethod
+    def _load_symbols():
+        r = requests.get('https://api.gemini.com/v1/symbols', timeout=10)
+        r.raise_for_status()
+        return r.json()
+
+    def _handle_message(self, endpoint, msg):
+        """
+        Puts a message received by the multiplexer on the data queue.
+        :param endpoint: str, endpoint the message was received from
+        :param msg: str, message
+        :return:
+        """
+        ep, pair = endpoint.split('/')
+        ts = time.time()
+        self.put_item((ep, pair, msg, ts), ts)
 
     def _restart_thread(self):
         """
@@ -63,8 +110,9 @@ class GeminiWSS(WSSAPI):
             log.debug("%s, %s", endpoint, msg)
             ep, pair = endpoint.split('/')
             log.debug("_subscription_thread(): Putting data on q..")
+            ts = time.time()
             try:
-                self.data_q.put((ep, pair, msg, time.time()), timeout=1)
+                self.put_item((ep, pair, msg, ts), ts, timeout=1)
             except TimeoutError:
                 continue
             finally:
@@ -75,12 +123,24 @@ class GeminiWSS(WSSAPI):
     def start(self):
         super(GeminiWSS, self).start()
 
+        if self.multiplexer:
+            log.debug("GeminiWSS.start(): launching Multiplexer..")
+            for endpoint in self.endpoints:
+                self.subscribe(endpoint)
+            self.multiplexer.start()
+            return
+
         log.debug("GeminiWSS.start(): launching Endpoint Threads..")
         for endpoint in self.endpoints:
             self.subscribe(endpoint)
 
     def stop(self):
         super(GeminiWSS, self).stop()
+        if self.multiplexer:
+            log.debug('stop(): Shutting down Multiplexer..')
+            self.multiplexer.stop()
+            return
+
         log.debug('stop(): Shutting down Endpoint threads..')
         for endpoint in self.endpoints:
             try:
@@ -98,6 +158,9 @@ class GeminiWSS(WSSAPI):
         self.start()
 
     def subscribe(self, endpoint):
+        if self.multiplexer:
+            self.multiplexer.add(endpoint, self.addr + endpoint)
+            return
         log.debug("GeminiWSS.subscribe(): Starting Thread for endpoint %s",
                   endpoint)
         self.threads_running[endpoint] = True
@@ -108,6 +171,9 @@ class GeminiWSS(WSSAPI):
         self.endpoint_threads[endpoint] = t
 
     def unsubscribe(self, endpoint):
+        if self.multiplexer:
+            self.multiplexer.remove(endpoint)
+            return
         self.threads_running[endpoint] = False
         try:
             self.endpoint_threads[endpoint].join(timeout=1)
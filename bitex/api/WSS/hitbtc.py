@@ -11,15 +11,17 @@ from websocket import create_connection, WebSocketTimeoutException
 
 # Import Homebrew
 from bitex.api.WSS.base import WSSAPI
+from bitex.api.WSS.latency import from_millis
+from bitex import jsonlib
 
 # Init Logging Facilities
 log = logging.getLogger(__name__)
 
 
 class HitBTCWSS(WSSAPI):
-    def __init__(self, key=None, secret=None):
+    def __init__(self, key=None, secret=None, **kwargs):
         data_addr = 'ws://api.hitbtc.com:80'
-        super(HitBTCWSS, self).__init__(data_addr, 'HitBTC')
+        super(HitBTCWSS, self).__init__(data_addr, 'HitBTC', **kwargs)
         self.trader_addr = 'ws://api.hitbtc.com:8080'
 
         self.data_thread = None
@@ -66,18 +68,34 @@ class HitBTCWSS(WSSAPI):
 
         while self.running:
             try:
-                data = conn.recv()
-                data = json.loads(data)
+                raw = conn.recv()
             except WebSocketTimeoutException:
                 self._controller_q.put('restart_data')
                 return
-            try:
-                pair = data['MarketDataIncrementalRefresh']['symbol']
-                endpoint = 'MarketDataIncrementalRefresh'
-            except KeyError:
-                pair = data['MarketDataSnapshotFullRefresh']['symbol']
-                endpoint = 'MarketDataSnapshotFullRefresh'
-            self.data_q.put((endpoint, pair, data[endpoint], time.time()))
+            ts = time.time()
+            self.record(raw, ts)
+            self.handle_frame(raw, ts)
+
+    def handle_frame(self, raw, ts, tag=''):
+        """
+        Processes a received market data message.
+        :param raw: str or bytes, as received
+        :param ts: timestamp, declares when data was received by the client
+        :param tag: unused; see WSSAPI.record()
+        """
+        if self.raw_frames:
+            self.put_raw(raw, ts)
+            return
+
+        data = jsonlib.loads(raw)
+        try:
+            pair = data['MarketDataIncrementalRefresh']['symbol']
+            endpoint = 'MarketDataIncrementalRefresh'
+        except KeyError:
+            pair = data['MarketDataSnapshotFullRefresh']['symbol']
+            endpoint = 'MarketDataSnapshotFullRefresh'
+        self.put_item((endpoint, pair, data[endpoint], ts), ts,
+                      from_millis(data[endpoint].get('timestamp')))
 
     def _trade_thread(self):
         try:
@@ -93,7 +111,7 @@ class HitBTCWSS(WSSAPI):
             except WebSocketTimeoutException:
                 self._controller_q.put('restart_data')
                 return
-            self.data_q.put(json.loads(data))
+            self.data_q.put(jsonlib.loads(data))
 
             try:
                 payload = self.trade_command_q.get()
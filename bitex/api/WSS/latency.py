@@ -0,0 +1,252 @@
+"""
+End-to-end latency of Websocket feeds.
+
+The clients put FeedItems on their data_q - tuples as before, i.e.
+('trades', 'BTCUSD', data, ts), which additionally carry the time the
+message was sent by the exchange (where the venue provides one), received by
+the client and put on the queue.
+
+A FeedLatencyMonitor, called by the consumer for each item it takes off the
+queue, records histograms per channel and pair of:
+
+    wire        exchange timestamp to handler; includes the clock offset
+                between the exchange and the local host
+    receive     local receipt to handler
+    queue       time spent in data_q
+
+    >>> monitor = FeedLatencyMonitor('Bitfinex')
+    >>> monitor.watch(wss.data_q, max_lag=2)  # warns about stalled consumers
+    >>> while True:
+    ...     item = wss.data_q.get()
+    ...     monitor.observe(item)
+    ...     handle(item)
+    >>> monitor.snapshot()[('trades', 'BTCUSD', 'queue')]['p99']
+"""
+# Import Built-Ins
+import logging
+import threading
+import time
+import re
+import calendar
+
+# Import Third-Party
+
+# Import Homebrew
+from bitex.timing import Histogram, format_statsd
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+METRICS = ('wire', 'receive', 'queue')
+
+
+class FeedItem(tuple):
+    """
+    Item of a Websocket client's data_q, with the timestamps of its journey.
+    Behaves like the plain tuple it wraps.
+    """
+    def __new__(cls, item, recv_ts=None, exchange_ts=None):
+        """
+        :param item: tuple, starting with channel and pair
+        :param recv_ts: timestamp, when the message was received
+        :param exchange_ts: timestamp, when the exchange sent the message or
+                            the event occurred, if known
+        """
+        self = super(FeedItem, cls).__new__(cls, item)
+        self.recv_ts = recv_ts
+        self.exchange_ts = exchange_ts
+        self.enqueue_ts = None
+        return self
+
+    @property
+    def channel(self):
+        return self[0]
+
+    @property
+    def pair(self):
+        return self[1]
+
+
+# ISO 8601 time, as in 2017-08-01T12:00:00.123456Z; naive times are UTC
+ISO_TIME = re.compile(r'(\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d)(\.\d+)?'
+                      r'(?:Z|([+-])(\d\d):?(\d\d))?$')
+
+
+def parse_iso(ts):
+    """
+    Converts an ISO 8601 time string, as sent by GDAX, into a timestamp.
+    Parsed via time.strptime(), as datetime.fromisoformat() needs Python 3.7.
+    :return: float, or None if ts is missing or invalid
+    """
+    if not ts or not isinstance(ts, str):
+        return None
+    match = ISO_TIME.match(ts)
+    if match is None:
+        return None
+    seconds, fraction, sign, hours, minutes = match.groups()
+    try:
+        timestamp = calendar.timegm(time.strptime(seconds,
+                                                  '%Y-%m-%dT%H:%M:%S'))
+    except ValueError:
+        return None
+    if fraction:
+        timestamp += float(fraction)
+    if sign:
+        offset = int(hours) * 3600 + int(minutes) * 60
+        timestamp -= offset if sign == '+' else -offset
+    return float(timestamp)
+
+
+def from_millis(ms):
+    """
+    :return: float timestamp of milliseconds since the epoch, or None
+    """
+    try:
+        return int(ms) / 1000
+    except (TypeError, ValueError):
+        return None
+
+
+class FeedLatencyMonitor:
+    """
+    Histograms of wire-to-handler, receive-to-handler and queue residency
+    times, per channel and pair.
+    """
+    def __init__(self, name='', precision=8):
+        """
+        :param name: str, i.e. the exchange's name; used in exports
+        :param precision: see bitex.timing.Histogram
+        """
+        self.name = name
+        self.precision = precision
+        self._histograms = {}
+        self._lock = threading.Lock()
+        self.latest = {}  # (channel, pair): {metric: seconds} of last item
+        self._watcher = None
+
+    def _histogram(self, key):
+        h = self._histograms.get(key)
+        if h is None:
+            with self._lock:
+                h = self._histograms.setdefault(key,
+                                                Histogram(self.precision))
+        return h
+
+    def observe(self, item, now=None):
+        """
+        Records the latencies of an item, as it's about to be handled. Items
+        which aren't FeedItems are ignored.
+        :param item: FeedItem, as taken off a data_q
+        :param now: timestamp, defaults to the current time
+        :return: dict of metric: seconds, or None
+        """
+        if not isinstance(item, FeedItem):
+            return None
+        if now is None:
+            now = time.time()
+        channel, pair = item[0], item[1]
+        latencies = {}
+        for metric, ts in (('wire', item.exchange_ts),
+                           ('receive', item.recv_ts),
+                           ('queue', item.enqueue_ts)):
+            if ts is not None:
+                latencies[metric] = now - ts
+                self._histogram((channel, pair, metric)).record(now - ts)
+        self.latest[(channel, pair)] = latencies
+        return latencies
+
+    def wrap(self, handler):
+        """
+        Returns a handler which observes each item before passing it on.
+        :param handler: callable, taking an item
+        :return: function
+        """
+        def observed(item):
+            self.observe(item)
+            return handler(item)
+        return observed
+
+    def snapshot(self, reset=False):
+        """
+        :param reset: if True, clears the histograms
+        :return: dict of (channel, pair, metric): summary, see
+                 bitex.timing.Histogram.summary()
+        """
+        with self._lock:
+            histograms = list(self._histograms.items())
+        return {key: h.summary(reset) for key, h in histograms}
+
+    def statsd(self, prefix='bitex.feed', reset=False):
+        """
+        Exports the summaries as StatsD gauges, i.e.
+        'bitex.feed.Bitfinex.trades.BTCUSD.queue.p99:1.2|g'.
+        :return: str
+        """
+        return format_statsd(
+            {(self.name,) + key: summary
+             for key, summary in self.snapshot(reset).items()}, prefix)
+
+    def lagging(self, max_lag, metric='wire'):
+        """
+        Returns the channels and pairs whose last handled item exceeded
+        max_lag; falls back to the receive latency for items without an
+        exchange timestamp, if metric is 'wire'.
+        :param max_lag: seconds
+        :param metric: one of METRICS
+        :return: dict of (channel, pair): seconds
+        """
+        result = {}
+        for key, latencies in list(self.latest.items()):
+            lag = latencies.get(metric)
+            if lag is None and metric == 'wire':
+                lag = latencies.get('receive')
+            if lag is not None and lag > max_lag:
+                result[key] = lag
+        return result
+
+    def watch(self, data_q, max_lag, interval=1.0, alert=None):
+        """
+        Checks every interval seconds, in a background thread, whether the
+        oldest item in data_q has waited longer than max_lag - i.e. whether
+        the consumer stalled - and whether any feed lags by more than
+        max_lag; replaces any running watch.
+        :param data_q: bitex.api.WSS.dataqueue.DataQueue
+        :param max_lag: seconds
+        :param interval: seconds between checks
+        :param alert: callable, called with a dict of (channel, pair): lag in
+                      seconds, where ('data_q', None) denotes the oldest
+                      queued item; logs a warning by default
+        """
+        self.stop_watching()
+        stop = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                try:
+                    lags = self.lagging(max_lag)
+                    age = data_q.head_age()
+                    if age is not None and age > max_lag:
+                        lags[('data_q', None)] = age
+                    if not lags:
+                        continue
+                    if alert is None:
+                        log.warning("%s feed lagging: %s", self.name, lags)
+                    else:
+                        alert(lags)
+                except Exception:
+                    log.exception("FeedLatencyMonitor.watch(): Error while "
+                                  "checking lag!")
+
+        thread = threading.Thread(target=run, daemon=True,
+                                  name='%s Feed Latency Watcher' % self.name)
+        self._watcher = thread, stop
+        thread.start()
+
+    def stop_watching(self):
+        if self._watcher is None:
+            return
+        thread, stop = self._watcher
+        self._watcher = None
+        stop.set()
+        thread.join()
@@ -0,0 +1,312 @@
+"""
+Drives many websocket-client connections from a single thread.
+
+All sockets are switched to non-blocking mode and registered with a selector;
+readable sockets are drained up to a fixed number of messages per pass, so a
+busy connection cannot starve the others. Handshakes are done by a small pool
+of worker threads, which hand established connections back to the loop.
+
+Each endpoint keeps its own reconnect state: a dropped or silent connection
+is closed and reopened after an exponentially increasing delay, without
+affecting the other endpoints.
+"""
+# Import Built-Ins
+import logging
+import selectors
+import socket
+import ssl
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Import Third-Party
+from websocket import create_connection, WebSocketTimeoutException
+
+# Import Homebrew
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+# Exceptions raised by a non-blocking recv() if no (complete) frame is
+# available yet; the connection's frame buffer keeps any partial data.
+WOULD_BLOCK = (WebSocketTimeoutException, BlockingIOError,
+               ssl.SSLWantReadError)
+
+
+class _Endpoint:
+    """
+    Connection and reconnect state of a single endpoint.
+    """
+    def __init__(self, name, url):
+        self.name = name
+        self.url = url
+        self.conn = None
+        self.sock = None
+        self.connecting = False
+        self.failures = 0
+        self.retry_at = 0.0
+        self.last_recv = 0.0
+
+
+class WebsocketMultiplexer:
+    """
+    Maintains websocket connections to several endpoints and calls
+    `callback(name, message)` from its loop thread for every message
+    received.
+    """
+    def __init__(self, callback, name='Multiplexer', timeout=10,
+                 heartbeat_timeout=30, backoff=(0.5, 30), max_reads=100,
+                 connect_workers=4):
+        """
+        :param callback: callable, taking the endpoint's name and the message
+        :param name: str, used to name the loop thread
+        :param timeout: seconds to wait for a connection's handshake
+        :param heartbeat_timeout: seconds after which a silent connection is
+                                  considered dead and reopened
+        :param backoff: (minimum, maximum) seconds to wait before reconnecting
+        :param max_reads: max number of messages read from one connection per
+                          pass of the loop
+        :param connect_workers: number of threads doing handshakes
+        """
+        self.callback = callback
+        self.name = name
+        self.timeout = timeout
+        self.heartbeat_timeout = heartbeat_timeout
+        self.backoff = backoff
+        self.max_reads = max_reads
+        self.connect_workers = connect_workers
+        self.running = False
+
+        self.endpoints = {}
+        self._commands = deque()
+        self._backlog = set()
+        self._selector = None
+        self._executor = None
+        self._thread = None
+        self._wake_r, self._wake_w = None, None
+
+    def add(self, name, url):
+        """
+        Connects to the given url; messages are passed to the callback along
+        with `name`.
+        """
+        self._commands.append(('add', name, url))
+        self._wake()
+
+    def remove(self, name):
+        """
+        Closes the connection to the given endpoint.
+        """
+        self._commands.append(('remove', name, None))
+        self._wake()
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        for endpoint in self.endpoints.values():
+            endpoint.connecting = False
+            endpoint.retry_at = 0.0
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+        self._executor = ThreadPoolExecutor(max_workers=self.connect_workers)
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name='%s Loop Thread' % self.name)
+        self._thread.start()
+
+    def stop(self, timeout=1):
+        """
+        Stops the loop and closes all connections. Returns as soon as the loop
+        thread exited, or after `timeout` seconds.
+        """
+        if not self.running:
+            return
+        self.running = False
+        self._wake()
+        self._thread.join(timeout)
+        # Handshakes still in progress are closed by _on_connected()
+        self._executor.shutdown(wait=False)
+
+    def _wake(self):
+        """
+        Interrupts the loop's select() call.
+        """
+        try:
+            self._wake_w.send(b'\0')
+        except (AttributeError, BlockingIOError, OSError):
+            # Not started, or a wake up is already pending
+            pass
+
+    def _run(self):
+        try:
+            while self.running:
+                self._apply_commands()
+                timeout = self._maintain()
+                for key, _ in self._selector.select(timeout):
+                    if key.data is None:
+                        self._drain_wake()
+                    else:
+                        self._read(key.data)
+                for endpoint in list(self._backlog):
+                    self._read(endpoint)
+        except Exception:
+            log.exception("%s: Loop crashed!", self.name)
+        finally:
+            for endpoint in self.endpoints.values():
+                self._close(endpoint)
+            # Keep adds and removes for the next start()
+            pending = deque()
+            while self._commands:
+                cmd, endpoint, arg = self._commands.popleft()
+                if cmd != 'connected':
+                    pending.append((cmd, endpoint, arg))
+                elif not arg.exception():
+                    arg.result().close()
+            self._commands.extend(pending)
+            self._selector.close()
+            self._wake_r.close()
+            self._wake_w.close()
+            log.debug("%s: Loop ended.", self.name)
+
+    def _drain_wake(self):
+        try:
+            while self._wake_r.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _apply_commands(self):
+        while self._commands:
+            cmd, name, arg = self._commands.popleft()
+            if cmd == 'add':
+                if name not in self.endpoints:
+                    self.endpoints[name] = _Endpoint(name, arg)
+            elif cmd == 'remove':
+                try:
+                    endpoint = self.endpoints.pop(name)
+                except KeyError:
+                    continue
+                self._close(endpoint)
+            elif cmd == 'connected':
+                self._register(name, arg)
+
+    def _maintain(self):
+        """
+        Opens connections which are due for (re)connecting, drops silent ones
+        and returns the time until the next reconnect is due.
+        :return: float, seconds
+        """
+        now = time.monotonic()
+        timeout = 1.0
+        for endpoint in self.endpoints.values():
+            if endpoint.conn is not None:
+                if now - endpoint.last_recv > self.heartbeat_timeout:
+                    log.warning("%s: No data from %s in %ss - reconnecting..",
+                                self.name, endpoint.name,
+                                self.heartbeat_timeout)
+                    self._drop(endpoint)
+            elif not endpoint.connecting:
+                if now >= endpoint.retry_at:
+                    self._connect(endpoint)
+                else:
+                    timeout = min(timeout, endpoint.retry_at - now)
+        return 0 if self._backlog else timeout
+
+    def _connect(self, endpoint):
+        log.debug("%s: Connecting to %s..", self.name, endpoint.url)
+        endpoint.connecting = True
+        future = self._executor.submit(create_connection, endpoint.url,
+                                       timeout=self.timeout)
+        future.add_done_callback(
+            lambda f: self._on_connected(endpoint, f))
+
+    def _on_connected(self, endpoint, future):
+        """
+        Called by a worker thread once a handshake completed or failed.
+        """
+        if not self.running:
+            if not future.exception():
+                future.result().close()
+            return
+        self._commands.append(('connected', endpoint, future))
+        self._wake()
+
+    def _register(self, endpoint, future):
+        endpoint.connecting = False
+        if self.endpoints.get(endpoint.name) is not endpoint:
+            # Removed in the meantime
+            if not future.exception():
+                future.result().close()
+            return
+        try:
+            conn = future.result()
+        except Exception as e:
+            log.error("%s: Connecting to %s failed: %s", self.name,
+                      endpoint.url, e)
+            self._schedule_retry(endpoint)
+            return
+        conn.sock.setblocking(False)
+        endpoint.conn = conn
+        endpoint.sock = conn.sock
+        endpoint.last_recv = time.monotonic()
+        self._selector.register(conn.sock, selectors.EVENT_READ, endpoint)
+        log.info("%s: Connected to %s.", self.name, endpoint.url)
+
+    def _read(self, endpoint):
+        self._backlog.discard(endpoint)
+        for _ in range(self.max_reads):
+            if endpoint.conn is None:
+                return
+            try:
+                msg = endpoint.conn.recv()
+            except WOULD_BLOCK:
+                return
+            except Exception as e:
+                log.warning("%s: Connection to %s lost: %s", self.name,
+                            endpoint.name, e)
+                self._drop(endpoint)
+                return
+            endpoint.last_recv = time.monotonic()
+            endpoint.failures = 0
+            if msg:
+                try:
+                    self.callback(endpoint.name, msg)
+                except Exception:
+                    log.exception("%s: Callback failed for message from %s",
+                                  self.name, endpoint.name)
+        # More data may be available - continue on the next pass
+        self._backlog.add(endpoint)
+
+    def _close(self, endpoint):
+        self._backlog.discard(endpoint)
+        if endpoint.conn is None:
+            return
+        # Unregister the socket we registered - websocket-client drops its
+        # reference to it once the connection is lost.
+        try:
+            self._selector.unregister(endpoint.sock)
+        except (KeyError, ValueError):
+            pass
+        try:
+            endpoint.conn.close(timeout=0)
+        except Exception:
+            pass
+        endpoint.conn = None
+        endpoint.sock = None
+
+    def _drop(self, endpoint):
+        self._close(endpoint)
+        self._schedule_retry(endpoint)
+
+    def _schedule_retry(self, endpoint):
+        endpoint.failures += 1
+        minimum, maximum = self.backoff
+        delay = min(maximum, minimum * 2 ** (endpoint.failures - 1))
+        endpoint.retry_at = time.monotonic() + delay
+        log.debug("%s: Reconnecting to %s in %ss", self.name, endpoint.name,
+                  delay)
@@ -10,15 +10,17 @@ import requests
 
 # Import Homebrew
 from bitex.api.WSS.base import WSSAPI
+from bitex.api.WSS.latency import from_millis
+from bitex import jsonlib
 
 # Init Logging Facilities
 log = logging.getLogger(__name__)
 
 
 class OKCoinWSS(WSSAPI):
-    def __init__(self):
+    def __init__(self, **kwargs):
         super(OKCoinWSS, self).__init__('wss://real.okcoin.com:10440/websocket/okcoinapi ',
-                                        'OKCoin')
+                                        'OKCoin', **kwargs)
         self.conn = None
 
         self.pairs = ['BTC', 'LTC']
@@ -51,14 +53,35 @@ class OKCoinWSS(WSSAPI):
             self.conn.send(json.dumps(payload))
         while self.running:
             try:
-                data = json.loads(self.conn.recv())
+                raw = self.conn.recv()
             except (WebSocketTimeoutException, ConnectionResetError):
                 self._controller_q.put('restart')
+                continue
+            ts = time.time()
+            self.record(raw, ts)
+            self.handle_frame(raw, ts)
+        self.conn = None
+
+    def handle_frame(self, raw, ts, tag=''):
+        """
+        Processes a received message.
+        :param raw: str or bytes, as received
+        :param ts: timestamp, declares when data was received by the client
+        :param tag: unused; see WSSAPI.record()
+        """
+        if self.raw_frames:
+            self.put_raw(raw, ts)
+            return
 
-            if 'data' in data:
-                pair = ''.join(data['channel'].split('spot')[1].split('_')[:2]).upper()
-                self.data_q.put((data['channel'], pair, data['data'],
-                                 time.time()))
+        data = jsonlib.loads(raw)
+        # OKCoin sends lists of messages
+        for msg in data if isinstance(data, list) else [data]:
+            if 'data' in msg and msg.get('channel') != 'addChannel':
+                pair = ''.join(msg['channel'].split('spot')[1].split('_')[:2]).upper()
+                payload = msg['data']
+                exchange_ts = (from_millis(payload.get('timestamp'))
+                               if isinstance(payload, dict) else None)
+                self.put_item((msg['channel'], pair, payload, ts), ts,
+                              exchange_ts)
             else:
-                log.debug(data)
-        self.conn = None
\ No newline at end of file
+                log.debug(msg)
\ No newline at end of file
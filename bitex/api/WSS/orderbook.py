@@ -0,0 +1,296 @@
+"""
+Local order books, maintained from the snapshots and deltas received via
+websocket.
+
+Each side of a book is a dict of price: size, plus a list of its prices kept
+sorted via bisect; the best bid and ask are read from the ends of those lists
+in constant time. Updates take a short lock, and queries copy the data they
+need under the same lock, so readers never hold up the thread applying
+updates for longer than the copy takes.
+
+Listeners added via add_listener() are called with the changed price levels
+after each update, i.e. to maintain aggregated views of several books.
+"""
+# Import Built-Ins
+import logging
+import threading
+from bisect import bisect_left, insort
+
+# Import Third-Party
+
+# Import Homebrew
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+class PriceLevelBook:
+    """
+    Order book aggregated by price level.
+    """
+    def __init__(self):
+        self._sizes = {'bids': {}, 'asks': {}}
+        # Prices sorted ascending - best bid is last, best ask is first
+        self._prices = {'bids': [], 'asks': []}
+        self._lock = threading.Lock()
+        self.ts = None
+        self._listeners = []
+        self._changes = []
+
+    def __len__(self):
+        return len(self._prices['bids']) + len(self._prices['asks'])
+
+    def _set(self, side, price, size):
+        """
+        Sets the size of the given price level; a size of 0 removes it. Must
+        be called while holding self._lock.
+        """
+        sizes = self._sizes[side]
+        prices = self._prices[side]
+        if size:
+            if price not in sizes:
+                insort(prices, price)
+            sizes[price] = size
+        elif price in sizes:
+            del sizes[price]
+            del prices[bisect_left(prices, price)]
+        else:
+            return
+        if self._listeners:
+            self._changes.append((side, price, size))
+
+    def add_listener(self, callback, initial=False):
+        """
+        Registers a callback, called after each update with a list of the
+        changed (side, price, size) levels and a flag, which is True if the
+        book was replaced and the list holds its complete contents. Callbacks
+        are called while holding the book's lock, and must not query it.
+        :param callback: callable taking changes and snapshot
+        :param initial: if True, callback is first called with the book's
+                        current contents
+        """
+        with self._lock:
+            self._listeners.append(callback)
+            if initial:
+                callback(self._contents(), True)
+
+    def _contents(self):
+        return [(side, price, self._sizes[side][price])
+                for side in ('bids', 'asks') for price in self._prices[side]]
+
+    def remove_listener(self, callback):
+        with self._lock:
+            self._listeners.remove(callback)
+
+    def _notify(self, snapshot=False):
+        """
+        Passes the changes of the current update to all listeners. Must be
+        called while holding self._lock.
+        """
+        if not self._listeners:
+            return
+        changes, self._changes = self._changes, []
+        if snapshot:
+            changes = self._contents()
+        for callback in self._listeners:
+            callback(changes, snapshot)
+
+    def set(self, side, price, size, ts=None):
+        """
+        Sets the size of a price level.
+        :param side: 'bids' or 'asks'
+        :param price: float
+        :param size: float; 0 removes the price level
+        :param ts: timestamp of the update
+        """
+        with self._lock:
+            self._set(side, price, size)
+            self.ts = ts
+            self._notify()
+
+    def update(self, levels, ts=None):
+        """
+        Applies several price level updates at once.
+        :param levels: iterable of (side, price, size)
+        :param ts: timestamp of the update
+        """
+        with self._lock:
+            for side, price, size in levels:
+                self._set(side, price, size)
+            self.ts = ts
+            self._notify()
+
+    def reset(self, bids=(), asks=(), ts=None):
+        """
+        Replaces the book's contents, i.e. with a snapshot.
+        :param bids: iterable of (price, size)
+        :param asks: iterable of (price, size)
+        :param ts: timestamp of the snapshot
+        """
+        bid_sizes = {price: size for price, size in bids if size}
+        ask_sizes = {price: size for price, size in asks if size}
+        with self._lock:
+            self._sizes = {'bids': bid_sizes, 'asks': ask_sizes}
+            self._prices = {'bids': sorted(bid_sizes),
+                            'asks': sorted(ask_sizes)}
+            self.ts = ts
+            self._notify(snapshot=True)
+
+    def clear(self):
+        self.reset()
+
+    def best_bid(self):
+        """
+        Returns the highest bid as (price, size), or None if there are no
+        bids.
+        :return: tuple or None
+        """
+        with self._lock:
+            prices = self._prices['bids']
+            if not prices:
+                return None
+            return prices[-1], self._sizes['bids'][prices[-1]]
+
+    def best_ask(self):
+        """
+        Returns the lowest ask as (price, size), or None if there are no
+        asks.
+        :return: tuple or None
+        """
+        with self._lock:
+            prices = self._prices['asks']
+            if not prices:
+                return None
+            return prices[0], self._sizes['asks'][prices[0]]
+
+    def depth_at(self, price, side=None):
+        """
+        Returns the size available at the given price; 0 if there's no such
+        price level.
+        :param price: float
+        :param side: 'bids' or 'asks'; if None, both sides are searched
+        :return: float
+        """
+        sides = (side,) if side else ('bids', 'asks')
+        with self._lock:
+            for s in sides:
+                try:
+                    return self._sizes[s][price]
+                except KeyError:
+                    continue
+        return 0
+
+    def top(self, n=10):
+        """
+        Returns the n best price levels of each side, best first.
+        :param n: int, or None for all levels
+        :return: dict of 'bids', 'asks': list of (price, size), and 'ts'
+        """
+        with self._lock:
+            bids, asks = self._sizes['bids'], self._sizes['asks']
+            bid_prices = self._prices['bids']
+            ask_prices = self._prices['asks']
+            if n is not None:
+                bid_prices = bid_prices[-n:] if n else []
+                ask_prices = ask_prices[:n]
+            return {'bids': [(p, bids[p]) for p in reversed(bid_prices)],
+                    'asks': [(p, asks[p]) for p in ask_prices],
+                    'ts': self.ts}
+
+    def snapshot(self):
+        """
+        Returns a copy of the entire book; see top().
+        :return: dict
+        """
+        return self.top(None)
+
+
+class OrderLevelBook(PriceLevelBook):
+    """
+    Order book tracking individual orders, aggregating their sizes by price
+    level.
+    """
+    def __init__(self):
+        super(OrderLevelBook, self).__init__()
+        self._orders = {}
+
+    def _set_order(self, order_id, side, price, size):
+        """
+        Adds, changes or (if size is 0) removes an order. Must be called while
+        holding self._lock.
+        """
+        try:
+            old_side, old_price, old_size = self._orders.pop(order_id)
+        except KeyError:
+            pass
+        else:
+            level = self._sizes[old_side].get(old_price, 0) - old_size
+            self._set(old_side, old_price, level if level > 1e-12 else 0)
+
+        if size:
+            self._orders[order_id] = side, price, size
+            self._set(side, price, self._sizes[side].get(price, 0) + size)
+
+    def set_order(self, order_id, side, price, size, ts=None):
+        """
+        Adds or changes an order.
+        :param order_id: the order's id
+        :param side: 'bids' or 'asks'
+        :param price: float
+        :param size: float; 0 removes the order
+        :param ts: timestamp of the update
+        """
+        with self._lock:
+            self._set_order(order_id, side, price, size)
+            self.ts = ts
+            self._notify()
+
+    def remove_order(self, order_id, ts=None):
+        """
+        Removes an order, if it is in the book.
+        :param order_id: the order's id
+        :param ts: timestamp of the update
+        """
+        with self._lock:
+            self._set_order(order_id, None, None, 0)
+            self.ts = ts
+            self._notify()
+
+    def update_orders(self, orders, ts=None):
+        """
+        Applies several order updates at once.
+        :param orders: iterable of (order_id, side, price, size)
+        :param ts: timestamp of the update
+        """
+        with self._lock:
+            for order_id, side, price, size in orders:
+                self._set_order(order_id, side, price, size)
+            self.ts = ts
+            self._notify()
+
+    def reset_orders(self, orders=(), ts=None):
+        """
+        Replaces the book's contents with the given orders.
+        :param orders: iterable of (order_id, side, price, size)
+        :param ts: timestamp of the snapshot
+        """
+        with self._lock:
+            self._orders = {}
+            self._sizes = {'bids': {}, 'asks': {}}
+            self._prices = {'bids': [], 'asks': []}
+            for order_id, side, price, size in orders:
+                self._set_order(order_id, side, price, size)
+            self.ts = ts
+            self._notify(snapshot=True)
+
+    def clear(self):
+        self.reset_orders()
+
+    def order(self, order_id):
+        """
+        Returns the given order as (side, price, size), or None if it isn't in
+        the book.
+        :return: tuple or None
+        """
+        with self._lock:
+            return self._orders.get(order_id)
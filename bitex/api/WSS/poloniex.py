@@ -3,83 +3,209 @@ import signal
 import logging
 import multiprocessing as mp
 import time
+import json
+from threading import Thread
 
 # Import Third-Party
 from autobahn.asyncio.wamp import ApplicationRunner, ApplicationSession
-from asyncio import coroutine, get_event_loop
+import asyncio
 import requests
 
 # Import Homebrew
 from bitex.api.WSS.base import WSSAPI
+from bitex.metadata import metadata_cache
 
 # Init Logging Facilities
 log = logging.getLogger(__name__)
 
 
 class PoloniexSession(ApplicationSession):
-
-    @coroutine
-    def onJoin(self, *args, **kwargs):
-        channel = self.config.extra['channel']
-
-        def onTicker(*args, **kwargs):
-            self.config.extra['queue'].put((channel, (args, kwargs, time.time())))
-
-        if self.config.extra['is_killed'].is_set():
+    """
+    WAMP session subscribing to all channels listed in config.extra
+    ['channels'] (or the single config.extra['channel']), putting received
+    data on config.extra['queue'].
+    """
+
+    async def onJoin(self, *args, **kwargs):
+        extra = self.config.extra
+        channels = extra.get('channels') or [extra['channel']]
+
+        def handler(channel):
+            def on_event(*args, **kwargs):
+                extra['queue'].put((channel, (args, kwargs, time.time())))
+            return on_event
+
+        if extra['is_killed'].is_set():
             raise KeyboardInterrupt()
-        try:
-            yield from self.subscribe(onTicker, self.config.extra['channel'])
+        for channel in channels:
+            await self.subscribe(handler(channel), channel)
+        asyncio.ensure_future(self._watch(extra['is_killed']))
 
-        except Exception as e:
-            raise
+    async def _watch(self, is_killed):
+        """
+        Leaves the session once is_killed is set, which ends the runner.
+        """
+        while not is_killed.is_set():
+            await asyncio.sleep(0.2)
+        self.leave()
 
 
 class PlnxEndpoint(mp.Process):
+    """
+    Process running a PoloniexSession for one or more channels.
+    """
     def __init__(self, endpoint, q, **kwargs):
-        super(PlnxEndpoint, self).__init__(name='%s Endpoint Process' %
-                                                endpoint, **kwargs)
+        """
+        :param endpoint: str, channel to subscribe to, or list of channels
+        :param q: mp.Queue to put received data on
+        """
+        channels = [endpoint] if isinstance(endpoint, str) else list(endpoint)
+        name = channels[0] if len(channels) == 1 else '%s Channel' % len(channels)
+        super(PlnxEndpoint, self).__init__(name='%s Endpoint Process' % name,
+                                           **kwargs)
         self.endpoint = endpoint
+        self.channels = channels
         self.q = q
         self.is_killed = mp.Event()
 
     def run(self):
         self.runner = ApplicationRunner("wss://api.poloniex.com:443", 'realm1',
-                                   extra={'channel': self.endpoint,
-                                          'queue': self.q,
-                                          'is_killed': self.is_killed})
+                                        extra={'channels': self.channels,
+                                               'queue': self.q,
+                                               'is_killed': self.is_killed})
         self.runner.run(PoloniexSession)
 
-    def join(self, *args, **kwargs):
+    def join(self, timeout=5):
         self.is_killed.set()
-        super(PlnxEndpoint, self).join(*args, **kwargs)
+        super(PlnxEndpoint, self).join(timeout)
+        if self.is_alive():
+            log.warning("PlnxEndpoint.join(): %s did not exit in time - "
+                        "terminating..", self.name)
+            self.terminate()
+            super(PlnxEndpoint, self).join()
 
 
 class PoloniexWSS(WSSAPI):
-    def __init__(self, endpoints=None):
-        super(PoloniexWSS, self).__init__(None, 'Poloniex')
-        self.data_q = mp.Queue()
+    """
+    Client for Poloniex's WAMP based Websocket API.
+
+    By default, every channel is served by a dedicated process and
+    connection. With shards=n, the channels are instead distributed
+    round-robin across n processes, each subscribing to all of its channels
+    via a single session.
+
+    The processes pass their events to a forwarding thread, which puts them
+    on data_q as (channel, (args, kwargs, ts)) items. As these carry no pair,
+    they cannot be conflated; raw_frames isn't supported either.
+    """
+    def __init__(self, endpoints=None, shards=None, **kwargs):
+        """
+        :param endpoints: list of channels to subscribe to; defaults to all
+                          markets plus the ticker
+        :param shards: number of worker processes to distribute the channels
+                       across; None for one process per channel
+        :param kwargs: kwargs for WSSAPI, i.e. maxsize, policy or capture
+        """
+        if kwargs.get('policy') == 'conflate':
+            raise ValueError("PoloniexWSS items cannot be conflated, as "
+                             "their pair is unknown!")
+        if kwargs.get('raw_frames'):
+            raise ValueError("PoloniexWSS does not support raw_frames!")
+        super(PoloniexWSS, self).__init__(None, 'Poloniex', **kwargs)
+        self.connections = {}
+        self.shards = shards
+        self._endpoints = endpoints
+        # Events put by the endpoint processes, and the thread forwarding
+        # them to data_q
+        self._events_q = mp.Queue()
+        self._forwarder = None
+
+    @property
+    def endpoints(self):
+        """
+        Channels to subscribe to; all markets plus the ticker by default, as
+        cached in bitex.metadata.
+        :return: list
+        """
+        if self._endpoints is None:
+            markets = metadata_cache.get('poloniex_markets', self._load_markets)
+            self._endpoints = markets + ['ticker']
+        return self._endpoints
+
+    @endpoints.setter
+    def endpoints(self, value):
+        self._endpoints = value
+
+    @staticmethod
+    def _load_markets():
+        r = requests.get('https://poloniex.com/public?command=returnTicker',
+                         timeout=10)
+        r.raise_for_status()
+        return list(r.json().keys())
+
+    def create_connections(self):
+        """
+        Creates the endpoint processes for all channels; called by start().
+        """
         self.connections = {}
-        if endpoints:
-            self.endpoints = endpoints
+        if self.shards:
+            shards = min(self.shards, len(self.endpoints))
+            for i in range(shards):
+                self.connections['shard-%s' % i] = PlnxEndpoint(
+                    self.endpoints[i::shards], self._events_q)
         else:
-            r = requests.get('https://poloniex.com/public?command=returnTicker')
-            self.endpoints = list(r.json().keys())
-            self.endpoints.append('ticker')
-
-        for endpoint in self.endpoints:
-            self.connections[endpoint] = PlnxEndpoint(endpoint, self.data_q)
+            for endpoint in self.endpoints:
+                self.connections[endpoint] = PlnxEndpoint(endpoint,
+                                                          self._events_q)
+
+    def _forward(self):
+        """
+        Puts the events received by the endpoint processes on data_q, until
+        stop() sends None.
+        """
+        while True:
+            event = self._events_q.get()
+            if event is None:
+                break
+            channel, (args, kwargs, ts) = event
+            if self.capture is not None:
+                self.record(json.dumps([args, kwargs]), ts, channel)
+            self.put_item((channel, (args, kwargs, ts)), ts)
+
+    def handle_frame(self, raw, ts, tag=''):
+        """
+        Puts a recorded event on data_q, as received by _forward().
+        :param raw: str or bytes, json list of the event's args and kwargs
+        :param ts: timestamp, declares when data was received by the client
+        :param tag: str, the event's channel
+        """
+        if isinstance(raw, bytes):
+            raw = raw.decode('utf-8')
+        args, kwargs = json.loads(raw)
+        self.put_item((tag, (args, kwargs, ts)), ts)
 
     def start(self):
         super(PoloniexWSS, self).start()
+        if self._forwarder is None or not self._forwarder.is_alive():
+            self._forwarder = Thread(target=self._forward, daemon=True,
+                                     name='Poloniex Forwarder Thread')
+            self._forwarder.start()
+        if not self.connections:
+            self.create_connections()
         for conn in self.connections:
             self.connections[conn].start()
 
     def stop(self):
         for conn in self.connections:
             self.connections[conn].join()
+        # Processes can only be started once
+        self.connections = {}
+        if self._forwarder is not None:
+            self._events_q.put(None)
+            self._forwarder.join(timeout=5)
+            self._forwarder = None
         super(PoloniexWSS, self).stop()
 
-
 if __name__ == "__main__":
 
     wss = PoloniexWSS()
@@ -0,0 +1,94 @@
+"""
+Single-producer, single-consumer ring buffer, used to hand messages from a
+receiver thread to a processing thread.
+
+The producer only writes the head index and the consumer only writes the
+tail index, so neither put() nor drain() takes a lock; the GIL makes each
+index update atomic. The consumer drains all available messages (up to a
+limit) at once, and only blocks on an Event if the buffer is empty, which
+the producer sets only while the consumer is actually waiting.
+"""
+# Import Built-Ins
+import logging
+import threading
+
+# Import Third-Party
+
+# Import Homebrew
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+class RingBuffer:
+    """
+    Bounded SPSC buffer. put() must only be called from one thread, and
+    drain() from one other thread.
+    """
+    def __init__(self, capacity=65536):
+        """
+        :param capacity: max number of buffered items; rounded up to a power
+                         of two
+        """
+        size = 1
+        while size < capacity:
+            size <<= 1
+        self.capacity = size
+        self._mask = size - 1
+        self._buffer = [None] * size
+        self._head = 0  # Next slot to write; only written by the producer
+        self._tail = 0  # Next slot to read; only written by the consumer
+        self._waiting = False
+        self._wakeup = threading.Event()
+
+    def __len__(self):
+        return self._head - self._tail
+
+    def empty(self):
+        return self._head == self._tail
+
+    def put(self, item):
+        """
+        Appends item to the buffer.
+        :return: False if the buffer is full, True otherwise
+        """
+        head = self._head
+        if head - self._tail >= self.capacity:
+            return False
+        self._buffer[head & self._mask] = item
+        self._head = head + 1
+        if self._waiting:
+            self._wakeup.set()
+        return True
+
+    def drain(self, max_items=None, timeout=None):
+        """
+        Removes and returns up to max_items items, oldest first. If the
+        buffer is empty, waits up to timeout seconds for an item.
+        :param max_items: int or None for all available items
+        :param timeout: seconds to wait; None or 0 to return immediately
+        :return: list
+        """
+        tail = self._tail
+        head = self._head
+        if head == tail and timeout:
+            self._wakeup.clear()
+            self._waiting = True
+            # Re-check, in case an item was put before we set _waiting
+            if self._head == tail:
+                self._wakeup.wait(timeout)
+            self._waiting = False
+            head = self._head
+
+        n = head - tail
+        if max_items is not None and n > max_items:
+            n = max_items
+        if not n:
+            return []
+        buffer, mask = self._buffer, self._mask
+        items = []
+        for i in range(tail, tail + n):
+            items.append(buffer[i & mask])
+            buffer[i & mask] = None
+        self._tail = tail + n
+        return items
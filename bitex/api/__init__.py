@@ -1,3 +1,4 @@
-import bitex.api.REST
-import bitex.api.WSS
+# Sub-packages are imported on first access, see bitex._lazy
+from bitex._lazy import lazy_attributes
 
+lazy_attributes(__name__, {'REST': 'bitex.api.REST', 'WSS': 'bitex.api.WSS'})
@@ -0,0 +1,156 @@
+"""
+Opt-in response cache for the methods decorated with
+bitex.utils.return_api_response().
+
+Responses are cached per method for a configurable time-to-live, and
+concurrent identical calls are coalesced, so only one request is sent and all
+callers receive the same APIResponse object. Only methods with a configured
+TTL are cached - by default the public market data methods ticker(),
+order_book() and trades().
+"""
+
+# Import Built-Ins
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+# Import Third-Party
+
+# Import Homebrew
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+class _Call:
+    """
+    A call in progress, which other threads may wait for.
+    """
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache with per-method time-to-live.
+    """
+    DEFAULT_TTLS = {'ticker': 1.0, 'order_book': 0.5, 'trades': 1.0}
+
+    def __init__(self, ttls=None, maxsize=1024):
+        """
+        :param ttls: dict of method name: ttl in seconds; defaults to
+                     DEFAULT_TTLS. Methods not listed are not cached.
+        :param maxsize: max number of cached responses
+        """
+        self.ttls = dict(self.DEFAULT_TTLS if ttls is None else ttls)
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(client, func, args, kwargs):
+        """
+        Returns a hashable key identifying the call, or None if the arguments
+        are not hashable.
+        :param client: API Client the method is called on
+        :param func: the called method
+        :param args: args the method was called with, excluding self
+        :param kwargs: kwargs the method was called with
+        :return: tuple or None
+        """
+        key = (client.uri, func.__qualname__, args,
+               tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_or_call(self, key, ttl, call):
+        """
+        Returns the cached response for key if it has not expired yet.
+        Otherwise, waits for an identical call in progress, or calls `call`
+        and caches its result.
+        :param key: hashable
+        :param ttl: time-to-live of the result, in seconds
+        :param call: callable returning an APIResponse
+        :return: APIResponse
+        """
+        with self._lock:
+            now = time.monotonic()
+            try:
+                expires, response = self._entries[key]
+            except KeyError:
+                pass
+            else:
+                if expires > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return response
+                del self._entries[key]
+
+            try:
+                pending = self._in_flight[key]
+            except KeyError:
+                pending = None
+                self._in_flight[key] = current = _Call()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if pending is not None:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            if pending.result is None:
+                # The call was interrupted (i.e. by KeyboardInterrupt) in
+                # its own thread; make our own
+                return call()
+            return pending.result
+
+        try:
+            current.result = call()
+        except Exception as e:
+            current.error = e
+            raise
+        finally:
+            try:
+                with self._lock:
+                    del self._in_flight[key]
+                    if current.result is not None and current.result.ok:
+                        self._entries[key] = (time.monotonic() + ttl,
+                                              current.result)
+                        self._entries.move_to_end(key)
+                        while len(self._entries) > self.maxsize:
+                            self._entries.popitem(last=False)
+            finally:
+                current.done.set()
+        return current.result
+
+    def stats(self):
+        """
+        Returns hits, misses, coalesced calls and number of cached responses.
+        :return: dict
+        """
+        return {'hits': self.hits, 'misses': self.misses,
+                'coalesced': self.coalesced, 'size': len(self._entries)}
+
+
+# Shared cache, used by API Clients created with cache=True
+default_cache = ResponseCache()
@@ -0,0 +1,263 @@
+"""
+Order book of a single pair, consolidated from the books of several
+exchanges ("venues").
+
+Each price level holds the size offered per venue. Venue books are merged in
+incrementally - from the local books of the Websocket clients via track(), or
+from REST order_book() queries via poll() - and only the changed price levels
+are touched, so the best bid and ask across all venues are always at hand:
+
+    >>> book = ConsolidatedBook('BTCUSD')
+    >>> book.poll('Kraken', Kraken(), interval=2)
+    >>> book.track('GDAX', gdax_wss.books.setdefault('BTC-USD',
+    ...                                               PriceLevelBook()))
+    >>> book.best_bid()
+    (2501.0, 3.5, {'Kraken': 1.5, 'GDAX': 2.0})
+"""
+# Import Built-Ins
+import logging
+import threading
+from bisect import bisect_left, insort
+
+# Import Third-Party
+
+# Import Homebrew
+from bitex.pairs import normalize_pair, venue_pair
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+class ConsolidatedBook:
+    """
+    Price level book merged from several venues, with per-level venue
+    attribution.
+    """
+    def __init__(self, pair):
+        """
+        :param pair: str, name of the pair on any exchange; see bitex.pairs
+        """
+        self.pair = normalize_pair(pair)
+        self._lock = threading.Lock()
+        # price: {venue: size}, and price: total size
+        self._levels = {'bids': {}, 'asks': {}}
+        self._totals = {'bids': {}, 'asks': {}}
+        # Prices sorted ascending - best bid is last, best ask is first
+        self._prices = {'bids': [], 'asks': []}
+        self._venues = {}  # venue: {'bids': {price: size}, 'asks': ...}
+        self._listeners = {}  # venue: (tracked book, callback)
+        self._pollers = {}  # venue: (thread, stop event)
+        self.ts = {}  # venue: timestamp of its last update
+
+    @property
+    def venues(self):
+        with self._lock:
+            return sorted(self._venues)
+
+    def _set(self, venue, side, price, size):
+        """
+        Sets a venue's size at a price level; 0 removes it. Must be called
+        while holding self._lock.
+        """
+        sizes = self._venues[venue][side]
+        if sizes.get(price, 0) == size:
+            return
+        levels, totals = self._levels[side], self._totals[side]
+        level = levels.get(price)
+        if size:
+            sizes[price] = size
+            if level is None:
+                level = levels[price] = {}
+                insort(self._prices[side], price)
+            level[venue] = size
+        else:
+            del sizes[price]
+            del level[venue]
+            if not level:
+                del levels[price], totals[price]
+                del self._prices[side][bisect_left(self._prices[side], price)]
+                return
+        totals[price] = sum(level.values())
+
+    def _venue(self, venue):
+        try:
+            return self._venues[venue]
+        except KeyError:
+            sizes = self._venues[venue] = {'bids': {}, 'asks': {}}
+            return sizes
+
+    def update(self, venue, levels, ts=None):
+        """
+        Applies changed price levels of a venue's book.
+        :param venue: str, name of the venue
+        :param levels: iterable of (side, price, size); size 0 removes it
+        :param ts: timestamp of the update
+        """
+        with self._lock:
+            self._venue(venue)
+            for side, price, size in levels:
+                self._set(venue, side, price, size)
+            self.ts[venue] = ts
+
+    def replace(self, venue, bids=(), asks=(), ts=None):
+        """
+        Replaces a venue's book, i.e. with a snapshot. Only levels which
+        differ from the venue's previous book are changed.
+        :param venue: str
+        :param bids: iterable of (price, size)
+        :param asks: iterable of (price, size)
+        :param ts: timestamp of the snapshot
+        """
+        new = {'bids': dict(bids), 'asks': dict(asks)}
+        with self._lock:
+            current = self._venue(venue)
+            for side in ('bids', 'asks'):
+                for price in [p for p in current[side]
+                              if p not in new[side]]:
+                    self._set(venue, side, price, 0)
+                for price, size in new[side].items():
+                    self._set(venue, side, price, size)
+            self.ts[venue] = ts
+
+    def replace_formatted(self, venue, book, ts=None):
+        """
+        Replaces a venue's book with one formatted by an interface's
+        order_book(), i.e. lists of [ts, price, size] quotes.
+        """
+        self.replace(venue,
+                     [(float(p), float(s)) for _, p, s in book['bids']],
+                     [(float(p), float(s)) for _, p, s in book['asks']], ts)
+
+    def remove(self, venue):
+        """
+        Removes a venue and its levels, and stops tracking or polling it.
+        """
+        self.untrack(venue)
+        self._stop_poller(venue)
+        with self._lock:
+            sizes = self._venues.get(venue)
+            if sizes is None:
+                return
+            for side in ('bids', 'asks'):
+                for price in list(sizes[side]):
+                    self._set(venue, side, price, 0)
+            del self._venues[venue]
+            self.ts.pop(venue, None)
+
+    def track(self, venue, book):
+        """
+        Keeps the venue's levels in sync with a local book, i.e. one
+        maintained by a Websocket client.
+        :param venue: str
+        :param book: bitex.api.WSS.orderbook.PriceLevelBook
+        """
+        def apply(changes, snapshot):
+            if snapshot:
+                bids = [(p, s) for side, p, s in changes if side == 'bids']
+                asks = [(p, s) for side, p, s in changes if side == 'asks']
+                self.replace(venue, bids, asks, book.ts)
+            else:
+                self.update(venue, changes, book.ts)
+
+        self.untrack(venue)
+        self._listeners[venue] = book, apply
+        book.add_listener(apply, initial=True)
+
+    def untrack(self, venue):
+        try:
+            book, callback = self._listeners.pop(venue)
+        except KeyError:
+            return
+        book.remove_listener(callback)
+
+    def poll(self, venue, interface, interval=1.0, **kwargs):
+        """
+        Queries a venue's order book via REST every interval seconds, in a
+        background thread.
+        :param venue: str, as in bitex.pairs.FORMATS
+        :param interface: bitex.interfaces instance
+        :param interval: seconds between queries
+        :param kwargs: passed to interface.order_book()
+        """
+        pair = venue_pair(venue, self.pair)
+        stop = threading.Event()
+
+        def run():
+            while not stop.is_set():
+                try:
+                    r = interface.order_book(pair, **kwargs)
+                    if r.formatted:
+                        self.replace_formatted(venue, r.formatted)
+                except Exception:
+                    log.exception("ConsolidatedBook.poll(): Failed to query "
+                                  "%s's order book for %s!", venue, pair)
+                stop.wait(interval)
+
+        self._stop_poller(venue)
+        thread = threading.Thread(target=run, daemon=True,
+                                  name='%s %s Poller' % (venue, pair))
+        self._pollers[venue] = thread, stop
+        thread.start()
+
+    def _stop_poller(self, venue):
+        try:
+            thread, stop = self._pollers.pop(venue)
+        except KeyError:
+            return
+        stop.set()
+        if thread is not threading.current_thread():
+            thread.join()
+
+    def stop(self):
+        """
+        Stops all pollers and stops tracking all books.
+        """
+        for venue in list(self._pollers):
+            self._stop_poller(venue)
+        for venue in list(self._listeners):
+            self.untrack(venue)
+
+    def _level(self, side, price):
+        return price, self._totals[side][price], dict(self._levels[side][price])
+
+    def best_bid(self):
+        """
+        Returns the highest bid across all venues.
+        :return: tuple of price, total size and dict of venue: size, or None
+        """
+        with self._lock:
+            prices = self._prices['bids']
+            return self._level('bids', prices[-1]) if prices else None
+
+    def best_ask(self):
+        """
+        Returns the lowest ask across all venues.
+        :return: tuple of price, total size and dict of venue: size, or None
+        """
+        with self._lock:
+            prices = self._prices['asks']
+            return self._level('asks', prices[0]) if prices else None
+
+    def crossed(self):
+        """
+        Returns True if the best bid of one venue is at or above the best ask
+        of another.
+        """
+        with self._lock:
+            bids, asks = self._prices['bids'], self._prices['asks']
+            return bool(bids and asks and bids[-1] >= asks[0])
+
+    def top(self, n=10):
+        """
+        Returns the n best price levels of each side, best first.
+        :param n: int, or None for all levels
+        :return: dict of 'bids', 'asks': list of (price, total size,
+                 {venue: size})
+        """
+        with self._lock:
+            bids, asks = self._prices['bids'], self._prices['asks']
+            if n is not None:
+                bids = bids[-n:] if n else []
+                asks = asks[:n]
+            return {'bids': [self._level('bids', p) for p in reversed(bids)],
+                    'asks': [self._level('asks', p) for p in asks]}
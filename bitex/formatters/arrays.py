@@ -0,0 +1,66 @@
+"""
+Conversion of formatted order books into numpy arrays, as returned by the
+interfaces' order_book() methods if called with arrays=True:
+
+    >>> Kraken().order_book('XXBTZEUR', arrays=True).formatted
+    {'bids': {'ts': array([...]), 'price': array([...]), 'size': array([...])},
+     'asks': {...}}
+
+Each array is contiguous float64, so depth, VWAP or slippage calculations run
+as array operations. Pass arrays=<n> instead to get prices and sizes as int64
+fixed-point values with n decimals.
+"""
+# Import Built-Ins
+import logging
+
+# Import Third-Party
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
+# Import Homebrew
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+SIDES = ('bids', 'asks')
+FIELDS = ('ts', 'price', 'size')
+
+
+def _side_arrays(quotes, decimals):
+    if not quotes:
+        values = numpy.empty((0, 3))
+    else:
+        try:
+            values = numpy.array(quotes, dtype=numpy.float64)
+        except (TypeError, ValueError):
+            # Exchanges without per-quote timestamps return None for ts
+            values = numpy.array(quotes, dtype=object)
+            values[numpy.equal(values, None)] = numpy.nan
+            values = values.astype(numpy.float64)
+
+    arrays = {'ts': numpy.ascontiguousarray(values[:, 0])}
+    for i, field in ((1, 'price'), (2, 'size')):
+        column = values[:, i]
+        if decimals is not None:
+            column = numpy.rint(column * 10 ** decimals).astype(numpy.int64)
+        arrays[field] = numpy.ascontiguousarray(column)
+    return arrays
+
+
+def order_book_arrays(book, decimals=None):
+    """
+    Converts an order book as returned by Formatter.order_book() into arrays
+    per side and field. Missing timestamps become NaN.
+    :param book: dict of 'bids' and 'asks' lists of [ts, price, size] quotes
+    :param decimals: None for float64 prices and sizes; otherwise they are
+                     int64 fixed-point values, scaled by 10 ** decimals
+    :return: dict of side: {'ts': ndarray, 'price': ndarray, 'size': ndarray}
+    """
+    if not numpy_available:
+        raise SystemError("No numpy installed! Cannot create arrays!")
+    return {side: _side_arrays(book.get(side) or [], decimals)
+            for side in SIDES}
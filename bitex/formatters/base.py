@@ -42,6 +42,18 @@ class Formatter:
         """
         return data
 
+    @staticmethod
+    def tickers(data, *args, **kwargs):
+        """
+        Returns dict of tickers for all pairs, with the exchange's pair names as
+        keys and values in the format returned by ticker().
+        :param data: requests.response() obj
+        :param args:
+        :param kwargs:
+        :return: dict
+        """
+        return data
+
     @staticmethod
     def order_book(data, *args, **kwargs):
         """
@@ -53,6 +65,8 @@ class Formatter:
              'asks': [['1480941691', '0.015', '1'],
                       ['1480941650', '0.016', '0.67'],
                       ['1480941678', '0.017', '23']]}
+        If the exchange doesn't timestamp its quotes, ts is None. Bids are
+        sorted best (highest) first, asks best (lowest) first.
         :param data: requests.response() obj
         :param args:
         :param kwargs:
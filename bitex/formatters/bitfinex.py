@@ -17,6 +17,12 @@ class BtfxFormatter(Formatter):
         return (data['bid'], data['ask'], data['high'], data['low'], None, None,
                 data['last_price'], data['volume'], data['timestamp'])
 
+    @staticmethod
+    def order_book(data, *args, **kwargs):
+        return {side: [[q['timestamp'], q['price'], q['amount']]
+                       for q in data[side]]
+                for side in ('bids', 'asks')}
+
     @staticmethod
     def order(data, *args, **kwargs):
         try:
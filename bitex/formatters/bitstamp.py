@@ -17,4 +17,8 @@ class BtstFormatter(Formatter):
         return (data['bid'], data['ask'], data['high'], data['low'], data['open'],
                 None, data['last'], data['volume'], data['timestamp'])
 
-
+    @staticmethod
+    def order_book(data, *args, **kwargs):
+        ts = data['timestamp']
+        return {side: [[ts, price, size] for price, size, *_ in data[side]]
+                for side in ('bids', 'asks')}
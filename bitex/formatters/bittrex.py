@@ -12,11 +12,29 @@ log = logging.getLogger(__name__)
 class BtrxFormatter(Formatter):
 
     @staticmethod
-    def ticker(data, *args, **kwargs):
-        data = data['result'][0]
+    def _ticker(data):
         return (data['Bid'], data['Ask'], data['High'], data['Low'], None, None,
                 data['Last'], data['Volume'], data['TimeStamp'])
 
+    @staticmethod
+    def ticker(data, *args, **kwargs):
+        if len(data['result']) == 1:
+            return BtrxFormatter._ticker(data['result'][0])
+        # Served from getmarketsummaries
+        pair = args[1]
+        for summary in data['result']:
+            if summary['MarketName'] == pair:
+                return BtrxFormatter._ticker(summary)
+        raise KeyError(pair)
+
+    @staticmethod
+    def tickers(data, *args, **kwargs):
+        """
+        Returns dict of pair: ticker, for all pairs in data.
+        """
+        return {d['MarketName']: BtrxFormatter._ticker(d)
+                for d in data['result']}
+
     @staticmethod
     def order(data, *args, **kwargs):
         if data['success']:
@@ -25,11 +43,29 @@ class BtrxFormatter(Formatter):
             return False
 
     @staticmethod
-    def order_book(data, *args, **kwargs):
-        if data['success']:
-            return data['result']
-        else:
+    def _order_book(data, side):
+        """
+        Formats a getorderbook response, whose result is a list of quotes if
+        only one side ('buy' or 'sell') was requested.
+        """
+        if not data['success']:
             return None
+        result = data['result']
+        if isinstance(result, list):
+            if side not in ('buy', 'sell'):
+                raise ValueError("Cannot tell the side of the quotes, as "
+                                 "side %r was requested!" % side)
+            result = {side: result}
+        return {side: [[None, q['Rate'], q['Quantity']]
+                       for q in result.get(key) or []]
+                for side, key in (('bids', 'buy'), ('asks', 'sell'))}
+
+    @staticmethod
+    def order_book(data, *args, **kwargs):
+        # Called with the args of Bittrex.order_book(self, pair, side='both')
+        side = kwargs['side'] if 'side' in kwargs else (
+            args[2] if len(args) > 2 else 'both')
+        return BtrxFormatter._order_book(data, side)
 
     @staticmethod
     def cancel(data, *args, **kwargs):
@@ -12,4 +12,33 @@ log = logging.getLogger(__name__)
 
 class BterFormatter(Formatter):
 
-    pass
\ No newline at end of file
+    @staticmethod
+    def _ticker(pair, data):
+        volume = data.get('vol_' + pair.split('_')[0])
+        return (data['buy'], data['sell'], data['high'], data['low'], None,
+                None, data['last'], volume, None)
+
+    @staticmethod
+    def ticker(data, *args, **kwargs):
+        pair = args[1]
+        if pair == 'all':
+            return BterFormatter.tickers(data)
+        if 'last' not in data:
+            # Served from the tickers endpoint
+            data = data[pair]
+        return BterFormatter._ticker(pair, data)
+
+    @staticmethod
+    def tickers(data, *args, **kwargs):
+        """
+        Returns dict of pair: ticker, for all pairs in data.
+        """
+        return {pair: BterFormatter._ticker(pair, d)
+                for pair, d in data.items()}
+
+    @staticmethod
+    def order_book(data, *args, **kwargs):
+        # Bter lists asks from the highest price down
+        return {'bids': [[None, price, size] for price, size in data['bids']],
+                'asks': [[None, price, size] for price, size
+                         in sorted(data['asks'], key=lambda q: float(q[0]))]}
@@ -5,6 +5,7 @@ import logging
 
 # Import Homebrew
 from bitex.formatters.base import Formatter
+from bitex.formatters.bittrex import BtrxFormatter
 
 # Init Logging Facilities
 log = logging.getLogger(__name__)
@@ -15,4 +16,11 @@ class CcexFormatter(Formatter):
     @staticmethod
     def ticker(data, *args, **kwargs):
         return (data['buy'], data['sell'], data['high'], data['low'], None,
-                None, data['lastprice'], None, data['updated'])
\ No newline at end of file
+                None, data['lastprice'], None, data['updated'])
+
+    @staticmethod
+    def order_book(data, *args, **kwargs):
+        # Shaped as Bittrex's; CCEX.order_book(self, pair, type='both')
+        side = kwargs['type'] if 'type' in kwargs else (
+            args[2] if len(args) > 2 else 'both')
+        return BtrxFormatter._order_book(data, side)
@@ -15,4 +15,9 @@ class CnckFormatter(Formatter):
     @staticmethod
     def ticker(data, *args, **kwargs):
         return (data['bid'], data['ask'], data['high'], data['low'], None, None,
-                data['last'], data['volume'], data['timestamp'])
\ No newline at end of file
+                data['last'], data['volume'], data['timestamp'])
+
+    @staticmethod
+    def order_book(data, *args, **kwargs):
+        return {side: [[None, price, size] for price, size in data[side]]
+                for side in ('bids', 'asks')}
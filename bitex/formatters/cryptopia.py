@@ -15,4 +15,10 @@ class CrptFormatter(Formatter):
     @staticmethod
     def ticker(data, *args, **kwargs):
         return (data['BidPrice'], data['AskPrice'], data['High'], data['Low'],
-                None, None, data['LastPrice'], None, data['timestamp'])
\ No newline at end of file
+                None, None, data['LastPrice'], None, data['timestamp'])
+
+    @staticmethod
+    def order_book(data, *args, **kwargs):
+        data = data['Data']
+        return {side: [[None, q['Price'], q['Volume']] for q in data[key]]
+                for side, key in (('bids', 'Buy'), ('asks', 'Sell'))}
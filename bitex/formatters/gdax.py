@@ -15,4 +15,9 @@ class GdaxFormatter(Formatter):
     @staticmethod
     def ticker(data, *args, **kwargs):
         return (data['bid'], data['ask'], None, None, None, None, data['price'],
-                data['volume'], data['time'])
\ No newline at end of file
+                data['volume'], data['time'])
+
+    @staticmethod
+    def order_book(data, *args, **kwargs):
+        return {side: [[None, price, size] for price, size, *_ in data[side]]
+                for side in ('bids', 'asks')}
@@ -15,4 +15,10 @@ class GmniFormatter(Formatter):
     @staticmethod
     def ticker(data, *args, **kwargs):
         return (data['bid'], data['ask'], None, None, None, None, data['last'],
-                data['volume'][args[0][:3].upper()], data['volume']['time'])
\ No newline at end of file
+                data['volume'][args[0][:3].upper()], data['volume']['time'])
+
+    @staticmethod
+    def order_book(data, *args, **kwargs):
+        return {side: [[q['timestamp'], q['price'], q['amount']]
+                       for q in data[side]]
+                for side in ('bids', 'asks')}
\ No newline at end of file
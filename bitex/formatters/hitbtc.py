@@ -12,4 +12,8 @@ log = logging.getLogger(__name__)
 
 class HitBtcFormatter(Formatter):
 
-    pass
\ No newline at end of file
+
+    @staticmethod
+    def order_book(data, *args, **kwargs):
+        return {side: [[None, price, size] for price, size in data[side]]
+                for side in ('bids', 'asks')}
@@ -16,4 +16,9 @@ class itbtFormatter(Formatter):
     def ticker(data, *args, **kwargs):
         return (data['bid'], data['ask'], data['high24h'], data['low24h'],
                 data['openToday'], None, data['lastPrice'], data['volume24h'],
-                data['serverTimeUTC'])
\ No newline at end of file
+                data['serverTimeUTC'])
+
+    @staticmethod
+    def order_book(data, *args, **kwargs):
+        return {side: [[None, price, size] for price, size in data[side]]
+                for side in ('bids', 'asks')}
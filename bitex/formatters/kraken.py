@@ -97,9 +97,11 @@ class KrknFormatter(Formatter):
                 quote_cur = 'Z' + quote_cur
             else:
                 quote_cur = 'X' + quote_cur
-            return data['result'][base_cur+quote_cur]
+            book = data['result'][base_cur+quote_cur]
         else:
-            return data['result'][pair]
+            book = data['result'][pair]
+        return {side: [[ts, price, size] for price, size, ts in book[side]]
+                for side in ('bids', 'asks')}
 
     @staticmethod
     def cancel(data, *args, **kwargs):
@@ -18,3 +18,10 @@ class OkcnFormatter(Formatter):
         data = data['ticker']
         return (data['buy'], data['sell'], data['high'], data['low'],
                 None, None, data['last'], data['vol'], date)
+
+    @staticmethod
+    def order_book(data, *args, **kwargs):
+        # OKCoin lists asks from the highest price down
+        return {'bids': [[None, price, size] for price, size in data['bids']],
+                'asks': [[None, price, size] for price, size
+                         in sorted(data['asks'], key=lambda q: float(q[0]))]}
@@ -12,11 +12,27 @@ log = logging.getLogger(__name__)
 
 class PlnxFormatter(Formatter):
 
+    @staticmethod
+    def _ticker(data):
+        return (data['highestBid'], data['lowestAsk'], data['high24hr'],
+                data['low24hr'], None, None, data['last'], data['quoteVolume'],
+                None)
+
     @staticmethod
     def ticker(data, *args, **kwargs):
-        data = data[args[0]]
-        return (data['highestBid'], data['lowestAsk'], None, None, None, None,
-                data['last'], None, None)
+        return PlnxFormatter._ticker(data[args[1]])
+
+    @staticmethod
+    def tickers(data, *args, **kwargs):
+        """
+        Returns dict of pair: ticker, for all pairs in data.
+        """
+        return {pair: PlnxFormatter._ticker(d) for pair, d in data.items()}
+
+    @staticmethod
+    def order_book(data, *args, **kwargs):
+        return {side: [[None, price, size] for price, size in data[side]]
+                for side in ('bids', 'asks')}
 
     @staticmethod
     def order(data, *args, **kwargs):
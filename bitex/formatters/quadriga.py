@@ -28,3 +28,9 @@ class QuadrigaCXFormatter(Formatter):
     @staticmethod
     def order_status(data, *args, **kwargs):
         return data
+
+    @staticmethod
+    def order_book(data, *args, **kwargs):
+        ts = data['timestamp']
+        return {side: [[ts, price, size] for price, size in data[side]]
+                for side in ('bids', 'asks')}
@@ -29,3 +29,9 @@ class QoinFormatter(Formatter):
     @staticmethod
     def order_status(data, *args, **kwargs):
         return data
+
+    @staticmethod
+    def order_book(data, *args, **kwargs):
+        return {side: [[None, price, size] for price, size in data[key]]
+                for side, key in (('bids', 'buy_price_levels'),
+                                  ('asks', 'sell_price_levels'))}
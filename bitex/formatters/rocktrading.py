@@ -16,4 +16,9 @@ class RockFormatter(Formatter):
     def ticker(data, *args, **kwargs):
         return (data['bid'], data['ask'], data['high'], data['low'],
                 data['open'], data['close'], data['last'],
-                data['volume_traded'], data['date'])
\ No newline at end of file
+                data['volume_traded'], data['date'])
+
+    @staticmethod
+    def order_book(data, *args, **kwargs):
+        return {side: [[None, q['price'], q['amount']] for q in data[side]]
+                for side in ('bids', 'asks')}
@@ -12,4 +12,13 @@ log = logging.getLogger(__name__)
 
 class VaultoroFormatter(Formatter):
 
-    pass
+
+    @staticmethod
+    def order_book(data, *args, **kwargs):
+        # data is a list of single-key dicts, 'b' holding bids and 's' asks
+        levels = {}
+        for d in data['data']:
+            levels.update(d)
+        return {side: [[None, q['Gold_Price'], q['Gold_Amount']]
+                       for q in levels.get(key) or []]
+                for side, key in (('bids', 'b'), ('asks', 's'))}
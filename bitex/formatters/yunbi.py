@@ -17,4 +17,11 @@ class YnbiFormatter(Formatter):
         date = data['at']
         data = data['ticker']
         return (data['buy'], data['sell'], data['high'], data['low'],
-                None, None, data['last'], data['vol'], date)
\ No newline at end of file
+                None, None, data['last'], data['vol'], date)
+
+    @staticmethod
+    def order_book(data, *args, **kwargs):
+        # Quotes are open orders; only their unfilled volume is on offer
+        return {side: [[None, q['price'], q['remaining_volume']]
+                       for q in data[side]]
+                for side in ('bids', 'asks')}
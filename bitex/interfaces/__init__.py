@@ -1,19 +1,27 @@
-from bitex.interfaces.bitfinex import Bitfinex
-from bitex.interfaces.bitstamp import Bitstamp
-from bitex.interfaces.bittrex import Bittrex
-from bitex.interfaces.ccex import CCEX
-from bitex.interfaces.coincheck import Coincheck
-from bitex.interfaces.cryptopia import Cryptopia
-from bitex.interfaces.gemini import Gemini
-from bitex.interfaces.itbit import ItBit
-from bitex.interfaces.kraken import Kraken
-from bitex.interfaces.okcoin import OKCoin
-from bitex.interfaces.rocktrading import RockTradingLtd
-from bitex.interfaces.yunbi import Yunbi
-from bitex.interfaces.poloniex import Poloniex
-from bitex.interfaces.quoine import Quoine
-from bitex.interfaces.quadriga import QuadrigaCX
-from bitex.interfaces.gdax import GDAX
-from bitex.interfaces.vaultoro import Vaultoro
-from bitex.interfaces.hitbtc import HitBtc
-from bitex.interfaces.bter import Bter
+# Interfaces are imported on first access, see bitex._lazy
+from bitex._lazy import lazy_attributes
+
+# Interface class name: module defining it; shared with the bitex package
+INTERFACES = {
+    'Bitfinex': 'bitex.interfaces.bitfinex',
+    'Bitstamp': 'bitex.interfaces.bitstamp',
+    'Bittrex': 'bitex.interfaces.bittrex',
+    'CCEX': 'bitex.interfaces.ccex',
+    'Coincheck': 'bitex.interfaces.coincheck',
+    'Cryptopia': 'bitex.interfaces.cryptopia',
+    'Gemini': 'bitex.interfaces.gemini',
+    'ItBit': 'bitex.interfaces.itbit',
+    'Kraken': 'bitex.interfaces.kraken',
+    'OKCoin': 'bitex.interfaces.okcoin',
+    'RockTradingLtd': 'bitex.interfaces.rocktrading',
+    'Yunbi': 'bitex.interfaces.yunbi',
+    'Poloniex': 'bitex.interfaces.poloniex',
+    'Quoine': 'bitex.interfaces.quoine',
+    'QuadrigaCX': 'bitex.interfaces.quadriga',
+    'GDAX': 'bitex.interfaces.gdax',
+    'Vaultoro': 'bitex.interfaces.vaultoro',
+    'HitBtc': 'bitex.interfaces.hitbtc',
+    'Bter': 'bitex.interfaces.bter',
+}
+
+lazy_attributes(__name__, INTERFACES)
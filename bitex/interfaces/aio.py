@@ -0,0 +1,139 @@
+"""
+Asynchronous versions of all interfaces. Each class offers the same methods as
+its synchronous counterpart, but the BitEx Standardized Methods (and all other
+methods decorated with bitex.utils.return_api_response()) are coroutines:
+
+    async with AsyncKraken() as k:
+        resp = await k.ticker('XXBTZEUR')
+        print(resp.formatted)
+
+Requires aiohttp.
+"""
+
+# Import Built-Ins
+import logging
+
+# Import Third-Party
+
+# Import Homebrew
+from bitex.api.REST.aio import AsyncAPIClient
+from bitex.metadata import metadata_cache
+from bitex.interfaces.bitfinex import Bitfinex
+from bitex.interfaces.bitstamp import Bitstamp
+from bitex.interfaces.bittrex import Bittrex
+from bitex.interfaces.bter import Bter
+from bitex.interfaces.ccex import CCEX
+from bitex.interfaces.coincheck import Coincheck
+from bitex.interfaces.cryptopia import Cryptopia
+from bitex.interfaces.gdax import GDAX
+from bitex.interfaces.gemini import Gemini
+from bitex.interfaces.hitbtc import HitBtc
+from bitex.interfaces.itbit import ItBit
+from bitex.interfaces.kraken import Kraken
+from bitex.interfaces.okcoin import OKCoin
+from bitex.interfaces.poloniex import Poloniex
+from bitex.interfaces.quadriga import QuadrigaCX
+from bitex.interfaces.quoine import Quoine
+from bitex.interfaces.rocktrading import RockTradingLtd
+from bitex.interfaces.vaultoro import Vaultoro
+from bitex.interfaces.yunbi import Yunbi
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+class AsyncBitfinex(AsyncAPIClient, Bitfinex):
+    pass
+
+
+class AsyncBitstamp(AsyncAPIClient, Bitstamp):
+    pass
+
+
+class AsyncBittrex(AsyncAPIClient, Bittrex):
+    pass
+
+
+class AsyncBter(AsyncAPIClient, Bter):
+    pass
+
+
+class AsyncCCEX(AsyncAPIClient, CCEX):
+    pass
+
+
+class AsyncCoincheck(AsyncAPIClient, Coincheck):
+    pass
+
+
+class AsyncCryptopia(AsyncAPIClient, Cryptopia):
+    pass
+
+
+class AsyncGDAX(AsyncAPIClient, GDAX):
+    pass
+
+
+class AsyncGemini(AsyncAPIClient, Gemini):
+    pass
+
+
+class AsyncHitBtc(AsyncAPIClient, HitBtc):
+    pass
+
+
+class AsyncItBit(AsyncAPIClient, ItBit):
+    pass
+
+
+class AsyncKraken(AsyncAPIClient, Kraken):
+    pass
+
+
+class AsyncOKCoin(AsyncAPIClient, OKCoin):
+    pass
+
+
+class AsyncPoloniex(AsyncAPIClient, Poloniex):
+    pass
+
+
+class AsyncQuadrigaCX(AsyncAPIClient, QuadrigaCX):
+    pass
+
+
+class AsyncQuoine(AsyncAPIClient, Quoine):
+    """
+    Quoine's product ids cannot be queried synchronously; unless fresh ones
+    are cached in bitex.metadata, await load_pairs() before calling any
+    method which takes a pair.
+    """
+
+    @property
+    def pairs(self):
+        if self._pairs is None:
+            self._pairs = metadata_cache.load('quoine_products')
+        return self._pairs or {}
+
+    @pairs.setter
+    def pairs(self, value):
+        self._pairs = value
+
+    async def load_pairs(self):
+        r = await self.public_query('products')
+        r.raise_for_status()
+        self.pairs = {d['currency_pair_code']: d['id'] for d in r.json()}
+        metadata_cache.store('quoine_products', self.pairs)
+        return self.pairs
+
+
+class AsyncRockTradingLtd(AsyncAPIClient, RockTradingLtd):
+    pass
+
+
+class AsyncVaultoro(AsyncAPIClient, Vaultoro):
+    pass
+
+
+class AsyncYunbi(AsyncAPIClient, Yunbi):
+    pass
@@ -9,7 +9,6 @@ import logging
 
 # Import Homebrew
 from bitex.api.REST import BitfinexREST
-from bitex.api.WSS.bitfinex import BitfinexWSS
 from bitex.utils import return_api_response
 from bitex.formatters.bitfinex import BtfxFormatter as fmt
 # Init Logging Facilities
@@ -17,11 +16,12 @@ log = logging.getLogger(__name__)
 
 
 class Bitfinex(BitfinexREST):
-    def __init__(self, key='', secret='', key_file='', websocket=False):
-        super(Bitfinex, self).__init__(key, secret)
+    def __init__(self, key='', secret='', key_file='', websocket=False, **kwargs):
+        super(Bitfinex, self).__init__(key, secret, **kwargs)
         if key_file:
             self.load_key(key_file)
         if websocket:
+            from bitex.api.WSS.bitfinex import BitfinexWSS
             self.wss = BitfinexWSS()
             self.wss.start()
         else:
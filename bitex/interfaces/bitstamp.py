@@ -9,7 +9,6 @@ import logging
 
 # Import Homebrew
 from bitex.api.REST import BitstampREST
-from bitex.api.WSS.bitstamp import BitstampWSS
 from bitex.utils import return_api_response
 from bitex.formatters.bitstamp import BtstFormatter as fmt
 
@@ -18,12 +17,13 @@ log = logging.getLogger(__name__)
 
 
 class Bitstamp(BitstampREST):
-    def __init__(self, key='', secret='', key_file='', websocket=False):
-        super(Bitstamp, self).__init__(key, secret)
+    def __init__(self, key='', secret='', key_file='', websocket=False, **kwargs):
+        super(Bitstamp, self).__init__(key, secret, **kwargs)
         if key_file:
             self.load_key(key_file)
 
         if websocket:
+            from bitex.api.WSS.bitstamp import BitstampWSS
             self.wss = BitstampWSS()
             self.wss.start()
         else:
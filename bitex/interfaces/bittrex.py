@@ -9,15 +9,22 @@ import logging
 
 # Import Homebrew
 from bitex.api.REST import BittrexREST
-from bitex.utils import return_api_response
+from bitex.utils import return_api_response, Snapshot
 from bitex.formatters.bittrex import BtrxFormatter as fmt
 # Init Logging Facilities
 log = logging.getLogger(__name__)
 
 
 class Bittrex(BittrexREST):
-    def __init__(self, key='', secret='', key_file=''):
-        super(Bittrex, self).__init__(key, secret)
+    def __init__(self, key='', secret='', key_file='', snapshot_ttl=0,
+                 **kwargs):
+        """
+        :param snapshot_ttl: if set, ticker() is served from the data of the
+                             last getmarketsummaries query, if it's younger
+                             than this many seconds
+        """
+        super(Bittrex, self).__init__(key, secret, **kwargs)
+        self._tickers = Snapshot(snapshot_ttl)
         if key_file:
             self.load_key(key_file)
 
@@ -31,8 +38,16 @@ class Bittrex(BittrexREST):
     BitEx Standardized Methods
     """
 
+    def _ticker_snapshot(self, **kwargs):
+        if kwargs:
+            return self.public_query('getmarketsummaries', params=kwargs)
+        return self._tickers.get(
+            lambda: self.public_query('getmarketsummaries'))
+
     @return_api_response(fmt.ticker)
     def ticker(self, pair, **kwargs):
+        if self._tickers.ttl and not kwargs:
+            return self._ticker_snapshot()
         q = {'market': pair}
         q.update(kwargs)
         return self.public_query('getmarketsummary', params=q)
@@ -100,6 +115,10 @@ class Bittrex(BittrexREST):
     Exchange Specific Methods
     """
 
+    @return_api_response(fmt.tickers)
+    def tickers(self, **kwargs):
+        return self._ticker_snapshot(**kwargs)
+
     @return_api_response(None)
     def pairs(self):
         return self.public_query('getmarkets')
@@ -9,7 +9,7 @@ import logging
 
 # Import Homebrew
 from bitex.api.REST import BterREST
-from bitex.utils import return_api_response
+from bitex.utils import return_api_response, Snapshot
 from bitex.formatters.bter import BterFormatter as fmt
 
 # Init Logging Facilities
@@ -17,8 +17,15 @@ log = logging.getLogger(__name__)
 
 
 class Bter(BterREST):
-    def __init__(self, key='', secret='', key_file=''):
-        super(Bter, self).__init__(key, secret)
+    def __init__(self, key='', secret='', key_file='', snapshot_ttl=0,
+                 **kwargs):
+        """
+        :param snapshot_ttl: if set, ticker() is served from the data of the
+                             last tickers query, if it's younger than this
+                             many seconds
+        """
+        super(Bter, self).__init__(key, secret, **kwargs)
+        self._tickers = Snapshot(snapshot_ttl)
         if key_file:
             self.load_key(key_file)
 
@@ -39,10 +46,15 @@ class Bter(BterREST):
     def order_book(self, pair, **kwargs):
         return self.public_query('depth/%s' % pair, params=kwargs)
 
+    def _ticker_snapshot(self, **kwargs):
+        if kwargs:
+            return self.public_query('tickers', params=kwargs)
+        return self._tickers.get(lambda: self.public_query('tickers'))
+
     @return_api_response(fmt.ticker)
     def ticker(self, pair, **kwargs):
-        if pair == 'all':
-            return self.public_query('tickers', params=kwargs)
+        if pair == 'all' or (self._tickers.ttl and not kwargs):
+            return self._ticker_snapshot(**kwargs)
         else:
             return self.public_query('ticker/%s' % pair, params=kwargs)
 
@@ -85,4 +97,12 @@ class Bter(BterREST):
 
     @return_api_response(fmt.deposit)
     def deposit_address(self, **kwargs):
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    """
+    Exchange Specific Methods
+    """
+
+    @return_api_response(fmt.tickers)
+    def tickers(self, **kwargs):
+        return self._ticker_snapshot(**kwargs)
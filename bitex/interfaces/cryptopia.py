@@ -16,8 +16,8 @@ log = logging.getLogger(__name__)
 
 
 class Cryptopia(CryptopiaREST):
-    def __init__(self, key='', secret='', key_file=''):
-        super(Cryptopia, self).__init__(key, secret)
+    def __init__(self, key='', secret='', key_file='', **kwargs):
+        super(Cryptopia, self).__init__(key, secret, **kwargs)
         if key_file:
             self.load_key(key_file)
         print(self.uri)
@@ -9,7 +9,6 @@ import logging
 
 # Import Homebrew
 from bitex.api.REST import GDAXRest
-from bitex.api.WSS.gdax import GDAXWSS
 from bitex.utils import return_api_response
 from bitex.formatters.gdax import GdaxFormatter as fmt
 
@@ -18,11 +17,12 @@ log = logging.getLogger(__name__)
 
 
 class GDAX(GDAXRest):
-    def __init__(self, key='', secret='', key_file='', websocket=False):
-        super(GDAX, self).__init__(key, secret)
+    def __init__(self, key='', secret='', key_file='', websocket=False, **kwargs):
+        super(GDAX, self).__init__(key, secret, **kwargs)
         if key_file:
             self.load_key(key_file)
         if websocket:
+            from bitex.api.WSS.gdax import GDAXWSS
             self.wss = GDAXWSS()
             self.wss.start()
         else:
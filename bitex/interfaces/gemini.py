@@ -9,7 +9,6 @@ import logging
 
 # Import Homebrew
 from bitex.api.REST import GeminiREST
-from bitex.api.WSS.gemini import GeminiWSS
 from bitex.utils import return_api_response
 from bitex.formatters.gemini import GmniFormatter as fmt
 
@@ -18,11 +17,12 @@ log = logging.getLogger(__name__)
 
 
 class Gemini(GeminiREST):
-    def __init__(self, key='', secret='', key_file='', websocket=False):
-        super(Gemini, self).__init__(key, secret)
+    def __init__(self, key='', secret='', key_file='', websocket=False, **kwargs):
+        super(Gemini, self).__init__(key, secret, **kwargs)
         if key_file:
             self.load_key(key_file)
         if websocket:
+            from bitex.api.WSS.gemini import GeminiWSS
             self.wss = GeminiWSS()
             self.wss.start()
         else:
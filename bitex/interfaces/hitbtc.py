@@ -9,7 +9,6 @@ import time
 
 # Import Homebrew
 from bitex.api.REST import HitBTCREST
-from bitex.api.WSS.hitbtc import HitBTCWSS
 from bitex.utils import return_api_response
 from bitex.formatters.hitbtc import HitBtcFormatter as fmt
 
@@ -18,11 +17,12 @@ log = logging.getLogger(__name__)
 
 
 class HitBtc(HitBTCREST):
-    def __init__(self, key='', secret='', key_file='', websocket=False):
-        super(HitBtc, self).__init__(key, secret)
+    def __init__(self, key='', secret='', key_file='', websocket=False, **kwargs):
+        super(HitBtc, self).__init__(key, secret, **kwargs)
         if key_file:
             self.load_key(key_file)
         if websocket:
+            from bitex.api.WSS.hitbtc import HitBTCWSS
             self.wss = HitBTCWSS()
             self.wss.start()
         else:
@@ -16,8 +16,8 @@ log = logging.getLogger(__name__)
 
 
 class Kraken(KrakenREST):
-    def __init__(self, key='', secret='', key_file=''):
-        super(Kraken, self).__init__(key, secret)
+    def __init__(self, key='', secret='', key_file='', **kwargs):
+        super(Kraken, self).__init__(key, secret, **kwargs)
         if key_file:
             self.load_key(key_file)
 
@@ -9,19 +9,25 @@ import logging
 
 # Import Homebrew
 from bitex.api.REST import PoloniexREST
-from bitex.api.WSS.poloniex import PoloniexWSS
-from bitex.utils import return_api_response
+from bitex.utils import return_api_response, Snapshot
 from bitex.formatters.poloniex import PlnxFormatter as fmt
 # Init Logging Facilities
 log = logging.getLogger(__name__)
 
 
 class Poloniex(PoloniexREST):
-    def __init__(self, key='', secret='', key_file='', websocket=False):
-        super(Poloniex, self).__init__(key, secret)
+    def __init__(self, key='', secret='', key_file='', websocket=False,
+                 snapshot_ttl=0, **kwargs):
+        """
+        :param snapshot_ttl: seconds for which ticker() reuses the data of
+                             the last returnTicker query
+        """
+        super(Poloniex, self).__init__(key, secret, **kwargs)
+        self._tickers = Snapshot(snapshot_ttl)
         if key_file:
             self.load_key(key_file)
         if websocket:
+            from bitex.api.WSS.poloniex import PoloniexWSS
             self.wss = PoloniexWSS()
             self.wss.start()
         else:
@@ -38,9 +44,14 @@ class Poloniex(PoloniexREST):
     BitEx Standardized Methods
     """
 
+    def _ticker_snapshot(self, **kwargs):
+        if kwargs:
+            return self.public_query('returnTicker', params=kwargs)
+        return self._tickers.get(lambda: self.public_query('returnTicker'))
+
     @return_api_response(fmt.ticker)
     def ticker(self, pair, **kwargs):
-        return self.public_query('returnTicker', params=kwargs)
+        return self._ticker_snapshot(**kwargs)
 
     @return_api_response(fmt.order_book)
     def order_book(self, pair, **kwargs):
@@ -103,6 +114,10 @@ class Poloniex(PoloniexREST):
     Exchange Specific Methods
     """
 
+    @return_api_response(fmt.tickers)
+    def tickers(self, **kwargs):
+        return self._ticker_snapshot(**kwargs)
+
     @return_api_response(None)
     def currencies(self):
         return self.public_query('returnCurrencies')
@@ -10,6 +10,7 @@ import logging
 # Import Homebrew
 from bitex.api.REST import QuoineREST
 from bitex.utils import return_api_response
+from bitex.metadata import metadata_cache
 from bitex.formatters.quoine import QoinFormatter as fmt
 
 # Init Logging Facilities
@@ -17,13 +18,37 @@ log = logging.getLogger(__name__)
 
 
 class Quoine(QuoineREST):
-    def __init__(self, key='', secret='', key_file=''):
-        super(Quoine, self).__init__(key, secret)
+    def __init__(self, key='', secret='', key_file='', **kwargs):
+        super(Quoine, self).__init__(key, secret, **kwargs)
         if key_file:
             self.load_key(key_file)
 
-        self.pairs = {d['currency_pair_code']: d['id']
-                      for d in self.public_query('products').json()}
+        self._pairs = None
+
+    @property
+    def pairs(self):
+        """
+        Dict mapping currency pair codes to Quoine's product ids, looked up
+        on first access and cached in bitex.metadata.
+        :return: dict
+        """
+        if self._pairs is None:
+            self._pairs = metadata_cache.get('quoine_products',
+                                             self._load_pairs)
+        return self._pairs
+
+    @pairs.setter
+    def pairs(self, value):
+        self._pairs = value
+
+    def _load_pairs(self):
+        """
+        Returns a dict mapping currency pair codes to Quoine's product ids.
+        :return: dict
+        """
+        r = self.public_query('products')
+        r.raise_for_status()
+        return {d['currency_pair_code']: d['id'] for d in r.json()}
 
     def public_query(self, endpoint, **kwargs):
         return self.query('GET', endpoint, **kwargs)
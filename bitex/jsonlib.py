@@ -0,0 +1,105 @@
+"""
+JSON decoding hook, used for all REST responses and Websocket messages.
+
+By default, the fastest installed backend is used - orjson, then ujson, then
+the standard library's json module. Select another one via use(), or the
+BITEX_JSON environment variable:
+
+    from bitex import jsonlib
+    jsonlib.use('json')            # name of a backend
+    jsonlib.use(my_decoder)        # any callable taking str or bytes
+"""
+
+# Import Built-Ins
+import logging
+import os
+import json
+
+# Import Third-Party
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# Import Homebrew
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+BACKENDS = {'orjson': orjson.loads if orjson else None,
+            'ujson': ujson.loads if ujson else None,
+            'json': json.loads}
+
+# Name of the backend in use
+backend = None
+_loads = json.loads
+
+
+def use(decoder=None):
+    """
+    Selects the JSON decoder.
+    :param decoder: name of a backend in BACKENDS, a callable, or None for
+                    the fastest backend available
+    :return: name of the backend in use
+    """
+    global backend, _loads
+    if callable(decoder):
+        backend, _loads = getattr(decoder, '__module__', None), decoder
+        return backend
+
+    if decoder is None:
+        decoder = next(name for name in ('orjson', 'ujson', 'json')
+                       if BACKENDS[name])
+    try:
+        func = BACKENDS[decoder]
+    except KeyError:
+        raise ValueError("Unknown JSON backend %s! Must be one of %s" %
+                         (decoder, sorted(BACKENDS)))
+    if func is None:
+        raise SystemError("No %s installed! Cannot use it for decoding JSON!"
+                          % decoder)
+    backend, _loads = decoder, func
+    log.debug("jsonlib: Decoding JSON using %s", backend)
+    return backend
+
+
+def loads(s):
+    """
+    Decodes the given JSON document.
+    :param s: str or bytes
+    :return: decoded data
+    :raises ValueError: if s isn't valid JSON
+    """
+    return _loads(s)
+
+
+class LazyJSON:
+    """
+    Undecoded JSON message, decoded on first access of its `data` attribute.
+    Lets Websocket clients queue frames without decoding them on the thread
+    reading the socket.
+    """
+    __slots__ = ('raw', '_data')
+    _UNSET = object()
+
+    def __init__(self, raw):
+        self.raw = raw
+        self._data = self._UNSET
+
+    @property
+    def data(self):
+        if self._data is self._UNSET:
+            self._data = loads(self.raw)
+        return self._data
+
+    def __repr__(self):
+        return 'LazyJSON(%r)' % (self.raw,)
+
+
+use(os.environ.get('BITEX_JSON') or None)
@@ -0,0 +1,120 @@
+"""
+On-disk cache for exchange metadata, such as the lists of products and
+symbols the Websocket clients subscribe to.
+
+Entries are stored as JSON files in ~/.cache/bitex (or $BITEX_CACHE_DIR) and
+are refreshed once older than their time-to-live, so a process starting with
+fresh metadata on disk needs no network round-trip to discover symbols.
+"""
+
+# Import Built-Ins
+import logging
+import os
+import json
+import time
+import tempfile
+
+# Import Third-Party
+
+# Import Homebrew
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+DEFAULT_TTL = 24 * 60 * 60
+
+
+def default_path():
+    return (os.environ.get('BITEX_CACHE_DIR') or
+            os.path.join(os.path.expanduser('~'), '.cache', 'bitex'))
+
+
+class MetadataCache:
+    """
+    Stores JSON serializable metadata on disk, one file per key.
+    """
+    def __init__(self, path=None, ttl=DEFAULT_TTL):
+        """
+        :param path: directory to store files in; defaults to
+                     $BITEX_CACHE_DIR or ~/.cache/bitex
+        :param ttl: default time-to-live of entries, in seconds
+        """
+        self.path = path or default_path()
+        self.ttl = ttl
+
+    def _file(self, key):
+        return os.path.join(self.path, key + '.json')
+
+    def load(self, key, ttl=None, stale=False):
+        """
+        Returns the data stored under key, or None if there is no entry or it
+        has expired.
+        :param key: str
+        :param ttl: time-to-live in seconds; defaults to self.ttl
+        :param stale: if True, returns expired entries as well
+        :return: data or None
+        """
+        ttl = self.ttl if ttl is None else ttl
+        try:
+            with open(self._file(key), 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not stale and time.time() - entry['ts'] > ttl:
+            return None
+        return entry['data']
+
+    def store(self, key, data):
+        """
+        Stores data under key. Errors are logged, as the cache is optional.
+        :param key: str
+        :param data: JSON serializable object
+        """
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path, prefix=key, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'ts': time.time(), 'data': data}, f)
+            os.replace(tmp, self._file(key))
+        except OSError:
+            log.exception("MetadataCache.store(): Failed to store %s in %s",
+                          key, self.path)
+
+    def get(self, key, fetch, ttl=None):
+        """
+        Returns the data stored under key. If there is no fresh entry, it is
+        fetched by calling fetch() and stored; should that fail, an expired
+        entry is returned instead, if available.
+        :param key: str
+        :param fetch: callable returning the data
+        :param ttl: time-to-live in seconds; defaults to self.ttl
+        :return: data
+        """
+        data = self.load(key, ttl)
+        if data is not None:
+            return data
+        try:
+            data = fetch()
+        except Exception:
+            data = self.load(key, stale=True)
+            if data is None:
+                raise
+            log.warning("MetadataCache.get(): Fetching %s failed - using "
+                        "expired entry.", key, exc_info=True)
+            return data
+        self.store(key, data)
+        return data
+
+    def invalidate(self, key):
+        """
+        Removes the entry stored under key.
+        """
+        try:
+            os.remove(self._file(key))
+        except OSError:
+            pass
+
+
+# Shared by all clients
+metadata_cache = MetadataCache()
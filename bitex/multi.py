@@ -0,0 +1,177 @@
+"""
+Fan-out helpers, which call the same method on several interfaces
+concurrently and collect the results keyed by exchange.
+
+Example:
+    from bitex import Kraken, Bitstamp, GDAX
+    from bitex.multi import fetch, PerExchange
+
+    pairs = PerExchange(Kraken='XXBTZUSD', Bitstamp='btcusd', GDAX='BTC-USD')
+    books = fetch([Kraken(), Bitstamp(), GDAX()], 'order_book', pairs,
+                  deadline=2)
+    books['Kraken']     # formatted order book
+    books.timed_out     # names of exchanges which missed the deadline
+"""
+
+# Import Built-Ins
+import logging
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# Import Third-Party
+
+# Import Homebrew
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+class PerExchange(dict):
+    """
+    Marks an argument passed to fetch() as exchange specific; each exchange
+    receives the value stored under its name.
+    """
+
+
+class FetchResult(dict):
+    """
+    Dict of exchange name: result, for all exchanges which answered in time.
+    Exchanges which raised an error are stored in the `errors` attribute,
+    those which missed the deadline in `timed_out`.
+    """
+    def __init__(self):
+        super(FetchResult, self).__init__()
+        self.errors = {}
+        self.timed_out = set()
+
+
+def _name_interfaces(exchanges):
+    """
+    Returns a dict of name: interface, for the given dict or iterable of
+    interfaces. Unnamed interfaces are named after their class; further
+    interfaces of the same class are numbered, i.e. 'Kraken', 'Kraken#2'.
+    """
+    if isinstance(exchanges, dict):
+        return dict(exchanges)
+    interfaces = {}
+    counts = {}
+    for exchange in exchanges:
+        name = type(exchange).__name__
+        counts[name] = counts.get(name, 0) + 1
+        if counts[name] > 1:
+            name = '%s#%d' % (name, counts[name])
+        interfaces[name] = exchange
+    return interfaces
+
+
+def _resolve(name, args, kwargs):
+    """
+    Replaces PerExchange arguments with the value for the given exchange.
+    """
+    args = [arg[name] if isinstance(arg, PerExchange) else arg
+            for arg in args]
+    kwargs = {k: v[name] if isinstance(v, PerExchange) else v
+              for k, v in kwargs.items()}
+    return args, kwargs
+
+
+def _result(response, formatted):
+    return response.formatted if formatted else response
+
+
+def fetch(exchanges, method, *args, deadline=5, max_workers=None,
+          formatted=True, **kwargs):
+    """
+    Calls the given method on all exchanges concurrently, using a bounded
+    thread pool, and returns once all of them answered or the deadline passed.
+    :param exchanges: iterable of interface objects, or dict of name: interface
+    :param method: name of the method to call, i.e. 'ticker'
+    :param args: args for the method; wrap exchange specific values in
+                 PerExchange
+    :param deadline: seconds to wait for all exchanges to answer
+    :param max_workers: maximum number of concurrent calls; defaults to one
+                        per exchange
+    :param formatted: if False, returns the APIResponse objects instead of
+                      their formatted data
+    :param kwargs: kwargs for the method; wrap exchange specific values in
+                   PerExchange
+    :return: FetchResult
+    """
+    interfaces = _name_interfaces(exchanges)
+    result = FetchResult()
+    if not interfaces:
+        return result
+
+    executor = ThreadPoolExecutor(max_workers=max_workers or len(interfaces))
+    try:
+        futures = {}
+        for name, interface in interfaces.items():
+            call_args, call_kwargs = _resolve(name, args, kwargs)
+            func = getattr(interface, method)
+            futures[executor.submit(func, *call_args, **call_kwargs)] = name
+
+        done, not_done = wait(futures, timeout=deadline)
+    finally:
+        # Don't wait for late calls; their results are discarded.
+        executor.shutdown(wait=False)
+
+    for future in done:
+        name = futures[future]
+        try:
+            result[name] = _result(future.result(), formatted)
+        except Exception as e:
+            log.exception("fetch(): Error while calling %s.%s()", name, method)
+            result.errors[name] = e
+
+    for future in not_done:
+        future.cancel()
+        result.timed_out.add(futures[future])
+    if result.timed_out:
+        log.warning("fetch(): %s missed the deadline of %ss for %s()",
+                    ', '.join(sorted(result.timed_out)), deadline, method)
+    return result
+
+
+async def afetch(exchanges, method, *args, deadline=5, max_concurrency=None,
+                 formatted=True, **kwargs):
+    """
+    Coroutine version of fetch(), for the interfaces in bitex.interfaces.aio.
+    :param max_concurrency: maximum number of concurrent calls; unbounded by
+                            default
+    :return: FetchResult
+    """
+    interfaces = _name_interfaces(exchanges)
+    result = FetchResult()
+    if not interfaces:
+        return result
+
+    semaphore = asyncio.Semaphore(max_concurrency or len(interfaces))
+
+    async def call(func, call_args, call_kwargs):
+        async with semaphore:
+            return await func(*call_args, **call_kwargs)
+
+    tasks = {}
+    for name, interface in interfaces.items():
+        call_args, call_kwargs = _resolve(name, args, kwargs)
+        func = getattr(interface, method)
+        task = asyncio.ensure_future(call(func, call_args, call_kwargs))
+        tasks[task] = name
+
+    done, not_done = await asyncio.wait(tasks, timeout=deadline)
+
+    for task in done:
+        name = tasks[task]
+        try:
+            result[name] = _result(task.result(), formatted)
+        except Exception as e:
+            log.exception("afetch(): Error while calling %s.%s()", name, method)
+            result.errors[name] = e
+
+    for task in not_done:
+        task.cancel()
+        result.timed_out.add(tasks[task])
+    if result.timed_out:
+        log.warning("afetch(): %s missed the deadline of %ss for %s()",
+                    ', '.join(sorted(result.timed_out)), deadline, method)
+    return result
@@ -0,0 +1,100 @@
+"""
+Normalization of currency pair names across exchanges.
+
+Pairs are normalized to base and quote currency concatenated in upper case,
+with Bitcoin as BTC, i.e. 'BTCUSD'; normalize_pair() converts an exchange's
+name of a pair into this form, and venue_pair() converts it back:
+
+    >>> normalize_pair('XXBTZUSD', 'Kraken')
+    'BTCUSD'
+    >>> venue_pair('GDAX', 'BTCUSD')
+    'BTC-USD'
+"""
+# Import Built-Ins
+import logging
+
+# Import Third-Party
+
+# Import Homebrew
+from bitex.formatters.kraken import KrknFormatter
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+# Currency codes differing from the common ones
+ALIASES = {'XBT': 'BTC', 'XDG': 'DOGE'}
+
+# Quote currencies, used to split pairs without separator, longest first
+QUOTES = ('USDT', 'USD', 'EUR', 'GBP', 'JPY', 'CAD', 'CNY', 'BTC', 'XBT',
+          'ETH')
+
+# Exchanges naming pairs quote currency first
+QUOTE_FIRST = {'Poloniex', 'Bittrex'}
+
+# Exchange: callable, formatting base and quote currency as pair name
+FORMATS = {
+    'Bitfinex': lambda base, quote: base + quote,
+    'Bitstamp': lambda base, quote: (base + quote).lower(),
+    'Bittrex': lambda base, quote: '%s-%s' % (quote, base),
+    'GDAX': lambda base, quote: '%s-%s' % (base, quote),
+    'Gemini': lambda base, quote: (base + quote).lower(),
+    'itBit': lambda base, quote: (base.replace('BTC', 'XBT') +
+                                  quote.replace('BTC', 'XBT')),
+    'Kraken': lambda base, quote: KrknFormatter.format_pair(base + quote),
+    'Poloniex': lambda base, quote: '%s_%s' % (quote, base),
+}
+
+
+def split_pair(pair, exchange=None):
+    """
+    Splits a pair as named by an exchange into base and quote currency.
+    :param pair: str, i.e. 'XXBTZUSD', 'BTC-USD', 'btcusd', 'tBTCUSD'
+    :param exchange: str, name of the exchange; needed for exchanges naming
+                     the quote currency first
+    :return: tuple of str, normalized
+    """
+    if exchange == 'Bitfinex' and len(pair) == 7 and pair[0] == 't':
+        pair = pair[1:]  # API v2 trading pair
+    pair = pair.upper()
+    for sep in ('-', '_', '/', ':'):
+        if sep in pair:
+            base, quote = pair.split(sep, 1)
+            break
+    else:
+        if (len(pair) == 8 and pair[0] in 'XZ' and pair[4] in 'XZ'):
+            base, quote = pair[1:4], pair[5:]  # Kraken, i.e. XXBTZUSD
+        else:
+            quote = next((q for q in QUOTES
+                          if pair.endswith(q) and len(pair) > len(q)), None)
+            if quote is None:
+                raise ValueError("Cannot split pair %r!" % pair)
+            base = pair[:-len(quote)]
+    if exchange in QUOTE_FIRST:
+        base, quote = quote, base
+    return ALIASES.get(base, base), ALIASES.get(quote, quote)
+
+
+def normalize_pair(pair, exchange=None):
+    """
+    Returns the normalized name of a pair as named by an exchange.
+    :param pair: str
+    :param exchange: str, see split_pair()
+    :return: str, i.e. 'BTCUSD'
+    """
+    return ''.join(split_pair(pair, exchange))
+
+
+def venue_pair(exchange, pair):
+    """
+    Returns an exchange's name of a pair.
+    :param exchange: str, a key of FORMATS
+    :param pair: str, normalized or as named by any exchange
+    :return: str
+    """
+    try:
+        fmt = FORMATS[exchange]
+    except KeyError:
+        raise ValueError("Unknown exchange %r! Must be one of %s" %
+                         (exchange, sorted(FORMATS)))
+    return fmt(*split_pair(pair))
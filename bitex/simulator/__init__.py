@@ -0,0 +1,20 @@
+"""
+Offline stand-ins for the exchanges' REST APIs and Websocket feeds, to run
+the clients - and tests and benchmarks of them - without network access.
+
+    >>> market = Market(seed=1)
+    >>> with RESTSimulator(market=market) as rest, \
+    ...         WSSSimulator(market=market) as wss:
+    ...     Bitfinex(url=rest.url('Bitfinex')).ticker('BTCUSD')
+
+See bitex.simulator.rest and bitex.simulator.feeds.
+"""
+# Simulators are imported on first access, see bitex._lazy
+from bitex._lazy import lazy_attributes
+
+lazy_attributes(__name__, {
+    'Credentials': 'bitex.simulator.rest',
+    'Market': 'bitex.simulator.market',
+    'RESTSimulator': 'bitex.simulator.rest',
+    'WSSSimulator': 'bitex.simulator.feeds',
+})
@@ -0,0 +1,551 @@
+"""
+Local stand-in for the exchanges' Websocket feeds.
+
+WSSSimulator speaks each venue's protocol at its own path: it answers
+subscriptions as the exchange does, sends snapshots of the subscribed books
+and then streams book updates, trades and tickers at a configurable rate.
+Point a client at it via its addr:
+
+    >>> with WSSSimulator(rate=1000) as sim:
+    ...     wss = BitfinexWSS(pairs=['BTCUSD'])
+    ...     wss.addr = sim.url('Bitfinex')
+    ...     wss.start()
+"""
+# Import Built-Ins
+import logging
+import json
+import re
+import threading
+import time
+from itertools import count
+
+# Import Third-Party
+
+# Import Homebrew
+from bitex.pairs import normalize_pair
+from bitex.simulator.market import Market, iso
+from bitex.simulator.websocket import WebsocketServer, ConnectionClosed
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+class Feed:
+    """
+    Base class of the simulated feeds; an instance serves one connection.
+    All methods return lists of messages to send, as json-serializable
+    objects; next_update() returns None while there's nothing to stream.
+    """
+    def __init__(self, market, pairs, path):
+        """
+        :param market: bitex.simulator.market.Market
+        :param pairs: list of normalized pairs, for venues streaming
+                      without subscriptions
+        :param path: str, path the client connected to
+        """
+        self.market = market
+        self.pairs = pairs
+        self.path = path
+        self._lock = threading.Lock()
+        self._n = count()
+
+    def opened(self):
+        return []
+
+    def on_message(self, message):
+        return []
+
+    def next_update(self):
+        raise NotImplementedError
+
+
+class BitfinexFeed(Feed):
+    """
+    Bitfinex API v2 - public ticker, book, raw book, trades and candles
+    channels.
+    """
+    def __init__(self, *args, **kwargs):
+        super(BitfinexFeed, self).__init__(*args, **kwargs)
+        self.channels = {}  # chanId: (kind, pair)
+        self._order = []
+        self._chan_ids = count(1)
+        self.strings = False
+
+    def _num(self, value):
+        return str(value) if self.strings else value
+
+    def opened(self):
+        return [{'event': 'info', 'version': 2}]
+
+    def on_message(self, message):
+        event = message.get('event')
+        if event == 'conf':
+            self.strings = bool(message.get('flags', 0) & 8)
+            return [{'event': 'conf', 'status': 'OK',
+                     'flags': message.get('flags', 0)}]
+        elif event == 'ping':
+            return [{'event': 'pong'}]
+        elif event == 'subscribe':
+            return self._subscribe(message)
+        elif event == 'unsubscribe':
+            with self._lock:
+                self.channels.pop(message.get('chanId'), None)
+                self._order = list(self.channels)
+            return [{'event': 'unsubscribed', 'status': 'OK',
+                     'chanId': message.get('chanId')}]
+        return [{'event': 'error', 'msg': 'unknown event', 'code': 10000}]
+
+    def _subscribe(self, message):
+        channel = message.get('channel')
+        if channel == 'candles':
+            symbol = message.get('key', '').split(':')[-1]
+        else:
+            symbol = message.get('pair') or message.get('symbol') or ''
+        try:
+            pair = normalize_pair(symbol, 'Bitfinex')
+        except ValueError:
+            return [{'event': 'error', 'msg': 'symbol: invalid',
+                     'code': 10001}]
+        reply = {'event': 'subscribed', 'channel': channel,
+                 'chanId': next(self._chan_ids)}
+        if channel == 'candles':
+            reply['key'] = message['key']
+            kind = 'candles'
+        elif channel in ('ticker', 'trades', 'book'):
+            reply.update(symbol='t' + pair, pair=pair)
+            kind = channel
+            if channel == 'book':
+                reply.update(prec=message.get('prec', 'P0'),
+                             freq=message.get('freq', 'F0'),
+                             len=message.get('len', '25'))
+                if reply['prec'].startswith('R'):
+                    kind = 'raw_book'
+        else:
+            return [{'event': 'error', 'msg': 'channel: unknown',
+                     'code': 10302}]
+        with self._lock:
+            self.channels[reply['chanId']] = kind, pair
+            self._order = list(self.channels)
+        return [reply, self._snapshot(reply['chanId'], kind, pair)]
+
+    @staticmethod
+    def _order_id(price):
+        return int(round(price * 1e4))
+
+    def _candle(self, pair):
+        t = self.market.ticker(pair)
+        return [int(t['ts'] // 60 * 60000), t['open'], t['last'], t['high'],
+                t['low'], t['volume']]
+
+    def _ticker(self, pair):
+        t = self.market.ticker(pair)
+        change = t['last'] - t['open']
+        return [t['bid'], t['bid_size'], t['ask'], t['ask_size'], change,
+                round(change / t['open'], 4), t['last'], t['volume'],
+                t['high'], t['low']]
+
+    def _trade(self, t):
+        amount = t['size'] if t['side'] == 'buy' else -t['size']
+        return [t['id'], int(t['ts'] * 1000), self._num(amount),
+                self._num(t['price'])]
+
+    def _snapshot(self, chan_id, kind, pair):
+        num = self._num
+        if kind in ('book', 'raw_book'):
+            book = self.market.book(pair)
+            entries = []
+            for side, sign in (('bids', 1), ('asks', -1)):
+                for price, size in book[side]:
+                    if kind == 'book':
+                        entries.append([num(price), 1, num(sign * size)])
+                    else:
+                        entries.append([self._order_id(price), num(price),
+                                        num(sign * size)])
+            return [chan_id, entries]
+        elif kind == 'trades':
+            return [chan_id, [self._trade(t)
+                              for t in self.market.trades(pair)]]
+        elif kind == 'candles':
+            return [chan_id, [self._candle(pair)]]
+        return [chan_id, self._ticker(pair)]
+
+    def next_update(self):
+        with self._lock:
+            if not self._order:
+                return None
+            n = next(self._n)
+            chan_id = self._order[n % len(self._order)]
+            kind, pair = self.channels[chan_id]
+        if n % 100 == 99:
+            return [chan_id, 'hb']
+        num = self._num
+        if kind in ('book', 'raw_book'):
+            side, price, size = self.market.step(pair)
+            sign = 1 if side == 'bids' else -1
+            if kind == 'book':
+                return [chan_id, [num(price), 1 if size else 0,
+                                  num(sign * (size or 1))]]
+            return [chan_id, [self._order_id(price), num(price if size else 0),
+                              num(sign * (size or 1))]]
+        elif kind == 'trades':
+            return [chan_id, 'te', self._trade(self.market.trade(pair))]
+        elif kind == 'candles':
+            return [chan_id, self._candle(pair)]
+        return [chan_id, self._ticker(pair)]
+
+
+class GDAXFeed(Feed):
+    """
+    GDAX - level2 and full channels; messages of the full channel carry
+    per-product sequence numbers.
+    """
+    def __init__(self, *args, **kwargs):
+        super(GDAXFeed, self).__init__(*args, **kwargs)
+        self.products = []
+        self.channels = set()
+        self.sequences = {}
+
+    def on_message(self, message):
+        if message.get('type') != 'subscribe':
+            return [{'type': 'error', 'message': 'Failed to subscribe'}]
+        products = message.get('product_ids', [])
+        channels = {c if isinstance(c, str) else c['name']
+                    for c in message.get('channels', ['full'])}
+        with self._lock:
+            self.products = list(dict.fromkeys(self.products + products))
+            self.channels |= channels
+            for pid in products:
+                self.sequences.setdefault(pid, 0)
+        replies = [{'type': 'subscriptions',
+                    'channels': [{'name': c, 'product_ids': self.products}
+                                 for c in sorted(self.channels)]}]
+        if 'level2' in channels:
+            for pid in products:
+                book = self.market.book(pid, 'GDAX')
+                replies.append({'type': 'snapshot', 'product_id': pid,
+                                'bids': [[str(p), str(s)]
+                                         for p, s in book['bids']],
+                                'asks': [[str(p), str(s)]
+                                         for p, s in book['asks']]})
+        return replies
+
+    def next_update(self):
+        with self._lock:
+            if not self.products or not self.channels:
+                return None
+            n = next(self._n)
+            pid = self.products[n % len(self.products)]
+            full = 'full' in self.channels and (
+                'level2' not in self.channels or
+                n // len(self.products) % 2)
+            if full:
+                self.sequences[pid] += 1
+                sequence = self.sequences[pid]
+        now = time.time()
+        if full:
+            t = self.market.trade(pid, 'GDAX')
+            return {'type': 'match', 'trade_id': t['id'],
+                    'sequence': sequence, 'maker_order_id': str(t['id']),
+                    'taker_order_id': str(-t['id']), 'time': iso(now),
+                    'product_id': pid, 'size': str(t['size']),
+                    'price': str(t['price']), 'side': t['side']}
+        side, price, size = self.market.step(pid, 'GDAX')
+        return {'type': 'l2update', 'product_id': pid, 'time': iso(now),
+                'changes': [['buy' if side == 'bids' else 'sell', str(price),
+                             str(size)]]}
+
+
+class GeminiFeed(Feed):
+    """
+    Gemini - market data of the symbol named by the path, i.e.
+    /v1/marketdata/BTCUSD.
+    """
+    def __init__(self, *args, **kwargs):
+        super(GeminiFeed, self).__init__(*args, **kwargs)
+        self.symbol = self.path.rstrip('/').split('/')[-1]
+        self._events = count(1)
+
+    def _update(self, events, ts=None):
+        ts = time.time() if ts is None else ts
+        return {'type': 'update', 'eventId': next(self._events),
+                'timestamp': int(ts), 'timestampms': int(ts * 1000),
+                'socket_sequence': next(self._n), 'events': events}
+
+    def opened(self):
+        book = self.market.book(self.symbol, 'Gemini')
+        events = [{'type': 'change', 'reason': 'initial', 'price': str(p),
+                   'delta': str(s), 'remaining': str(s),
+                   'side': 'bid' if side == 'bids' else 'ask'}
+                  for side in ('bids', 'asks') for p, s in book[side]]
+        # The initial update carries no timestamp
+        update = self._update(events)
+        del update['timestamp'], update['timestampms']
+        return [update]
+
+    def next_update(self):
+        if next(self._events) % 4:
+            side, price, size = self.market.step(self.symbol, 'Gemini')
+            return self._update([{
+                'type': 'change', 'price': str(price), 'delta': str(size),
+                'remaining': str(size), 'reason': 'place' if size else 'cancel',
+                'side': 'bid' if side == 'bids' else 'ask'}])
+        t = self.market.trade(self.symbol, 'Gemini')
+        return self._update([{
+            'type': 'trade', 'tid': t['id'], 'price': str(t['price']),
+            'amount': str(t['size']),
+            'makerSide': 'ask' if t['side'] == 'buy' else 'bid'}], t['ts'])
+
+
+class OKCoinFeed(Feed):
+    """
+    OKCoin API v1 - spot ticker, depth, trades and kline channels, i.e.
+    ok_sub_spotusd_btc_ticker.
+    """
+    channel_regex = re.compile(r'ok_sub_spot(?P<quote>[a-z]+)_(?P<base>\w+?)_'
+                               r'(?P<kind>ticker|depth(_\d+)?|trades|'
+                               r'kline_\w+)$', re.IGNORECASE)
+
+    def __init__(self, *args, **kwargs):
+        super(OKCoinFeed, self).__init__(*args, **kwargs)
+        self.channels = []  # list of (channel, kind, pair)
+
+    def on_message(self, message):
+        events = message if isinstance(message, list) else [message]
+        replies = []
+        for event in events:
+            channel = event.get('channel', '')
+            match = self.channel_regex.match(channel)
+            if event.get('event') != 'addChannel' or match is None:
+                replies.append({'channel': 'addChannel', 'data': {
+                    'result': False, 'channel': channel,
+                    'error_code': 10011}})
+                continue
+            pair = (match.group('base') + match.group('quote')).upper()
+            with self._lock:
+                self.channels.append((channel, match.group('kind'), pair))
+            replies.append({'channel': 'addChannel',
+                            'data': {'result': True, 'channel': channel}})
+        return [replies]
+
+    def next_update(self):
+        with self._lock:
+            if not self.channels:
+                return None
+            channel, kind, pair = self.channels[next(self._n) %
+                                                len(self.channels)]
+        if kind == 'ticker':
+            t = self.market.ticker(pair)
+            data = {'buy': str(t['bid']), 'sell': str(t['ask']),
+                    'high': str(t['high']), 'low': str(t['low']),
+                    'last': str(t['last']), 'vol': str(t['volume']),
+                    'timestamp': int(t['ts'] * 1000)}
+        elif kind.startswith('depth'):
+            depth = int(kind.split('_')[1]) if '_' in kind else 20
+            self.market.step(pair)
+            book = self.market.book(pair, depth=depth)
+            # OKCoin lists asks from the highest price down
+            data = {'asks': [[str(p), str(s)] for p, s in
+                             reversed(book['asks'])],
+                    'bids': [[str(p), str(s)] for p, s in book['bids']],
+                    'timestamp': int(time.time() * 1000)}
+        elif kind == 'trades':
+            t = self.market.trade(pair)
+            data = [[str(t['id']), str(t['price']), str(t['size']),
+                     time.strftime('%H:%M:%S', time.gmtime(t['ts'])),
+                     'bid' if t['side'] == 'buy' else 'ask']]
+        else:
+            t = self.market.ticker(pair)
+            data = [[int(t['ts'] // 60 * 60000), str(t['open']),
+                     str(t['high']), str(t['low']), str(t['last']),
+                     str(t['volume'])]]
+        return [{'channel': channel, 'data': data}]
+
+
+class HitBTCFeed(Feed):
+    """
+    HitBTC API v1 - market data of all pairs, streamed without subscribing.
+    """
+    def opened(self):
+        messages = []
+        for pair in self.pairs:
+            book = self.market.book(pair)
+            messages.append({'MarketDataSnapshotFullRefresh': {
+                'snapshotSeqNo': 0, 'symbol': pair,
+                'exchangeStatus': 'working',
+                'ask': [{'price': str(p), 'size': s}
+                        for p, s in book['asks']],
+                'bid': [{'price': str(p), 'size': s}
+                        for p, s in book['bids']]}})
+        return messages
+
+    def next_update(self):
+        if not self.pairs:
+            return None
+        n = next(self._n)
+        pair = self.pairs[n % len(self.pairs)]
+        update = {'seqNo': n + 1, 'timestamp': int(time.time() * 1000),
+                  'symbol': pair, 'exchangeStatus': 'working', 'ask': [],
+                  'bid': [], 'trade': []}
+        if n % 4 == 3:
+            t = self.market.trade(pair)
+            update['trade'].append({'price': str(t['price']),
+                                    'size': t['size'], 'tradeId': t['id'],
+                                    'timestamp': int(t['ts'] * 1000),
+                                    'side': t['side']})
+        else:
+            side, price, size = self.market.step(pair)
+            update[side[:3]].append({'price': str(price), 'size': size})
+        return {'MarketDataIncrementalRefresh': update}
+
+
+# Venue name: Feed class; feeds are served at /<name in lower case>
+FEEDS = {'Bitfinex': BitfinexFeed, 'GDAX': GDAXFeed, 'Gemini': GeminiFeed,
+         'OKCoin': OKCoinFeed, 'HitBTC': HitBTCFeed}
+
+
+class WSSSimulator:
+    """
+    Websocket server simulating the feeds of all venues in FEEDS.
+    """
+    def __init__(self, host='127.0.0.1', port=0, market=None, pairs=None,
+                 rate=100, limit=None, batch_size=64):
+        """
+        :param host: str, address to bind to
+        :param port: int, 0 picks a free port
+        :param market: bitex.simulator.market.Market, shared with other
+                       simulators to serve the same books
+        :param pairs: list of pairs streamed by venues which don't take
+                      subscriptions (HitBTC); defaults to all of the market's
+        :param rate: updates per second and connection; None streams as fast
+                     as possible
+        :param limit: number of updates per connection, after which the
+                      stream stops; None streams until the client disconnects
+        :param batch_size: updates written per system call, if rate is None
+        """
+        self.market = market or Market()
+        self.pairs = [normalize_pair(p) for p in pairs or self.market.pairs]
+        self.rate = rate
+        self.limit = limit
+        self.batch_size = batch_size
+        self.connections = set()
+        self._stop = threading.Event()
+        self._server = WebsocketServer(self._serve, host, port)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def host(self):
+        return self._server.host
+
+    @property
+    def port(self):
+        return self._server.port
+
+    def start(self):
+        self._stop.clear()
+        self._server.start()
+        log.info("WSS simulator listening on %s:%s", self.host, self.port)
+
+    def stop(self):
+        self._stop.set()
+        for conn in list(self.connections):
+            conn.close()
+        self._server.stop()
+
+    def url(self, venue):
+        """
+        Returns the address to set as a venue's client's addr, i.e.
+        wss.addr = sim.url('Bitfinex').
+        :param venue: str, a key of FEEDS
+        :return: str
+        """
+        url = 'ws://%s:%s/%s' % (self.host, self.port, venue.lower())
+        # Gemini's client appends the endpoint of each symbol
+        return url + '/v1/' if venue.lower() == 'gemini' else url
+
+    def _feed(self, path):
+        prefix = path.strip('/').split('/')[0].lower()
+        for name, cls in FEEDS.items():
+            if name.lower() == prefix:
+                return cls(self.market, self.pairs, path)
+        return None
+
+    def _serve(self, conn):
+        feed = self._feed(conn.path)
+        if feed is None:
+            log.warning("WSSSimulator: No feed at %s!", conn.path)
+            return
+        self.connections.add(conn)
+        try:
+            for message in feed.opened():
+                conn.send(json.dumps(message))
+            # Serializes replies and updates, so that no update of a channel
+            # is sent before the reply confirming its subscription
+            lock = threading.Lock()
+            reader = threading.Thread(target=self._read,
+                                      args=(conn, feed, lock), daemon=True,
+                                      name='WSS Simulator Reader')
+            reader.start()
+            self._stream(conn, feed, lock)
+            while not conn.closed and not self._stop.is_set():
+                reader.join(0.1)
+        finally:
+            self.connections.discard(conn)
+
+    def _read(self, conn, feed, lock):
+        while True:
+            raw = conn.recv()
+            if raw is None:
+                return
+            with lock:
+                try:
+                    replies = feed.on_message(json.loads(raw))
+                except (ValueError, AttributeError):
+                    log.warning("WSSSimulator: Invalid message %r", raw)
+                    continue
+                try:
+                    for reply in replies:
+                        conn.send(json.dumps(reply))
+                except ConnectionClosed:
+                    return
+
+    def _stream(self, conn, feed, lock):
+        interval = 1 / self.rate if self.rate else 0
+        batch_size = 1 if interval else self.batch_size
+        due = time.perf_counter()
+        sent = 0
+        while not conn.closed and not self._stop.is_set():
+            n = batch_size if self.limit is None else min(batch_size,
+                                                          self.limit - sent)
+            if n <= 0:
+                return
+            if interval:
+                due += interval
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    # Don't burst to catch up after falling behind
+                    due = time.perf_counter()
+            with lock:
+                batch = []
+                for _ in range(n):
+                    update = feed.next_update()
+                    if update is None:
+                        break
+                    batch.append(json.dumps(update))
+                try:
+                    if batch:
+                        conn.send_many(batch)
+                except ConnectionClosed:
+                    return
+            if not batch:
+                # Nothing subscribed yet
+                time.sleep(0.01)
+                continue
+            sent += len(batch)
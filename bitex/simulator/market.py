@@ -0,0 +1,166 @@
+"""
+Synthetic market data served by the simulators - an order book per pair,
+whose levels change at random, and random trades around its mid price.
+
+Pairs are normalized as in bitex.pairs; books are created on first use.
+Given a seed, a Market produces the same sequence of books and updates.
+"""
+# Import Built-Ins
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from itertools import count
+
+# Import Third-Party
+
+# Import Homebrew
+from bitex.pairs import normalize_pair
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+# Initial mid price per pair; others start at 100
+PRICES = {'BTCUSD': 2500.0, 'BTCUSDT': 2500.0, 'BTCEUR': 2200.0,
+          'BTCJPY': 280000.0, 'BTCCAD': 3300.0, 'BTCCNY': 17000.0,
+          'ETHUSD': 250.0, 'ETHBTC': 0.1, 'LTCUSD': 45.0, 'LTCBTC': 0.018,
+          'GLDBTC': 0.016}
+
+
+def iso(ts):
+    """
+    :return: str, ts as ISO 8601 UTC time with microseconds
+    """
+    return datetime.fromtimestamp(ts, timezone.utc).strftime(
+        '%Y-%m-%dT%H:%M:%S.%fZ')
+
+
+class _Book:
+    __slots__ = ('mid', 'tick', 'sides', 'last', 'open', 'high', 'low',
+                 'volume')
+
+    def __init__(self, mid):
+        self.mid = mid
+        self.tick = mid / 10000
+        self.sides = {'bids': {}, 'asks': {}}
+        self.last = self.open = self.high = self.low = mid
+        self.volume = 0.0
+
+
+class Market:
+    """
+    Order books and trades of several pairs.
+    """
+    def __init__(self, pairs=None, depth=25, seed=None):
+        """
+        :param pairs: list of pairs to create books for up front; defaults
+                      to those in PRICES
+        :param depth: number of price levels per side
+        :param seed: seed of the random number generator
+        """
+        self.depth = depth
+        self._random = random.Random(seed)
+        self._books = {}
+        self._lock = threading.Lock()
+        self._ids = count(1)
+        for pair in pairs or PRICES:
+            self._book(pair)
+
+    @property
+    def pairs(self):
+        with self._lock:
+            return list(self._books)
+
+    def _book(self, pair, exchange=None):
+        """
+        Must be called while holding self._lock, unless during __init__().
+        """
+        pair = normalize_pair(pair, exchange)
+        try:
+            return self._books[pair]
+        except KeyError:
+            book = self._books[pair] = _Book(PRICES.get(pair, 100.0))
+            for level in range(1, self.depth + 1):
+                for side, sign in (('bids', -1), ('asks', 1)):
+                    price = self._price(book, sign * level)
+                    book.sides[side][price] = self._size()
+            return book
+
+    def _price(self, book, ticks):
+        return round(book.mid + ticks * book.tick, 8)
+
+    def _size(self):
+        return round(self._random.uniform(0.01, 5), 4)
+
+    def book(self, pair, exchange=None, depth=None):
+        """
+        :param pair: str, as named by the exchange
+        :param exchange: str, see bitex.pairs.split_pair()
+        :param depth: max number of levels per side
+        :return: dict of 'bids' and 'asks', each a list of (price, size),
+                 best first
+        """
+        with self._lock:
+            book = self._book(pair, exchange)
+            bids = sorted(book.sides['bids'].items(), reverse=True)
+            asks = sorted(book.sides['asks'].items())
+        return {'bids': bids[:depth], 'asks': asks[:depth]}
+
+    def ticker(self, pair, exchange=None):
+        """
+        :return: dict of bid, ask, bid_size, ask_size, last, open, high,
+                 low, volume and ts
+        """
+        with self._lock:
+            book = self._book(pair, exchange)
+            bid = max(book.sides['bids'].items(), default=(book.mid, 0))
+            ask = min(book.sides['asks'].items(), default=(book.mid, 0))
+            return {'bid': bid[0], 'bid_size': bid[1], 'ask': ask[0],
+                    'ask_size': ask[1], 'last': book.last, 'open': book.open,
+                    'high': book.high, 'low': book.low,
+                    'volume': round(book.volume, 4), 'ts': time.time()}
+
+    def step(self, pair, exchange=None):
+        """
+        Changes the size of a random price level; a size of 0 removes it.
+        :return: tuple of side, price and new size
+        """
+        with self._lock:
+            book = self._book(pair, exchange)
+            side = self._random.choice(('bids', 'asks'))
+            ticks = self._random.randint(1, self.depth)
+            price = self._price(book, -ticks if side == 'bids' else ticks)
+            levels = book.sides[side]
+            if price in levels and self._random.random() < 0.3:
+                size = 0
+                del levels[price]
+            else:
+                size = levels[price] = self._size()
+            return side, price, size
+
+    def trade(self, pair, exchange=None):
+        """
+        Executes a random trade at the best bid or ask.
+        :return: dict of id, ts, price, size and side ('buy' or 'sell')
+        """
+        with self._lock:
+            book = self._book(pair, exchange)
+            side = self._random.choice(('buy', 'sell'))
+            levels = book.sides['asks' if side == 'buy' else 'bids']
+            price = ((min(levels) if side == 'buy' else max(levels))
+                     if levels else book.mid)
+            size = round(self._random.uniform(0.001, 1), 4)
+            book.last = price
+            book.high = max(book.high, price)
+            book.low = min(book.low, price)
+            book.volume += size
+            return {'id': next(self._ids), 'ts': time.time(), 'price': price,
+                    'size': size, 'side': side}
+
+    def trades(self, pair, exchange=None, n=10):
+        """
+        :return: list of n trades, see trade(); latest first
+        """
+        return [self.trade(pair, exchange) for _ in range(n)][::-1]
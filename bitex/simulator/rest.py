@@ -0,0 +1,1597 @@
+"""
+Local HTTP stand-in for the exchanges' REST APIs.
+
+RESTSimulator serves each venue under its own path prefix, answering public
+endpoints with data shaped like the exchange's responses, and authenticating
+private endpoints by checking the signature the venue's REST client
+computed in sign() - an invalid signature is rejected as the exchange would.
+Point a client at it via its url:
+
+    >>> with RESTSimulator() as sim:
+    ...     kraken = Kraken(url=sim.url('Kraken'), key=sim.credentials.key,
+    ...                     secret=sim.credentials.secret)
+    ...     kraken.order_book('XBTUSD').formatted
+    ...     kraken.balance().json()
+"""
+# Import Built-Ins
+import logging
+import base64
+import hashlib
+import hmac
+import json
+import re
+import threading
+import time
+from collections import Counter, namedtuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, quote_plus, urlencode
+
+# Import Third-Party
+
+# Import Homebrew
+from bitex.pairs import normalize_pair, split_pair, venue_pair
+from bitex.simulator.market import Market, iso
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+Credentials = namedtuple('Credentials', 'key secret passphrase user_id')
+
+# Secret is base64, as Kraken and GDAX expect it
+DEFAULT_CREDENTIALS = Credentials(
+    'simulator-key', base64.b64encode(b'simulator-secret').decode(),
+    'simulator-passphrase', 'simulator-user')
+
+
+def _equal(a, b):
+    if isinstance(a, str):
+        a = a.encode('utf-8')
+    if isinstance(b, str):
+        b = b.encode('utf-8')
+    return hmac.compare_digest(a or b'', b or b'')
+
+
+class Request:
+    """
+    A request, as received by the simulator.
+    """
+    def __init__(self, method, path, query, body, headers, url, raw_path,
+                 relative):
+        """
+        :param method: str, i.e. 'GET'
+        :param path: str, path below the venue's prefix, sans query
+        :param query: dict of query parameters
+        :param body: bytes
+        :param headers: http.client.HTTPMessage
+        :param url: str, the full url as requested by the client
+        :param raw_path: str, path and query as requested by the client
+        :param relative: str, path and query below the venue's prefix
+        """
+        self.method = method
+        self.path = path
+        self.query = query
+        self.body = body
+        self.headers = headers
+        self.url = url
+        self.raw_path = raw_path
+        self.relative = relative
+
+    @property
+    def form(self):
+        return dict(parse_qsl(self.body.decode('utf-8')))
+
+    @property
+    def params(self):
+        """
+        Query and form parameters, merged.
+        """
+        params = dict(self.query)
+        if self.body and not self.body.startswith(b'{'):
+            params.update(self.form)
+        return params
+
+
+class Venue:
+    """
+    Base class of the simulated REST APIs. Subclasses list their routes as
+    tuples of http methods, a regex matching the path - whose named groups
+    are passed to the handler - the name of the handler and whether the
+    endpoint is private.
+    """
+    name = None
+    routes = ()
+
+    def __init__(self, market, credentials):
+        self.market = market
+        self.credentials = credentials
+        self._ids = iter(range(1, 2 ** 63))
+
+    def dispatch(self, request):
+        """
+        :return: tuple of status code and json payload
+        """
+        for methods, pattern, handler, private in self.routes:
+            match = re.fullmatch(pattern, request.path)
+            if match is None or request.method not in methods:
+                continue
+            if private and not self.verify(request):
+                log.debug("%s: rejected signature of %s %s", self.name,
+                          request.method, request.url)
+                return self.rejected()
+            try:
+                return 200, getattr(self, handler)(request,
+                                                   **match.groupdict())
+            except (KeyError, ValueError) as e:
+                return self.error(400, 'Invalid request: %s' % e)
+        return self.error(404, 'Unknown endpoint %s' % request.path)
+
+    def verify(self, request):
+        """
+        Checks the signature of a private request; mirrors the venue's
+        REST client's sign().
+        :return: bool
+        """
+        raise NotImplementedError
+
+    def rejected(self):
+        return self.error(401, 'Invalid signature')
+
+    def error(self, status, message):
+        return status, {'error': message}
+
+    def pair(self, pair):
+        return venue_pair(self.name, pair)
+
+    def all_pairs(self):
+        return [self.pair(p) for p in self.market.pairs]
+
+    def book(self, pair, depth=None):
+        return self.market.book(pair, self.name, depth=depth)
+
+    def ticker(self, pair):
+        return self.market.ticker(pair, self.name)
+
+    def trades(self, pair, n=10):
+        return self.market.trades(pair, self.name, n=n)
+
+    def order_id(self):
+        return next(self._ids)
+
+
+class ItBitVenue(Venue):
+    """
+    itBit's API v1. As the client signs its parameters but doesn't send
+    them, only queries without parameters pass verification.
+    """
+    name = 'ItBit'
+    routes = ((('GET',), r'/v1/markets/(?P<pair>\w+)/ticker', 'pair_ticker',
+               False),
+              (('GET',), r'/v1/markets/(?P<pair>\w+)/order_book',
+               'order_book', False),
+              (('GET',), r'/v1/markets/(?P<pair>\w+)/trades', 'trade_history',
+               False),
+              (('GET', 'POST', 'DELETE'), r'/v1/(?P<endpoint>[\w/-]+)',
+               'private', True))
+
+    def pair(self, pair):
+        return venue_pair('itBit', pair)
+
+    def verify(self, request):
+        try:
+            key, signature = request.headers['Authorization'].split(':', 1)
+            body = json.loads(request.body) if request.body else {}
+        except (KeyError, ValueError):
+            return False
+        nonce = request.headers.get('X-Auth-Nonce', '')
+        message = json.dumps([request.method, request.url, body, nonce,
+                              request.headers.get('X-Auth-Timestamp', '')],
+                             separators=(',', ':'))
+        digest = hashlib.sha256((nonce + message).encode('utf-8')).digest()
+        expected = hmac.new(self.credentials.secret.encode('utf-8'),
+                            request.url.encode('utf-8') + digest,
+                            hashlib.sha512)
+        return (_equal(key, self.credentials.key) and
+                _equal(signature, base64.b64encode(expected.digest())))
+
+    def error(self, status, message):
+        return status, {'code': 10000 + status, 'description': message}
+
+    def pair_ticker(self, request, pair):
+        t = self.ticker(pair)
+        return {'pair': self.pair(pair), 'bid': str(t['bid']),
+                'bidAmt': str(t['bid_size']), 'ask': str(t['ask']),
+                'askAmt': str(t['ask_size']), 'lastPrice': str(t['last']),
+                'lastAmt': '0.01', 'volume24h': str(t['volume']),
+                'volumeToday': str(t['volume']), 'high24h': str(t['high']),
+                'low24h': str(t['low']), 'highToday': str(t['high']),
+                'lowToday': str(t['low']), 'openToday': str(t['open']),
+                'vwapToday': str(t['last']), 'vwap24h': str(t['last']),
+                'serverTimeUTC': iso(t['ts'])}
+
+    def order_book(self, request, pair):
+        return {side: [[str(p), str(s)] for p, s in levels]
+                for side, levels in self.book(pair).items()}
+
+    def trade_history(self, request, pair):
+        trades = self.trades(pair)
+        return {'count': len(trades), 'recentTrades': [
+            {'timestamp': iso(t['ts']), 'matchNumber': str(t['id']),
+             'price': str(t['price']), 'amount': str(t['size'])}
+            for t in trades]}
+
+    def private(self, request, endpoint):
+        if endpoint == 'wallets':
+            return [{'id': 'simulator-wallet',
+                     'userId': request.query.get('userId'),
+                     'name': 'Wallet', 'balances': [
+                         {'currency': c, 'availableBalance': b,
+                          'totalBalance': b}
+                         for c, b in (('XBT', '5.0'), ('USD', '10000.0'))]}]
+        elif endpoint.endswith('/orders'):
+            return {'id': str(self.order_id()), 'status': 'submitted'}
+        return {}
+
+
+class KrakenVenue(Venue):
+    name = 'Kraken'
+    routes = ((('GET', 'POST'), r'/0/public/(?P<method>\w+)', 'public',
+               False),
+              (('POST',), r'/0/private/(?P<method>\w+)', 'private', True))
+
+    def verify(self, request):
+        nonce = request.form.get('nonce', '')
+        encoded = nonce.encode('utf-8') + request.body
+        message = (request.path.encode('utf-8') +
+                   hashlib.sha256(encoded).digest())
+        signature = hmac.new(base64.b64decode(self.credentials.secret),
+                             message, hashlib.sha512)
+        return (_equal(request.headers.get('API-Key'), self.credentials.key)
+                and _equal(request.headers.get('API-Sign'),
+                           base64.b64encode(signature.digest())))
+
+    def rejected(self):
+        return 200, {'error': ['EAPI:Invalid signature']}
+
+    def error(self, status, message):
+        return status, {'error': ['EGeneral:%s' % message]}
+
+    def public(self, request, method):
+        params = request.params
+        if method == 'Time':
+            now = time.time()
+            rfc1123 = time.strftime('%a, %d %b %y %H:%M:%S +0000',
+                                    time.gmtime(now))
+            return {'error': [], 'result': {'unixtime': int(now),
+                                            'rfc1123': rfc1123}}
+        pairs = [self.pair(p) for p in params['pair'].split(',')]
+        result = {}
+        for pair in pairs:
+            if method == 'Ticker':
+                t = self.ticker(pair)
+                result[pair] = {
+                    'a': [str(t['ask']), '1', '1.000'],
+                    'b': [str(t['bid']), '1', '1.000'],
+                    'c': [str(t['last']), '0.01'],
+                    'v': [str(t['volume'])] * 2, 'p': [str(t['last'])] * 2,
+                    't': [10, 10], 'l': [str(t['low'])] * 2,
+                    'h': [str(t['high'])] * 2, 'o': str(t['open'])}
+            elif method == 'Depth':
+                count = int(params.get('count', 0)) or None
+                ts = int(time.time())
+                result[pair] = {
+                    side: [[str(p), str(s), ts] for p, s in levels]
+                    for side, levels in self.book(pair, count).items()}
+            elif method == 'Trades':
+                result[pair] = [[str(t['price']), str(t['size']), t['ts'],
+                                 t['side'][0], 'l', '']
+                                for t in self.trades(pair)]
+                result['last'] = str(int(time.time() * 1e9))
+            else:
+                raise KeyError(method)
+        return {'error': [], 'result': result}
+
+    def private(self, request, method):
+        form = request.form
+        if method == 'Balance':
+            result = {'ZUSD': '10000.0000', 'XXBT': '5.0000000000'}
+        elif method == 'AddOrder':
+            result = {'descr': {'order': '%s %s %s @ limit %s' % (
+                form.get('type'), form.get('volume'), form.get('pair'),
+                form.get('price'))}, 'txid': ['O%06d' % self.order_id()]}
+        elif method == 'CancelOrder':
+            result = {'count': 1}
+        else:
+            result = {}
+        return {'error': [], 'result': result}
+
+
+class BitfinexVenue(Venue):
+    name = 'Bitfinex'
+    header = 'X-BFX'
+    routes = ((('GET',), r'/v1/pubticker/(?P<pair>\w+)', 'pubticker', False),
+              (('GET',), r'/v1/book/(?P<pair>\w+)', 'orderbook', False),
+              (('GET',), r'/v1/trades/(?P<pair>\w+)', 'trade_history', False),
+              (('GET',), r'/v1/symbols', 'symbols', False),
+              (('POST',), r'/v1/(?P<endpoint>[\w/]+)', 'private', True))
+
+    def verify(self, request):
+        payload = request.headers.get(self.header + '-PAYLOAD', '')
+        signature = hmac.new(self.credentials.secret.encode('utf-8'),
+                             payload.encode('utf-8'), hashlib.sha384)
+        try:
+            decoded = json.loads(base64.b64decode(payload))
+        except ValueError:
+            return False
+        return (_equal(request.headers.get(self.header + '-APIKEY'),
+                       self.credentials.key) and
+                _equal(request.headers.get(self.header + '-SIGNATURE'),
+                       signature.hexdigest()) and
+                decoded.get('request') == request.path)
+
+    def rejected(self):
+        return 400, {'message': 'Invalid %s-SIGNATURE' % self.header}
+
+    def error(self, status, message):
+        return status, {'message': message}
+
+    def pubticker(self, request, pair):
+        t = self.ticker(pair)
+        return {'mid': str((t['bid'] + t['ask']) / 2), 'bid': str(t['bid']),
+                'ask': str(t['ask']), 'last_price': str(t['last']),
+                'low': str(t['low']), 'high': str(t['high']),
+                'volume': str(t['volume']), 'timestamp': str(t['ts'])}
+
+    def orderbook(self, request, pair):
+        ts = str(time.time())
+        return {side: [{'price': str(p), 'amount': str(s), 'timestamp': ts}
+                       for p, s in levels]
+                for side, levels in self.book(pair).items()}
+
+    def trade_history(self, request, pair):
+        return [{'timestamp': int(t['ts']), 'tid': t['id'],
+                 'price': str(t['price']), 'amount': str(t['size']),
+                 'exchange': self.name.lower(), 'type': t['side']}
+                for t in self.trades(pair)]
+
+    def symbols(self, request):
+        return [p.lower() for p in self.all_pairs()]
+
+    def _order(self, payload):
+        return {'id': self.order_id(), 'symbol': payload.get('symbol'),
+                'price': payload.get('price'), 'side': payload.get('side'),
+                'original_amount': payload.get('amount'), 'is_live': True,
+                'timestamp': str(time.time())}
+
+    def private(self, request, endpoint):
+        payload = json.loads(base64.b64decode(
+            request.headers[self.header + '-PAYLOAD']))
+        if endpoint == 'balances':
+            return [{'type': 'exchange', 'currency': c, 'amount': a,
+                     'available': a} for c, a in (('usd', '10000.0'),
+                                                  ('btc', '5.0'))]
+        elif endpoint in ('order/new', 'order/cancel/replace'):
+            order = self._order(payload)
+            order['order_id'] = order['id']
+            return order
+        elif endpoint in ('order/status', 'order/cancel'):
+            return dict(self._order(payload), id=payload.get('order_id'))
+        return {}
+
+
+class GeminiVenue(BitfinexVenue):
+    name = 'Gemini'
+    header = 'X-GEMINI'
+
+    def rejected(self):
+        return 400, {'result': 'error', 'reason': 'InvalidSignature',
+                     'message': 'InvalidSignature'}
+
+    def error(self, status, message):
+        return status, {'result': 'error', 'reason': 'Bad Request',
+                        'message': message}
+
+    def pubticker(self, request, pair):
+        t = self.ticker(pair)
+        base, quote = pair[:3].upper(), pair[3:].upper()
+        return {'bid': str(t['bid']), 'ask': str(t['ask']),
+                'last': str(t['last']),
+                'volume': {base: str(t['volume']),
+                           quote: str(round(t['volume'] * t['last'], 2)),
+                           'timestamp': int(t['ts'] * 1000)}}
+
+    def trade_history(self, request, pair):
+        trades = super(GeminiVenue, self).trade_history(request, pair)
+        for trade in trades:
+            trade['timestampms'] = trade['timestamp'] * 1000
+        return trades
+
+    def private(self, request, endpoint):
+        result = super(GeminiVenue, self).private(request, endpoint)
+        if isinstance(result, dict) and 'id' in result:
+            result['order_id'] = str(result.pop('id'))
+        return result
+
+
+class GDAXVenue(Venue):
+    name = 'GDAX'
+    routes = ((('GET',), r'/products/(?P<pair>[\w-]+)/ticker', 'product_ticker',
+               False),
+              (('GET',), r'/products/(?P<pair>[\w-]+)/book', 'product_book',
+               False),
+              (('GET',), r'/products/(?P<pair>[\w-]+)/trades',
+               'product_trades', False),
+              (('GET',), r'/products', 'products', False),
+              (('GET',), r'/time', 'server_time', False),
+              (('GET',), r'/accounts', 'accounts', True),
+              (('POST',), r'/orders', 'new_order', True),
+              (('GET', 'DELETE'), r'/orders(/(?P<order_id>[\w-]+))?', 'orders',
+               True))
+
+    def __init__(self, *args, **kwargs):
+        super(GDAXVenue, self).__init__(*args, **kwargs)
+        self._sequence = 0
+
+    def verify(self, request):
+        timestamp = request.headers.get('CB-ACCESS-TIMESTAMP', '')
+        message = (timestamp + request.method + request.raw_path +
+                   request.body.decode('utf-8'))
+        signature = hmac.new(base64.b64decode(self.credentials.secret),
+                             message.encode('utf-8'), hashlib.sha256)
+        return (_equal(request.headers.get('CB-ACCESS-KEY'),
+                       self.credentials.key) and
+                _equal(request.headers.get('CB-ACCESS-PASSPHRASE'),
+                       self.credentials.passphrase) and
+                _equal(request.headers.get('CB-ACCESS-SIGN'),
+                       base64.b64encode(signature.digest())))
+
+    def error(self, status, message):
+        return status, {'message': message}
+
+    def rejected(self):
+        return self.error(401, 'invalid signature')
+
+    def product_ticker(self, request, pair):
+        t = self.ticker(pair)
+        return {'trade_id': self.order_id(), 'price': str(t['last']),
+                'size': '0.01', 'bid': str(t['bid']), 'ask': str(t['ask']),
+                'volume': str(t['volume']), 'time': iso(t['ts'])}
+
+    def product_book(self, request, pair):
+        self._sequence += 1
+        level = int(request.query.get('level', 1))
+        book = self.book(pair, depth=1 if level == 1 else 50)
+        result = {side: [[str(p), str(s), 1] for p, s in levels]
+                  for side, levels in book.items()}
+        result['sequence'] = self._sequence
+        return result
+
+    def product_trades(self, request, pair):
+        return [{'time': iso(t['ts']), 'trade_id': t['id'],
+                 'price': str(t['price']), 'size': str(t['size']),
+                 'side': t['side']} for t in self.trades(pair)]
+
+    def products(self, request):
+        return [{'id': p, 'base_currency': p.split('-')[0],
+                 'quote_currency': p.split('-')[1]}
+                for p in self.all_pairs()]
+
+    def server_time(self, request):
+        now = time.time()
+        return {'iso': iso(now), 'epoch': now}
+
+    def accounts(self, request):
+        return [{'id': str(i), 'currency': c, 'balance': b, 'available': b,
+                 'hold': '0.0'}
+                for i, (c, b) in enumerate((('USD', '10000.0'),
+                                            ('BTC', '5.0')))]
+
+    def new_order(self, request):
+        order = json.loads(request.body or b'{}')
+        return {'id': str(self.order_id()), 'price': order.get('price'),
+                'size': order.get('size'), 'side': order.get('side'),
+                'product_id': order.get('product_id'), 'status': 'pending',
+                'created_at': iso(time.time())}
+
+    def orders(self, request, order_id=None):
+        if request.method == 'DELETE':
+            return [order_id] if order_id else []
+        if order_id:
+            return {'id': order_id, 'status': 'open'}
+        return []
+
+
+class BitstampVenue(Venue):
+    name = 'Bitstamp'
+    routes = ((('GET',), r'/v2/ticker/(?P<pair>\w+)/?', 'pair_ticker', False),
+              (('GET',), r'/v2/order_book/(?P<pair>\w+)/?', 'order_book',
+               False),
+              (('GET',), r'/v2/transactions/(?P<pair>\w+)/?', 'transactions',
+               False),
+              (('POST',), r'/(?P<endpoint>[\w/]+)', 'private', True))
+
+    def verify(self, request):
+        form = request.form
+        message = (form.get('nonce', '') + self.credentials.user_id +
+                   self.credentials.key)
+        signature = hmac.new(self.credentials.secret.encode('utf-8'),
+                             message.encode('utf-8'), hashlib.sha256)
+        return (_equal(form.get('key'), self.credentials.key) and
+                _equal(form.get('signature'),
+                       signature.hexdigest().upper()))
+
+    def rejected(self):
+        return 403, {'status': 'error', 'reason': 'Invalid signature',
+                     'code': 'API0005'}
+
+    def error(self, status, message):
+        return status, {'status': 'error', 'reason': message}
+
+    def pair_ticker(self, request, pair):
+        t = self.ticker(pair)
+        return {'high': str(t['high']), 'last': str(t['last']),
+                'timestamp': str(int(t['ts'])), 'bid': str(t['bid']),
+                'vwap': str(t['last']), 'volume': str(t['volume']),
+                'low': str(t['low']), 'ask': str(t['ask']),
+                'open': str(t['open'])}
+
+    def order_book(self, request, pair):
+        book = {side: [[str(p), str(s)] for p, s in levels]
+                for side, levels in self.book(pair).items()}
+        book['timestamp'] = str(int(time.time()))
+        return book
+
+    def transactions(self, request, pair):
+        return [{'date': str(int(t['ts'])), 'tid': t['id'],
+                 'price': str(t['price']), 'amount': str(t['size']),
+                 'type': '0' if t['side'] == 'buy' else '1'}
+                for t in self.trades(pair)]
+
+    def private(self, request, endpoint):
+        form = request.form
+        if endpoint.rstrip('/') == 'v2/balance':
+            return {'usd_balance': '10000.00', 'btc_balance': '5.00000000',
+                    'usd_available': '10000.00',
+                    'btc_available': '5.00000000'}
+        elif endpoint.startswith(('v2/buy/', 'v2/sell/')):
+            return {'id': str(self.order_id()),
+                    'datetime': iso(time.time()),
+                    'type': '0' if 'buy' in endpoint else '1',
+                    'price': form.get('price'), 'amount': form.get('amount')}
+        elif endpoint.rstrip('/') == 'cancel_order':
+            return {'id': form.get('id')}
+        return {}
+
+
+class PoloniexVenue(Venue):
+    name = 'Poloniex'
+    routes = ((('GET',), r'/public', 'public', False),
+              (('POST',), r'/tradingApi', 'trading_api', True))
+
+    def verify(self, request):
+        signature = hmac.new(self.credentials.secret.encode('utf-8'),
+                             request.body, hashlib.sha512)
+        return (_equal(request.headers.get('Key'), self.credentials.key) and
+                _equal(request.headers.get('Sign'), signature.hexdigest()))
+
+    def rejected(self):
+        return 403, {'error': 'Invalid API key/secret pair.'}
+
+    def _ticker(self, pair):
+        t = self.ticker(pair)
+        return {'last': str(t['last']), 'lowestAsk': str(t['ask']),
+                'highestBid': str(t['bid']), 'percentChange': '0.0',
+                'baseVolume': str(round(t['volume'] * t['last'], 8)),
+                'quoteVolume': str(t['volume']), 'isFrozen': '0',
+                'high24hr': str(t['high']), 'low24hr': str(t['low'])}
+
+    def public(self, request):
+        params = request.params
+        command = params['command']
+        if command == 'returnTicker':
+            return {pair: self._ticker(pair) for pair in self.all_pairs()}
+        pair = params['currencyPair']
+        if command == 'returnOrderBook':
+            depth = int(params.get('depth', 0)) or None
+            book = {side: [[str(p), s] for p, s in levels]
+                    for side, levels in self.book(pair, depth).items()}
+            book.update(isFrozen='0', seq=self.order_id())
+            return book
+        elif command == 'returnTradeHistory':
+            return [{'globalTradeID': t['id'], 'tradeID': t['id'],
+                     'date': iso(t['ts'])[:19].replace('T', ' '),
+                     'type': t['side'], 'rate': str(t['price']),
+                     'amount': str(t['size']),
+                     'total': str(round(t['price'] * t['size'], 8))}
+                    for t in self.trades(pair)]
+        raise KeyError(command)
+
+    def trading_api(self, request):
+        form = request.form
+        command = form.get('command')
+        if command in ('returnBalances', 'returnCompleteBalances'):
+            return {'BTC': '5.00000000', 'USDT': '10000.00000000'}
+        elif command in ('buy', 'sell'):
+            return {'orderNumber': str(self.order_id()),
+                    'resultingTrades': []}
+        elif command == 'cancelOrder':
+            return {'success': 1}
+        return {}
+
+
+class BittrexVenue(Venue):
+    name = 'Bittrex'
+    routes = ((('GET',), r'/v1\.1/public/(?P<method>\w+)', 'public', False),
+              (('GET',), r'/v1\.1/(?P<endpoint>(market|account)/\w+)',
+               'private', True))
+
+    def verify(self, request):
+        signature = hmac.new(self.credentials.secret.encode('utf-8'),
+                             request.url.encode('utf-8'), hashlib.sha512)
+        return (_equal(request.query.get('apikey'), self.credentials.key) and
+                _equal(request.headers.get('apisign'), signature.hexdigest()))
+
+    def rejected(self):
+        return 200, {'success': False, 'message': 'INVALID_SIGNATURE',
+                     'result': None}
+
+    def error(self, status, message):
+        return status, {'success': False, 'message': message, 'result': None}
+
+    def _summary(self, pair):
+        t = self.ticker(pair)
+        return {'MarketName': pair, 'High': t['high'], 'Low': t['low'],
+                'Volume': t['volume'], 'Last': t['last'],
+                'BaseVolume': round(t['volume'] * t['last'], 8),
+                'TimeStamp': iso(t['ts'])[:23], 'Bid': t['bid'],
+                'Ask': t['ask'], 'OpenBuyOrders': self.market.depth,
+                'OpenSellOrders': self.market.depth, 'PrevDay': t['open']}
+
+    def public(self, request, method):
+        params = request.params
+        if method == 'getmarketsummaries':
+            result = [self._summary(pair) for pair in self.all_pairs()]
+        elif method == 'getmarketsummary':
+            result = [self._summary(self.pair(params['market']))]
+        elif method == 'getorderbook':
+            book = self.book(params['market'])
+            result = {key: [{'Quantity': s, 'Rate': p}
+                            for p, s in book[side]]
+                      for key, side in (('buy', 'bids'), ('sell', 'asks'))}
+            side = params.get('type', 'both')
+            if side != 'both':
+                result = result[side]
+        elif method == 'getmarkethistory':
+            result = [{'Id': t['id'], 'TimeStamp': iso(t['ts'])[:23],
+                       'Quantity': t['size'], 'Price': t['price'],
+                       'Total': round(t['price'] * t['size'], 8),
+                       'FillType': 'FILL', 'OrderType': t['side'].upper()}
+                      for t in self.trades(params['market'])]
+        else:
+            raise KeyError(method)
+        return {'success': True, 'message': '', 'result': result}
+
+    def private(self, request, endpoint):
+        if endpoint == 'account/getbalances':
+            result = [{'Currency': c, 'Balance': b, 'Available': b,
+                       'Pending': 0.0} for c, b in (('BTC', 5.0),
+                                                    ('USDT', 10000.0))]
+        elif endpoint.startswith(('market/buy', 'market/sell')):
+            result = {'uuid': str(self.order_id())}
+        else:
+            result = None
+        return {'success': True, 'message': '', 'result': result}
+
+
+class HitBTCVenue(Venue):
+    name = 'HitBTC'
+    routes = ((('GET',), r'/1/public/api/(?P<pair>\w+)/orderbook',
+               'orderbook', False),
+              (('GET',), r'/1/public/api/(?P<pair>\w+)/ticker', 'pair_ticker',
+               False),
+              (('GET',), r'/1/public/api/(?P<pair>\w+)/trades',
+               'trade_history', False),
+              (('GET', 'POST'), r'/api/1/(?P<endpoint>[\w/]+)', 'private',
+               True))
+
+    def pair(self, pair):
+        return pair.upper()
+
+    def verify(self, request):
+        signature = hmac.new(self.credentials.secret.encode('utf-8'),
+                             request.relative.lstrip('/').encode('utf-8'),
+                             hashlib.sha512)
+        return (_equal(request.query.get('apikey'), self.credentials.key) and
+                _equal(request.headers.get('Api-signature'),
+                       signature.hexdigest()))
+
+    def error(self, status, message):
+        return status, {'error': {'code': status, 'message': message}}
+
+    def rejected(self):
+        return self.error(401, 'Authorisation failed')
+
+    def orderbook(self, request, pair):
+        return {side: [[str(p), str(s)] for p, s in levels]
+                for side, levels in self.book(pair).items()}
+
+    def pair_ticker(self, request, pair):
+        t = self.ticker(pair)
+        return {'ask': str(t['ask']), 'bid': str(t['bid']),
+                'last': str(t['last']), 'low': str(t['low']),
+                'high': str(t['high']), 'open': str(t['open']),
+                'volume': str(t['volume']),
+                'volume_quote': str(round(t['volume'] * t['last'], 8)),
+                'timestamp': int(t['ts'] * 1000)}
+
+    def trade_history(self, request, pair):
+        return {'trades': [[t['id'], str(t['price']), str(t['size']),
+                            int(t['ts'] * 1000)] for t in self.trades(pair)]}
+
+    def private(self, request, endpoint):
+        params = request.params
+        if endpoint == 'trading/balance':
+            return {'balance': [{'currency_code': c, 'cash': b,
+                                 'reserved': 0} for c, b in (('BTC', 5.0),
+                                                             ('USD', 10000.0))]}
+        elif endpoint == 'trading/new_order':
+            return {'ExecutionReport': {
+                'orderId': str(self.order_id()), 'orderStatus': 'new',
+                'clientOrderId': params.get('clientOrderId'),
+                'symbol': params.get('symbol'), 'side': params.get('side'),
+                'price': params.get('price'),
+                'quantity': params.get('quantity'),
+                'timestamp': int(time.time() * 1000)}}
+        return {}
+
+
+class OKCoinVenue(Venue):
+    name = 'OKCoin'
+    routes = ((('GET',), r'/v1/ticker\.do', 'pair_ticker', False),
+              (('GET',), r'/v1/depth\.do', 'depth', False),
+              (('GET',), r'/v1/trades\.do', 'trade_history', False),
+              (('POST',), r'/v1/(?P<endpoint>\w+)\.(do|info)', 'private',
+               True))
+
+    def pair(self, pair):
+        return pair
+
+    @staticmethod
+    def symbol(request):
+        # The interface passes the pair as 'pair'
+        params = request.params
+        return params.get('symbol') or params['pair']
+
+    def verify(self, request):
+        nonce = request.headers.get('ACCESS-NONCE', '')
+        signature = hmac.new(self.credentials.secret.encode('utf-8'),
+                             (nonce + request.url).encode('utf-8'),
+                             hashlib.sha256)
+        return (_equal(request.headers.get('ACCESS-KEY'),
+                       self.credentials.key) and
+                _equal(request.headers.get('ACCESS-SIGNATURE'),
+                       signature.hexdigest()))
+
+    def rejected(self):
+        return 200, {'result': False, 'error_code': 10007}
+
+    def error(self, status, message):
+        return status, {'result': False, 'error_code': 10000,
+                        'message': message}
+
+    def pair_ticker(self, request):
+        t = self.ticker(self.symbol(request))
+        return {'date': str(int(t['ts'])),
+                'ticker': {'buy': str(t['bid']), 'sell': str(t['ask']),
+                           'high': str(t['high']), 'low': str(t['low']),
+                           'last': str(t['last']),
+                           'vol': str(t['volume'])}}
+
+    def depth(self, request):
+        book = self.book(self.symbol(request),
+                         int(request.params.get('size', 200)))
+        # OKCoin lists asks from the highest price down
+        return {'asks': [[p, s] for p, s in reversed(book['asks'])],
+                'bids': [[p, s] for p, s in book['bids']]}
+
+    def trade_history(self, request):
+        return [{'date': int(t['ts']), 'date_ms': int(t['ts'] * 1000),
+                 'price': t['price'], 'amount': t['size'], 'tid': t['id'],
+                 'type': t['side']}
+                for t in self.trades(self.symbol(request))]
+
+    def private(self, request, endpoint):
+        if endpoint == 'userinfo':
+            return {'result': True, 'info': {'funds': {
+                'free': {'btc': '5.0', 'usd': '10000.0'},
+                'freezed': {'btc': '0', 'usd': '0'}}}}
+        elif endpoint in ('trade', 'cancel_order'):
+            return {'result': True, 'order_id': self.order_id()}
+        return {'result': True}
+
+
+
+class BterVenue(Venue):
+    """
+    Bter's API v1. Private endpoints verify the exchange's scheme - the key
+    as Key header, and the hmac of the form body as Sign header.
+    """
+    name = 'Bter'
+    routes = ((('GET',), r'/1/ticker/(?P<pair>\w+)', 'pair_ticker', False),
+              (('GET',), r'/1/tickers', 'all_tickers', False),
+              (('GET',), r'/1/depth/(?P<pair>\w+)', 'depth', False),
+              (('GET',), r'/1/trade/(?P<pair>\w+)', 'trade_history', False),
+              (('POST',), r'/1/private/(?P<method>\w+)', 'private', True))
+
+    def pair(self, pair):
+        return '%s_%s' % tuple(p.lower() for p in split_pair(pair))
+
+    def verify(self, request):
+        signature = hmac.new(self.credentials.secret.encode('utf-8'),
+                             request.body, hashlib.sha512)
+        return (_equal(request.headers.get('Key'), self.credentials.key) and
+                _equal(request.headers.get('Sign'), signature.hexdigest()))
+
+    def error(self, status, message):
+        return status, {'result': 'false', 'message': message}
+
+    def _ticker(self, pair):
+        t = self.ticker(pair)
+        base, quote = pair.split('_')
+        return {'result': 'true', 'last': t['last'], 'high': t['high'],
+                'low': t['low'], 'avg': t['last'], 'sell': t['ask'],
+                'buy': t['bid'], 'vol_' + base: t['volume'],
+                'vol_' + quote: round(t['volume'] * t['last'], 8)}
+
+    def pair_ticker(self, request, pair):
+        return self._ticker(self.pair(pair))
+
+    def all_tickers(self, request):
+        return {pair: self._ticker(pair) for pair in self.all_pairs()}
+
+    def depth(self, request, pair):
+        book = self.book(pair)
+        # Bter lists asks from the highest price down
+        return {'result': 'true',
+                'asks': [[p, s] for p, s in reversed(book['asks'])],
+                'bids': [[p, s] for p, s in book['bids']]}
+
+    def trade_history(self, request, pair):
+        return {'result': 'true', 'elapsed': '0ms', 'data': [
+            {'date': str(int(t['ts'])), 'price': t['price'],
+             'amount': t['size'], 'tid': str(t['id']), 'type': t['side']}
+            for t in self.trades(pair)]}
+
+    def private(self, request, method):
+        if method == 'getfunds':
+            return {'result': 'true', 'available_funds': {
+                'BTC': '5.0', 'USD': '10000.0'}, 'locked_funds': {}}
+        elif method == 'placeorder':
+            return {'result': 'true', 'order_id': self.order_id(),
+                    'msg': 'Success'}
+        return {'result': 'true', 'msg': 'Success'}
+
+
+class CCEXVenue(BittrexVenue):
+    """
+    C-Cex's api_pub.html and api.html endpoints, selected by the 'a' query
+    parameter; their payloads are shaped as Bittrex's.
+    """
+    name = 'CCEX'
+    routes = ((('GET',), r'/api_pub\.html', 'public', False),
+              (('GET', 'POST'), r'/api\.html', 'private', True))
+
+    def pair(self, pair):
+        return '%s-%s' % tuple(p.lower() for p in split_pair(pair))
+
+    def public(self, request, method=None):
+        action = request.query['a']
+        if action.endswith('.json'):
+            # The interface requests tickers here, rather than at /<pair>.json
+            t = self.ticker(action[:-len('.json')])
+            return {'ticker': {'high': t['high'], 'low': t['low'],
+                               'avg': t['last'], 'lastbuy': t['bid'],
+                               'lastsell': t['ask'], 'buy': t['bid'],
+                               'sell': t['ask'], 'lastprice': t['last'],
+                               'updated': int(t['ts'])}}
+        elif action == 'getmarkets':
+            return {'success': True, 'message': '', 'result': [
+                {'MarketName': pair, 'IsActive': True}
+                for pair in self.all_pairs()]}
+        return super(CCEXVenue, self).public(request, action)
+
+    def private(self, request, endpoint=None):
+        action = request.query['a']
+        if action == 'getbalance':
+            result = [{'Currency': c, 'Balance': b, 'Available': b,
+                       'Pending': 0.0} for c, b in (('BTC', 5.0),
+                                                    ('USD', 10000.0))]
+        elif action in ('buylimit', 'selllimit'):
+            result = {'uuid': str(self.order_id())}
+        else:
+            result = None
+        return {'success': True, 'message': '', 'result': result}
+
+
+class CoincheckVenue(Venue):
+    """
+    Coincheck's API. The signature is the hmac of nonce, path and json
+    encoded parameters, as computed by the client.
+    """
+    name = 'Coincheck'
+    routes = ((('GET',), r'/api/ticker', 'pair_ticker', False),
+              (('GET',), r'/api/order_books', 'order_books', False),
+              (('GET',), r'/api/trades', 'trade_history', False),
+              (('GET', 'POST', 'DELETE'), r'/api/(?P<endpoint>[\w/]+)',
+               'private', True))
+
+    def pair(self, pair):
+        return '%s_%s' % tuple(p.lower() for p in split_pair(pair))
+
+    def verify(self, request):
+        nonce = request.headers.get('ACCESS-NONCE', '')
+        message = (nonce + request.path +
+                   (request.body.decode('utf-8') or json.dumps({})))
+        signature = hmac.new(self.credentials.secret.encode('utf-8'),
+                             message.encode('utf-8'), hashlib.sha256)
+        return (_equal(request.headers.get('ACCESS-KEY'),
+                       self.credentials.key) and
+                _equal(request.headers.get('ACCESS-SIGNATURE'),
+                       signature.hexdigest()))
+
+    def error(self, status, message):
+        return status, {'success': False, 'error': message}
+
+    def pair_ticker(self, request):
+        t = self.ticker(request.params.get('pair', 'btc_jpy'))
+        return {'last': t['last'], 'bid': t['bid'], 'ask': t['ask'],
+                'high': t['high'], 'low': t['low'], 'volume': str(t['volume']),
+                'timestamp': int(t['ts'])}
+
+    def order_books(self, request):
+        book = self.book(request.params.get('pair', 'btc_jpy'))
+        return {side: [[str(p), str(s)] for p, s in levels]
+                for side, levels in book.items()}
+
+    def trade_history(self, request):
+        pair = request.params['pair']
+        return {'success': True, 'pagination': {'limit': 10, 'order': 'desc',
+                                                'starting_after': None,
+                                                'ending_before': None},
+                'data': [{'id': t['id'], 'amount': str(t['size']),
+                          'rate': t['price'], 'pair': pair,
+                          'order_type': t['side'],
+                          'created_at': iso(t['ts'])[:19] + '.000Z'}
+                         for t in self.trades(pair)]}
+
+    def private(self, request, endpoint):
+        if endpoint == 'accounts/balance':
+            return {'success': True, 'jpy': '1000000.0', 'btc': '5.0',
+                    'jpy_reserved': '0.0', 'btc_reserved': '0.0'}
+        elif endpoint in ('orders', 'exchange/orders'):
+            params = request.params
+            return {'success': True, 'id': self.order_id(),
+                    'rate': params.get('rate'),
+                    'amount': params.get('amount'),
+                    'order_type': params.get('order_type'),
+                    'pair': params.get('pair'),
+                    'created_at': iso(time.time())}
+        elif endpoint.startswith('exchange/orders/'):
+            return {'success': True, 'id': int(endpoint.split('/')[-1])}
+        return {'success': True}
+
+
+class CryptopiaVenue(Venue):
+    """
+    Cryptopia's API, authenticated by 'amx' Authorization headers.
+    """
+    name = 'Cryptopia'
+    routes = ((('GET',), r'/GetMarket/(?P<pair>\w+)(/\d+)?', 'get_market',
+               False),
+              (('GET',), r'/GetMarketOrders/(?P<pair>\w+)(/\d+)?',
+               'get_market_orders', False),
+              (('GET',), r'/GetMarketHistory/(?P<pair>\w+)(/\d+)?',
+               'get_market_history', False),
+              (('GET',), r'/GetMarkets(/(?P<base>\w+))?(/\d+)?',
+               'get_markets', False),
+              (('GET',), r'/GetTradePairs', 'get_trade_pairs', False),
+              (('POST',), r'/(?P<method>\w+)', 'private', True))
+
+    def pair(self, pair):
+        return '%s_%s' % split_pair(pair)
+
+    def verify(self, request):
+        try:
+            scheme, credentials = request.headers['Authorization'].split(' ')
+            key, signature, nonce = credentials.split(':')
+        except (KeyError, ValueError):
+            return False
+        content = base64.b64encode(hashlib.md5(request.body).digest())
+        message = (key + request.method +
+                   quote_plus(request.url).lower() + nonce +
+                   content.decode('utf-8'))
+        expected = hmac.new(base64.b64decode(self.credentials.secret),
+                            message.encode('utf-8'), hashlib.sha256)
+        return (scheme == 'amx' and _equal(key, self.credentials.key) and
+                _equal(signature, base64.b64encode(expected.digest())))
+
+    def rejected(self):
+        return 200, {'Success': False, 'Error': 'Signature does not match '
+                                                'request parameters.'}
+
+    def error(self, status, message):
+        return status, {'Success': False, 'Message': message, 'Data': None}
+
+    def _market(self, pair):
+        t = self.ticker(pair)
+        return {'TradePairId': self.all_pairs().index(pair) + 1,
+                'Label': pair.replace('_', '/'), 'AskPrice': t['ask'],
+                'BidPrice': t['bid'], 'Low': t['low'], 'High': t['high'],
+                'Volume': t['volume'], 'LastPrice': t['last'],
+                'BuyVolume': t['bid_size'], 'SellVolume': t['ask_size'],
+                'Change': 0.0, 'Open': t['open'],
+                'BaseVolume': round(t['volume'] * t['last'], 8)}
+
+    @staticmethod
+    def _result(data):
+        return {'Success': True, 'Message': None, 'Data': data}
+
+    def get_market(self, request, pair):
+        return self._result(self._market(self.pair(pair)))
+
+    def get_market_orders(self, request, pair):
+        pair = self.pair(pair)
+        book = self.book(pair)
+        return self._result({
+            key: [{'TradePairId': self.all_pairs().index(pair) + 1,
+                   'Label': pair.replace('_', '/'), 'Price': p, 'Volume': s,
+                   'Total': round(p * s, 8)} for p, s in book[side]]
+            for key, side in (('Buy', 'bids'), ('Sell', 'asks'))})
+
+    def get_market_history(self, request, pair):
+        pair = self.pair(pair)
+        return self._result([
+            {'TradePairId': self.all_pairs().index(pair) + 1,
+             'Label': pair.replace('_', '/'),
+             'Type': t['side'].capitalize(), 'Price': t['price'],
+             'Amount': t['size'], 'Total': round(t['price'] * t['size'], 8),
+             'Timestamp': int(t['ts'])} for t in self.trades(pair)])
+
+    def get_markets(self, request, base=None):
+        return self._result([self._market(pair) for pair in self.all_pairs()
+                             if base is None or pair.endswith('_' + base)])
+
+    def get_trade_pairs(self, request):
+        return self._result([
+            {'Id': i, 'Label': pair.replace('_', '/'),
+             'Currency': pair.split('_')[0], 'Symbol': pair.split('_')[0],
+             'BaseCurrency': pair.split('_')[1],
+             'BaseSymbol': pair.split('_')[1], 'Status': 'OK',
+             'TradeFee': 0.2, 'MinimumTrade': 0.00000001}
+            for i, pair in enumerate(self.all_pairs(), 1)])
+
+    def private(self, request, method):
+        if method == 'GetBalance':
+            return self._result([
+                {'CurrencyId': i, 'Symbol': c, 'Total': b, 'Available': b,
+                 'Unconfirmed': 0.0, 'HeldForTrades': 0.0,
+                 'PendingWithdraw': 0.0, 'Status': 'OK'}
+                for i, (c, b) in enumerate((('BTC', 5.0), ('USDT', 10000.0)),
+                                           1)])
+        elif method == 'SubmitTrade':
+            return self._result({'OrderId': self.order_id(),
+                                 'FilledOrders': []})
+        elif method == 'CancelTrade':
+            params = json.loads(request.body or b'{}')
+            return self._result([params.get('OrderId')])
+        return self._result(None)
+
+
+class QuadrigaCXVenue(Venue):
+    """
+    QuadrigaCX's API v2. Private endpoints verify the exchange's scheme -
+    key, nonce and the hmac of nonce, client id and key, posted as json.
+    """
+    name = 'QuadrigaCX'
+    routes = ((('GET',), r'/v2/ticker', 'book_ticker', False),
+              (('GET',), r'/v2/order_book', 'order_book', False),
+              (('GET',), r'/v2/transactions', 'transactions', False),
+              (('POST',), r'/v2/(?P<method>\w+)', 'private', True))
+
+    def pair(self, pair):
+        return '%s_%s' % tuple(p.lower() for p in split_pair(pair))
+
+    def verify(self, request):
+        try:
+            payload = json.loads(request.body)
+        except ValueError:
+            return False
+        message = (str(payload.get('nonce', '')) + self.credentials.user_id +
+                   self.credentials.key)
+        signature = hmac.new(self.credentials.secret.encode('utf-8'),
+                             message.encode('utf-8'), hashlib.sha256)
+        return (_equal(payload.get('key'), self.credentials.key) and
+                _equal(payload.get('signature'), signature.hexdigest()))
+
+    def error(self, status, message):
+        return status, {'error': {'code': 101, 'message': message}}
+
+    def book_ticker(self, request):
+        t = self.ticker(request.params.get('book', 'btc_cad'))
+        return {'high': str(t['high']), 'last': str(t['last']),
+                'timestamp': str(int(t['ts'])), 'volume': str(t['volume']),
+                'vwap': str(t['last']), 'low': str(t['low']),
+                'ask': str(t['ask']), 'bid': str(t['bid'])}
+
+    def order_book(self, request):
+        book = {side: [[str(p), str(s)] for p, s in levels] for side, levels
+                in self.book(request.params.get('book', 'btc_cad')).items()}
+        book['timestamp'] = str(int(time.time()))
+        return book
+
+    def transactions(self, request):
+        return [{'date': str(int(t['ts'])), 'tid': t['id'],
+                 'price': str(t['price']), 'amount': str(t['size']),
+                 'side': t['side']}
+                for t in self.trades(request.params.get('book', 'btc_cad'))]
+
+    def private(self, request, method):
+        params = json.loads(request.body)
+        if method == 'balance':
+            return {'btc_balance': '5.0', 'cad_balance': '10000.0',
+                    'btc_available': '5.0', 'cad_available': '10000.0',
+                    'fee': '0.5'}
+        elif method in ('buy', 'sell'):
+            return {'id': str(self.order_id()), 'datetime': iso(time.time()),
+                    'type': 0 if method == 'buy' else 1,
+                    'price': params.get('price'),
+                    'amount': params.get('amount'),
+                    'book': params.get('book', 'btc_cad'), 'status': 0}
+        elif method == 'cancel_order':
+            return 'true'
+        return {}
+
+
+class QuoineVenue(Venue):
+    """
+    Quoine's API, authenticated by HS256 json web tokens in X-Quoine-Auth,
+    whose path claim must be the requested path. Products are numbered in
+    the order of the market's pairs.
+    """
+    name = 'Quoine'
+    routes = ((('GET',), r'/products', 'products', False),
+              (('GET',), r'/products/(?P<product_id>\d+)', 'product', False),
+              (('GET',), r'/products/(?P<product_id>\d+)/price_levels',
+               'price_levels', False),
+              (('GET',), r'/executions', 'executions', False),
+              (('GET',), r'/accounts/balance', 'balance', True),
+              (('POST',), r'/orders', 'new_order', True),
+              (('GET', 'PUT'), r'/orders/(?P<order_id>\d+)(/cancel)?',
+               'order', True))
+
+    def pair(self, pair):
+        return normalize_pair(pair)
+
+    @staticmethod
+    def _b64decode(data):
+        return base64.urlsafe_b64decode(data + '=' * (-len(data) % 4))
+
+    def verify(self, request):
+        try:
+            header, payload, signature = (
+                request.headers['X-Quoine-Auth'].split('.'))
+            claims = json.loads(self._b64decode(payload))
+        except (KeyError, ValueError):
+            return False
+        expected = hmac.new(self.credentials.secret.encode('utf-8'),
+                            (header + '.' + payload).encode('utf-8'),
+                            hashlib.sha256).digest()
+        return (_equal(self._b64decode(signature), expected) and
+                _equal(claims.get('token_id'), self.credentials.key) and
+                claims.get('path') == request.relative)
+
+    def rejected(self):
+        return 401, {'message': 'Unauthorized'}
+
+    def error(self, status, message):
+        return status, {'message': message}
+
+    def _product(self, i, pair):
+        t = self.ticker(pair)
+        base, quote = split_pair(pair)
+        return {'id': str(i), 'product_type': 'CurrencyPair',
+                'code': 'CASH', 'currency_pair_code': pair,
+                'base_currency': base, 'quoted_currency': quote,
+                'currency': quote, 'market_ask': t['ask'],
+                'market_bid': t['bid'], 'high_market_ask': t['high'],
+                'low_market_bid': t['low'], 'last_traded_price': str(t['last']),
+                'volume_24h': str(t['volume'])}
+
+    def _pair(self, product_id):
+        return self.all_pairs()[int(product_id) - 1]
+
+    def products(self, request):
+        return [self._product(i, pair)
+                for i, pair in enumerate(self.all_pairs(), 1)]
+
+    def product(self, request, product_id):
+        return self._product(int(product_id), self._pair(product_id))
+
+    def price_levels(self, request, product_id):
+        book = self.book(self._pair(product_id))
+        return {key: [[str(p), str(s)] for p, s in book[side]]
+                for key, side in (('buy_price_levels', 'bids'),
+                                  ('sell_price_levels', 'asks'))}
+
+    def executions(self, request):
+        trades = self.trades(request.params['currency_pair_code'])
+        return {'models': [{'id': t['id'], 'quantity': str(t['size']),
+                            'price': str(t['price']), 'taker_side': t['side'],
+                            'created_at': int(t['ts'])} for t in trades],
+                'current_page': 1, 'total_pages': 1}
+
+    def balance(self, request):
+        return [{'currency': c, 'balance': b} for c, b in (('BTC', '5.0'),
+                                                          ('USD', '10000.0'))]
+
+    def new_order(self, request):
+        order = json.loads(request.body or b'{}').get('order', {})
+        return dict(order, id=self.order_id(), status='live',
+                    created_at=int(time.time()))
+
+    def order(self, request, order_id):
+        return {'id': int(order_id), 'status': (
+            'cancelled' if request.method == 'PUT' else 'live')}
+
+
+class RockTradingVenue(Venue):
+    """
+    The Rock Trading's API v1; the signature is the hmac of nonce and url.
+    """
+    name = 'RockTradingLtd'
+    routes = ((('GET',), r'/v1/funds/(?P<pair>\w+)/ticker', 'fund_ticker',
+               False),
+              (('GET',), r'/v1/tickers', 'tickers', False),
+              (('GET',), r'/v1/funds/(?P<pair>\w+)/orderbook', 'orderbook',
+               False),
+              (('GET',), r'/v1/funds/(?P<pair>\w+)/trades', 'fund_trades',
+               False),
+              (('GET', 'POST', 'DELETE'), r'/v1/(?P<endpoint>[\w/]+)',
+               'private', True))
+
+    def pair(self, pair):
+        return normalize_pair(pair)
+
+    def verify(self, request):
+        nonce = request.headers.get('X-TRT-Nonce', '')
+        signature = hmac.new(self.credentials.secret.encode('utf-8'),
+                             (nonce + request.url).encode('utf-8'),
+                             hashlib.sha384)
+        return (_equal(request.headers.get('X-TRT-APIKEY'),
+                       self.credentials.key) and
+                _equal(request.headers.get('X-TRT-SIGNATURE'),
+                       signature.hexdigest()))
+
+    def error(self, status, message):
+        return status, {'errors': [{'message': message}]}
+
+    def _ticker(self, pair):
+        t = self.ticker(pair)
+        return {'fund_id': pair, 'date': iso(t['ts']), 'bid': t['bid'],
+                'ask': t['ask'], 'last': t['last'], 'open': t['open'],
+                'close': t['last'], 'low': t['low'], 'high': t['high'],
+                'volume': round(t['volume'] * t['last'], 8),
+                'volume_traded': t['volume']}
+
+    def fund_ticker(self, request, pair):
+        return self._ticker(self.pair(pair))
+
+    def tickers(self, request):
+        return {'tickers': [self._ticker(pair) for pair in self.all_pairs()]}
+
+    def orderbook(self, request, pair):
+        book = self.book(pair)
+        result = {side: [{'price': p, 'amount': s, 'depth': s}
+                         for p, s in levels] for side, levels in book.items()}
+        result.update(fund_id=self.pair(pair), date=iso(time.time()))
+        return result
+
+    def fund_trades(self, request, pair):
+        return {'trades': [{'id': t['id'], 'fund_id': self.pair(pair),
+                            'amount': t['size'], 'price': t['price'],
+                            'side': t['side'], 'dark': False,
+                            'date': iso(t['ts'])} for t in self.trades(pair)],
+                'meta': {'current': {'page': 1}}}
+
+    def private(self, request, endpoint):
+        if endpoint == 'balances':
+            return {'balances': [{'currency': c, 'balance': b,
+                                  'trading_balance': b}
+                                 for c, b in (('BTC', 5.0), ('EUR', 10000.0))]}
+        parts = endpoint.split('/')
+        if parts[0] == 'funds' and parts[2:3] == ['orders']:
+            order_id = parts[3] if len(parts) > 3 else self.order_id()
+            return {'id': int(order_id), 'fund_id': parts[1],
+                    'status': ('deleted' if request.method == 'DELETE'
+                               else 'active'), 'date': iso(time.time())}
+        return {}
+
+
+class VaultoroVenue(Venue):
+    """
+    Vaultoro's API, trading gold (GLD) against bitcoin only. The signature
+    is the hmac of the requested url.
+    """
+    name = 'Vaultoro'
+    pair_name = 'GLDBTC'
+    routes = ((('GET',), r'/markets', 'markets', False),
+              (('GET',), r'/orderbook', 'orderbook', False),
+              (('GET',), r'/latesttrades', 'latest_trades', False),
+              (('GET', 'POST'), r'/1/(?P<endpoint>[\w/]+)', 'private', True))
+
+    def verify(self, request):
+        signature = hmac.new(self.credentials.secret.encode('utf-8'),
+                             request.url.encode('utf-8'), hashlib.sha256)
+        return _equal(request.headers.get('X-Signature'),
+                      signature.hexdigest())
+
+    def error(self, status, message):
+        return status, {'status': 'error', 'message': message}
+
+    def markets(self, request):
+        t = self.ticker(self.pair_name)
+        return {'status': 'success', 'data': {
+            'MarketCurrency': 'GLD', 'BaseCurrency': 'BTC',
+            'MarketCurrencyLong': 'Gold', 'BaseCurrencyLong': 'Bitcoin',
+            'MarketName': 'BTC-GLD', 'IsActive': 'true',
+            'MinTrade': '0.0002', 'MinUnitQty': '0.001',
+            'LastPrice': str(t['last']), '24hLow': str(t['low']),
+            '24hHigh': str(t['high']), '24hVolume': str(t['volume'])}}
+
+    def orderbook(self, request):
+        book = self.book(self.pair_name)
+        return {'status': 'success', 'data': [
+            {key: [{'Gold_Price': p, 'Gold_Amount': s} for p, s in book[side]]}
+            for key, side in (('b', 'bids'), ('s', 'asks'))]}
+
+    def latest_trades(self, request):
+        count = int(request.params.get('count', 10))
+        return [{'Time': iso(t['ts']), 'Gold_Price': t['price'],
+                 'Gold_Volume': t['size'],
+                 'Type': 'buy' if t['side'] == 'buy' else 'sell'}
+                for t in self.trades(self.pair_name, n=min(count, 100))]
+
+    def private(self, request, endpoint):
+        if endpoint == 'balance':
+            return {'status': 'success', 'data': [
+                {'currency_code': c, 'cash': b, 'reserved': 0}
+                for c, b in (('BTC', 5.0), ('GLD', 100.0))]}
+        elif endpoint.startswith(('buy/', 'sell/')):
+            return {'status': 'success', 'data': {
+                'Order_ID': str(self.order_id()),
+                'type': endpoint.split('/')[0]}}
+        return {'status': 'success', 'data': []}
+
+
+class YunbiVenue(Venue):
+    """
+    Yunbi's API v2. Private endpoints verify the exchange's scheme -
+    access_key, tonce and the hmac of method, path and sorted query as
+    signature query parameters.
+    """
+    name = 'Yunbi'
+    routes = ((('GET',), r'/v2/tickers(/(?P<pair>\w+))?\.json', 'tickers',
+               False),
+              (('GET',), r'/v2/order_book\.json', 'order_book', False),
+              (('GET',), r'/v2/trades\.json', 'trade_history', False),
+              (('GET',), r'/v2/markets\.json', 'markets', False),
+              (('GET', 'POST'), r'/v2/(?P<endpoint>[\w/]+)\.json', 'private',
+               True))
+
+    def pair(self, pair):
+        return ''.join(split_pair(pair)).lower()
+
+    def verify(self, request):
+        params = request.params
+        signature = params.pop('signature', '')
+        message = '%s|%s|%s' % (request.method,
+                                request.raw_path.partition('?')[0][
+                                    len('/yunbi'):].replace('/v2/',
+                                                            '/api/v2/', 1),
+                                urlencode(sorted(params.items())))
+        expected = hmac.new(self.credentials.secret.encode('utf-8'),
+                            message.encode('utf-8'), hashlib.sha256)
+        return (_equal(params.get('access_key'), self.credentials.key) and
+                _equal(signature, expected.hexdigest()))
+
+    def rejected(self):
+        return 401, {'error': {'code': 2005,
+                               'message': 'Signature is incorrect.'}}
+
+    def error(self, status, message):
+        return status, {'error': {'code': 2002, 'message': message}}
+
+    def _ticker(self, pair):
+        t = self.ticker(pair)
+        return {'at': int(t['ts']), 'ticker': {
+            'buy': str(t['bid']), 'sell': str(t['ask']), 'low': str(t['low']),
+            'high': str(t['high']), 'last': str(t['last']),
+            'vol': str(t['volume'])}}
+
+    def tickers(self, request, pair=None):
+        if pair:
+            return self._ticker(pair)
+        return {pair: self._ticker(pair) for pair in self.all_pairs()}
+
+    def _orders(self, pair, side, levels):
+        return [{'id': self.order_id(), 'side': side, 'ord_type': 'limit',
+                 'price': str(p), 'avg_price': '0.0', 'state': 'wait',
+                 'market': pair, 'volume': str(s),
+                 'remaining_volume': str(s), 'executed_volume': '0.0',
+                 'trades_count': 0} for p, s in levels]
+
+    def order_book(self, request):
+        pair = request.params['market']
+        book = self.book(pair)
+        return {'asks': self._orders(pair, 'sell', book['asks']),
+                'bids': self._orders(pair, 'buy', book['bids'])}
+
+    def trade_history(self, request):
+        pair = request.params['market']
+        return [{'id': t['id'], 'price': str(t['price']),
+                 'volume': str(t['size']),
+                 'funds': str(round(t['price'] * t['size'], 8)),
+                 'market': pair, 'created_at': iso(t['ts'])[:19] + 'Z',
+                 'side': 'bid' if t['side'] == 'buy' else 'ask'}
+                for t in self.trades(pair)]
+
+    def markets(self, request):
+        return [{'id': pair, 'name': '%s/%s' % split_pair(pair)}
+                for pair in self.all_pairs()]
+
+    def private(self, request, endpoint):
+        params = request.params
+        if endpoint == 'members/me':
+            return {'sn': self.credentials.user_id, 'activated': True,
+                    'accounts': [{'currency': c, 'balance': b, 'locked': '0.0'}
+                                 for c, b in (('btc', '5.0'),
+                                              ('cny', '100000.0'))]}
+        elif endpoint == 'orders':
+            return self._orders(params.get('market'), params.get('side'),
+                                [(params.get('price'),
+                                  params.get('volume'))])[0]
+        elif endpoint == 'order/delete':
+            return {'id': int(params.get('id', 0)), 'state': 'cancel'}
+        return {}
+
+# Interface name: Venue class; venues are served at /<name in lower case>
+VENUES = {cls.name: cls for cls in (
+    KrakenVenue, BitfinexVenue, GeminiVenue, GDAXVenue, BitstampVenue,
+    PoloniexVenue, BittrexVenue, HitBTCVenue, OKCoinVenue, ItBitVenue,
+    BterVenue,
+    CCEXVenue, CoincheckVenue, CryptopiaVenue, QuadrigaCXVenue, QuoineVenue,
+    RockTradingVenue, VaultoroVenue, YunbiVenue)}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately; without TCP_NODELAY, each
+    # response of a kept-alive connection waits for a delayed ACK
+    disable_nagle_algorithm = True
+
+    def _handle(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        status, payload, headers = self.server.simulator.handle(
+            self.command, self.path, self.headers, body)
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        log.debug("%s - %s", self.address_string(), format % args)
+
+
+class RESTSimulator:
+    """
+    Threaded HTTP server simulating the REST APIs of all venues in VENUES.
+    """
+    def __init__(self, host='127.0.0.1', port=0, credentials=None,
+                 market=None, latency=0):
+        """
+        :param host: str, address to bind to
+        :param port: int, 0 picks a free port
+        :param credentials: Credentials, accepted by private endpoints;
+                            defaults to DEFAULT_CREDENTIALS
+        :param market: bitex.simulator.market.Market, shared with other
+                       simulators to serve the same books
+        :param latency: seconds each response is delayed by
+        """
+        self.host = host
+        self.port = port
+        self.credentials = credentials or DEFAULT_CREDENTIALS
+        self.market = market or Market()
+        self.latency = latency
+        self.venues = {name.lower(): cls(self.market, self.credentials)
+                       for name, cls in VENUES.items()}
+        self.requests = Counter()  # venue name: number of requests served
+        self._failures = []
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        self._server = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._server.daemon_threads = True
+        self._server.simulator = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        daemon=True, name='REST Simulator')
+        self._thread.start()
+        log.info("REST simulator listening on %s:%s", self.host, self.port)
+
+    def stop(self):
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = self._thread = None
+
+    def url(self, venue):
+        """
+        Returns the url to pass to a venue's client, i.e.
+        Kraken(url=sim.url('Kraken')).
+        :param venue: str, a key of VENUES
+        :return: str
+        """
+        url = 'http://%s:%s/%s' % (self.host, self.port, venue.lower())
+        # HitBTC's client appends paths without leading slash
+        return url + '/' if venue.lower() == 'hitbtc' else url
+
+    def fail_next(self, status=503, count=1, headers=None):
+        """
+        Answers the next count requests, to any venue, with an error.
+        :param status: int, http status code
+        :param headers: dict, i.e. {'Retry-After': '1'}
+        """
+        with self._lock:
+            self._failures.extend([(status, headers or {})] * count)
+
+    def handle(self, method, raw_path, headers, body):
+        """
+        :return: tuple of status code, json payload and dict of headers
+        """
+        if self.latency:
+            time.sleep(self.latency)
+        prefix, _, rest = raw_path.lstrip('/').partition('/')
+        venue = self.venues.get(prefix.lower())
+        with self._lock:
+            failure = self._failures.pop(0) if self._failures else None
+            if venue is not None:
+                self.requests[venue.name] += 1
+        if failure is not None:
+            return failure[0], {'error': 'Simulated failure'}, failure[1]
+        if venue is None:
+            return 404, {'error': 'Unknown venue %r' % prefix}, {}
+        path, _, query = rest.partition('?')
+        request = Request(method, '/' + re.sub('/+', '/', path).strip('/'),
+                          dict(parse_qsl(query)), body, headers,
+                          'http://%s%s' % (headers.get('Host'), raw_path),
+                          raw_path, raw_path[len(prefix) + 1:])
+        status, payload = venue.dispatch(request)
+        return status, payload, {}
@@ -0,0 +1,256 @@
+"""
+Minimal RFC 6455 websocket server, enough to serve the simulated feeds to
+the websocket-client based WSS clients: text frames, fragmented messages,
+ping / pong and the closing handshake. Extensions and subprotocols are not
+supported.
+"""
+# Import Built-Ins
+import logging
+import base64
+import hashlib
+import socket
+import socketserver
+import struct
+import threading
+
+# Import Third-Party
+
+# Import Homebrew
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+OP_CONTINUATION, OP_TEXT, OP_BINARY = 0x0, 0x1, 0x2
+OP_CLOSE, OP_PING, OP_PONG = 0x8, 0x9, 0xA
+
+
+def accept_key(key):
+    """
+    :param key: str, the client's Sec-WebSocket-Key header
+    :return: str, the Sec-WebSocket-Accept header
+    """
+    digest = hashlib.sha1((key + GUID).encode('ascii')).digest()
+    return base64.b64encode(digest).decode('ascii')
+
+
+def encode_frame(payload, opcode=OP_TEXT):
+    """
+    Encodes an unmasked, final server frame.
+    :param payload: str or bytes
+    :return: bytes
+    """
+    if isinstance(payload, str):
+        payload = payload.encode('utf-8')
+    n = len(payload)
+    if n < 126:
+        header = struct.pack('!BB', 0x80 | opcode, n)
+    elif n < 65536:
+        header = struct.pack('!BBH', 0x80 | opcode, 126, n)
+    else:
+        header = struct.pack('!BBQ', 0x80 | opcode, 127, n)
+    return header + payload
+
+
+def _unmask(payload, mask):
+    # XOR whole words at once, rather than byte by byte
+    n = len(payload)
+    key = int.from_bytes((mask * (n // 4 + 1))[:n], 'big')
+    return (int.from_bytes(payload, 'big') ^ key).to_bytes(n, 'big')
+
+
+class ConnectionClosed(Exception):
+    pass
+
+
+class WebsocketConnection:
+    """
+    Server side of an established websocket connection. send() is thread
+    safe, so messages may be sent while another thread waits in recv().
+    """
+    def __init__(self, sock, path, headers):
+        """
+        :param sock: socket.socket, after the opening handshake
+        :param path: str, the requested path, i.e. '/bitfinex'
+        :param headers: dict of lower case header name: value
+        """
+        self.sock = sock
+        self.path = path
+        self.headers = headers
+        self.closed = False
+        self._send_lock = threading.Lock()
+        self._reader = sock.makefile('rb')
+
+    def _send_frame(self, payload, opcode):
+        frame = encode_frame(payload, opcode)
+        with self._send_lock:
+            if self.closed:
+                raise ConnectionClosed()
+            try:
+                self.sock.sendall(frame)
+            except OSError:
+                self.closed = True
+                raise ConnectionClosed()
+
+    def send(self, message):
+        """
+        :param message: str, sent as a text frame
+        """
+        self._send_frame(message, OP_TEXT)
+
+    def send_many(self, messages):
+        """
+        Sends several text frames with a single system call.
+        :param messages: iterable of str
+        """
+        data = b''.join(encode_frame(m) for m in messages)
+        with self._send_lock:
+            if self.closed:
+                raise ConnectionClosed()
+            try:
+                self.sock.sendall(data)
+            except OSError:
+                self.closed = True
+                raise ConnectionClosed()
+
+    def _read(self, n):
+        data = self._reader.read(n)
+        if len(data) < n:
+            raise ConnectionClosed()
+        return data
+
+    def _read_frame(self):
+        first, second = self._read(2)
+        fin, opcode = first & 0x80, first & 0x0F
+        n = second & 0x7F
+        if n == 126:
+            n = struct.unpack('!H', self._read(2))[0]
+        elif n == 127:
+            n = struct.unpack('!Q', self._read(8))[0]
+        mask = self._read(4) if second & 0x80 else None
+        payload = self._read(n)
+        if mask and payload:
+            payload = _unmask(payload, mask)
+        return fin, opcode, payload
+
+    def recv(self):
+        """
+        Waits for the next message, answering pings meanwhile.
+        :return: str or bytes, or None once the connection closed
+        """
+        fragments, message_opcode = [], None
+        try:
+            while True:
+                fin, opcode, payload = self._read_frame()
+                if opcode == OP_PING:
+                    self._send_frame(payload, OP_PONG)
+                    continue
+                elif opcode == OP_PONG:
+                    continue
+                elif opcode == OP_CLOSE:
+                    self.close(payload[:2] or None)
+                    return None
+                if opcode != OP_CONTINUATION:
+                    message_opcode = opcode
+                fragments.append(payload)
+                if fin:
+                    data = b''.join(fragments)
+                    return (data.decode('utf-8') if message_opcode == OP_TEXT
+                            else data)
+        except (ConnectionClosed, OSError, ValueError):
+            self.closed = True
+            return None
+
+    def close(self, code=None):
+        """
+        Sends a close frame and shuts the connection down.
+        :param code: bytes, status code to echo; 1000 by default
+        """
+        try:
+            self._send_frame(code or struct.pack('!H', 1000), OP_CLOSE)
+        except ConnectionClosed:
+            pass
+        self.closed = True
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        request_line = self.rfile.readline(65537).decode('latin-1')
+        try:
+            method, path, _ = request_line.split(' ', 2)
+        except ValueError:
+            return
+        headers = {}
+        while True:
+            line = self.rfile.readline(65537).decode('latin-1').strip()
+            if not line:
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        key = headers.get('sec-websocket-key')
+        if method != 'GET' or key is None:
+            self.wfile.write(b'HTTP/1.1 400 Bad Request\r\n'
+                             b'Content-Length: 0\r\n\r\n')
+            return
+        self.wfile.write(('HTTP/1.1 101 Switching Protocols\r\n'
+                          'Upgrade: websocket\r\n'
+                          'Connection: Upgrade\r\n'
+                          'Sec-WebSocket-Accept: %s\r\n\r\n' %
+                          accept_key(key)).encode('ascii'))
+        self.wfile.flush()
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        conn = WebsocketConnection(self.request, path, headers)
+        try:
+            self.server.handler(conn)
+        except ConnectionClosed:
+            pass
+        except Exception:
+            log.exception("WebsocketServer: Error while serving %s!", path)
+        finally:
+            if not conn.closed:
+                conn.close()
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class WebsocketServer:
+    """
+    Serves each connection in its own thread, by calling handler with the
+    WebsocketConnection; the connection is closed once handler returns.
+    """
+    def __init__(self, handler, host='127.0.0.1', port=0):
+        """
+        :param handler: callable, taking a WebsocketConnection
+        :param host: str, address to bind to
+        :param port: int, 0 picks a free port
+        """
+        self.handler = handler
+        self.host = host
+        self.port = port
+        self._server = None
+        self._thread = None
+
+    def start(self):
+        self._server = _Server((self.host, self.port), _Handler)
+        self._server.handler = self.handler
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        daemon=True, name='Websocket Server')
+        self._thread.start()
+
+    def stop(self):
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = self._thread = None
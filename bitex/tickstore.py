@@ -0,0 +1,331 @@
+"""
+Columnar on-disk store for trades and best bid/offer (BBO) snapshots.
+
+Rows are stored per exchange, pair, kind and UTC day, with one file of
+fixed-width little-endian values per column:
+
+    <root>/<exchange>/<pair>/trades/2017-09-01/ts.bin     float64
+                                               price.bin  float64
+                                               size.bin   float64
+                                               side.bin   int8 (1 buy, -1 sell)
+    <root>/<exchange>/<pair>/bbo/2017-09-01/ts.bin, bid.bin, bid_size.bin,
+                                            ask.bin, ask_size.bin
+
+Files are only appended to, and timestamps never decrease within a file, so
+queries memory-map the columns and find a time range by binary search,
+without loading the files. The files can also be opened directly with
+numpy.memmap(path, dtype=DTYPES[code]).
+"""
+# Import Built-Ins
+import logging
+import os
+import sys
+import mmap
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+# Import Third-Party
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
+# Import Homebrew
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+# Column names and array typecodes per kind of row
+SCHEMAS = {'trades': (('ts', 'd'), ('price', 'd'), ('size', 'd'),
+                      ('side', 'b')),
+           'bbo': (('ts', 'd'), ('bid', 'd'), ('bid_size', 'd'),
+                   ('ask', 'd'), ('ask_size', 'd'))}
+DTYPES = {'d': '<f8', 'b': '<i1'}
+SUFFIX = '.bin'
+
+
+def _day(ts):
+    return time.strftime('%Y-%m-%d', time.gmtime(ts))
+
+
+def _bitfinex(item):
+    """
+    Normalizes trades and ticker items of BitfinexWSS's data_q.
+    """
+    channel, pair, (data, ts) = item[:3]
+    if channel == 'trades':
+        if data[0] == 'te':
+            trades = [data[1]]
+        elif isinstance(data[0], list):
+            trades = data[0]  # Snapshot
+        else:
+            trades = []  # 'tu' repeats an earlier 'te' message
+        for _, _, amount, price in trades:
+            amount = float(amount)
+            yield 'trades', pair, (ts, float(price), abs(amount),
+                                   1 if amount > 0 else -1)
+    elif channel == 'ticker':
+        bid, bid_size, ask, ask_size = data[:4]
+        yield 'bbo', pair, (ts, float(bid), float(bid_size), float(ask),
+                            float(ask_size))
+
+
+# Functions normalizing items of a client's data_q into rows, by exchange
+NORMALIZERS = {'Bitfinex': _bitfinex}
+
+
+class _Partition:
+    """
+    Buffered appender for the column files of a single partition.
+    """
+    def __init__(self, path, schema):
+        os.makedirs(path, exist_ok=True)
+        self.schema = schema
+        self.buffers = [array(code) for _, code in schema]
+        self.last_ts = float('-inf')
+
+        paths = [os.path.join(path, name + SUFFIX) for name, _ in schema]
+        # Drop incomplete rows left behind by a crash
+        rows = min(os.path.getsize(p) // array(code).itemsize
+                   if os.path.exists(p) else 0
+                   for p, (_, code) in zip(paths, schema))
+        self.files = []
+        for p, (_, code) in zip(paths, schema):
+            f = open(p, 'ab')
+            f.truncate(rows * array(code).itemsize)
+            self.files.append(f)
+        if rows:
+            ts = array('d')
+            with open(paths[0], 'rb') as f:
+                f.seek((rows - 1) * ts.itemsize)
+                ts.fromfile(f, 1)
+            if sys.byteorder == 'big':
+                ts.byteswap()
+            self.last_ts = ts[0]
+
+    def append(self, row):
+        for buffer, value in zip(self.buffers, row):
+            buffer.append(value)
+
+    def __len__(self):
+        return len(self.buffers[0])
+
+    def flush(self):
+        for buffer, f in zip(self.buffers, self.files):
+            if sys.byteorder == 'big':
+                buffer.byteswap()
+            buffer.tofile(f)
+            f.flush()
+            del buffer[:]
+
+    def close(self):
+        self.flush()
+        for f in self.files:
+            f.close()
+
+
+class Ticks:
+    """
+    Rows of a time range, backed by memory-mapped column files.
+    """
+    def __init__(self, schema, parts):
+        """
+        :param schema: tuple of (name, typecode) pairs
+        :param parts: list of lists of memoryviews, one list per partition
+        """
+        self.schema = schema
+        self.names = [name for name, _ in schema]
+        self._parts = parts
+
+    def __len__(self):
+        return sum(len(part[0]) for part in self._parts)
+
+    def __iter__(self):
+        for part in self._parts:
+            yield from zip(*part)
+
+    def column(self, name):
+        """
+        Returns a column's values. Only copies data if the rows span more
+        than one day.
+        :param name: str, see SCHEMAS
+        :return: memoryview
+        """
+        i = self.names.index(name)
+        views = [part[i] for part in self._parts]
+        if len(views) == 1:
+            return views[0]
+        return memoryview(b''.join(views)).cast(self.schema[i][1])
+
+    def arrays(self):
+        """
+        Returns all columns as numpy arrays.
+        :return: dict of name: numpy.ndarray
+        """
+        if not numpy_available:
+            raise SystemError("No numpy installed! Cannot create arrays!")
+        return {name: numpy.frombuffer(self.column(name), dtype=DTYPES[code])
+                for name, code in self.schema}
+
+
+class TickStore:
+    """
+    Writes and queries trades and BBO snapshots below a root directory.
+    Writes are buffered; call flush() or close() to write them to disk.
+    """
+    def __init__(self, root, flush_every=1024):
+        """
+        :param root: directory to store files in
+        :param flush_every: number of buffered rows per partition, after
+                            which they are written to disk
+        """
+        self.root = root
+        self.flush_every = flush_every
+        self._partitions = {}
+
+    def _path(self, exchange, pair, kind, day=None):
+        path = os.path.join(self.root, exchange, pair, kind)
+        return os.path.join(path, day) if day else path
+
+    def append(self, kind, exchange, pair, row):
+        """
+        Appends a row. Timestamps are clamped to the last timestamp written
+        to the partition, so they never decrease.
+        :param kind: 'trades' or 'bbo'
+        :param exchange: str
+        :param pair: str
+        :param row: tuple of values in the order of SCHEMAS[kind]
+        """
+        ts = row[0]
+        key = kind, exchange, pair, _day(ts)
+        try:
+            partition = self._partitions[key]
+        except KeyError:
+            # Rows of the previous day are complete
+            for k in [k for k in self._partitions if k[:3] == key[:3]]:
+                self._partitions.pop(k).close()
+            partition = self._partitions[key] = _Partition(
+                self._path(exchange, pair, kind, key[3]), SCHEMAS[kind])
+
+        if ts < partition.last_ts:
+            row = (partition.last_ts,) + tuple(row[1:])
+        else:
+            partition.last_ts = ts
+        partition.append(row)
+        if len(partition) >= self.flush_every:
+            partition.flush()
+
+    def write_trade(self, exchange, pair, ts, price, size, side):
+        """
+        :param side: 1 for buys, -1 for sells, 0 if unknown
+        """
+        self.append('trades', exchange, pair, (ts, price, size, side))
+
+    def write_bbo(self, exchange, pair, ts, bid, bid_size, ask, ask_size):
+        self.append('bbo', exchange, pair, (ts, bid, bid_size, ask, ask_size))
+
+    def write_item(self, exchange, item):
+        """
+        Stores the trades or BBO contained in an item of a Websocket client's
+        data_q; other items are ignored.
+        :param exchange: name of the client, as in NORMALIZERS
+        :param item: tuple, as taken from data_q
+        :return: number of rows written
+        """
+        n = 0
+        for kind, pair, row in NORMALIZERS[exchange](item):
+            self.append(kind, exchange, pair, row)
+            n += 1
+        return n
+
+    def flush(self):
+        for partition in self._partitions.values():
+            partition.flush()
+
+    def close(self):
+        for partition in self._partitions.values():
+            partition.close()
+        self._partitions = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _map(self, path, schema):
+        """
+        Memory-maps a partition's columns.
+        :return: list of memoryviews, or None if the partition is empty
+        """
+        sizes = [array(code).itemsize for _, code in schema]
+        paths = [os.path.join(path, name + SUFFIX) for name, _ in schema]
+        try:
+            rows = min(os.path.getsize(p) // size
+                       for p, size in zip(paths, sizes))
+        except OSError:
+            return None
+        if not rows:
+            return None
+        views = []
+        for p, size, (_, code) in zip(paths, sizes, schema):
+            with open(p, 'rb') as f:
+                mm = mmap.mmap(f.fileno(), rows * size, access=mmap.ACCESS_READ)
+            views.append(memoryview(mm).cast(code))
+        return views
+
+    def query(self, kind, exchange, pair, start=None, end=None):
+        """
+        Returns the rows with start <= ts <= end.
+        :param kind: 'trades' or 'bbo'
+        :param exchange: str
+        :param pair: str
+        :param start: timestamp; None for no lower bound
+        :param end: timestamp; None for no upper bound
+        :return: Ticks
+        """
+        self.flush()
+        schema = SCHEMAS[kind]
+        path = self._path(exchange, pair, kind)
+        try:
+            days = sorted(os.listdir(path))
+        except FileNotFoundError:
+            days = []
+        first = _day(start) if start is not None else None
+        last = _day(end) if end is not None else None
+
+        parts = []
+        for day in days:
+            if (first and day < first) or (last and day > last):
+                continue
+            views = self._map(os.path.join(path, day), schema)
+            if views is None:
+                continue
+            ts = views[0]
+            i = bisect_left(ts, start) if start is not None else 0
+            j = bisect_right(ts, end) if end is not None else len(ts)
+            if i < j:
+                parts.append([view[i:j] for view in views])
+        return Ticks(schema, parts)
+
+    def trades(self, exchange, pair, start=None, end=None):
+        return self.query('trades', exchange, pair, start, end)
+
+    def bbo(self, exchange, pair, start=None, end=None):
+        return self.query('bbo', exchange, pair, start, end)
+
+    def bbo_at(self, exchange, pair, ts):
+        """
+        Returns the last BBO snapshot at or before ts, on the same day.
+        :return: tuple of (ts, bid, bid_size, ask, ask_size), or None
+        """
+        self.flush()
+        views = self._map(self._path(exchange, pair, 'bbo', _day(ts)),
+                          SCHEMAS['bbo'])
+        if views is None:
+            return None
+        i = bisect_right(views[0], ts)
+        return tuple(view[i - 1] for view in views) if i else None
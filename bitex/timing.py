@@ -0,0 +1,301 @@
+"""
+Timings of the phases of REST queries, aggregated in histograms per exchange,
+endpoint and phase.
+
+APIClient.query() and the interfaces' methods record how long each query
+spent in these phases:
+
+    sign        building and signing the request
+    ttfb        time to first byte - connecting, sending the request and
+                waiting for the response headers
+    download    reading the response body
+    decode      parsing the json
+    format      applying the formatter
+
+Queries made via an interface method are recorded under the method's name
+(i.e. 'order_book'), others under their endpoint. All clients record into the
+shared `timings` registry by default, which can be pulled at any time:
+
+    >>> Bitfinex().order_book('BTCUSD')
+    >>> timings.snapshot()[('Bitfinex', 'order_book', 'ttfb')]
+    {'count': 1, 'min': 212.9, 'mean': 212.9, 'p50': 212.9, ... 'max': 212.9}
+
+or exported periodically as StatsD-compatible text:
+
+    >>> timings.report_every(60)
+
+Histograms have HDR-style log-linear buckets: each power of two is divided
+into equally sized buckets, bounding the relative error of all values and
+percentiles, while recording stays a few integer operations.
+"""
+# Import Built-Ins
+import logging
+import threading
+
+try:
+    from contextvars import ContextVar
+except ImportError:  # Python < 3.7
+    ContextVar = None
+
+# Import Third-Party
+
+# Import Homebrew
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+PHASES = ('sign', 'ttfb', 'download', 'decode', 'format')
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+class _ThreadLocalVar(threading.local):
+    """
+    Stand-in for contextvars.ContextVar on Python < 3.7, holding a value per
+    thread; concurrent coroutines of one thread share it.
+    """
+    def __init__(self, name, default=None):
+        self.name = name
+        self.value = default
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        token, self.value = self.value, value
+        return token
+
+    def reset(self, token):
+        self.value = token
+
+
+# Name of the interface method currently querying, used as endpoint label
+method = (ContextVar or _ThreadLocalVar)('bitex_timing_method', default=None)
+
+
+class Histogram:
+    """
+    Log-linear histogram of durations, recorded in microseconds.
+    """
+    def __init__(self, precision=8):
+        """
+        :param precision: significant bits kept per value; the relative error
+                          of values is below 1 / 2 ** (precision - 1)
+        """
+        self.precision = precision
+        self._half = 1 << (precision - 1)
+        self._lock = threading.Lock()
+        self._clear()
+
+    def _clear(self):
+        self._counts = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def _index(self, value):
+        shift = value.bit_length() - self.precision
+        if shift <= 0:
+            return value
+        return shift * self._half + (value >> shift)
+
+    def _value(self, index):
+        """
+        Returns the midpoint of a bucket.
+        """
+        if index < 2 * self._half:
+            return index
+        shift = index // self._half - 1
+        mantissa = index - shift * self._half
+        return (mantissa << shift) + (1 << (shift - 1))
+
+    def record(self, seconds):
+        """
+        :param seconds: float, the duration
+        """
+        value = max(int(seconds * 1e6), 0)
+        index = self._index(value)
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + 1
+            self.count += 1
+            self.total += value
+            if self.min is None or value < self.min:
+                self.min = value
+            if self.max is None or value > self.max:
+                self.max = value
+
+    def _percentiles(self, percentiles):
+        """
+        Must be called while holding self._lock.
+        """
+        results = []
+        buckets = sorted(self._counts.items())
+        for p in percentiles:
+            rank = max(p / 100 * self.count, 1)
+            seen = 0
+            for index, n in buckets:
+                seen += n
+                if seen >= rank:
+                    value = self._value(index)
+                    results.append(min(max(value, self.min), self.max))
+                    break
+        return results
+
+    def percentile(self, p):
+        """
+        :param p: float, between 0 and 100
+        :return: float, milliseconds, or None if nothing was recorded
+        """
+        with self._lock:
+            if not self.count:
+                return None
+            return self._percentiles([p])[0] / 1000
+
+    def summary(self, reset=False):
+        """
+        Returns count, min, mean, percentiles and max, all in milliseconds.
+        :param reset: if True, clears the histogram
+        :return: dict
+        """
+        with self._lock:
+            if not self.count:
+                return {'count': 0}
+            result = {'count': self.count, 'min': self.min / 1000,
+                      'mean': self.total / self.count / 1000}
+            for p, v in zip(PERCENTILES, self._percentiles(PERCENTILES)):
+                result['p%s' % str(p).replace('.', '')] = v / 1000
+            result['max'] = self.max / 1000
+            if reset:
+                self._clear()
+        return result
+
+
+class Timings:
+    """
+    Histograms of query phase durations, per exchange, endpoint and phase.
+    """
+    def __init__(self, precision=8):
+        """
+        :param precision: see Histogram
+        """
+        self.precision = precision
+        self._histograms = {}
+        self._lock = threading.Lock()
+        self._reporter = None
+
+    def histogram(self, exchange, endpoint, phase):
+        """
+        :return: Histogram, created if necessary
+        """
+        key = exchange, endpoint, phase
+        h = self._histograms.get(key)
+        if h is None:
+            with self._lock:
+                h = self._histograms.setdefault(key,
+                                                Histogram(self.precision))
+        return h
+
+    def record(self, exchange, endpoint, phase, seconds):
+        """
+        :param exchange: str, name of the client's class
+        :param endpoint: str, interface method or endpoint queried
+        :param phase: str, one of PHASES
+        :param seconds: float
+        """
+        self.histogram(exchange, endpoint, phase).record(seconds)
+
+    def snapshot(self, reset=False):
+        """
+        Returns the summaries of all histograms.
+        :param reset: if True, clears the histograms
+        :return: dict of (exchange, endpoint, phase): summary, see
+                 Histogram.summary()
+        """
+        with self._lock:
+            histograms = list(self._histograms.items())
+        return {key: h.summary(reset) for key, h in histograms}
+
+    def reset(self):
+        with self._lock:
+            self._histograms = {}
+
+    def statsd(self, prefix='bitex', reset=False):
+        """
+        Exports the summaries as StatsD gauges, one per line, i.e.
+        'bitex.Kraken.order_book.ttfb.p99:212.9|g'.
+        :param prefix: str, prepended to all metric names
+        :param reset: if True, clears the histograms
+        :return: str
+        """
+        return format_statsd(self.snapshot(reset), prefix)
+
+    def report_every(self, interval, write=None, prefix='bitex', reset=True):
+        """
+        Exports the summaries every interval seconds, in a background thread;
+        replaces any running report.
+        :param interval: seconds
+        :param write: callable, called with the text of statsd(); logs it at
+                      INFO level by default
+        :param prefix: see statsd()
+        :param reset: if True, each report covers the interval since the last
+        """
+        self.stop_reporting()
+        stop = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                try:
+                    text = self.statsd(prefix, reset)
+                    if not text:
+                        continue
+                    if write is None:
+                        log.info("Query timings:\n%s", text)
+                    else:
+                        write(text)
+                except Exception:
+                    log.exception("Timings.report_every(): Error while "
+                                  "reporting!")
+
+        thread = threading.Thread(target=run, daemon=True,
+                                  name='Timings Reporter')
+        self._reporter = thread, stop
+        thread.start()
+
+    def stop_reporting(self):
+        if self._reporter is None:
+            return
+        thread, stop = self._reporter
+        self._reporter = None
+        stop.set()
+        thread.join()
+
+
+def _metric(name):
+    """
+    Replaces characters StatsD doesn't allow in metric names.
+    """
+    return ''.join(c if c.isalnum() or c in '_-' else '_' for c in name)
+
+
+def format_statsd(summaries, prefix='bitex'):
+    """
+    Formats histogram summaries as StatsD gauges, one per line.
+    :param summaries: dict of key tuple: summary, see Histogram.summary();
+                      the key's (non-empty) parts form the metric name
+    :param prefix: str, prepended to all metric names as is
+    :return: str
+    """
+    lines = []
+    for key, summary in sorted(summaries.items(), key=lambda i: str(i[0])):
+        if not summary['count']:
+            continue
+        name = '.'.join([prefix] * bool(prefix) +
+                        [_metric(str(s)) for s in key if s])
+        for stat, value in summary.items():
+            lines.append('%s.%s:%s|g' % (name, stat, round(value, 3)))
+    return '\n'.join(lines)
+
+
+timings = Timings()
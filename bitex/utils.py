@@ -5,64 +5,213 @@ Provides utility functions used across more than one module or sub module.
 
 # Import Built-Ins
 import logging
-import json
+import inspect
+import threading
+import time
 from functools import wraps
 
 # Import Third-Party
 import requests
 
 # Import Homebrew
+from bitex.api.REST.response import APIResponse
+from bitex import timing
 
 # Init Logging Facilities
 log = logging.getLogger(__name__)
 
 
+def _process_response(r, formatter, args, kwargs, arrays=None, name=None):
+    """
+    Checks the status of the given APIResponse, parses its json and applies
+    the formatter, if any.
+    :param r: bitex.api.response.APIResponse()
+    :param formatter: bitex.formatters.Formatter() obj
+    :param args: args func was called with
+    :param kwargs: kwargs func was called with
+    :param arrays: if not None, the formatted order book is converted via
+                   bitex.formatters.arrays.order_book_arrays(); True for
+                   float64 arrays, or the number of decimals of int64 arrays
+    :param name: name of the called method; if given and the object it was
+                 called on records timings, the durations of decoding and
+                 formatting are recorded
+    :return: bitex.api.response.APIResponse()
+    """
+    timings = getattr(args[0], 'timings', None) if name and args else None
+    start = time.perf_counter()
+
+    # Check Status
+    try:
+        r.raise_for_status()
+    except requests.HTTPError:
+        log.exception("return_api_response: HTTPError for url %s",
+                      r.request.url)
+
+    #  Verify json data; r.json() decodes using bitex.jsonlib, whose
+    #  backends all raise ValueError subclasses on invalid data
+    try:
+        data = r.json()
+    except ValueError:
+        log.error('return_api_response: Error while parsing json. '
+                  'Request url was: %s, result is: '
+                  '%s', r.request.url, r.text)
+        data = None
+    except Exception:
+        log.exception("return_api_response(): Unexpected error while parsing "
+                      "json from %s", r.request.url)
+        raise
+    decoded = time.perf_counter()
+
+    # Format, if available
+    if formatter is not None and data:
+        try:
+            r.formatted = formatter(data, *args, **kwargs)
+        except Exception:
+            log.exception("Error while applying formatter!")
+
+    if arrays is not None and r.formatted is not None:
+        from bitex.formatters.arrays import order_book_arrays
+        try:
+            r.formatted = order_book_arrays(
+                r.formatted, None if arrays is True else arrays)
+        except Exception:
+            log.exception("Error while converting order book to arrays!")
+            r.formatted = None
+
+    if timings is not None:
+        exchange = args[0].__class__.__name__
+        timings.record(exchange, name, 'decode', decoded - start)
+        timings.record(exchange, name, 'format',
+                       time.perf_counter() - decoded)
+    return r
+
+
 def return_api_response(formatter=None):
     """
     Decorator, which Applies the referenced formatter (if available) to the
     function output and adds it to the APIResponse Object's `formatted`
     attribute.
+
+    If the object the method is called on has a `cache` attribute
+    (bitex.cache.ResponseCache), the response is served from and stored in it.
+
+    If the function returns an awaitable (i.e. it was called on an
+    bitex.api.REST.aio.AsyncAPIClient), the wrapper returns a coroutine instead,
+    which yields the processed APIResponse.
+
+    order_book() methods additionally accept an `arrays` keyword, which is not
+    passed on to the method; see bitex.formatters.arrays.
     :param formatter: bitex.formatters.Formatter() obj
     :return: bitex.api.response.APIResponse()
     """
     def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
+        async def await_response(awaitable, args, kwargs, arrays):
+            token = timing.method.set(func.__name__)
             try:
-                r = func(*args, **kwargs)
+                r = await awaitable
             except Exception:
-                log.exception("return_api_response(): Error during call to %s(%s, %s)",
-                              func.__name__, args, kwargs)
+                log.exception("return_api_response(): Error during call to "
+                              "%s(%s, %s)", func.__name__, args, kwargs)
                 raise
+            finally:
+                timing.method.reset(token)
+            return _process_response(r, formatter, args, kwargs, arrays,
+                                     func.__name__)
 
-            # Check Status
+        def call(*args, **kwargs):
+            arrays = (kwargs.pop('arrays', None)
+                      if func.__name__ == 'order_book' else None)
+            if arrays is False:
+                arrays = None
+            if arrays is not None:
+                from bitex.formatters.arrays import numpy_available
+                if not numpy_available:
+                    raise SystemError("No numpy installed! Cannot return "
+                                      "order books as arrays!")
+            token = timing.method.set(func.__name__)
             try:
-                r.raise_for_status()
-            except requests.HTTPError:
-                log.exception("return_api_response: HTTPError for url %s",
-                              r.request.url)
-
-            #  Verify json data
-            try:
-                data = r.json()
-            except json.JSONDecodeError:
-                log.error('return_api_response: Error while parsing json. '
-                          'Request url was: %s, result is: '
-                          '%s', r.request.url, r.text)
-                data = None
+                r = func(*args, **kwargs)
             except Exception:
-                log.exception("return_api_response(): Unexpected error while parsing "
-                              "json from %s", r.request.url)
+                log.exception("return_api_response(): Error during call to %s(%s, %s)",
+                              func.__name__, args, kwargs)
                 raise
+            finally:
+                timing.method.reset(token)
 
-            # Format, if available
-            if formatter is not None and data:
-                try:
-                    r.formatted = formatter(data, *args, **kwargs)
-                except Exception:
-                    log.exception("Error while applying formatter!")
+            if inspect.isawaitable(r):
+                return await_response(r, args, kwargs, arrays)
 
-            return r
+            return _process_response(r, formatter, args, kwargs, arrays,
+                                     func.__name__)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = getattr(args[0], 'cache', None) if args else None
+            if cache is not None:
+                ttl = cache.ttls.get(func.__name__)
+                key = (cache.make_key(args[0], func, args[1:], kwargs)
+                       if ttl else None)
+                if key is not None:
+                    return cache.get_or_call(key, ttl,
+                                             lambda: call(*args, **kwargs))
+            return call(*args, **kwargs)
 
         return wrapper
     return decorator
+
+
+class Snapshot:
+    """
+    Holds the latest response of a query, to be reused for `ttl` seconds.
+    Used by interfaces which serve several methods from a single endpoint, i.e.
+    per-pair tickers from an endpoint returning the tickers of all pairs.
+    """
+    def __init__(self, ttl=0):
+        """
+        :param ttl: seconds a response is reused for; 0 disables reuse
+        """
+        self.ttl = ttl
+        self._response = None
+        self._timestamp = 0
+        self._lock = threading.Lock()
+        self._fetching = None  # threading.Event of the query in flight
+
+    def get(self, query):
+        """
+        Returns a copy of the stored response, if it's younger than self.ttl.
+        Otherwise calls query() and stores its result; concurrent callers wait
+        for this call instead of sending their own. The lock is only held to
+        inspect and update the stored response, never during query().
+
+        With a ttl of 0, query() is called directly.
+
+        Awaitables (as returned by async clients) are passed through as-is.
+        :param query: callable, returning an APIResponse
+        :return: APIResponse
+        """
+        if not self.ttl:
+            return query()
+
+        while True:
+            with self._lock:
+                if (self._response is not None and
+                        time.monotonic() - self._timestamp < self.ttl):
+                    return APIResponse(self._response)
+                fetching = self._fetching
+                if fetching is None:
+                    self._fetching = fetched = threading.Event()
+                    break
+            # Another caller is querying; use its response, or query
+            # ourselves if it failed
+            fetching.wait()
+
+        try:
+            r = query()
+            if not inspect.isawaitable(r):
+                with self._lock:
+                    self._response, self._timestamp = r, time.monotonic()
+            return r
+        finally:
+            with self._lock:
+                self._fetching = None
+            fetched.set()
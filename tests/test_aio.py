@@ -0,0 +1,101 @@
+# Import Built-Ins
+import logging
+import asyncio
+from unittest import TestCase
+
+# Import Homebrew
+from bitex.simulator import Market, RESTSimulator
+from bitex.api.REST.aio import AsyncAPIClient
+from bitex.api.REST.gdax import GDAXRest
+from bitex.api.REST.response import APIResponse
+from bitex.interfaces.aio import AsyncKraken, AsyncBitfinex, AsyncGemini
+
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+class AsyncGDAXRest(AsyncAPIClient, GDAXRest):
+    pass
+
+
+def run_until_complete(coro):
+    # Use a loop of our own, leaving the current event loop of the thread
+    # untouched for other tests
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class AsyncAPIClientTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.sim = RESTSimulator(market=Market(seed=1))
+        cls.sim.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.sim.stop()
+
+    def client(self, cls, venue, secret=None, **kwargs):
+        return cls(url=self.sim.url(venue), key=self.sim.credentials.key,
+                   secret=secret or self.sim.credentials.secret,
+                   timings=False, **kwargs)
+
+    def run_async(self, cls, venue, query, **kwargs):
+        async def run():
+            async with self.client(cls, venue, **kwargs) as client:
+                return await query(client)
+        return run_until_complete(run())
+
+    def test_public_query(self):
+        r = self.run_async(AsyncKraken, 'Kraken',
+                           lambda c: c.query('GET', 'public/Time'))
+        self.assertIsInstance(r, APIResponse)
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.json()['error'], [])
+        self.assertIn('unixtime', r.json()['result'])
+
+    def test_formatter_is_applied(self):
+        ticker = self.run_async(AsyncKraken, 'Kraken',
+                                lambda c: c.ticker('XBTUSD'))
+        self.assertEqual(ticker.status_code, 200)
+        bid, ask = map(float, ticker.formatted[:2])
+        self.assertLess(bid, ask)
+
+        book = self.run_async(AsyncBitfinex, 'Bitfinex',
+                              lambda c: c.order_book('btcusd'))
+        self.assertEqual(book.status_code, 200)
+        self.assertLess(float(book.formatted['bids'][0][1]),
+                        float(book.formatted['asks'][0][1]))
+
+    def test_signed_private_query(self):
+        creds = self.sim.credentials
+        queries = [
+            (AsyncKraken, 'Kraken', {}, lambda c: c.balance()),
+            (AsyncBitfinex, 'Bitfinex', {}, lambda c: c.balance()),
+            (AsyncGemini, 'Gemini', {}, lambda c: c.balance()),
+            (AsyncGDAXRest, 'GDAX', {'passphrase': creds.passphrase},
+             lambda c: c.query('GET', 'accounts', authenticate=True))]
+        for cls, venue, kwargs, query in queries:
+            venue_sim = self.sim.venues[venue.lower()]
+            with self.subTest(venue=venue):
+                accepted = self.run_async(cls, venue, query, **kwargs)
+                self.assertEqual(accepted.status_code, 200)
+                self.assertNotEqual(accepted.json(), venue_sim.rejected()[1])
+
+                rejected = self.run_async(cls, venue, query,
+                                          secret='d3Jvbmc=', **kwargs)
+                self.assertEqual((rejected.status_code, rejected.json()),
+                                 venue_sim.rejected())
+
+    def test_queries_run_concurrently_on_one_session(self):
+        async def run():
+            async with self.client(AsyncKraken, 'Kraken') as kraken:
+                return await asyncio.gather(*[kraken.ticker('XBTUSD')
+                                              for _ in range(10)])
+        responses = run_until_complete(run())
+        self.assertEqual([r.status_code for r in responses], [200] * 10)
+        self.assertTrue(all(r.formatted for r in responses))
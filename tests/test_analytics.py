@@ -0,0 +1,78 @@
+# Import Built-Ins
+import logging
+from unittest import TestCase, skipUnless
+
+# Import Third-Party
+
+# Import Homebrew
+from bitex.analytics import BookAnalytics, IncrementalAnalytics
+from bitex.analytics import numpy_available
+
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+BOOK = {'bids': [[None, '99', '1'], [None, '98', '2'], [None, '97', '3']],
+        'asks': [[None, '101', '1'], [None, '102', '1'], [None, '104', '2']]}
+
+
+class BookAnalyticsTest(TestCase):
+    def check(self, book):
+        self.assertEqual(book.mid(), 100.0)
+        self.assertEqual(book.spread(), 2.0)
+        self.assertEqual(book.microprice(), 100.0)
+        self.assertEqual(book.vwap(2, 'buy'), 101.5)
+        self.assertEqual(book.fill(3, 'buy'), (3, 307.0, 104.0))
+        self.assertEqual(book.vwap(2.5, 'sell'), (99 + 98 * 1.5) / 2.5)
+        self.assertAlmostEqual(book.slippage(2, 'buy'), 0.5 / 101)
+        self.assertAlmostEqual(book.impact(3, 'buy'), 0.04)
+        self.assertAlmostEqual(book.impact(2, 'sell'), 0.02)
+        # Not enough depth: fills what is available
+        self.assertEqual(book.fill(10, 'buy'), (4.0, 411.0, 104.0))
+        self.assertEqual(book.imbalance(), (6 - 4) / 10)
+        self.assertEqual(book.imbalance(levels=1), 0.0)
+
+    def test_lists(self):
+        book = BookAnalytics(BOOK)
+        self.check(book)
+        self.assertEqual(book.depth('asks'), ([101.0, 102.0, 104.0],
+                                              [1.0, 2.0, 4.0]))
+        self.assertEqual(book.size_within(98, 'bids'), 3.0)
+        self.assertEqual(book.size_within(103, 'buy'), 2.0)
+        self.assertEqual(book.size_within(100, 'asks'), 0.0)
+
+    @skipUnless(numpy_available, "numpy not installed")
+    def test_arrays(self):
+        from bitex.formatters.arrays import order_book_arrays
+        book = BookAnalytics(order_book_arrays(BOOK))
+        self.check(book)
+        self.assertEqual(book.size_within(98, 'bids'), 3.0)
+
+    def test_empty_side(self):
+        book = BookAnalytics({'bids': BOOK['bids'], 'asks': []})
+        self.assertIsNone(book.mid())
+        self.assertIsNone(book.vwap(1, 'buy'))
+        self.assertEqual(book.imbalance(), 1.0)
+        with self.assertRaises(ValueError):
+            book.vwap(1, 'long')
+
+
+class IncrementalAnalyticsTest(TestCase):
+    def test_matches_book_analytics_after_deltas(self):
+        book = IncrementalAnalytics()
+        book.reset([(99.0, 1.0), (98.0, 5.0)], [(101.0, 1.0), (102.0, 1.0)])
+        book.update([('bids', 98.0, 2.0), ('bids', 97.0, 3.0),
+                     ('asks', 104.0, 2.0), ('asks', 103.0, 1.0)])
+        book.set('asks', 103.0, 0)
+        self.assertEqual(book.total('bids'), (6.0, 99 + 196 + 291.0))
+        self.assertEqual(book.total('asks'), (4.0, 411.0))
+
+        reference = BookAnalytics(BOOK)
+        for size in (0.5, 2, 3, 10):
+            for side in ('buy', 'sell'):
+                self.assertEqual(book.fill(size, side),
+                                 reference.fill(size, side))
+        self.assertEqual(book.imbalance(), reference.imbalance())
+        self.assertEqual(book.imbalance(levels=2), reference.imbalance(2))
+        self.assertEqual(book.microprice(), reference.microprice())
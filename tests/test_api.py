@@ -55,6 +55,30 @@ class APITests(unittest.TestCase):
         self.assertIsInstance(r[1], dict)
 
 
+class DummyREST(APIClient):
+    def sign(self, url, endpoint, endpoint_path, method_verb, *args, **kwargs):
+        return url, {}
+
+
+class SessionTests(unittest.TestCase):
+    """
+    Tests the pooled requests.Session shared by a client's queries.
+    """
+    def setUp(self):
+        self.api = DummyREST('http://google.com/api', api_version='v1')
+
+    def test_restapi_session_is_pooled_and_closable(self):
+        session = self.api.session
+        self.assertIsInstance(session, requests.Session)
+        self.assertIs(self.api.session, session)
+        self.api.close()
+        self.assertIsNot(self.api.session, session)
+
+        with self.api as api:
+            session = api.session
+        self.assertIsNone(self.api._session)
+
+
 class KrakenAPITest(APITests):
     def setUp(self):
         self.api = KrakenREST()
@@ -0,0 +1,46 @@
+# Import Built-Ins
+import io
+import os
+import logging
+import tempfile
+from unittest import TestCase
+
+# Import Homebrew
+from benchmarks import harness
+
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+def results(**best):
+    return {'meta': {}, 'results': {name: {'best': seconds}
+                                    for name, seconds in best.items()}}
+
+
+class HarnessTest(TestCase):
+    def test_run_reports_the_fastest_run_per_op(self):
+        durations = iter([3.0, 1.0, 2.0])
+        bench = harness.Benchmark('b', 'micro', lambda n: next(durations),
+                                  n=100, repeat=3)
+        result = harness.run(bench, scale=0.1)
+        self.assertEqual(result['n'], 10)
+        self.assertAlmostEqual(result['best'], 0.1)
+        self.assertAlmostEqual(result['median'], 0.2)
+        self.assertAlmostEqual(result['ops_per_sec'], 10)
+
+    def test_compare_flags_slow_downs_beyond_threshold(self):
+        baseline = results(a=1.0, b=1.0, c=1.0)
+        current = results(a=1.2, b=1.3, c=0.5, new=9.0)
+        self.assertEqual(harness.compare(current, baseline, threshold=0.25),
+                         [('b', 1.0, 1.3, 1.3)])
+        out = io.StringIO()
+        harness.report(current, baseline, 0.25, out=out)
+        self.assertIn('REGRESSED', out.getvalue().splitlines()[1])
+        self.assertIn('new', out.getvalue().splitlines()[3])
+
+    def test_saved_results_load_back(self):
+        with tempfile.TemporaryDirectory() as path:
+            path = os.path.join(path, 'results.json')
+            harness.save(results(a=1e-6), path)
+            self.assertEqual(harness.load(path), results(a=1e-6))
@@ -0,0 +1,175 @@
+# Import Built-Ins
+import logging
+import time
+import threading
+from unittest import TestCase
+
+# Import Third-Party
+import requests
+
+# Import Homebrew
+from bitex.cache import ResponseCache
+from bitex.utils import return_api_response, Snapshot
+from bitex.api.REST.response import APIResponse
+
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+class FakeResponse:
+    ok = True
+    formatted = None
+
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class FakeClient:
+    uri = 'https://api.example.com'
+
+    def __init__(self, cache, delay=0):
+        self.cache = cache
+        self.delay = delay
+        self.calls = 0
+
+    @return_api_response(lambda data, *args, **kwargs: data['price'])
+    def ticker(self, pair):
+        self.calls += 1
+        time.sleep(self.delay)
+        return FakeResponse({'price': self.calls})
+
+    @return_api_response(None)
+    def balance(self):
+        self.calls += 1
+        return FakeResponse({})
+
+
+class ResponseCacheTest(TestCase):
+    def test_responses_are_cached_until_ttl_expires(self):
+        client = FakeClient(ResponseCache(ttls={'ticker': 0.1}))
+        first = client.ticker('BTCUSD')
+        self.assertIs(client.ticker('BTCUSD'), first)
+        self.assertEqual(client.ticker('ETHUSD').formatted, 2)
+        time.sleep(0.15)
+        self.assertEqual(client.ticker('BTCUSD').formatted, 3)
+
+    def test_methods_without_ttl_are_not_cached(self):
+        client = FakeClient(ResponseCache())
+        client.balance()
+        client.balance()
+        self.assertEqual(client.calls, 2)
+
+    def test_lru_eviction(self):
+        client = FakeClient(ResponseCache(ttls={'ticker': 10}, maxsize=2))
+        for pair in ('A', 'B', 'A', 'C', 'A'):
+            client.ticker(pair)
+        self.assertEqual(client.calls, 3)
+        self.assertEqual(len(client.cache), 2)
+
+    def test_concurrent_calls_are_coalesced(self):
+        client = FakeClient(ResponseCache(ttls={'ticker': 10}), delay=0.2)
+        results = []
+        threads = [threading.Thread(
+            target=lambda: results.append(client.ticker('BTCUSD')))
+            for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(client.calls, 1)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(client.cache.stats()['coalesced'], 4)
+
+
+    def test_interrupted_call_releases_waiters(self):
+        cache = ResponseCache(ttls={'ticker': 10})
+        started, release = threading.Event(), threading.Event()
+
+        def interrupted():
+            started.set()
+            release.wait()
+            raise KeyboardInterrupt()
+
+        def run():
+            try:
+                cache.get_or_call('key', 10, interrupted)
+            except KeyboardInterrupt:
+                errors.append('interrupted')
+        errors, results = [], []
+        caller = threading.Thread(target=run)
+        caller.start()
+        started.wait()
+        waiter = threading.Thread(target=lambda: results.append(
+            cache.get_or_call('key', 10, lambda: FakeResponse({}))))
+        waiter.start()
+        while cache.stats()['coalesced'] < 1:
+            time.sleep(0.001)
+        release.set()
+        caller.join()
+        waiter.join(timeout=2)
+        self.assertFalse(waiter.is_alive())
+        self.assertEqual(errors, ['interrupted'])
+        self.assertEqual(results[0].json(), {})
+        self.assertEqual(cache.stats()['size'], 0)
+
+
+class SnapshotTest(TestCase):
+    def response(self):
+        r = requests.Response()
+        r.status_code, r._content = 200, b'{}'
+        return APIResponse(r)
+
+    def test_zero_ttl_queries_are_not_serialized(self):
+        snapshot = Snapshot(ttl=0)
+        barrier = threading.Barrier(2, timeout=2)
+
+        def query():
+            barrier.wait()  # Breaks unless both queries run at once
+            return self.response()
+        results = []
+        threads = [threading.Thread(
+            target=lambda: results.append(snapshot.get(query)))
+            for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(results), 2)
+        self.assertFalse(barrier.broken)
+
+    def test_concurrent_calls_are_coalesced_without_holding_the_lock(self):
+        snapshot = Snapshot(ttl=10)
+        calls, unlocked = [], []
+
+        def query():
+            calls.append(1)
+            if snapshot._lock.acquire(blocking=False):
+                unlocked.append(1)
+                snapshot._lock.release()
+            time.sleep(0.2)
+            return self.response()
+        results = []
+        threads = [threading.Thread(
+            target=lambda: results.append(snapshot.get(query)))
+            for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual((len(calls), len(unlocked), len(results)), (1, 1, 5))
+        self.assertTrue(all(r.status_code == 200 for r in results))
+
+    def test_failed_query_lets_waiting_callers_retry(self):
+        snapshot = Snapshot(ttl=10)
+
+        def failing():
+            raise requests.ConnectionError()
+        self.assertRaises(requests.ConnectionError, snapshot.get, failing)
+        self.assertEqual(snapshot.get(self.response).status_code, 200)
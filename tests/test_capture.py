@@ -0,0 +1,115 @@
+# Import Built-Ins
+import logging
+import json
+import os
+import tempfile
+import time
+from unittest import TestCase, mock
+
+# Import Third-Party
+
+# Import Homebrew
+from bitex.api.WSS.capture import CaptureWriter, Replayer, read_capture
+from bitex.api.WSS.bitfinex import BitfinexWSS
+from bitex.api.WSS.bitstamp import BitstampWSS
+from bitex.api.WSS.gdax import GDAXWSS
+
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+class CaptureTest(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = tmp.name
+
+    def capture(self, frames, **kwargs):
+        with CaptureWriter(self.path, **kwargs) as writer:
+            for ts, tag, raw in frames:
+                writer.write(ts, raw, tag)
+        return writer
+
+    def test_segments_rotate_and_read_back_in_order(self):
+        frames = [(i + 0.5, 'tag%d' % (i % 2), '[%d, "%s"]' % (i, 'x' * i))
+                  for i in range(50)]
+        writer = self.capture(frames, segment_size=256)
+        self.assertGreater(len(writer.segments), 1)
+        self.assertTrue(all(os.path.getsize(f) <= 256
+                            for f in writer.segments))
+        self.assertEqual(list(read_capture(self.path)),
+                         [(ts, tag, raw.encode()) for ts, tag, raw in frames])
+
+        # A new writer appends new segments, leaving existing ones untouched
+        self.capture([(99.0, '', '[]')], prefix='capture')
+        self.assertEqual(list(read_capture(self.path))[-1], (99.0, '', b'[]'))
+
+    def test_truncated_record_is_ignored(self):
+        writer = self.capture([(1.0, '', '[1]'), (2.0, '', '[2]')])
+        with open(writer.segments[0], 'r+b') as f:
+            f.truncate(os.path.getsize(writer.segments[0]) - 1)
+        self.assertEqual(list(read_capture(self.path)), [(1.0, '', b'[1]')])
+
+    def test_writes_are_flushed_by_size_and_interval(self):
+        writer = CaptureWriter(self.path, flush_interval=60, flush_size=100)
+        self.addCleanup(writer.close)
+        writer.write(1.0, '[1]')
+        self.assertEqual(list(read_capture(self.path)), [])
+        writer.write(2.0, '[%s]' % ('2' * 100))
+        self.assertEqual(len(list(read_capture(self.path))), 2)
+
+        writer.flush_interval = 0
+        writer.write(3.0, '[3]')
+        self.assertEqual(list(read_capture(self.path))[-1], (3.0, '', b'[3]'))
+
+    def test_replay_at_recorded_speed(self):
+        self.capture([(100.0, '', '1'), (100.1, '', '2')])
+        handler = mock.Mock()
+        start = time.monotonic()
+        self.assertEqual(Replayer(self.path, handler, speed=1.0).run(), 2)
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+        handler.assert_called_with(b'2', 100.1, '')
+
+    def test_bitfinex_replay_rebuilds_books(self):
+        self.capture([
+            (1.0, '', json.dumps({'event': 'subscribed', 'channel': 'book',
+                                  'chanId': 7, 'pair': 'BTCUSD',
+                                  'prec': 'P0'})),
+            (2.0, '', '[7, [["100", 2, "1.5"], ["101", 1, "-2"]]]'),
+            (3.0, '', '[7, ["100", 0, "1"]]')])
+        wss = BitfinexWSS(pairs=['BTCUSD'])
+        Replayer(self.path, wss).run()
+        book = wss.books['BTCUSD']
+        self.assertEqual(book.best_bid(), None)
+        self.assertEqual(book.best_ask(), (101.0, 2.0))
+
+    def test_gdax_replays_recorded_snapshots(self):
+        wss = GDAXWSS(pairs=['BTC-USD'], capture=CaptureWriter(self.path))
+        wss._rest = mock.Mock()
+        wss._rest.order_book.return_value.json.return_value = {
+            'sequence': 20, 'bids': [['99', '1', 1]], 'asks': [['101', '2', 1]]}
+        msg = {'type': 'received', 'product_id': 'BTC-USD'}
+        for ts, seq in ((1.0, 10), (2.0, 15)):
+            raw = json.dumps(dict(msg, sequence=seq))
+            wss.record(raw, ts)
+            wss.handle_frame(raw, ts)
+        wss.capture.close()
+
+        replay = GDAXWSS(pairs=['BTC-USD'])
+        replay._rest = mock.Mock()
+        self.assertEqual(Replayer(self.path, replay).run(), 3)
+        replay._rest.order_book.assert_not_called()
+        self.assertEqual(replay.best_bid_ask('BTC-USD'),
+                         ((99.0, 1.0), (101.0, 2.0)))
+        self.assertEqual(replay.sequences, {'BTC-USD': 20})
+
+    def test_bitstamp_replays_callbacks(self):
+        wss = BitstampWSS(capture=CaptureWriter(self.path))
+        wss._recording(wss.btcusd_lt_callback)('{"price": 2500}')
+        wss.capture.close()
+        replay = BitstampWSS()
+        Replayer(self.path, replay).run()
+        recorded, replayed = wss.data_q.get_nowait(), replay.data_q.get_nowait()
+        self.assertEqual(recorded, replayed)
+        self.assertEqual(recorded.recv_ts, replayed.recv_ts)
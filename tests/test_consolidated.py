@@ -0,0 +1,86 @@
+# Import Built-Ins
+import logging
+import time
+from unittest import TestCase, mock
+
+# Import Third-Party
+
+# Import Homebrew
+from bitex.consolidated import ConsolidatedBook
+from bitex.pairs import normalize_pair, venue_pair
+from bitex.api.WSS.orderbook import PriceLevelBook
+
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+class PairsTest(TestCase):
+    def test_normalize_and_format_pairs(self):
+        names = {'Kraken': 'XXBTZUSD', 'GDAX': 'BTC-USD', 'Gemini': 'btcusd',
+                 'Bitstamp': 'btcusd', 'Bitfinex': 'BTCUSD', 'itBit': 'XBTUSD',
+                 'Poloniex': 'USD_BTC', 'Bittrex': 'USD-BTC'}
+        for exchange, name in names.items():
+            self.assertEqual(normalize_pair(name, exchange), 'BTCUSD')
+            self.assertEqual(venue_pair(exchange, 'btc_usd'), name)
+        self.assertEqual(normalize_pair('tETHBTC', 'Bitfinex'), 'ETHBTC')
+        with self.assertRaises(ValueError):
+            venue_pair('Mt.Gox', 'BTCUSD')
+
+
+class ConsolidatedBookTest(TestCase):
+    def test_merges_venues_with_attribution(self):
+        book = ConsolidatedBook('XXBTZUSD')
+        self.assertEqual(book.pair, 'BTCUSD')
+        book.replace('Kraken', bids=[(100.0, 1.0), (99.0, 2.0)],
+                     asks=[(101.0, 1.0)])
+        book.replace('GDAX', bids=[(100.0, 0.5)], asks=[(100.5, 3.0)])
+        self.assertEqual(book.best_bid(),
+                         (100.0, 1.5, {'Kraken': 1.0, 'GDAX': 0.5}))
+        self.assertEqual(book.best_ask(), (100.5, 3.0, {'GDAX': 3.0}))
+        self.assertFalse(book.crossed())
+
+        book.update('GDAX', [('asks', 100.5, 0), ('bids', 100.2, 1.0)])
+        self.assertEqual(book.best_ask(), (101.0, 1.0, {'Kraken': 1.0}))
+        self.assertEqual([lvl[0] for lvl in book.top(5)['bids']],
+                         [100.2, 100.0, 99.0])
+
+        book.replace('Kraken', bids=[(99.0, 2.0)], asks=[(100.1, 1.0)])
+        self.assertTrue(book.crossed())
+        book.remove('GDAX')
+        self.assertEqual(book.venues, ['Kraken'])
+        self.assertEqual(book.top(None), {
+            'bids': [(99.0, 2.0, {'Kraken': 2.0})],
+            'asks': [(100.1, 1.0, {'Kraken': 1.0})]})
+
+    def test_tracks_local_books(self):
+        local = PriceLevelBook()
+        local.reset([(100.0, 1.0)], [(101.0, 2.0)])
+        book = ConsolidatedBook('BTC-USD')
+        book.track('GDAX', local)
+        self.assertEqual(book.best_bid(), (100.0, 1.0, {'GDAX': 1.0}))
+
+        local.update([('bids', 100.5, 1.0), ('asks', 101.0, 0)], ts=5)
+        self.assertEqual(book.best_bid()[0], 100.5)
+        self.assertIsNone(book.best_ask())
+        self.assertEqual(book.ts['GDAX'], 5)
+
+        local.reset([(90.0, 1.0)], [])
+        self.assertEqual(book.top(None)['bids'], [(90.0, 1.0, {'GDAX': 1.0})])
+
+        book.untrack('GDAX')
+        local.set('bids', 95.0, 1.0)
+        self.assertEqual(book.best_bid()[0], 90.0)
+
+    def test_polls_rest_interfaces(self):
+        interface = mock.Mock()
+        interface.order_book.return_value.formatted = {
+            'bids': [[None, '100', '1']], 'asks': [[None, '101', '2']]}
+        book = ConsolidatedBook('BTCUSD')
+        book.poll('Kraken', interface, interval=0.01)
+        deadline = time.time() + 1
+        while book.best_bid() is None and time.time() < deadline:
+            time.sleep(0.01)
+        book.stop()
+        interface.order_book.assert_called_with('XXBTZUSD')
+        self.assertEqual(book.best_bid(), (100.0, 1.0, {'Kraken': 1.0}))
@@ -0,0 +1,72 @@
+# Import Built-Ins
+import logging
+from queue import Full
+from unittest import TestCase
+
+# Import Third-Party
+
+# Import Homebrew
+from bitex.api.WSS.dataqueue import DataQueue
+from bitex.api.WSS.bitfinex import BitfinexWSS
+
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+def drain(q):
+    items = []
+    while not q.empty():
+        items.append(q.get_nowait())
+    return items
+
+
+class DataQueueTest(TestCase):
+    def test_block_policy_behaves_like_queue(self):
+        q = DataQueue(maxsize=1)
+        q.put(('ticker', 'BTCUSD', 1))
+        with self.assertRaises(Full):
+            q.put(('ticker', 'BTCUSD', 2), timeout=0.01)
+
+    def test_drop_policies(self):
+        oldest = DataQueue(maxsize=2, policy='drop_oldest')
+        newest = DataQueue(maxsize=2, policy='drop_newest')
+        for q in (oldest, newest):
+            for i in range(4):
+                q.put(('trades', 'BTCUSD', i))
+        self.assertEqual([i for *_, i in drain(oldest)], [2, 3])
+        self.assertEqual([i for *_, i in drain(newest)], [0, 1])
+        self.assertEqual(newest.stats()['dropped'], {'trades': 2})
+
+    def test_conflate_keeps_latest_item_per_channel_and_pair(self):
+        q = DataQueue(maxsize=10, policy='conflate',
+                      conflate_channels=['ticker'])
+        q.put(('ticker', 'BTCUSD', 1))
+        q.put(('ticker', 'ETHUSD', 1))
+        q.put(('trades', 'BTCUSD', 1))
+        q.put(('trades', 'BTCUSD', 2))
+        q.put(('ticker', 'BTCUSD', 2))
+        self.assertEqual(drain(q), [('ticker', 'BTCUSD', 2),
+                                    ('ticker', 'ETHUSD', 1),
+                                    ('trades', 'BTCUSD', 1),
+                                    ('trades', 'BTCUSD', 2)])
+        q.put(('ticker', 'BTCUSD', 3))
+        self.assertEqual(drain(q), [('ticker', 'BTCUSD', 3)])
+        self.assertEqual(q.stats(), {'size': 0, 'dropped': {},
+                                     'conflated': {'ticker': 1}})
+
+    def test_conflate_never_drops_book_deltas_by_default(self):
+        q = DataQueue(maxsize=10, policy='conflate')
+        for channel in ('order_book', 'raw_book', 'trades', 'ticker'):
+            q.put((channel, 'BTCUSD', 1))
+            q.put((channel, 'BTCUSD', 2))
+        self.assertEqual([(c, i) for c, _, i in drain(q)],
+                         [('order_book', 1), ('order_book', 2),
+                          ('raw_book', 1), ('raw_book', 2),
+                          ('trades', 1), ('trades', 2), ('ticker', 2)])
+        self.assertEqual(q.stats()['conflated'], {'ticker': 1})
+
+    def test_wss_clients_pass_options_to_data_q(self):
+        wss = BitfinexWSS(maxsize=100, policy='conflate')
+        self.assertEqual((wss.data_q.maxsize, wss.data_q.policy),
+                         (100, 'conflate'))
@@ -1,13 +1,21 @@
 # Import Built-Ins
 import logging
-from unittest import TestCase
+from unittest import TestCase, mock, skipUnless
 # Import Third-Party
+import requests
 
 # Import Homebrew
 from bitex.formatters.kraken import KrknFormatter
 from bitex.formatters.bitfinex import BtfxFormatter
 from bitex.formatters.bitstamp import BtstFormatter
 from bitex.formatters.bittrex import BtrxFormatter
+from bitex.formatters.poloniex import PlnxFormatter
+from bitex.formatters.bter import BterFormatter
+from bitex.formatters.gdax import GdaxFormatter
+from bitex.formatters.quoine import QoinFormatter
+from bitex.formatters.arrays import numpy_available
+from bitex.api.REST.response import APIResponse
+from bitex.utils import return_api_response
 
 
 # Init Logging Facilities
@@ -41,4 +49,93 @@ class FormatterTest(TestCase):
         test_pairs = ['btcusd', 'ltcbtc', 'xmr_btc', 'BTCEUR']
         expected_output = ['BTC-USD', 'BTC-LTC', 'XMR-BTC', 'BTC-EUR']
         fmt_output = [fmt.format_pair(pair) for pair in test_pairs]
-        self.assertEqual(fmt_output, expected_output)
\ No newline at end of file
+        self.assertEqual(fmt_output, expected_output)
+
+    def test_tickers_formatters_return_all_pairs(self):
+        plnx = {'BTC_LTC': {'last': '0.1', 'lowestAsk': '0.11',
+                            'highestBid': '0.09', 'high24hr': '0.2',
+                            'low24hr': '0.05', 'quoteVolume': '10'}}
+        btrx = {'success': True, 'result': [
+            {'MarketName': 'BTC-LTC', 'Bid': 0.09, 'Ask': 0.11, 'High': 0.2,
+             'Low': 0.05, 'Last': 0.1, 'Volume': 10, 'TimeStamp': 'ts'},
+            {'MarketName': 'BTC-ETH', 'Bid': 0.29, 'Ask': 0.31, 'High': 0.4,
+             'Low': 0.25, 'Last': 0.3, 'Volume': 20, 'TimeStamp': 'ts'}]}
+        bter = {'ltc_btc': {'result': 'true', 'last': 0.1, 'high': 0.2,
+                            'low': 0.05, 'avg': 0.1, 'sell': 0.11, 'buy': 0.09,
+                            'vol_ltc': 10, 'vol_btc': 1}}
+
+        self.assertEqual(PlnxFormatter.tickers(plnx),
+                         {'BTC_LTC': ('0.09', '0.11', '0.2', '0.05', None,
+                                      None, '0.1', '10', None)})
+        self.assertEqual(PlnxFormatter.ticker(plnx, None, 'BTC_LTC'),
+                         PlnxFormatter.tickers(plnx)['BTC_LTC'])
+
+        self.assertEqual(sorted(BtrxFormatter.tickers(btrx)), ['BTC-ETH',
+                                                               'BTC-LTC'])
+        self.assertEqual(BtrxFormatter.ticker(btrx, None, 'BTC-ETH'),
+                         (0.29, 0.31, 0.4, 0.25, None, None, 0.3, 20, 'ts'))
+
+        self.assertEqual(BterFormatter.tickers(bter),
+                         {'ltc_btc': (0.09, 0.11, 0.2, 0.05, None, None, 0.1,
+                                      10, None)})
+        self.assertEqual(BterFormatter.ticker(bter, None, 'ltc_btc'),
+                         BterFormatter.ticker(bter['ltc_btc'], None, 'ltc_btc'))
+
+    def test_order_book_formatters_return_ts_price_size(self):
+        expected = {'bids': [[None, '99', '1']], 'asks': [[None, '101', '2']]}
+        krkn = {'error': [], 'result': {'XXBTZEUR': {
+            'bids': [['99', '1', 1]], 'asks': [['101', '2', 2]]}}}
+        btfx = {'bids': [{'price': '99', 'amount': '1', 'timestamp': 1}],
+                'asks': [{'price': '101', 'amount': '2', 'timestamp': 2}]}
+        btrx = {'success': True, 'result': {'buy': [{'Rate': '99',
+                                                     'Quantity': '1'}],
+                                            'sell': [{'Rate': '101',
+                                                      'Quantity': '2'}]}}
+        gdax = {'sequence': 1, 'bids': [['99', '1', 3]],
+                'asks': [['101', '2', 1]]}
+        self.assertEqual(KrknFormatter.order_book(krkn, None, 'XXBTZEUR'),
+                         {'bids': [[1, '99', '1']], 'asks': [[2, '101', '2']]})
+        self.assertEqual(BtfxFormatter.order_book(btfx),
+                         {'bids': [[1, '99', '1']], 'asks': [[2, '101', '2']]})
+        self.assertEqual(BtrxFormatter.order_book(btrx), expected)
+        self.assertEqual(GdaxFormatter.order_book(gdax), expected)
+        qoin = {'buy_price_levels': [['99', '1']],
+                'sell_price_levels': [['101', '2']]}
+        self.assertEqual(QoinFormatter.order_book(qoin), expected)
+
+    def test_one_sided_bittrex_order_book(self):
+        sell = {'success': True, 'result': [{'Rate': '101', 'Quantity': '2'}]}
+        expected = {'bids': [], 'asks': [[None, '101', '2']]}
+        self.assertEqual(BtrxFormatter.order_book(sell, None, 'USDT-BTC',
+                                                  'sell'), expected)
+        self.assertEqual(BtrxFormatter.order_book(sell, None, 'USDT-BTC',
+                                                  side='sell'), expected)
+        self.assertRaises(ValueError, BtrxFormatter.order_book, sell, None,
+                          'USDT-BTC')
+
+    @skipUnless(numpy_available, "numpy not installed")
+    def test_order_book_arrays(self):
+        import numpy
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = (b'{"bids": [["100.5", "1", 3], ["100", "2.5", 1]],'
+                         b' "asks": [["101", "0.25", 2]]}')
+        query = mock.Mock(return_value=APIResponse(resp))
+
+        @return_api_response(GdaxFormatter.order_book)
+        def order_book(self, pair, **kwargs):
+            return query(pair, **kwargs)
+
+        book = order_book(None, 'BTC-USD', level=2, arrays=True).formatted
+        query.assert_called_with('BTC-USD', level=2)
+        self.assertEqual(book['bids']['price'].dtype, numpy.float64)
+        self.assertTrue(book['bids']['price'].flags['C_CONTIGUOUS'])
+        self.assertEqual(book['bids']['price'].tolist(), [100.5, 100.0])
+        self.assertEqual(book['bids']['size'].tolist(), [1.0, 2.5])
+        self.assertTrue(numpy.isnan(book['asks']['ts']).all())
+
+        book = order_book(None, 'BTC-USD', arrays=8).formatted
+        self.assertEqual(book['bids']['price'].dtype, numpy.int64)
+        self.assertEqual(book['asks']['size'].tolist(), [25000000])
+        self.assertIsInstance(order_book(None, 'BTC-USD').formatted['bids'],
+                              list)
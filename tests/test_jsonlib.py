@@ -0,0 +1,67 @@
+# Import Built-Ins
+import logging
+import json
+from unittest import TestCase, mock
+
+# Import Third-Party
+import requests
+
+# Import Homebrew
+from bitex import jsonlib
+from bitex.api.REST.response import APIResponse
+from bitex.api.WSS.gdax import GDAXWSS
+
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+class JSONLibTest(TestCase):
+    def setUp(self):
+        self.backend = jsonlib.backend
+        self.addCleanup(jsonlib.use, self.backend)
+
+    def test_backends_decode_alike(self):
+        doc = b'{"bids": [["2500.1", "1.5", 3]], "ts": 1.25, "ok": true}'
+        for name, func in jsonlib.BACKENDS.items():
+            if func is None:
+                continue
+            self.assertEqual(jsonlib.use(name), name)
+            self.assertEqual(jsonlib.loads(doc), json.loads(doc.decode()))
+            with self.assertRaises(ValueError):
+                jsonlib.loads(b'{"bids": ')
+
+    def test_use(self):
+        with self.assertRaises(ValueError):
+            jsonlib.use('pickle')
+        decoder = mock.Mock(return_value={'a': 1})
+        jsonlib.use(decoder)
+        self.assertEqual(jsonlib.loads('{}'), {'a': 1})
+
+    def test_lazy_json_decodes_once(self):
+        decoder = mock.Mock(side_effect=json.loads)
+        jsonlib.use(decoder)
+        frame = jsonlib.LazyJSON('[1, 2]')
+        decoder.assert_not_called()
+        self.assertEqual(frame.data, [1, 2])
+        self.assertEqual(frame.data, [1, 2])
+        self.assertEqual(decoder.call_count, 1)
+
+    def test_api_response_uses_backend(self):
+        resp = requests.Response()
+        resp._content = b'{"last": "2500.1"}'
+        decoder = mock.Mock(side_effect=json.loads)
+        jsonlib.use(decoder)
+        r = APIResponse(resp)
+        self.assertEqual(r.json(), {'last': '2500.1'})
+        decoder.assert_called_once_with(b'{"last": "2500.1"}')
+
+    def test_raw_frames(self):
+        with self.assertRaises(ValueError):
+            GDAXWSS(pairs=['BTC-USD'], raw_frames=True, policy='conflate')
+
+        wss = GDAXWSS(pairs=['BTC-USD'], raw_frames=True)
+        wss.put_raw('{"type": "heartbeat"}', 1.0)
+        channel, pair, frame, ts = wss.data_q.get_nowait()
+        self.assertEqual((channel, pair, ts), ('raw', None, 1.0))
+        self.assertEqual(frame.data, {'type': 'heartbeat'})
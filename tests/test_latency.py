@@ -0,0 +1,78 @@
+# Import Built-Ins
+import logging
+import pickle
+import time
+from unittest import TestCase
+
+# Import Third-Party
+
+# Import Homebrew
+from bitex.api.WSS.base import WSSAPI
+from bitex.api.WSS.bitfinex import BitfinexWSS
+from bitex.api.WSS.latency import FeedItem, FeedLatencyMonitor, parse_iso
+
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+class FeedItemTest(TestCase):
+    def test_behaves_like_a_tuple(self):
+        item = FeedItem(('trades', 'BTCUSD', [1], 10.0), 10.0, 9.5)
+        channel, pair, data, ts = item
+        self.assertEqual(item, ('trades', 'BTCUSD', [1], 10.0))
+        self.assertEqual((item.channel, item.pair), ('trades', 'BTCUSD'))
+        copy = pickle.loads(pickle.dumps(item))
+        self.assertEqual((copy, copy.exchange_ts), (item, 9.5))
+
+    def test_parse_exchange_timestamps(self):
+        self.assertEqual(parse_iso('2017-08-01T12:00:00.5Z'), 1501588800.5)
+        self.assertIsNone(parse_iso(None))
+        self.assertEqual(parse_iso('2017-08-01T12:00:00.250000Z'),
+                         1501588800.25)
+        self.assertEqual(parse_iso('2017-08-01T14:00:00+02:00'), 1501588800)
+        self.assertEqual(parse_iso('2017-08-01T12:00:00'), 1501588800)
+        self.assertIsNone(parse_iso('2017-08-01T25:00:00Z'))
+        self.assertIsNone(parse_iso('yesterday'))
+        self.assertIsNone(parse_iso(1501588800))
+        self.assertEqual(BitfinexWSS._trade_ts(['te', [1, 1500000000000, 1,
+                                                      2500]]), 1500000000)
+        self.assertEqual(BitfinexWSS._trade_ts([[[1, 1000, 1, 1],
+                                                 [2, 3000, 1, 1]]]), 3)
+
+
+class FeedLatencyMonitorTest(TestCase):
+    def test_records_latencies_per_channel_and_pair(self):
+        wss = WSSAPI(None, 'Test')
+        wss.put_item(('trades', 'BTCUSD', None), ts=time.time() - 0.5,
+                     exchange_ts=time.time() - 1)
+        wss.put_item(('ticker', 'BTCUSD', None), ts=time.time())
+        monitor = FeedLatencyMonitor('Test')
+        self.assertGreaterEqual(wss.data_q.head_age(), 0)
+        for _ in range(2):
+            monitor.observe(wss.get())
+        self.assertIsNone(wss.data_q.head_age())
+
+        snapshot = monitor.snapshot()
+        self.assertAlmostEqual(snapshot[('trades', 'BTCUSD', 'wire')]['max'],
+                               1000, delta=50)
+        self.assertNotIn(('ticker', 'BTCUSD', 'wire'), snapshot)
+        self.assertEqual(snapshot[('ticker', 'BTCUSD', 'queue')]['count'], 1)
+        self.assertEqual(list(monitor.lagging(0.75)), [('trades', 'BTCUSD')])
+        self.assertEqual(list(monitor.lagging(0.25, 'receive')),
+                         [('trades', 'BTCUSD')])
+        self.assertIn('bitex.feed.Test.trades.BTCUSD.wire.p99:',
+                      monitor.statsd())
+
+    def test_watch_alerts_on_stalled_consumer(self):
+        wss = WSSAPI(None, 'Test')
+        wss.put_item(('trades', 'BTCUSD', None), ts=time.time())
+        alerts = []
+        monitor = FeedLatencyMonitor('Test')
+        monitor.watch(wss.data_q, max_lag=0.05, interval=0.02,
+                      alert=alerts.append)
+        deadline = time.time() + 1
+        while not alerts and time.time() < deadline:
+            time.sleep(0.01)
+        monitor.stop_watching()
+        self.assertIn(('data_q', None), alerts[0])
@@ -0,0 +1,39 @@
+# Import Built-Ins
+import logging
+import sys
+import subprocess
+from unittest import TestCase
+
+# Import Third-Party
+
+# Import Homebrew
+import bitex
+import bitex.interfaces
+from bitex.interfaces.kraken import Kraken
+
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+class LazyImportTest(TestCase):
+    def test_rest_only_import_does_not_load_websocket_clients(self):
+        script = ("import sys, bitex; bitex.Kraken; from bitex import GDAX; "
+                  "print(','.join(m for m in ('autobahn', 'pusherclient', "
+                  "'websocket', 'multiprocessing') if m in sys.modules))")
+        out = subprocess.check_output([sys.executable, '-c', script],
+                                      stderr=subprocess.DEVNULL)
+        self.assertEqual(out.decode().strip(), '')
+
+    def test_attributes_resolve_on_access(self):
+        self.assertIs(bitex.Kraken, Kraken)
+        self.assertIs(bitex.interfaces.Kraken, Kraken)
+        self.assertIn('Poloniex', dir(bitex))
+        with self.assertRaises(AttributeError):
+            bitex.NotAnExchange
+
+    def test_package_exports_all_interfaces(self):
+        self.assertEqual(bitex.__all__, bitex.interfaces.__all__)
+        for name in bitex.__all__:
+            self.assertIs(getattr(bitex, name),
+                          getattr(bitex.interfaces, name))
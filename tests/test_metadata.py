@@ -0,0 +1,88 @@
+# Import Built-Ins
+import logging
+import os
+import json
+import shutil
+import tempfile
+from unittest import TestCase, mock, skipUnless
+
+# Import Third-Party
+
+# Import Homebrew
+from bitex.metadata import MetadataCache, metadata_cache
+from bitex.api.WSS.gdax import GDAXWSS
+from bitex.api.WSS.gemini import GeminiWSS
+from bitex.api.WSS.poloniex import PoloniexWSS
+from bitex.interfaces.quoine import Quoine
+from bitex.api.REST.quoine import jwt_available
+
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+class MetadataCacheTest(TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.cache = MetadataCache(self.path, ttl=60)
+        self.fetch = mock.Mock(return_value=['BTC-USD'])
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def expire(self, key):
+        with open(os.path.join(self.path, key + '.json'), 'r+') as f:
+            entry = json.load(f)
+            entry['ts'] -= 120
+            f.seek(0)
+            f.truncate()
+            json.dump(entry, f)
+
+    def test_fresh_entries_are_not_fetched_again(self):
+        self.assertEqual(self.cache.get('products', self.fetch), ['BTC-USD'])
+        self.assertEqual(MetadataCache(self.path).get('products', self.fetch),
+                         ['BTC-USD'])
+        self.assertEqual(self.fetch.call_count, 1)
+
+        self.expire('products')
+        self.cache.get('products', self.fetch)
+        self.assertEqual(self.fetch.call_count, 2)
+
+    def test_expired_entry_is_used_if_fetching_fails(self):
+        self.cache.store('products', ['BTC-USD'])
+        self.expire('products')
+        self.fetch.side_effect = ConnectionError
+        self.assertEqual(self.cache.get('products', self.fetch), ['BTC-USD'])
+        self.cache.invalidate('products')
+        with self.assertRaises(ConnectionError):
+            self.cache.get('products', self.fetch)
+
+
+class DeferredDiscoveryTest(TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        patcher = mock.patch.object(metadata_cache, 'path', self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.path)
+
+    @mock.patch('requests.get', side_effect=AssertionError("Network I/O"))
+    @mock.patch('requests.Session.request',
+                side_effect=AssertionError("Network I/O"))
+    def test_constructors_and_cached_metadata_need_no_network(self, *_):
+        GDAXWSS(), GeminiWSS(), PoloniexWSS()
+
+        metadata_cache.store('gdax_products', ['BTC-USD'])
+        metadata_cache.store('gemini_symbols', ['btcusd'])
+        metadata_cache.store('poloniex_markets', ['BTC_ETH'])
+        self.assertEqual(GDAXWSS().pairs, ['BTC-USD'])
+        self.assertEqual(GeminiWSS().endpoints, ['marketdata/BTCUSD'])
+        self.assertEqual(PoloniexWSS().endpoints, ['BTC_ETH', 'ticker'])
+
+    @skipUnless(jwt_available, "Quoine requires PyJWT")
+    @mock.patch('requests.Session.request',
+                side_effect=AssertionError("Network I/O"))
+    def test_quoine_looks_up_products_lazily(self, *_):
+        quoine = Quoine()
+        metadata_cache.store('quoine_products', {'BTCUSD': 1})
+        self.assertEqual(quoine.pairs, {'BTCUSD': 1})
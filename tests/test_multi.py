@@ -0,0 +1,74 @@
+# Import Built-Ins
+import logging
+import time
+import asyncio
+from unittest import TestCase
+
+# Import Third-Party
+
+# Import Homebrew
+from bitex.multi import fetch, afetch, PerExchange, _name_interfaces
+
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+class FakeResponse:
+    def __init__(self, formatted):
+        self.formatted = formatted
+
+
+class FakeInterface:
+    def __init__(self, delay):
+        self.delay = delay
+
+    def ticker(self, pair):
+        if pair is None:
+            raise ValueError("No pair given!")
+        time.sleep(self.delay)
+        return FakeResponse(pair)
+
+
+class AsyncFakeInterface(FakeInterface):
+    async def ticker(self, pair):
+        await asyncio.sleep(self.delay)
+        return FakeResponse(pair)
+
+
+class FetchTest(TestCase):
+    def test_fetch_runs_concurrently_and_returns_partial_results(self):
+        exchanges = {'fast': FakeInterface(0.1), 'slow': FakeInterface(0.1),
+                     'late': FakeInterface(2), 'broken': FakeInterface(0)}
+        pairs = PerExchange(fast='BTCUSD', slow='btcusd', late='XBTUSD',
+                            broken=None)
+        start = time.time()
+        result = fetch(exchanges, 'ticker', pairs, deadline=0.5)
+        self.assertLess(time.time() - start, 1)
+        self.assertEqual(result, {'fast': 'BTCUSD', 'slow': 'btcusd'})
+        self.assertEqual(result.timed_out, {'late'})
+        self.assertIsInstance(result.errors['broken'], ValueError)
+
+    def test_afetch_runs_concurrently_and_returns_partial_results(self):
+        exchanges = {'a': AsyncFakeInterface(0.1),
+                     'b': AsyncFakeInterface(0.1),
+                     'c': AsyncFakeInterface(2)}
+        start = time.time()
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        result = loop.run_until_complete(
+            afetch(exchanges, 'ticker', 'BTCUSD', deadline=0.5))
+        self.assertLess(time.time() - start, 1)
+        self.assertEqual(result, {'a': 'BTCUSD', 'b': 'BTCUSD'})
+        self.assertEqual(result.timed_out, {'c'})
+
+    def test_interfaces_of_the_same_class_are_numbered(self):
+        a, b, c = FakeInterface(0), FakeInterface(0), AsyncFakeInterface(0)
+        self.assertEqual(_name_interfaces([a, b, c]),
+                         {'FakeInterface': a, 'FakeInterface#2': b,
+                          'AsyncFakeInterface': c})
+        pairs = PerExchange(FakeInterface='BTCUSD',
+                            **{'FakeInterface#2': 'XBTUSD'})
+        self.assertEqual(fetch([a, b], 'ticker', pairs),
+                         {'FakeInterface': 'BTCUSD',
+                          'FakeInterface#2': 'XBTUSD'})
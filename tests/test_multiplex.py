@@ -0,0 +1,117 @@
+# Import Built-Ins
+import logging
+import time
+import base64
+import hashlib
+import socketserver
+import threading
+from unittest import TestCase
+
+# Import Third-Party
+
+# Import Homebrew
+from bitex.api.WSS.multiplex import WebsocketMultiplexer
+
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+class FeedHandler(socketserver.StreamRequestHandler):
+    """
+    Minimal websocket server, sending `server.messages` text frames to each
+    client and closing the connection if `server.close_after` is set.
+    """
+    GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+    def handle(self):
+        headers = {}
+        for line in iter(self.rfile.readline, b'\r\n'):
+            key, _, value = line.decode().partition(':')
+            headers[key.strip().lower()] = value.strip()
+        accept = base64.b64encode(hashlib.sha1(
+            (headers['sec-websocket-key'] + self.GUID).encode()).digest())
+        self.wfile.write(b'HTTP/1.1 101 Switching Protocols\r\n'
+                         b'Upgrade: websocket\r\nConnection: Upgrade\r\n'
+                         b'Sec-WebSocket-Accept: ' + accept + b'\r\n\r\n')
+        self.server.connections += 1
+        for msg in self.server.messages:
+            payload = msg.encode()
+            self.wfile.write(bytes([0x81, len(payload)]) + payload)
+        if self.server.close_after:
+            return
+        self.server.stopped.wait(5)
+
+
+class FeedServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, messages, close_after=False):
+        super(FeedServer, self).__init__(('127.0.0.1', 0), FeedHandler)
+        self.messages = messages
+        self.close_after = close_after
+        self.connections = 0
+        self.stopped = threading.Event()
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def url(self):
+        return 'ws://127.0.0.1:%s/' % self.server_address[1]
+
+    def stop(self):
+        self.stopped.set()
+        self.shutdown()
+        self.server_close()
+
+
+class WebsocketMultiplexerTest(TestCase):
+    def setUp(self):
+        self.received = []
+        self.mux = WebsocketMultiplexer(
+            lambda name, msg: self.received.append(
+                (name, msg, threading.current_thread().name)),
+            backoff=(0.05, 0.1))
+        self.servers = []
+
+    def tearDown(self):
+        self.mux.stop()
+        for server in self.servers:
+            server.stop()
+
+    def serve(self, *args, **kwargs):
+        server = FeedServer(*args, **kwargs)
+        self.servers.append(server)
+        return server
+
+    def wait_for(self, condition, timeout=5):
+        end = time.time() + timeout
+        while not condition() and time.time() < end:
+            time.sleep(0.01)
+        return condition()
+
+    def test_all_endpoints_are_served_by_one_thread(self):
+        for i in range(5):
+            server = self.serve(['%s-%s' % (i, n) for n in range(20)])
+            self.mux.add('endpoint%s' % i, server.url)
+        self.mux.start()
+        self.assertTrue(self.wait_for(lambda: len(self.received) == 100))
+        self.assertEqual({name for _, _, name in self.received},
+                         {'Multiplexer Loop Thread'})
+        self.assertEqual([msg for name, msg, _ in self.received
+                          if name == 'endpoint3'],
+                         ['3-%s' % n for n in range(20)])
+
+        start = time.time()
+        self.mux.stop()
+        self.assertLess(time.time() - start, 0.1)
+        self.assertFalse(self.mux._thread.is_alive())
+
+    def test_dropped_endpoint_reconnects(self):
+        dropping = self.serve(['a'], close_after=True)
+        stable = self.serve(['b'])
+        self.mux.add('dropping', dropping.url)
+        self.mux.add('stable', stable.url)
+        self.mux.start()
+        self.assertTrue(self.wait_for(lambda: dropping.connections >= 3))
+        self.assertEqual(stable.connections, 1)
@@ -0,0 +1,155 @@
+# Import Built-Ins
+import logging
+import threading
+from unittest import TestCase, mock
+
+# Import Third-Party
+
+# Import Homebrew
+from bitex.api.WSS.orderbook import PriceLevelBook, OrderLevelBook
+from bitex.api.WSS.bitfinex import BitfinexWSS
+from bitex.api.WSS.gdax import GDAXWSS
+
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+class PriceLevelBookTest(TestCase):
+    def test_levels_are_sorted_and_removed(self):
+        book = PriceLevelBook()
+        book.reset(bids=[(99, 1), (100, 2)], asks=[(102, 1), (101, 3)])
+        book.update([('bids', 100.5, 4), ('asks', 101, 0)])
+        self.assertEqual(book.best_bid(), (100.5, 4))
+        self.assertEqual(book.best_ask(), (102, 1))
+        self.assertEqual(book.top(2), {'bids': [(100.5, 4), (100, 2)],
+                                       'asks': [(102, 1)], 'ts': None})
+        self.assertEqual(book.depth_at(99), 1)
+        self.assertEqual(book.depth_at(101), 0)
+        self.assertEqual(len(book.snapshot()['bids']), 3)
+
+    def test_orders_are_aggregated_by_price(self):
+        book = OrderLevelBook()
+        book.reset_orders([(1, 'bids', 100, 1), (2, 'bids', 100, 2),
+                           (3, 'asks', 101, 1)])
+        self.assertEqual(book.best_bid(), (100, 3))
+        book.set_order(2, 'bids', 99, 2)
+        book.remove_order(3)
+        self.assertEqual(book.top(), {'bids': [(100, 1), (99, 2)],
+                                      'asks': [], 'ts': None})
+
+
+class BitfinexBookTest(TestCase):
+    def setUp(self):
+        self.wss = BitfinexWSS(pairs=['BTCUSD'])
+        self.wss.channel_labels = {1: ('book', {'pair': 'BTCUSD'}),
+                                   2: ('raw_book', {'pair': 'BTCUSD'})}
+
+    def test_book_applies_snapshot_and_deltas(self):
+        self.wss._handle_book(1, 1, [[['100', 2, '1.5'], ['101', 1, '-2']]])
+        self.wss._handle_book(2, 1, [['100.5', 1, '0.5']])
+        self.wss._handle_book(3, 1, [['101', 0, '-1']])
+        book = self.wss.books['BTCUSD']
+        self.assertEqual(book.top(), {'bids': [(100.5, 0.5), (100, 1.5)],
+                                      'asks': [], 'ts': 3})
+        self.assertEqual(self.wss.data_q.qsize(), 3)
+
+    def test_raw_book_applies_snapshot_and_deltas(self):
+        self.wss._handle_raw_book(1, 2, [[[11, '100', '1'], [12, '101', '-2'],
+                                          [13, '100', '0.5']]])
+        self.wss._handle_raw_book(2, 2, [[11, '0', '1']])
+        book = self.wss.raw_books['BTCUSD']
+        self.assertEqual(book.best_bid(), (100, 0.5))
+        self.assertEqual(book.best_ask(), (101, 2))
+
+
+class GDAXBookTest(TestCase):
+    def setUp(self):
+        self.wss = GDAXWSS(pairs=['BTC-USD'])
+        self.wss._rest = mock.Mock()
+        self.wss.rest.order_book.return_value.json.return_value = {
+            'sequence': 20, 'bids': [['99', '5', 1]], 'asks': [['105', '1', 2]]}
+
+    def test_book_applies_snapshot_and_l2updates(self):
+        self.wss.handle_message({'type': 'snapshot', 'product_id': 'BTC-USD',
+                                 'bids': [['100', '1']],
+                                 'asks': [['101', '2'], ['102', '1']]}, 1)
+        self.wss.handle_message({'type': 'l2update', 'product_id': 'BTC-USD',
+                                 'changes': [['sell', '101', '0'],
+                                             ['buy', '100.5', '3']]}, 2)
+        self.assertEqual(self.wss.best_bid_ask('BTC-USD'),
+                         ((100.5, 3), (102, 1)))
+        self.assertEqual(self.wss.top('BTC-USD', 1)['bids'], [(100.5, 3)])
+
+    def test_sequence_gap_triggers_resnapshot(self):
+        msg = {'type': 'open', 'product_id': 'BTC-USD'}
+        self.assertTrue(self.wss.handle_message(dict(msg, sequence=10), 1))
+        self.assertTrue(self.wss.handle_message(dict(msg, sequence=11), 2))
+        self.assertFalse(self.wss.handle_message(dict(msg, sequence=11), 3))
+        self.assertFalse(self.wss.rest.order_book.called)
+
+        self.wss.handle_message(dict(msg, sequence=15), 4)
+        self.wss._snapshot_threads['BTC-USD'].join()
+        self.wss.rest.order_book.assert_called_once_with('BTC-USD', level=2)
+        self.assertEqual(self.wss.best_bid_ask('BTC-USD'), ((99, 5), (105, 1)))
+        # Messages already contained in the snapshot are dropped
+        self.assertFalse(self.wss.handle_message(dict(msg, sequence=18), 5))
+        self.assertTrue(self.wss.handle_message(dict(msg, sequence=21), 6))
+
+    def test_l2updates_are_buffered_until_snapshot_is_applied(self):
+        fetched = threading.Event()
+        response = self.wss.rest.order_book.return_value
+        self.wss.rest.order_book.side_effect = (
+            lambda *args, **kwargs: fetched.wait(5) and response)
+
+        def l2update(price, size):
+            return {'type': 'l2update', 'product_id': 'BTC-USD',
+                    'changes': [['buy', price, size]]}
+
+        msg = {'type': 'open', 'product_id': 'BTC-USD'}
+        self.wss.handle_message({'type': 'snapshot', 'product_id': 'BTC-USD',
+                                 'bids': [['100', '1']], 'asks': []}, 1)
+        self.wss.handle_message(dict(msg, sequence=10), 2)
+        self.wss.handle_message(dict(msg, sequence=15), 3)  # Gap
+        # Received before sequence 20, so contained in the snapshot
+        self.wss.handle_message(l2update('98', '1'), 4)
+        self.wss.handle_message(dict(msg, sequence=21), 5)
+        self.wss.handle_message(l2update('99', '0'), 6)
+        self.wss.handle_message(l2update('99.5', '2'), 7)
+        # Nothing is applied to the stale book meanwhile
+        self.assertEqual(self.wss.best_bid_ask('BTC-USD'), ((100, 1), None))
+
+        fetched.set()
+        self.wss._snapshot_threads['BTC-USD'].join()
+        self.assertEqual(self.wss.top('BTC-USD')['bids'], [(99.5, 2)])
+        self.wss.handle_message(l2update('99.6', '1'), 8)
+        self.assertEqual(self.wss.best_bid_ask('BTC-USD')[0], (99.6, 1))
+
+    def test_stale_snapshots_are_discarded(self):
+        fetched = threading.Event()
+        response = self.wss.rest.order_book.return_value
+        self.wss.rest.order_book.side_effect = (
+            lambda *args, **kwargs: fetched.wait(5) and response)
+        msg = {'type': 'open', 'product_id': 'BTC-USD'}
+        self.wss.handle_message(dict(msg, sequence=10), 1)
+        self.wss.handle_message(dict(msg, sequence=15), 2)  # Gap
+
+        # Reconnect while the snapshot (at sequence 20) is being queried
+        self.wss._reset_sequences()
+        self.wss.handle_message(dict(msg, sequence=30), 3)
+        self.wss.handle_message({'type': 'snapshot', 'product_id': 'BTC-USD',
+                                 'bids': [['100', '1']], 'asks': []}, 4)
+        self.wss.handle_message({'type': 'l2update', 'product_id': 'BTC-USD',
+                                 'changes': [['buy', '100.5', '2']]}, 5)
+        fetched.set()
+        self.wss._snapshot_threads['BTC-USD'].join()
+        self.assertEqual(self.wss.top('BTC-USD')['bids'],
+                         [(100.5, 2), (100, 1)])
+        self.assertEqual(self.wss.sequences, {'BTC-USD': 30})
+
+        # Snapshots older than the book are discarded as well
+        self.assertFalse(self.wss._apply_snapshot(
+            'BTC-USD', {'sequence': 25, 'bids': [], 'asks': []}, 6))
+        self.assertTrue(self.wss._apply_snapshot(
+            'BTC-USD', {'sequence': 31, 'bids': [['99', '1']], 'asks': []}, 7))
+        self.assertEqual(self.wss.top('BTC-USD')['bids'], [(99, 1)])
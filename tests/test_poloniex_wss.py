@@ -0,0 +1,88 @@
+# Import Built-Ins
+import logging
+import asyncio
+import queue
+import os
+import tempfile
+import multiprocessing as mp
+from unittest import TestCase, mock
+
+# Import Third-Party
+from autobahn.wamp.types import ComponentConfig
+
+# Import Homebrew
+from bitex.api.WSS.poloniex import PoloniexWSS, PoloniexSession
+from bitex.api.WSS.capture import CaptureWriter, Replayer
+
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+class PoloniexWSSTest(TestCase):
+    def test_shards_distribute_channels_round_robin(self):
+        channels = ['BTC_ETH', 'BTC_XMR', 'BTC_LTC', 'BTC_ZEC', 'ticker']
+        wss = PoloniexWSS(endpoints=channels, shards=2)
+        wss.create_connections()
+        self.assertEqual(
+            {name: conn.channels for name, conn in wss.connections.items()},
+            {'shard-0': ['BTC_ETH', 'BTC_LTC', 'ticker'],
+             'shard-1': ['BTC_XMR', 'BTC_ZEC']})
+
+    def test_default_mode_uses_one_process_per_channel(self):
+        wss = PoloniexWSS(endpoints=['BTC_ETH', 'ticker'])
+        wss.create_connections()
+        self.assertEqual(sorted(wss.connections), ['BTC_ETH', 'ticker'])
+
+    def test_session_subscribes_to_all_channels(self):
+        q = queue.Queue()
+        is_killed = mp.Event()
+        session = PoloniexSession(ComponentConfig(
+            'realm1', extra={'channels': ['BTC_ETH', 'ticker'], 'queue': q,
+                             'is_killed': is_killed}))
+        session.subscribe = mock.AsyncMock()
+        session.leave = mock.Mock()
+
+        async def join():
+            await session.onJoin()
+            is_killed.set()
+            await asyncio.sleep(0.3)
+
+        asyncio.run(join())
+        subscribed = {c[0][1]: c[0][0] for c in session.subscribe.call_args_list}
+        self.assertEqual(sorted(subscribed), ['BTC_ETH', 'ticker'])
+        subscribed['ticker']('data')
+        self.assertEqual(q.get_nowait()[0], 'ticker')
+        session.leave.assert_called_once_with()
+
+    def test_events_are_forwarded_to_a_bounded_data_q(self):
+        wss = PoloniexWSS(endpoints=['ticker'], maxsize=2,
+                          policy='drop_oldest')
+        for i in range(3):
+            wss._events_q.put(('ticker', ([['BTC_ETH', str(i)]], {}, i)))
+        wss._events_q.put(None)
+        wss._forward()
+        items = [wss.data_q.get_nowait() for _ in range(wss.data_q.qsize())]
+        self.assertEqual(items, [('ticker', ([['BTC_ETH', '1']], {}, 1)),
+                                 ('ticker', ([['BTC_ETH', '2']], {}, 2))])
+        self.assertEqual(items[0].recv_ts, 1)
+        self.assertEqual(wss.data_q.dropped['ticker'], 1)
+
+    def test_unsupported_options_raise(self):
+        self.assertRaises(ValueError, PoloniexWSS, policy='conflate')
+        self.assertRaises(ValueError, PoloniexWSS, raw_frames=True)
+
+    def test_events_are_captured_and_replayed(self):
+        with tempfile.TemporaryDirectory() as path:
+            path = os.path.join(path, 'capture')
+            wss = PoloniexWSS(capture=CaptureWriter(path))
+            wss._events_q.put(('BTC_ETH', ([{'type': 'newTrade'}], {'seq': 1},
+                                           10.5)))
+            wss._events_q.put(None)
+            wss._forward()
+            wss.capture.close()
+            replay = PoloniexWSS()
+            Replayer(path, replay).run()
+            recorded, replayed = wss.data_q.get_nowait(), replay.data_q.get_nowait()
+            self.assertEqual(recorded, replayed)
+            self.assertEqual(replayed.recv_ts, 10.5)
@@ -0,0 +1,63 @@
+# Import Built-Ins
+import logging
+import time
+from unittest import TestCase
+
+# Import Third-Party
+
+# Import Homebrew
+from bitex.api.REST.ratelimit import TokenBucket, RateLimiter
+from bitex.api.REST.ratelimit import RateLimitExceeded
+from bitex.api.REST import KrakenREST, ratelimit
+
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+class TokenBucketTest(TestCase):
+    def test_bucket_allows_burst_up_to_capacity(self):
+        bucket = TokenBucket(rate=1, capacity=3)
+        self.assertTrue(all(bucket.acquire(blocking=False) for _ in range(3)))
+        self.assertFalse(bucket.acquire(blocking=False))
+        self.assertEqual(bucket.stats()['rejected'], 1)
+
+    def test_blocking_acquire_waits_for_refill(self):
+        bucket = TokenBucket(rate=20, capacity=1)
+        start = time.time()
+        for _ in range(3):
+            bucket.acquire()
+        self.assertGreaterEqual(time.time() - start, 0.09)
+        self.assertGreater(bucket.stats()['wait_total'], 0.09)
+
+    def test_acquire_respects_timeout(self):
+        bucket = TokenBucket(rate=1, capacity=1)
+        bucket.acquire()
+        self.assertFalse(bucket.acquire(timeout=0.1))
+
+
+class RateLimiterTest(TestCase):
+    def test_unknown_hosts_are_not_limited(self):
+        limiter = RateLimiter(limits={})
+        self.assertIsNone(limiter.bucket('localhost', 'public'))
+        self.assertTrue(limiter.acquire('localhost', 'public', blocking=False))
+
+    def test_public_and_private_buckets_are_separate(self):
+        limiter = RateLimiter(limits={'api.kraken.com': {'public': (1, 1),
+                                                         'private': (1, 1)}})
+        self.assertTrue(limiter.acquire('api.kraken.com', 'public'))
+        self.assertTrue(limiter.acquire('api.kraken.com', 'private'))
+        self.assertFalse(limiter.acquire('api.kraken.com', 'public',
+                                         blocking=False))
+
+    def test_client_raises_if_non_blocking_and_exhausted(self):
+        limiter = RateLimiter(limits={'api.kraken.com': {'public': (1, 1)}})
+        api = KrakenREST(rate_limit=limiter, rate_limit_blocking=False)
+        api.throttle()
+        self.assertRaises(RateLimitExceeded, api.throttle)
+        api.throttle(authenticate=True)
+
+    def test_clients_are_not_rate_limited_by_default(self):
+        self.assertIsNone(KrakenREST().rate_limiter)
+        self.assertIs(KrakenREST(rate_limit=True).rate_limiter,
+                      ratelimit.limiter)
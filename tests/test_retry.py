@@ -0,0 +1,112 @@
+# Import Built-Ins
+import logging
+from datetime import timedelta
+from unittest import TestCase, mock
+
+# Import Third-Party
+import requests
+
+# Import Homebrew
+from bitex.api.REST.retry import RetryPolicy, retry_after
+from bitex.api.REST import KrakenREST, GDAXRest
+from bitex.interfaces import Bittrex
+
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+def response(status, headers=None):
+    return mock.Mock(status_code=status, headers=headers or {},
+                     elapsed=timedelta(0))
+
+
+class RetryPolicyTest(TestCase):
+    def test_backoff_grows_and_is_capped(self):
+        policy = RetryPolicy(backoff=1, max_backoff=5, jitter=False)
+        self.assertEqual([policy.delay(n) for n in range(1, 5)], [1, 2, 4, 5])
+        policy = RetryPolicy(backoff=1, max_backoff=5)
+        self.assertTrue(all(0 <= policy.delay(3) <= 4 for _ in range(100)))
+
+    def test_retry_after_header(self):
+        self.assertEqual(retry_after(response(429, {'Retry-After': '3'})), 3)
+        self.assertEqual(retry_after(response(429, {'Retry-After':
+            'Wed, 21 Oct 2015 07:28:00 GMT'})), 0)
+        self.assertIsNone(retry_after(response(429)))
+
+    def test_only_idempotent_queries_are_retryable(self):
+        policy = RetryPolicy()
+        self.assertTrue(policy.retryable('GET', {}))
+        self.assertFalse(policy.retryable('POST', {'params': {'size': 1}}))
+        self.assertTrue(policy.retryable('POST', {'params': {'client_oid':
+                                                             'abc'}}))
+        self.assertTrue(policy.retryable('POST', {'headers': {
+            'Idempotency-Key': 'abc'}}))
+        self.assertFalse(RetryPolicy(attempts=1).retryable('GET', {}))
+        self.assertFalse(policy.retryable('GET', {}, authenticate=True))
+        self.assertTrue(policy.retryable('GET', {'params': {'client_oid':
+                                                            'abc'}},
+                                         authenticate=True))
+
+    def test_attempts_respect_count_and_deadline(self):
+        attempts = RetryPolicy(attempts=3, jitter=False,
+                               backoff=0.01).start()
+        self.assertEqual(attempts.next_delay(response(503)), 0.01)
+        self.assertIsNone(attempts.next_delay(response(400)))
+        self.assertEqual(attempts.next_delay(), 0.02)
+        self.assertIsNone(attempts.next_delay())
+
+        attempts = RetryPolicy(deadline=1).start()
+        self.assertLessEqual(attempts.timeout(5), 1)
+        self.assertIsNone(attempts.next_delay(response(429, {'Retry-After':
+                                                             '2'})))
+
+
+class ClientRetryTest(TestCase):
+    def setUp(self):
+        self.policy = RetryPolicy(attempts=3, backoff=0.001)
+
+    def test_public_query_is_retried(self):
+        api = KrakenREST(rate_limit=False, retry=self.policy)
+        ok = response(200)
+        with mock.patch.object(api, 'api_request', side_effect=[
+                response(502), requests.Timeout(), ok]) as request:
+            self.assertIs(api.query('GET', 'public/Ticker'), ok)
+        self.assertEqual(request.call_count, 3)
+
+        with mock.patch.object(api, 'api_request',
+                               return_value=response(503)) as request:
+            self.assertEqual(api.query('GET', 'public/Ticker').status_code,
+                             503)
+        self.assertEqual(request.call_count, 3)
+
+    def test_orders_need_idempotency_key(self):
+        api = GDAXRest(key='key', secret='c2VjcmV0', passphrase='pass',
+                       rate_limit=False, retry=self.policy)
+        with mock.patch.object(api, 'api_request',
+                               side_effect=requests.ConnectionError()) as r:
+            self.assertRaises(requests.ConnectionError, api.query, 'POST',
+                              'orders', authenticate=True,
+                              params={'size': 1})
+            self.assertEqual(r.call_count, 1)
+            r.reset_mock()
+            self.assertRaises(requests.ConnectionError, api.query, 'POST',
+                              'orders', authenticate=True,
+                              params={'size': 1, 'client_oid': 'abc'})
+            self.assertEqual(r.call_count, 3)
+
+    def test_private_get_orders_are_sent_once(self):
+        api = Bittrex(key='key', secret='secret', rate_limit=False,
+                      retry=self.policy)
+        with mock.patch.object(api, 'api_request',
+                               return_value=response(503)) as request:
+            self.assertEqual(api.bid('BTC-LTC', 0.01, 1).status_code, 503)
+        self.assertEqual(request.call_count, 1)
+        self.assertIn('market/buylimit', request.call_args[0][1])
+
+    def test_retries_can_be_disabled(self):
+        api = KrakenREST(rate_limit=False, retry=False)
+        with mock.patch.object(api, 'api_request',
+                               return_value=response(503)) as request:
+            api.query('GET', 'public/Ticker')
+        self.assertEqual(request.call_count, 1)
@@ -0,0 +1,57 @@
+# Import Built-Ins
+import logging
+import threading
+import time
+from unittest import TestCase
+
+# Import Third-Party
+
+# Import Homebrew
+from bitex.api.WSS.ringbuffer import RingBuffer
+from bitex.api.WSS.bitfinex import BitfinexWSS
+
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+class RingBufferTest(TestCase):
+    def test_items_are_drained_in_order_up_to_capacity(self):
+        ring = RingBuffer(capacity=3)
+        self.assertEqual(ring.capacity, 4)
+        self.assertTrue(all(ring.put(i) for i in range(4)))
+        self.assertFalse(ring.put(4))
+        self.assertEqual(ring.drain(3), [0, 1, 2])
+        self.assertTrue(ring.put(4))
+        self.assertEqual(ring.drain(), [3, 4])
+        self.assertEqual(ring.drain(timeout=0.01), [])
+
+    def test_drain_wakes_up_on_put(self):
+        ring = RingBuffer()
+        threading.Timer(0.05, ring.put, args=('msg',)).start()
+        start = time.time()
+        self.assertEqual(ring.drain(timeout=5), ['msg'])
+        self.assertLess(time.time() - start, 1)
+
+    def test_all_items_are_handed_over_between_threads(self):
+        ring = RingBuffer(capacity=64)
+        n = 20000
+
+        def produce():
+            for i in range(n):
+                while not ring.put(i):
+                    time.sleep(0)
+
+        threading.Thread(target=produce, daemon=True).start()
+        received = []
+        end = time.time() + 10
+        while len(received) < n and time.time() < end:
+            received.extend(ring.drain(100, timeout=0.1))
+        self.assertEqual(received, list(range(n)))
+
+    def test_bitfinex_ring_transport_batches_messages(self):
+        wss = BitfinexWSS(transport='ring', batch_size=2)
+        for i in range(3):
+            wss._hand_off((i, ['msg']))
+        self.assertEqual(len(wss._next_messages()), 2)
+        self.assertEqual(len(wss._next_messages()), 1)
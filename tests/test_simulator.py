@@ -0,0 +1,230 @@
+# Import Built-Ins
+import logging
+import json
+import time
+from unittest import TestCase, skipUnless
+
+# Import Third-Party
+from websocket import create_connection, WebSocketTimeoutException
+
+# Import Homebrew
+from bitex.simulator import Market, RESTSimulator, WSSSimulator
+from bitex.interfaces import Bitfinex, Bittrex, Gemini, HitBtc, Kraken, OKCoin
+from bitex.interfaces import Poloniex, Bter, CCEX, Coincheck, Cryptopia
+from bitex.interfaces import QuadrigaCX, RockTradingLtd, Vaultoro, Yunbi
+from bitex.api.REST.bitstamp import BitstampREST
+from bitex.api.REST.gdax import GDAXRest
+from bitex.api.REST.itbit import ItbitREST
+from bitex.api.REST.retry import RetryPolicy
+from bitex.api.WSS.bitfinex import BitfinexWSS
+from bitex.api.WSS.gdax import GDAXWSS
+from bitex.formatters.arrays import numpy_available
+
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+class MarketTest(TestCase):
+    def test_seeded_markets_are_reproducible(self):
+        a, b = Market(seed=7), Market(seed=7)
+        self.assertEqual([a.step('BTCUSD') for _ in range(50)],
+                         [b.step('XXBTZUSD', 'Kraken') for _ in range(50)])
+        book = a.book('BTCUSD')
+        self.assertLess(book['bids'][0][0], book['asks'][0][0])
+        self.assertEqual(book['bids'], sorted(book['bids'], reverse=True))
+
+
+class RESTSimulatorTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.sim = RESTSimulator(market=Market(seed=1))
+        cls.sim.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.sim.stop()
+
+    def client(self, cls, venue, secret=None, **kwargs):
+        return cls(url=self.sim.url(venue), key=self.sim.credentials.key,
+                   secret=secret or self.sim.credentials.secret,
+                   rate_limit=False, timings=False, **kwargs)
+
+    def test_public_endpoints_match_formatters(self):
+        queries = [(Kraken, 'Kraken', 'order_book', 'XBTUSD'),
+                   (Bitfinex, 'Bitfinex', 'ticker', 'btcusd'),
+                   (Gemini, 'Gemini', 'order_book', 'btcusd'),
+                   (Poloniex, 'Poloniex', 'ticker', 'USDT_BTC'),
+                   (Bittrex, 'Bittrex', 'order_book', 'USDT-BTC'),
+                   (OKCoin, 'OKCoin', 'ticker', 'btc_usd')]
+        for cls, venue, method, pair in queries:
+            with self.subTest(venue=venue):
+                r = getattr(self.client(cls, venue), method)(pair)
+                self.assertEqual(r.status_code, 200)
+                self.assertIsNotNone(r.formatted)
+                if method == 'ticker':
+                    bid, ask = map(float, r.formatted[:2])
+                else:
+                    bid, ask = (float(r.formatted[side][0][1])
+                                for side in ('bids', 'asks'))
+                self.assertLess(bid, ask)
+
+    def test_remaining_venues_serve_market_data(self):
+        queries = [(Bter, 'Bter', 'btc_usd'), (CCEX, 'CCEX', 'btc-usd'),
+                   (Coincheck, 'Coincheck', 'btc_jpy'),
+                   (Cryptopia, 'Cryptopia', 'BTC_USDT'),
+                   (QuadrigaCX, 'QuadrigaCX', 'btc_cad'),
+                   (RockTradingLtd, 'RockTradingLtd', 'BTCEUR'),
+                   (Vaultoro, 'Vaultoro', 'GLDBTC'),
+                   (Yunbi, 'Yunbi', 'btccny')]
+        for cls, venue, pair in queries:
+            with self.subTest(venue=venue):
+                client = self.client(cls, venue)
+                for method in ('order_book', 'trades'):
+                    r = getattr(client, method)(pair)
+                    self.assertEqual(r.status_code, 200)
+                    self.assertTrue(r.json())
+        bid, ask = map(float, self.client(Coincheck, 'Coincheck').ticker(
+            'btc_jpy').formatted[:2])
+        self.assertLess(bid, ask)
+
+    @skipUnless(numpy_available, "numpy not installed")
+    def test_order_books_of_all_venues_convert_to_arrays(self):
+        queries = [(Kraken, 'Kraken', 'XBTUSD'),
+                   (Bitfinex, 'Bitfinex', 'btcusd'),
+                   (Gemini, 'Gemini', 'btcusd'),
+                   (Poloniex, 'Poloniex', 'USDT_BTC'),
+                   (Bittrex, 'Bittrex', 'USDT-BTC'),
+                   (HitBtc, 'HitBtc', 'BTCUSD'),
+                   (OKCoin, 'OKCoin', 'btc_usd'),
+                   (Bter, 'Bter', 'btc_usd'),
+                   (CCEX, 'CCEX', 'btc-usd'),
+                   (Coincheck, 'Coincheck', 'btc_jpy'),
+                   (Cryptopia, 'Cryptopia', 'BTC_USDT'),
+                   (QuadrigaCX, 'QuadrigaCX', 'btc_cad'),
+                   (RockTradingLtd, 'RockTradingLtd', 'BTCEUR'),
+                   (Vaultoro, 'Vaultoro', 'GLDBTC'),
+                   (Yunbi, 'Yunbi', 'btccny')]
+        for cls, venue, pair in queries:
+            with self.subTest(venue=venue):
+                book = self.client(cls, venue).order_book(
+                    pair, arrays=True).formatted
+                self.assertIsNotNone(book)
+                bids, asks = book['bids']['price'], book['asks']['price']
+                self.assertTrue(len(bids) and len(asks))
+                self.assertLess(bids[0], asks[0])
+                self.assertEqual(bids.tolist(), sorted(bids, reverse=True))
+                self.assertEqual(asks.tolist(), sorted(asks))
+
+    def test_one_sided_bittrex_order_books(self):
+        for cls, venue, pair in ((Bittrex, 'Bittrex', 'USDT-BTC'),
+                                 (CCEX, 'CCEX', 'btc-usd')):
+            client = self.client(cls, venue)
+            both = client.order_book(pair).formatted
+            with self.subTest(venue=venue):
+                self.assertEqual(client.order_book(pair, 'sell').formatted,
+                                 {'bids': [], 'asks': both['asks']})
+                kwarg = 'side' if cls is Bittrex else 'type'
+                self.assertEqual(
+                    client.order_book(pair, **{kwarg: 'buy'}).formatted,
+                    {'bids': both['bids'], 'asks': []})
+
+    def test_signatures_are_verified(self):
+        creds = self.sim.credentials
+        queries = [
+            (Kraken, 'Kraken', {}, lambda c: c.balance()),
+            (Bitfinex, 'Bitfinex', {}, lambda c: c.balance()),
+            (Gemini, 'Gemini', {}, lambda c: c.balance()),
+            (Poloniex, 'Poloniex', {}, lambda c: c.balance()),
+            (Bittrex, 'Bittrex', {}, lambda c: c.balance()),
+            (HitBtc, 'HitBtc', {}, lambda c: c.balance()),
+            (OKCoin, 'OKCoin', {}, lambda c: c.balance()),
+            (Coincheck, 'Coincheck', {}, lambda c: c.balance()),
+            (Cryptopia, 'Cryptopia', {}, lambda c: c.balance()),
+            (RockTradingLtd, 'RockTradingLtd', {}, lambda c: c.balance()),
+            (Vaultoro, 'Vaultoro', {}, lambda c: c.balance()),
+            (GDAXRest, 'GDAX', {'passphrase': creds.passphrase},
+             lambda c: c.query('GET', 'accounts', authenticate=True)),
+            (ItbitREST, 'ItBit', {},
+             lambda c: c.query('GET', 'wallets', authenticate=True)),
+            (BitstampREST, 'Bitstamp', {'user_id': creds.user_id},
+             lambda c: c.query('POST', 'v2/balance/', authenticate=True))]
+        for cls, venue, kwargs, query in queries:
+            venue_sim = self.sim.venues[venue.lower()]
+            with self.subTest(venue=venue):
+                accepted = query(self.client(cls, venue, **kwargs))
+                self.assertEqual(accepted.status_code, 200)
+                self.assertNotEqual(accepted.json(), venue_sim.rejected()[1])
+
+                rejected = query(self.client(cls, venue, secret='d3Jvbmc=',
+                                             **kwargs))
+                self.assertEqual((rejected.status_code, rejected.json()),
+                                 venue_sim.rejected())
+
+    def test_injected_failures_are_retried(self):
+        kraken = self.client(Kraken, 'Kraken',
+                             retry=RetryPolicy(backoff=0.01, jitter=False))
+        self.sim.fail_next(503, headers={'Retry-After': '0'})
+        r = kraken.order_book('XBTUSD')
+        self.assertEqual(r.status_code, 200)
+        self.assertIn('bids', r.formatted)
+
+
+class WSSSimulatorTest(TestCase):
+    def setUp(self):
+        self.market = Market(seed=2)
+        self.sim = WSSSimulator(market=self.market, rate=2000)
+        self.sim.start()
+        self.addCleanup(self.sim.stop)
+
+    def test_bitfinex_client_maintains_books(self):
+        wss = BitfinexWSS(pairs=['BTCUSD'])
+        wss.addr = self.sim.url('Bitfinex')
+        wss.start()
+        self.addCleanup(wss.stop)
+        channels = set()
+
+        def all_channels():
+            while not wss.data_q.empty():
+                channels.add(wss.data_q.get()[0])
+            return len(channels) == 5
+
+        self.assertTrue(wait_for(all_channels))
+        self.assertIn('BTCUSD', wss.raw_books)
+        book = wss.books['BTCUSD']
+        self.assertLess(book.best_bid()[0], book.best_ask()[0])
+
+    def test_gdax_client_follows_sequences(self):
+        wss = GDAXWSS(pairs=['BTC-USD', 'ETH-USD'])
+        wss.addr = self.sim.url('GDAX')
+        wss.start()
+        self.addCleanup(wss.stop)
+        self.assertTrue(wait_for(lambda: len(wss.sequences) == 2 and
+                                 min(wss.sequences.values()) > 10))
+        bid, ask = wss.best_bid_ask('ETH-USD')
+        self.assertLess(bid[0], ask[0])
+        self.assertEqual(set(wss.books), {'BTC-USD', 'ETH-USD'})
+
+    def test_rate_and_limit(self):
+        self.sim.limit = 20
+        self.sim.rate = 200
+        conn = create_connection(self.sim.url('HitBTC'), timeout=1)
+        self.addCleanup(conn.close)
+        snapshots = [json.loads(conn.recv()) for _ in self.sim.pairs]
+        self.assertTrue(all('MarketDataSnapshotFullRefresh' in s
+                            for s in snapshots))
+        start = time.time()
+        updates = [json.loads(conn.recv())['MarketDataIncrementalRefresh']
+                   for _ in range(20)]
+        self.assertGreater(time.time() - start, 0.08)
+        self.assertEqual([u['seqNo'] for u in updates], list(range(1, 21)))
+        conn.ping()
+        with self.assertRaises(WebSocketTimeoutException):
+            conn.recv()
@@ -0,0 +1,103 @@
+# Import Built-Ins
+import logging
+import os
+import tempfile
+from unittest import TestCase, skipUnless
+
+# Import Third-Party
+
+# Import Homebrew
+from bitex.tickstore import TickStore, numpy_available
+from bitex.api.WSS.bitfinex import BitfinexWSS
+
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+DAY = 86400.0
+T0 = 1500000000.0 - 1500000000.0 % DAY  # Midnight UTC
+
+
+class TickStoreTest(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+        self.store = TickStore(self.root, flush_every=10)
+        self.addCleanup(self.store.close)
+
+    def test_range_queries_across_days(self):
+        for i in range(100):
+            self.store.write_trade('Bitfinex', 'BTCUSD', T0 + i * 3600,
+                                   2500 + i, 0.5, 1 if i % 2 else -1)
+        self.assertEqual(len(os.listdir(os.path.join(
+            self.root, 'Bitfinex', 'BTCUSD', 'trades'))), 5)
+
+        trades = self.store.trades('Bitfinex', 'BTCUSD', T0 + 20 * 3600,
+                                   T0 + 30 * 3600)
+        self.assertEqual(len(trades), 11)
+        self.assertEqual(list(trades.column('price')),
+                         [2500.0 + i for i in range(20, 31)])
+        self.assertEqual(next(iter(trades)), (T0 + 20 * 3600, 2520.0, 0.5, -1))
+        self.assertEqual(len(self.store.trades('Bitfinex', 'BTCUSD')), 100)
+        self.assertEqual(len(self.store.trades('Bitfinex', 'ETHUSD')), 0)
+
+    def test_timestamps_never_decrease(self):
+        for ts in (T0 + 2, T0 + 1, T0 + 3):
+            self.store.write_bbo('GDAX', 'BTC-USD', ts, 99, 1, 101, 2)
+        self.assertEqual(list(self.store.bbo('GDAX', 'BTC-USD').column('ts')),
+                         [T0 + 2, T0 + 2, T0 + 3])
+        self.assertEqual(self.store.bbo_at('GDAX', 'BTC-USD', T0 + 2.5),
+                         (T0 + 2, 99.0, 1.0, 101.0, 2.0))
+        self.assertIsNone(self.store.bbo_at('GDAX', 'BTC-USD', T0 + 1))
+
+    def test_reopening_drops_incomplete_rows(self):
+        self.store.write_trade('Bitfinex', 'BTCUSD', T0, 2500, 1, 1)
+        self.store.close()
+        path = os.path.join(self.root, 'Bitfinex', 'BTCUSD', 'trades',
+                            os.listdir(os.path.join(self.root, 'Bitfinex',
+                                                    'BTCUSD', 'trades'))[0])
+        with open(os.path.join(path, 'ts.bin'), 'ab') as f:
+            f.write(b'\x00' * 8)  # Crashed after writing one column
+
+        store = TickStore(self.root)
+        store.write_trade('Bitfinex', 'BTCUSD', T0 + 1, 2501, 1, -1)
+        self.assertEqual(list(store.trades('Bitfinex', 'BTCUSD')),
+                         [(T0, 2500.0, 1.0, 1), (T0 + 1, 2501.0, 1.0, -1)])
+        store.close()
+
+    def test_write_bitfinex_items(self):
+        wss = BitfinexWSS(pairs=['BTCUSD'])
+        wss.channel_labels[2] = ('ticker', {'pair': 'BTCUSD'})
+        wss._handle_ticker(T0 + 2, 2, [[2498, 3, 2499, 4, 0, 0, 2498, 10,
+                                        2510, 2490]])
+        ticker = wss.data_q.get()
+        items = [('trades', 'BTCUSD', ([[[1, 0, '0.5', '2500'],
+                                          [2, 0, '-1', '2499']]], T0)),
+                 ('trades', 'BTCUSD', (['te', [3, 0, '-2', '2498']], T0 + 1)),
+                 ('trades', 'BTCUSD', (['tu', [3, 0, '-2', '2498']], T0 + 1)),
+                 ticker,
+                 ('ohlc', 'BTCUSD', ([[0, 1, 2, 3, 4, 5]], T0 + 2))]
+        self.assertEqual([self.store.write_item('Bitfinex', item)
+                          for item in items], [2, 1, 0, 1, 0])
+        self.assertEqual(list(self.store.trades('Bitfinex', 'BTCUSD')),
+                         [(T0, 2500.0, 0.5, 1), (T0, 2499.0, 1.0, -1),
+                          (T0 + 1, 2498.0, 2.0, -1)])
+        self.assertEqual(list(self.store.bbo('Bitfinex', 'BTCUSD')),
+                         [(T0 + 2, 2498.0, 3.0, 2499.0, 4.0)])
+
+    @skipUnless(numpy_available, "numpy not installed")
+    def test_arrays(self):
+        import numpy
+        for i in range(30):
+            self.store.write_trade('Bitfinex', 'BTCUSD', T0 + i * 7200,
+                                   2500 + i, 1, 1)
+        arrays = self.store.trades('Bitfinex', 'BTCUSD').arrays()
+        self.assertEqual(arrays['price'].dtype, numpy.float64)
+        self.assertEqual(arrays['side'].dtype, numpy.int8)
+        self.assertEqual(arrays['price'].tolist(),
+                         [2500.0 + i for i in range(30)])
+        path = os.path.join(self.root, 'Bitfinex', 'BTCUSD', 'trades')
+        day = sorted(os.listdir(path))[0]
+        ts = numpy.memmap(os.path.join(path, day, 'ts.bin'), dtype='<f8')
+        self.assertEqual(ts[0], T0)
@@ -0,0 +1,89 @@
+# Import Built-Ins
+import logging
+import random
+import threading
+from datetime import timedelta
+from unittest import TestCase, mock
+
+# Import Third-Party
+import requests
+
+# Import Homebrew
+from bitex import timing
+from bitex.timing import Histogram, Timings, PHASES, _ThreadLocalVar
+from bitex.api.REST.response import APIResponse
+from bitex.interfaces import Kraken
+
+
+# Init Logging Facilities
+log = logging.getLogger(__name__)
+
+
+class HistogramTest(TestCase):
+    def test_percentiles_within_precision(self):
+        h = Histogram(precision=8)
+        values = [random.uniform(0.0001, 2) for _ in range(10000)]
+        for v in values:
+            h.record(v)
+        values.sort()
+        for p in (50, 90, 99):
+            exact = values[int(p / 100 * len(values)) - 1] * 1000
+            self.assertAlmostEqual(h.percentile(p), exact,
+                                   delta=exact / 64)
+        summary = h.summary(reset=True)
+        self.assertEqual(summary['count'], 10000)
+        self.assertEqual(summary['max'], int(values[-1] * 1e6) / 1000)
+        self.assertIn('p999', summary)
+        self.assertEqual(h.summary(), {'count': 0})
+        self.assertIsNone(h.percentile(50))
+
+    def test_small_values_are_exact(self):
+        h = Histogram()
+        for us in (1, 2, 3, 100):
+            h.record(us / 1e6)
+        self.assertEqual(h.percentile(50), 0.002)
+        self.assertEqual(h.percentile(100), 0.1)
+
+
+class TimingsTest(TestCase):
+    def test_statsd_export(self):
+        timings = Timings()
+        timings.record('Kraken', 'order_book', 'ttfb', 0.25)
+        timings.record('GDAXRest', 'products/BTC-USD/book', 'sign', 0.001)
+        lines = timings.statsd(reset=True).splitlines()
+        self.assertIn('bitex.Kraken.order_book.ttfb.p99:250.0|g', lines)
+        self.assertIn('bitex.GDAXRest.products_BTC-USD_book.sign.count:1|g',
+                      lines)
+        self.assertEqual(timings.statsd(), '')
+
+    def test_interface_queries_record_all_phases(self):
+        timings = Timings()
+        kraken = Kraken(rate_limit=False, timings=timings)
+        r = requests.Response()
+        r.status_code = 200
+        r._content = b'{"error": [], "result": {}}'
+        r.elapsed = timedelta(milliseconds=5)
+        r.request = mock.Mock()
+        with mock.patch.object(kraken, 'api_request',
+                               return_value=APIResponse(r)):
+            kraken.order_book('XXBTZUSD')
+        snapshot = timings.snapshot()
+        for phase in PHASES:
+            self.assertEqual(snapshot[('Kraken', 'order_book', phase)]['count'],
+                             1)
+        self.assertEqual(len(snapshot), len(PHASES))
+
+    def test_method_labels_without_contextvars(self):
+        # Python < 3.7 lacks contextvars; its stand-in must label alike
+        with mock.patch.object(timing, 'method',
+                               _ThreadLocalVar('bitex_timing_method')):
+            self.test_interface_queries_record_all_phases()
+            token = timing.method.set('ticker')
+            seen = []
+            thread = threading.Thread(
+                target=lambda: seen.append(timing.method.get()))
+            thread.start()
+            thread.join()
+            self.assertEqual((timing.method.get(), seen), ('ticker', [None]))
+            timing.method.reset(token)
+            self.assertIsNone(timing.method.get())